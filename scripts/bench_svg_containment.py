@@ -0,0 +1,107 @@
+"""Benchmark SVG containment extraction on large synthetic diagrams.
+
+Generates architecture-style SVGs (a grid of labelled groups, each
+holding nested boxes, duplicate boxes, and text labels) and times
+:class:`~ac_dc.doc_index.extractors.svg.SvgExtractor` twice per size:
+once with the grid-backed :class:`BoxIndex`, once with a stand-in
+that returns every shape as a candidate — the linear scan the
+containment builder used before the index existed. The two outlines
+must be identical; the script exits non-zero if they differ.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_svg_containment.py [N ...]
+
+Each ``N`` is a group count (default: 100 500 1000). A group
+contributes roughly ten shapes and four texts, so 1000 groups is
+on the order of 10k shapes. The linear baseline grows
+quadratically; expect it to dominate the run time at the top size.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+
+from ac_dc.doc_index.extractors import svg as svg_module
+from ac_dc.doc_index.extractors.svg import SvgExtractor
+
+DEFAULT_SIZES = (100, 500, 1000)
+
+
+class _LinearIndex:
+    """Every shape is a candidate for every query."""
+
+    def __init__(self, boxes: list) -> None:
+        self._all = list(range(len(boxes)))
+
+    def candidates(self, x: float, y: float) -> list[int]:
+        return self._all
+
+
+def synthetic_svg(groups: int, seed: int = 0) -> str:
+    """Build a diagram with ``groups`` labelled containers."""
+    rng = random.Random(seed)
+    cols = max(1, int(groups ** 0.5))
+    parts: list[str] = [
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 '
+        f'{cols * 220} {(groups // cols + 1) * 220}">'
+    ]
+    for g in range(groups):
+        gx, gy = (g % cols) * 220, (g // cols) * 220
+        parts.append(
+            f'<g aria-label="Service {g}"><rect x="{gx}" y="{gy}" '
+            'width="200" height="200"/></g>'
+        )
+        for k in range(4):
+            x = gx + 10 + (k % 2) * 95
+            y = gy + 10 + (k // 2) * 95
+            parts.append(
+                f'<rect x="{x}" y="{y}" width="85" height="85"/>'
+            )
+            parts.append(
+                f'<rect x="{x + 5}" y="{y + 40}" width="40" height="30"/>'
+            )
+            if rng.random() < 0.2:
+                parts.append(
+                    f'<rect x="{x}" y="{y}" width="85" height="85"/>'
+                )
+            parts.append(
+                f'<text x="{x + 10}" y="{y + 20}">svc {g} part {k}</text>'
+            )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def _time_extract(content: str) -> tuple[float, object]:
+    start = time.perf_counter()
+    outline = SvgExtractor().extract(Path("bench.svg"), content)
+    return time.perf_counter() - start, outline
+
+
+def main(argv: list[str]) -> int:
+    sizes = [int(a) for a in argv] or list(DEFAULT_SIZES)
+    original = svg_module.BoxIndex
+    print(f"{'groups':>8} {'shapes':>8} {'indexed':>10} {'linear':>10} {'speedup':>8}")
+    for groups in sizes:
+        content = synthetic_svg(groups)
+        shapes = content.count("<rect")
+        indexed_s, indexed = _time_extract(content)
+        svg_module.BoxIndex = _LinearIndex  # type: ignore[assignment,misc]
+        try:
+            linear_s, linear = _time_extract(content)
+        finally:
+            svg_module.BoxIndex = original  # type: ignore[misc]
+        if indexed != linear:
+            print(f"outline mismatch at {groups} groups", file=sys.stderr)
+            return 1
+        print(
+            f"{groups:>8} {shapes:>8} {indexed_s:>9.2f}s "
+            f"{linear_s:>9.2f}s {linear_s / indexed_s:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
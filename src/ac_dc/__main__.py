@@ -3,7 +3,15 @@
 Delegates to the argparse-based CLI in :mod:`ac_dc.cli`.
 """
 
+import multiprocessing
+
 from ac_dc.cli import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # The PyInstaller binary is built from this file. Spawned
+    # process-pool workers (parallel symbol indexing) re-run
+    # the frozen executable; freeze_support routes them to the
+    # worker loop instead of a second CLI launch. No-op when
+    # not frozen.
+    multiprocessing.freeze_support()
+    main()
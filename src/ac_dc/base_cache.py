@@ -10,8 +10,9 @@ Design notes pinned by specs4/2-indexing:
 - **Storage-mechanism abstraction.** :class:`BaseCache` exposes
   ``get``/``put``/``invalidate``/``clear`` with identical semantics
   for in-memory and on-disk backings. Subclasses override
-  ``_persist`` and ``_load_all`` to add disk sidecars. The symbol
-  cache leaves both as no-ops; the doc cache implements them.
+  ``_persist`` and ``_load_all`` to add disk persistence. The doc
+  cache writes one sidecar per file; the symbol cache keeps a
+  single pack file.
 
 - **Mtime, not content hash.** Cache invalidation is driven by
   file modification time — cheap to check, correct in the
@@ -63,8 +64,8 @@ class BaseCache(Generic[T]):
     signature hash over the value's structural representation.
 
     Subclasses that want disk persistence override ``_persist`` and
-    ``_load_all``. The defaults are no-ops, giving the symbol cache
-    pure in-memory behaviour without conditional logic in the base.
+    ``_load_all``. The defaults are no-ops, giving pure in-memory
+    behaviour without conditional logic in the base.
     """
 
     def __init__(self) -> None:
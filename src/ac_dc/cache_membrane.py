@@ -37,6 +37,7 @@ published publicly at https://github.com/flatmax/membrane.cache
 
 from __future__ import annotations
 
+import heapq
 import logging
 import math
 from dataclasses import dataclass
@@ -374,6 +375,193 @@ class RelaxationStats:
 _MAX_RELAX_ITERS = 1000
 
 
+class _RelaxState:
+    """Incremental tier aggregates and mover queues for :func:`relax`.
+
+    The naive loop rescanned every item on every membrane of
+    every pass — once to sum V/c, and up to three more times in
+    :func:`pick_mover` — so a relaxation cost O(passes × items).
+    Within one call only a mover's state changes, so everything
+    can be computed once and then patched per move:
+
+    - **Aggregates** — per-tier count and token sum over the
+      non-balance-excluded items. A move subtracts from the
+      source tier and adds to the destination.
+    - **Mover queues** — per lower tier, two heaps ordered by
+      that membrane's pick key: ``aged`` (``n ≥ n_admit``) and
+      ``young`` (the rest). The floored pick is the top of
+      ``aged``; the unfloored retry is the smaller of the two
+      tops. Only the top is ever removed, so no lazy deletion
+      is needed. Protected items never enter a queue.
+
+    Heap entries end with the item's position in ``files``, so
+    equal pick keys resolve to the earliest item — exactly the
+    strict ``<`` tie-break of the linear :func:`pick_mover`
+    scan. Moves are therefore identical to the naive loop.
+
+    Token sums are exact while every token count is integral
+    (the tracker's are ints), so incremental arithmetic matches
+    the naive left-to-right sum bit for bit. With fractional
+    counts the affected tiers are marked dirty and re-summed in
+    list order on demand, preserving the same float result.
+    """
+
+    def __init__(
+        self,
+        files: list[Any],
+        config: FluxConfig,
+        tier_of: Callable[[Any], int],
+        n_of: Callable[[Any], int],
+        tokens_of: Callable[[Any], float],
+        key_of: Callable[[Any], str],
+        is_protected: Callable[[Any], bool],
+        is_balance_excluded: Callable[[Any], bool],
+    ) -> None:
+        self._files = files
+        self._n_of = n_of
+        self._tokens_of = tokens_of
+        self._key_of = key_of
+        self._is_protected = is_protected
+        self._is_balance_excluded = is_balance_excluded
+        self._tier_of = tier_of
+        # Lower tier → its membrane's params.
+        self._params_by_lower: dict[int, MembraneParams] = {
+            lower: config.membranes[m_idx]
+            for m_idx, (lower, _upper) in enumerate(LIVE_MEMBRANES)
+        }
+        self.counts: dict[int, int] = {}
+        self._sums: dict[int, float] = {}
+        self._dirty: set[int] = set()
+        self._tiers: list[int] = []
+        self._tokens: list[float] = []
+        self._balanced: list[bool] = []
+        self._aged: dict[int, list[tuple[Any, ...]]] = {
+            lower: [] for lower in self._params_by_lower
+        }
+        self._young: dict[int, list[tuple[Any, ...]]] = {
+            lower: [] for lower in self._params_by_lower
+        }
+        self._exact = True
+        for pos, f in enumerate(files):
+            tokens = tokens_of(f)
+            self._tiers.append(tier_of(f))
+            self._tokens.append(tokens)
+            self._balanced.append(not is_balance_excluded(f))
+            if self._exact and not float(tokens).is_integer():
+                self._exact = False
+        for pos, f in enumerate(files):
+            tier = self._tiers[pos]
+            if self._balanced[pos]:
+                self.counts[tier] = self.counts.get(tier, 0) + 1
+                self._sums[tier] = (
+                    self._sums.get(tier, 0.0) + self._tokens[pos]
+                )
+            if not is_protected(f):
+                self._enqueue(pos, n_of(f))
+        for heap in (*self._aged.values(), *self._young.values()):
+            heapq.heapify(heap)
+
+    def _entry(
+        self, pos: int, n: int, params: MembraneParams
+    ) -> tuple[Any, ...]:
+        tokens = self._tokens[pos]
+        key = self._key_of(self._files[pos])
+        if params.pick_mode == "oldest":
+            return (-n, tokens, key, pos)
+        return (tokens, -n, key, pos)
+
+    def _enqueue(self, pos: int, n: int, push: bool = False) -> None:
+        tier = self._tiers[pos]
+        params = self._params_by_lower.get(tier)
+        if params is None:
+            return
+        # Negative ages are never pickable: the floored pick
+        # needs ``n ≥ n_admit`` and the retry ``n ≥ 0``.
+        if n < min(params.n_admit, 0):
+            return
+        heap = (
+            self._aged[tier] if n >= params.n_admit
+            else self._young[tier]
+        )
+        entry = self._entry(pos, n, params)
+        if push:
+            heapq.heappush(heap, entry)
+        else:
+            heap.append(entry)
+
+    def tokens(self, tier: int) -> float:
+        """Token sum of ``tier``, matching a left-to-right scan."""
+        if tier in self._dirty:
+            total = 0.0
+            for pos, t in enumerate(self._tiers):
+                if t == tier and self._balanced[pos]:
+                    total += self._tokens[pos]
+            self._sums[tier] = total
+            self._dirty.discard(tier)
+        return self._sums.get(tier, 0.0)
+
+    def pick(self, lower: int, floored: bool) -> int | None:
+        """Position of the best mover out of ``lower``, or None.
+
+        ``floored`` honours the membrane's ``n_admit``; otherwise
+        the young queue competes too.
+        """
+        aged = self._aged[lower]
+        if floored:
+            return aged[0][-1] if aged else None
+        young = self._young[lower]
+        if aged and young:
+            return min(aged[0], young[0])[-1]
+        if aged:
+            return aged[0][-1]
+        if young:
+            return young[0][-1]
+        return None
+
+    def move(
+        self, pos: int, set_tier: Callable[[Any, int], None], upper: int
+    ) -> None:
+        """Apply a move of the item at ``pos`` and patch the state."""
+        f = self._files[pos]
+        old_tier = self._tiers[pos]
+        # The mover is the top of one of its tier's queues.
+        aged = self._aged[old_tier]
+        if aged and aged[0][-1] == pos:
+            heapq.heappop(aged)
+        else:
+            heapq.heappop(self._young[old_tier])
+        if self._balanced[pos]:
+            self._remove_mass(old_tier, self._tokens[pos])
+        set_tier(f, upper)
+        # Re-read the mover — the setter may reset its age
+        # (the tracker zeroes ``n`` on every move).
+        new_tier = self._tier_of(f)
+        tokens = self._tokens_of(f)
+        if self._exact and not float(tokens).is_integer():
+            self._exact = False
+            self._dirty.update(self._sums)
+        self._tiers[pos] = new_tier
+        self._tokens[pos] = tokens
+        self._balanced[pos] = not self._is_balance_excluded(f)
+        if self._balanced[pos]:
+            self.counts[new_tier] = self.counts.get(new_tier, 0) + 1
+            if self._exact:
+                self._sums[new_tier] = (
+                    self._sums.get(new_tier, 0.0) + tokens
+                )
+            else:
+                self._dirty.add(new_tier)
+        if not self._is_protected(f):
+            self._enqueue(pos, self._n_of(f), push=True)
+
+    def _remove_mass(self, tier: int, tokens: float) -> None:
+        self.counts[tier] -= 1
+        if self._exact:
+            self._sums[tier] -= tokens
+        else:
+            self._dirty.add(tier)
+
+
 def relax(
     files: list[Any],
     *,
@@ -420,6 +608,15 @@ def relax(
     contribute mass to V/c (their bytes really are in their
     tier) but cannot be picked as movers.
 
+    Tier aggregates and mover queues are built once and patched
+    per move (see :class:`_RelaxState`), so a call costs
+    O(items + moves × log items) rather than a rescan of every
+    item per membrane per pass. The picks and firing order are
+    the same as scanning with :func:`pick_mover`. Only the
+    mover may change between callbacks — ``set_tier`` may reset
+    its age or tokens, but mutating other items mid-relaxation
+    is unsupported.
+
     Returns a :class:`RelaxationStats` record. ``moves`` is a list
     of ``(membrane_idx, key)`` tuples in firing order.
     """
@@ -428,6 +625,10 @@ def relax(
         return stats
 
     threshold = config.threshold
+    state = _RelaxState(
+        files, config, tier_of, n_of, tokens_of, key_of,
+        is_protected, is_balance_excluded,
+    )
 
     for it in range(_MAX_RELAX_ITERS):
         moved_any = False
@@ -440,20 +641,11 @@ def relax(
                 # exists. Used on Active→L3 where V degenerates
                 # (active is structurally lighter than the
                 # cache).
-                mover = pick_mover(
-                    files,
-                    tier_idx=lower,
-                    n_admit=params.n_admit,
-                    pick_mode=params.pick_mode,
-                    tier_of=tier_of,
-                    n_of=n_of,
-                    tokens_of=tokens_of,
-                    key_of=key_of,
-                    excluded=[f for f in files if is_protected(f)],
-                )
-                if mover is None:
+                pos = state.pick(lower, floored=True)
+                if pos is None:
                     continue
-                set_tier(mover, upper)
+                mover = files[pos]
+                state.move(pos, set_tier, upper)
                 stats.fired_via_flux += 1
                 stats.moves.append((m_idx, key_of(mover)))
                 moved_any = True
@@ -462,58 +654,28 @@ def relax(
                     return stats
                 continue
 
-            c_lower = 0
-            c_upper = 0
-            t_lower = 0.0
-            t_upper = 0.0
-            for f in files:
-                if is_balance_excluded(f):
-                    continue
-                t = tier_of(f)
-                if t == lower:
-                    c_lower += 1
-                    t_lower += tokens_of(f)
-                elif t == upper:
-                    c_upper += 1
-                    t_upper += tokens_of(f)
-
+            c_lower = state.counts.get(lower, 0)
+            c_upper = state.counts.get(upper, 0)
             if c_lower == 0 and c_upper == 0:
                 continue
+            t_lower = state.tokens(lower)
+            t_upper = state.tokens(upper)
 
             phi = compute_flux(c_lower, t_lower, t_upper, c_upper, params)
 
             if phi < threshold:
                 continue
 
-            mover = pick_mover(
-                files,
-                tier_idx=lower,
-                n_admit=params.n_admit,
-                pick_mode=params.pick_mode,
-                tier_of=tier_of,
-                n_of=n_of,
-                tokens_of=tokens_of,
-                key_of=key_of,
-                excluded=[f for f in files if is_protected(f)],
-            )
-            if mover is None and params.n_admit > 0:
+            pos = state.pick(lower, floored=True)
+            if pos is None and params.n_admit > 0:
                 # Retry without the admission floor — on flux
                 # membranes the floor is a soft prefer-aged-
                 # movers rule, not a strict gate.
-                mover = pick_mover(
-                    files,
-                    tier_idx=lower,
-                    n_admit=0,
-                    pick_mode=params.pick_mode,
-                    tier_of=tier_of,
-                    n_of=n_of,
-                    tokens_of=tokens_of,
-                    key_of=key_of,
-                    excluded=[f for f in files if is_protected(f)],
-                )
-            if mover is None:
+                pos = state.pick(lower, floored=False)
+            if pos is None:
                 continue
-            set_tier(mover, upper)
+            mover = files[pos]
+            state.move(pos, set_tier, upper)
 
             stats.fired_via_flux += 1
             stats.moves.append((m_idx, key_of(mover)))
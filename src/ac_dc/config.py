@@ -212,6 +212,38 @@ def _backup_name(original: Path, installed_version: str) -> Path:
 # ---------------------------------------------------------------------------
 
 
+def _pool_settings(section: dict[str, Any]) -> dict[str, int]:
+    """Parse ``workers`` / ``parallel_min_files`` / ``shard_size``.
+
+    Shared by the symbol- and doc-index sections. Negative or
+    malformed values fall back to the defaults (0 → one worker
+    per CPU, 256, 64).
+    """
+    try:
+        workers = int(section.get("workers", 0))
+    except (TypeError, ValueError):
+        workers = 0
+    if workers < 0:
+        workers = 0
+    try:
+        min_files = int(section.get("parallel_min_files", 256))
+    except (TypeError, ValueError):
+        min_files = 256
+    if min_files <= 0:
+        min_files = 256
+    try:
+        shard_size = int(section.get("shard_size", 64))
+    except (TypeError, ValueError):
+        shard_size = 64
+    if shard_size <= 0:
+        shard_size = 64
+    return {
+        "workers": workers,
+        "parallel_min_files": min_files,
+        "shard_size": shard_size,
+    }
+
+
 class ConfigManager:
     """Owns the user config directory and exposes cached accessors.
 
@@ -759,6 +791,15 @@ class ConfigManager:
         return {
             "path": section.get("path"),  # None → use default under tmpdir
             "ttl_hours": int(section.get("ttl_hours", 24)),
+            # Byte budget for stored entries; LRU eviction above it.
+            "max_size_mb": max(1, int(section.get("max_size_mb", 256))),
+            # Fetch fan-out and per-host keep-alive connections.
+            "max_concurrent_fetches": max(
+                1, int(section.get("max_concurrent_fetches", 4))
+            ),
+            "max_connections_per_host": max(
+                1, int(section.get("max_connections_per_host", 2))
+            ),
         }
 
     @property
@@ -799,6 +840,15 @@ class ConfigManager:
             "enabled": bool(section.get("enabled", True)),
             "extensions": [str(e) for e in extensions],
             "max_source_size_mb": int(section.get("max_source_size_mb", 50)),
+            # Background conversion worker processes; 0 means
+            # one per CPU.
+            "workers": max(0, int(section.get("workers", 0))),
+            "file_timeout_seconds": max(
+                1, int(section.get("file_timeout_seconds", 600))
+            ),
+            "libreoffice_max_instances": max(
+                1, int(section.get("libreoffice_max_instances", 2))
+            ),
         }
 
     @property
@@ -806,7 +856,14 @@ class ConfigManager:
         """Document index section with defaults filled in.
 
         Consumed by Layer 2's keyword enricher. Ranges and thresholds
-        follow specs4/2-indexing/keyword-enrichment.md.
+        follow specs4/2-indexing/keyword-enrichment.md. Also carries
+        the structural pass's process-pool settings (``workers``,
+        ``parallel_min_files``, ``shard_size``), parsed as in
+        :attr:`symbol_index_config`, and the enrichment worker
+        settings: ``keywords_out_of_process`` (host the model
+        in a child process), ``keywords_worker_max_rss_mb``
+        (recycle the child above this RSS) and
+        ``keywords_batch_files`` (files per model batch).
         """
         section = self.app_config.get("doc_index", {})
         if not isinstance(section, dict):
@@ -832,6 +889,18 @@ class ConfigManager:
             "keywords_max_doc_freq": float(
                 section.get("keywords_max_doc_freq", 0.6)
             ),
+            "keywords_out_of_process": bool(
+                section.get("keywords_out_of_process", True)
+            ),
+            "keywords_worker_max_rss_mb": max(
+                256, int(section.get("keywords_worker_max_rss_mb", 3072))
+            ),
+            "keywords_batch_files": max(
+                1, int(section.get("keywords_batch_files", 8))
+            ),
+            # Process pool for cold structural extraction —
+            # same keys and defaults as ``symbol_index``.
+            **_pool_settings(section),
         }
 
     @property
@@ -1035,6 +1104,83 @@ class ConfigManager:
             "interval_seconds": interval,
         }
 
+    @property
+    def streaming_config(self) -> dict[str, Any]:
+        """Stream chunk delivery section with defaults filled in.
+
+        Controls how the streaming worker pushes accumulated
+        content to connected browsers (see
+        :class:`ac_dc.llm._chunk_emitter.StreamChunkEmitter`):
+
+        - ``delta_chunks`` — send append-only ``streamDelta``
+          events between full-content checkpoints. Default
+          True. False restores full-content ``streamChunk``
+          on every flush.
+        - ``coalesce_ms`` — minimum interval between flushes.
+          Default 50. Zero flushes on every provider chunk.
+        - ``coalesce_chars`` — pending-text size that forces
+          a flush inside the window. Default 2048.
+        - ``checkpoint_seconds`` — maximum interval between
+          full-content checkpoints, bounding how long a
+          reconnected client waits to resync. Default 5.
+
+        Negative or malformed values fall back to defaults.
+        """
+        section = self.app_config.get("streaming", {})
+        if not isinstance(section, dict):
+            section = {}
+        try:
+            coalesce_ms = int(section.get("coalesce_ms", 50))
+        except (TypeError, ValueError):
+            coalesce_ms = 50
+        if coalesce_ms < 0:
+            coalesce_ms = 50
+        try:
+            coalesce_chars = int(section.get("coalesce_chars", 2048))
+        except (TypeError, ValueError):
+            coalesce_chars = 2048
+        if coalesce_chars <= 0:
+            coalesce_chars = 2048
+        try:
+            checkpoint = float(section.get("checkpoint_seconds", 5.0))
+        except (TypeError, ValueError):
+            checkpoint = 5.0
+        if checkpoint < 0:
+            checkpoint = 5.0
+        return {
+            "delta_chunks": bool(section.get("delta_chunks", True)),
+            "coalesce_ms": coalesce_ms,
+            "coalesce_chars": coalesce_chars,
+            "checkpoint_seconds": checkpoint,
+        }
+
+    @property
+    def symbol_index_config(self) -> dict[str, Any]:
+        """Symbol indexing section with defaults filled in.
+
+        Controls the process pool
+        :meth:`ac_dc.symbol_index.index.SymbolIndex.index_repo`
+        shards cold parses across:
+
+        - ``workers`` — pool size. Default 0, meaning one
+          worker per CPU. 1 disables the pool and parses
+          every file in-process.
+        - ``parallel_min_files`` — files needing a parse
+          before the pool is used. Default 256; below that,
+          worker start-up outweighs the gain. Warm starts
+          and per-turn re-indexes are almost all cache hits
+          and stay in-process.
+        - ``shard_size`` — files per worker task, and the
+          granularity of startup progress reports.
+          Default 64.
+
+        Negative or malformed values fall back to defaults.
+        """
+        section = self.app_config.get("symbol_index", {})
+        if not isinstance(section, dict):
+            section = {}
+        return _pool_settings(section)
+
     @property
     def cache_tiering_config(self) -> dict[str, Any]:
         """Cache-tiering (membrane / flux controller) section.
@@ -41,6 +41,7 @@ Non-goals for this layer:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable
@@ -302,6 +303,18 @@ class ContextManager:
         # consumers either honour the fields or ignore them.
         self._history: list[dict[str, Any]] = []
 
+        # Per-message token counts and stability hashes, keyed
+        # by ``id(msg)``. Each entry pins the message dict and
+        # the role/content objects it was counted from, so a
+        # reused id or a replaced content string is detected and
+        # recounted. The hash slot is filled lazily by
+        # :meth:`history_stability_items` — budget-only callers
+        # never pay for it. Rebuilt on every walk of the history,
+        # which also drops entries for messages no longer in it.
+        self._message_tokens: dict[
+            int, tuple[dict[str, Any], Any, Any, int, str | None]
+        ] = {}
+
         # System prompt — current + saved copy for review-mode swap
         # or mode-switch-back restoration.
         self._system_prompt = system_prompt
@@ -650,8 +663,67 @@ class ContextManager:
         purge()
 
     def history_token_count(self) -> int:
-        """Count tokens across the current history."""
-        return self._counter.count(self._history)
+        """Count tokens across the current history.
+
+        Called several times per turn (budget, compaction
+        status, request estimate) and in a loop by
+        :meth:`emergency_truncate`. Messages are immutable in
+        practice once appended, so each one's count is cached
+        and only new or replaced messages reach the counter.
+        """
+        return sum(entry[3] for entry in self._message_entries())
+
+    def history_stability_items(self) -> list[tuple[str, int]]:
+        """Return ``(hash, tokens)`` for each history message.
+
+        The stability tracker registers every message as a
+        ``history:{i}`` item on every turn. The hash is the
+        SHA-256 of ``"{role}:{content}"`` — the same identity
+        the tracker has always used — and, like the token
+        count, is computed once per message and reused until
+        the message is replaced.
+        """
+        return [
+            (entry[4] or "", entry[3])
+            for entry in self._message_entries(with_hash=True)
+        ]
+
+    def _message_entries(
+        self, *, with_hash: bool = False
+    ) -> list[tuple[dict[str, Any], Any, Any, int, str | None]]:
+        """Walk the history, reusing cached per-message entries."""
+        entries: list[
+            tuple[dict[str, Any], Any, Any, int, str | None]
+        ] = []
+        cache: dict[
+            int, tuple[dict[str, Any], Any, Any, int, str | None]
+        ] = {}
+        for msg in self._history:
+            role = msg.get("role")
+            content = msg.get("content")
+            entry = self._message_tokens.get(id(msg))
+            if (
+                entry is None
+                or entry[0] is not msg
+                or entry[1] is not role
+                or entry[2] is not content
+            ):
+                entry = (
+                    msg, role, content,
+                    self._counter.count_message(msg), None,
+                )
+            if with_hash and entry[4] is None:
+                text = content or ""
+                if not isinstance(text, str):
+                    text = str(text)
+                digest = hashlib.sha256(
+                    f"{msg.get('role', 'user')}:{text}".encode("utf-8")
+                ).hexdigest()
+                entry = entry[:4] + (digest,)
+            cache[id(msg)] = entry
+            entries.append(entry)
+        self._message_tokens = cache
+        return entries
 
     # ------------------------------------------------------------------
     # System prompt
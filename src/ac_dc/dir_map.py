@@ -0,0 +1,184 @@
+"""Path-keyed dict that also maintains a per-directory file index.
+
+The symbol and doc indexes keep their per-file results in a plain
+``path → entry`` dict, and the D36 dir-block accessors
+(``get_dir_symbols_block``, ``get_dir_signature_hash`` and the doc
+equivalents) used to find a directory's members by filtering every
+indexed path. The stability update asks for every directory's
+hash on every turn, so a request cost O(directories × files) —
+quadratic in repo size for a flat-ish tree.
+
+:class:`DirectoryMap` is a drop-in ``dict`` subclass that keeps a
+``directory → member paths`` index in step with every mutation,
+so a directory's sorted members are an O(1) lookup after the
+first sort. It subclasses ``dict`` rather than wrapping one
+because callers (and tests) assign into the store directly —
+``index._all_outlines[path] = outline`` — and every such write
+must reach the directory index without a separate call.
+
+Each directory also carries a **version** that bumps whenever a
+member is added, removed, or replaced by a different object.
+Re-storing the identical object (a cache hit re-populating the
+map) is not a change. The indexes key their per-directory render
+and hash caches on this version; :meth:`touch` covers the rare
+in-place mutation of an entry that changes how it renders
+(import re-resolution, keyword enrichment).
+
+Not thread-safe — like the stores it replaces, it's mutated only
+from the indexing executor.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, TypeVar
+
+V = TypeVar("V")
+
+
+def dir_of(rel_path: str) -> str:
+    """Return the directory portion of a repo-relative path.
+
+    Top-level files map to the empty string.
+    """
+    idx = rel_path.rfind("/")
+    if idx == -1:
+        return ""
+    return rel_path[:idx]
+
+
+class DirectoryMap(dict[str, V]):
+    """``dict`` of repo-relative path → entry, indexed by directory.
+
+    Every mutating ``dict`` method is overridden to keep
+    ``_members`` (directory → member set), ``_sorted`` (lazily
+    sorted member tuples) and ``_versions`` in step. Reads are
+    untouched ``dict`` operations.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        self._members: dict[str, set[str]] = {}
+        self._sorted: dict[str, tuple[str, ...]] = {}
+        self._versions: dict[str, int] = {}
+        # Monotonic across the map's lifetime so a directory
+        # that empties and refills never reuses a version a
+        # caller may still hold.
+        self._clock = 0
+        self.update(*args, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Directory queries
+    # ------------------------------------------------------------------
+
+    def directories(self) -> list[str]:
+        """Sorted directories with at least one member."""
+        return sorted(self._members)
+
+    def files_in(self, directory: str) -> tuple[str, ...]:
+        """Sorted member paths of ``directory`` (empty when none)."""
+        cached = self._sorted.get(directory)
+        if cached is None:
+            cached = tuple(sorted(self._members.get(directory, ())))
+            self._sorted[directory] = cached
+        return cached
+
+    def dir_version(self, directory: str) -> int:
+        """Version of ``directory``'s membership and entries.
+
+        Changes whenever a member is added, removed, replaced
+        by a different object, or :meth:`touch`-ed. Zero for a
+        directory that has never had members.
+        """
+        return self._versions.get(directory, 0)
+
+    def touch(self, path: str) -> None:
+        """Record an in-place change to ``path``'s entry."""
+        if path in self:
+            self._bump(dir_of(path))
+
+    # ------------------------------------------------------------------
+    # Bookkeeping
+    # ------------------------------------------------------------------
+
+    def _bump(self, directory: str) -> None:
+        self._clock += 1
+        self._versions[directory] = self._clock
+
+    def _added(self, path: str) -> None:
+        directory = dir_of(path)
+        self._members.setdefault(directory, set()).add(path)
+        self._sorted.pop(directory, None)
+        self._bump(directory)
+
+    def _removed(self, path: str) -> None:
+        directory = dir_of(path)
+        members = self._members.get(directory)
+        if members is not None:
+            members.discard(path)
+            if not members:
+                del self._members[directory]
+        self._sorted.pop(directory, None)
+        self._bump(directory)
+
+    # ------------------------------------------------------------------
+    # Mutating dict overrides
+    # ------------------------------------------------------------------
+
+    def __setitem__(self, path: str, value: V) -> None:
+        if path in self:
+            old = dict.__getitem__(self, path)
+            dict.__setitem__(self, path, value)
+            if old is not value:
+                self._bump(dir_of(path))
+            return
+        dict.__setitem__(self, path, value)
+        self._added(path)
+
+    def __delitem__(self, path: str) -> None:
+        dict.__delitem__(self, path)
+        self._removed(path)
+
+    _MISSING = object()
+
+    def pop(self, path: str, default: Any = _MISSING) -> Any:
+        if path in self:
+            value = dict.pop(self, path)
+            self._removed(path)
+            return value
+        if default is DirectoryMap._MISSING:
+            raise KeyError(path)
+        return default
+
+    def popitem(self) -> tuple[str, V]:
+        path, value = dict.popitem(self)
+        self._removed(path)
+        return path, value
+
+    def setdefault(self, path: str, default: Any = None) -> Any:
+        if path not in self:
+            self[path] = default
+        return dict.__getitem__(self, path)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        items: Iterable[tuple[str, V]]
+        if args:
+            (source,) = args
+            items = (
+                source.items() if hasattr(source, "items") else source
+            )
+            for path, value in items:
+                self[path] = value
+        for path, value in kwargs.items():
+            self[path] = value
+
+    def clear(self) -> None:
+        directories = list(self._members)
+        dict.clear(self)
+        self._members.clear()
+        self._sorted.clear()
+        for directory in directories:
+            self._bump(directory)
+
+    def __ior__(self, other: Any) -> "DirectoryMap[V]":
+        self.update(other)
+        return self
@@ -0,0 +1,233 @@
+"""Persistent source-hash cache for ``scan_convertible_files``.
+
+Classifying a source that already has a converted output means
+comparing the SHA-256 recorded in the output's provenance
+header against the source's current hash. Hashing reads the
+whole source — routinely hundreds of MB for decks and scanned
+PDFs — and the Doc Convert tab rescans every time it opens, so
+an unchanged tree paid for a full read of every converted
+source on each visit.
+
+:class:`SourceHashCache` remembers each source's hash against
+its stat fingerprint, so a rescan of an unchanged tree costs a
+``stat`` per file.
+
+Design points:
+
+- **Keyed by path, validated by (size, mtime_ns, inode).** Same
+  fingerprint git's index uses to skip re-reading clean files.
+  An in-place edit moves ``mtime_ns``; a replace-by-rename
+  (what most editors and ``git checkout`` do) also moves the
+  inode. A mismatch re-hashes and overwrites the entry.
+
+- **Racy timestamps are not trusted.** A file whose mtime is
+  within :data:`_RACY_WINDOW_NS` of the time it was hashed
+  may still be changing inside one timestamp tick without its
+  size or mtime moving. Such hashes are returned but not
+  cached — the next scan re-hashes, by which time the
+  fingerprint has settled. Git guards the same window with
+  its "racily clean" re-check.
+
+- **One pack file, flushed per scan.** Same layout as
+  :mod:`ac_dc.symbol_index.cache` and
+  :mod:`ac_dc.doc_index.keyword_cache`: one
+  ``.ac-dc4/doc_convert_hashes.json`` read at construction and
+  rewritten atomically by :meth:`SourceHashCache.flush` when
+  something changed. Sources that vanish from a scan are
+  pruned via :meth:`SourceHashCache.retain`.
+
+- **Thread-safe.** Scans are RPC calls and may overlap; a
+  lock guards the entry map. Hashing itself runs outside the
+  lock.
+
+Governing spec: ``specs4/4-features/doc-convert.md``
+§ Status Badges.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from ac_dc.config import _AC_DC_DIR
+
+from .provenance import hash_file
+
+logger = logging.getLogger(__name__)
+
+
+# Pack file name under the per-repo ``.ac-dc4/`` directory.
+_PACK_FILENAME = "doc_convert_hashes.json"
+
+# Pack schema version. Bump when the serialised shape changes
+# — a mismatch discards the pack and the next scan re-hashes.
+_PACK_VERSION = 1
+
+# Files modified this recently (relative to when they were
+# hashed) aren't cached; see the module docstring.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _fingerprint(st: os.stat_result) -> tuple[int, int, int]:
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+class SourceHashCache:
+    """Path-keyed SHA-256 cache validated by stat fingerprint.
+
+    Construct with a ``repo_root`` to load and maintain the pack
+    file; with ``repo_root=None`` the cache is purely in-memory.
+    """
+
+    def __init__(self, repo_root: Path | str | None = None) -> None:
+        self._repo_root: Path | None = (
+            Path(repo_root) if repo_root is not None else None
+        )
+        # rel_path → (size, mtime_ns, inode, sha256)
+        self._entries: dict[str, tuple[int, int, int, str]] = {}
+        self._lock = threading.Lock()
+        # True when in-memory entries differ from the pack.
+        self._dirty = False
+        # Session counters, for logs and tests.
+        self.hits = 0
+        self.misses = 0
+        if self._repo_root is not None:
+            self._load_all()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hash(
+        self,
+        rel_path: str,
+        source_abs: Path,
+        st: os.stat_result | None = None,
+    ) -> str:
+        """Return the SHA-256 of ``source_abs``, from cache when valid.
+
+        ``st`` is the caller's stat of the file, if it already
+        has one (the scan does) — saves a second syscall.
+        Raises ``OSError`` when the file can't be stat'ed or
+        read, like :func:`hash_file`.
+        """
+        if st is None:
+            st = source_abs.stat()
+        fingerprint = _fingerprint(st)
+        with self._lock:
+            entry = self._entries.get(rel_path)
+            if entry is not None and entry[:3] == fingerprint:
+                self.hits += 1
+                return entry[3]
+            self.misses += 1
+        digest = hash_file(source_abs)
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            return digest
+        with self._lock:
+            self._entries[rel_path] = (*fingerprint, digest)
+            self._dirty = True
+        return digest
+
+    def retain(self, rel_paths: set[str]) -> None:
+        """Drop entries for every path not in ``rel_paths``."""
+        with self._lock:
+            stale = [p for p in self._entries if p not in rel_paths]
+            for path in stale:
+                del self._entries[path]
+            if stale:
+                self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Pack persistence
+    # ------------------------------------------------------------------
+
+    def _pack_path(self) -> Path | None:
+        if self._repo_root is None:
+            return None
+        return self._repo_root / _AC_DC_DIR / _PACK_FILENAME
+
+    def flush(self) -> None:
+        """Rewrite the pack file if anything changed since the last write.
+
+        Written to a temp file and renamed into place so a crash
+        mid-write leaves the previous pack intact. Disk errors
+        are logged; the in-memory cache stays authoritative.
+        """
+        pack = self._pack_path()
+        if pack is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload: dict[str, Any] = {
+                "version": _PACK_VERSION,
+                "entries": {
+                    path: list(entry)
+                    for path, entry in self._entries.items()
+                },
+            }
+            self._dirty = False
+        tmp_path = pack.with_suffix(".json.tmp")
+        try:
+            pack.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps(payload, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, pack)
+        except OSError as exc:
+            logger.warning(
+                "Failed to write doc convert hash cache %s: %s",
+                pack, exc,
+            )
+            with self._lock:
+                self._dirty = True
+
+    def _load_all(self) -> None:
+        """Bulk-load the pack file.
+
+        A missing pack is a cold start. An unreadable pack or
+        a version mismatch is logged and ignored — the next
+        flush overwrites it. Malformed entries are skipped.
+        """
+        pack = self._pack_path()
+        if pack is None:
+            return
+        try:
+            raw = pack.read_text(encoding="utf-8")
+        except OSError:
+            return
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            logger.warning(
+                "Ignoring corrupt doc convert hash cache %s: %s",
+                pack, exc,
+            )
+            return
+        if not isinstance(payload, dict):
+            return
+        if payload.get("version") != _PACK_VERSION:
+            logger.info(
+                "Doc convert hash cache %s has version %r "
+                "(expected %d); ignoring",
+                pack, payload.get("version"), _PACK_VERSION,
+            )
+            return
+        entries = payload.get("entries")
+        if not isinstance(entries, dict):
+            return
+        for path, entry in entries.items():
+            try:
+                size, mtime_ns, inode, digest = entry
+                self._entries[str(path)] = (
+                    int(size), int(mtime_ns), int(inode), str(digest),
+                )
+            except (TypeError, ValueError) as exc:
+                logger.debug(
+                    "Skipping doc convert hash cache entry: %s", exc
+                )
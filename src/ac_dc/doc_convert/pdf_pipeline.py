@@ -9,6 +9,7 @@ during the package split.
 from __future__ import annotations
 
 import base64
+import contextlib
 import logging
 import re
 import shutil
@@ -42,12 +43,23 @@ class PdfPipeline:
         probe_import,
         markitdown_fallback,
         python_pptx_fallback,
+        libreoffice_slots=None,
     ) -> None:
         self._fail = fail
         self._skip = skip
         self._probe_import = probe_import
         self._markitdown_fallback = markitdown_fallback
         self._python_pptx_fallback = python_pptx_fallback
+        # Context manager held around each soffice run. The
+        # background worker pool passes a permit of its
+        # parent-side semaphore so parallel workers never
+        # run more than the configured number of LibreOffice
+        # instances; in-process use needs no limit.
+        self._libreoffice_slots = (
+            libreoffice_slots
+            if libreoffice_slots is not None
+            else contextlib.nullcontext()
+        )
 
     # ------------------------------------------------------------------
     # pptx / odp — LibreOffice → PDF → PyMuPDF pipeline (primary)
@@ -105,18 +117,19 @@ class PdfPipeline:
         ) as tmpdir:
             tmp_path = Path(tmpdir)
             try:
-                proc = subprocess.run(
-                    [
-                        soffice_path,
-                        "--headless",
-                        "--convert-to", "pdf",
-                        "--outdir", str(tmp_path),
-                        str(source_abs),
-                    ],
-                    capture_output=True,
-                    timeout=_LIBREOFFICE_TIMEOUT_SECONDS,
-                    text=True,
-                )
+                with self._libreoffice_slots:
+                    proc = subprocess.run(
+                        [
+                            soffice_path,
+                            "--headless",
+                            "--convert-to", "pdf",
+                            "--outdir", str(tmp_path),
+                            str(source_abs),
+                        ],
+                        capture_output=True,
+                        timeout=_LIBREOFFICE_TIMEOUT_SECONDS,
+                        text=True,
+                    )
             except subprocess.TimeoutExpired:
                 logger.debug(
                     "LibreOffice timed out for %s; falling back",
@@ -46,6 +46,7 @@ from .constants import (
     _PPTX_EXTENSIONS,
     _XLSX_EXTENSIONS,
 )
+from .hash_cache import SourceHashCache
 from .markitdown_pipeline import MarkitdownPipeline
 from .pdf_pipeline import PdfPipeline
 from .pptx_pipeline import PptxPipeline
@@ -55,6 +56,7 @@ from .provenance import (
     parse_provenance_body,
     read_provenance_header,
 )
+from .worker_pool import ConvertPool
 from .xlsx_pipeline import XlsxPipeline
 
 if TYPE_CHECKING:
@@ -84,6 +86,7 @@ class DocConvert:
         config: "ConfigManager",
         repo: Any = None,
         event_callback: Any = None,
+        libreoffice_slots: Any = None,
     ) -> None:
         """Construct the service.
 
@@ -110,10 +113,26 @@ class DocConvert:
             silently dropped and ``convert_files`` falls back to
             fully synchronous operation returning inline
             results.
+        libreoffice_slots:
+            Optional context manager held around every
+            LibreOffice run. The background worker pool
+            passes each worker a permit of a shared
+            semaphore to cap concurrent soffice instances;
+            ``None`` means no limit (conversions in this
+            process run one at a time anyway).
         """
         self._config = config
         self._repo = repo
         self._event_callback = event_callback
+        # Worker pools of in-flight background batches, so
+        # ``cancel_conversion`` can reach them.
+        self._active_pools: set[ConvertPool] = set()
+        # Source hashes by stat fingerprint, so rescans don't
+        # re-read unchanged sources. Persisted under the repo's
+        # ``.ac-dc4/`` when a repo is attached; in-memory
+        # otherwise (tests, worker processes).
+        repo_root = getattr(repo, "root", None)
+        self._hash_cache = SourceHashCache(repo_root)
         # Collab reference, set by main.py when collab mode is
         # active. None in single-user mode — every caller is
         # treated as localhost. Matches the pattern on Repo,
@@ -152,6 +171,7 @@ class DocConvert:
             probe_import=lambda name: self._probe_import(name),
             markitdown_fallback=self._markitdown.convert,
             python_pptx_fallback=self._pptx.convert,
+            libreoffice_slots=libreoffice_slots,
         )
 
     # ------------------------------------------------------------------
@@ -231,6 +251,16 @@ class DocConvert:
         )
         return mb * 1024 * 1024
 
+    @property
+    def _workers(self) -> int:
+        """Background worker process count; 0 in config means CPU count."""
+        workers = int(
+            self._config.doc_convert_config.get("workers", 0)
+        )
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        return workers
+
     # ------------------------------------------------------------------
     # Repo-root resolution
     # ------------------------------------------------------------------
@@ -347,6 +377,12 @@ class DocConvert:
         pathological repo (weird symlinks, permission denied
         on a directory) should not prevent the rest of the scan
         from succeeding.
+
+        Cost on an unchanged tree: the repo's cached git listing
+        plus one ``stat`` per candidate source and a header
+        probe of each existing output. Source hashes come from
+        :class:`SourceHashCache`, which is flushed once per
+        scan.
         """
         if not self._enabled:
             return []
@@ -371,13 +407,14 @@ class DocConvert:
                 # `root` — but be defensive.
                 continue
             try:
-                size = source_abs.stat().st_size
+                st = source_abs.stat()
             except OSError as exc:
                 logger.debug(
                     "DocConvert scan: stat failed for %s: %s",
                     source_abs, exc,
                 )
                 continue
+            size = st.st_size
 
             output_abs = source_abs.with_suffix(".md")
             try:
@@ -385,10 +422,13 @@ class DocConvert:
             except ValueError:
                 continue
 
-            status = self._classify_status(source_abs, output_abs)
+            rel_key = str(rel_path).replace("\\", "/")
+            status = self._classify_status(
+                source_abs, output_abs, rel_key, st,
+            )
 
             entries.append({
-                "path": str(rel_path).replace("\\", "/"),
+                "path": rel_key,
                 "name": source_abs.name,
                 "size": size,
                 "status": status,
@@ -401,6 +441,8 @@ class DocConvert:
         # stable ordering for UI state (selected checkboxes,
         # scroll position).
         entries.sort(key=lambda e: e["path"])
+        self._hash_cache.retain({e["path"] for e in entries})
+        self._hash_cache.flush()
         return entries
 
     def _iter_candidates(
@@ -408,19 +450,41 @@ class DocConvert:
         root: Path,
         extensions: tuple[str, ...],
     ) -> Any:
-        """Walk ``root``, yielding files with matching extensions.
+        """Yield files under ``root`` with matching extensions.
 
         Skips every directory in ``_EXCLUDED_DIRS`` plus hidden
         directories (except ``.github`` which some repos use
         for CI config that might contain docs worth converting).
 
-        Uses ``os.walk`` rather than ``Path.rglob`` because it's
-        easier to mutate the directory list in place (the
-        standard way to prune a walk). ``Path.rglob`` has no
-        equivalent prune hook; filtering after the fact would
-        still descend into ``node_modules``.
+        With a repo attached the candidates come from its git
+        listing (tracked plus untracked-non-ignored, deleted
+        files dropped) — the same shared snapshot the file
+        picker and flat file list use, so a scan reuses it
+        rather than walking the tree, and gitignored output
+        directories never show up. The exclusion rules above
+        still apply to it.
+
+        Without a repo (or when the listing fails) falls back to
+        ``os.walk``, which is easier to prune in place than
+        ``Path.rglob`` — that has no prune hook, so filtering
+        after the fact would still descend into
+        ``node_modules``.
         """
         extensions_set = set(extensions)
+        listed = self._git_listed_files()
+        if listed is not None:
+            for rel in listed:
+                if Path(rel).suffix.lower() not in extensions_set:
+                    continue
+                parts = rel.split("/")[:-1]
+                if any(
+                    d in _EXCLUDED_DIRS
+                    or (d.startswith(".") and d != ".github")
+                    for d in parts
+                ):
+                    continue
+                yield root / rel
+            return
         for dirpath, dirnames, filenames in os.walk(root):
             # Prune excluded and hidden dirs in place. The
             # walker respects in-place mutation of `dirnames`.
@@ -436,10 +500,34 @@ class DocConvert:
                     continue
                 yield dir_path / filename
 
+    def _git_listed_files(self) -> list[str] | None:
+        """Repo-relative paths from the repo's git listing, or None.
+
+        None when no repo is attached, the repo doesn't expose
+        a listing (test stand-ins), or git fails — the caller
+        then walks the filesystem.
+        """
+        listing = getattr(self._repo, "get_flat_file_list", None)
+        if listing is None:
+            return None
+        try:
+            text = listing()
+        except Exception as exc:
+            logger.debug(
+                "DocConvert scan: git listing failed (%s); walking",
+                exc,
+            )
+            return None
+        if not isinstance(text, str):
+            return None
+        return [line for line in text.split("\n") if line]
+
     def _classify_status(
         self,
         source_abs: Path,
         output_abs: Path,
+        rel_path: str | None = None,
+        st: os.stat_result | None = None,
     ) -> str:
         """Classify the source file's conversion status.
 
@@ -456,6 +544,10 @@ class DocConvert:
         hashing the source is treated as ``new``, so a
         permissions hiccup doesn't silently show ``current``
         for a file the user can't actually read.
+
+        With ``rel_path`` the source hash goes through the
+        stat-fingerprint cache (``st`` saves re-stat'ing);
+        without it the source is hashed directly.
         """
         if not output_abs.is_file():
             return "new"
@@ -465,7 +557,12 @@ class DocConvert:
             return "conflict"
 
         try:
-            current_hash = self._hash_file(source_abs)
+            if rel_path is None:
+                current_hash = self._hash_file(source_abs)
+            else:
+                current_hash = self._hash_cache.hash(
+                    rel_path, source_abs, st,
+                )
         except OSError as exc:
             logger.debug(
                 "DocConvert scan: hash failed for %s: %s",
@@ -594,8 +691,9 @@ class DocConvert:
         """Synchronous per-file conversion. Returns results inline.
 
         Used by tests and by the CLI-without-websocket path.
-        The background path uses the same per-file loop but
-        emits progress events between files.
+        Runs in this process, one file at a time; the
+        background path converts through a worker pool and
+        emits progress events as files finish.
         """
         root = self._root()
         results: list[dict[str, Any]] = []
@@ -610,31 +708,35 @@ class DocConvert:
     ) -> None:
         """Background conversion task with progress events.
 
-        Each file is converted in the default thread executor
-        so the event loop stays responsive — individual file
-        conversions (especially PDFs via PyMuPDF) routinely
-        block for many seconds, and running them directly on
-        the loop would stall the websocket and prevent the
-        ``start`` and ``file`` events from reaching the
-        browser until the whole batch finished. That produced
-        a "Converting 0 of N…" hang with no progress events
-        visible in the UI.
+        Files are converted by a :class:`ConvertPool` — up to
+        ``workers`` child processes, each file bounded by
+        ``file_timeout_seconds``, and no more than
+        ``libreoffice_max_instances`` soffice runs at once
+        across the pool. Conversions never run on the event
+        loop; individual files (especially PDFs via PyMuPDF)
+        routinely block for many seconds, and running them on
+        the loop would stall the websocket and hold back the
+        ``start`` and ``file`` events until the whole batch
+        finished.
 
         Emits three event stages:
 
         - ``start`` — before the first file, carrying the
           total count so the UI can size its progress display
-        - ``file`` — per-file, after conversion completes,
-          carrying the result dict and the running index
+        - ``file`` — per-file, as each conversion completes,
+          carrying the result dict and a running index. With
+          several workers files finish out of request order;
+          ``index`` counts completions, and the UI keys rows
+          by ``result.path``.
         - ``complete`` — after all files, carrying the full
-          results list so the UI has the final summary even
-          if it missed some per-file events
+          results list in request order so the UI has the
+          final summary even if it missed some per-file
+          events, plus ``cancelled`` when
+          :meth:`cancel_conversion` stopped the batch
 
         Event failures are swallowed so a broken frontend
         subscriber can't abort an in-flight conversion batch.
         """
-        import asyncio
-
         root = self._root()
         total = len(paths)
         await self._send_convert_event({
@@ -642,30 +744,21 @@ class DocConvert:
             "count": total,
         })
 
-        loop = asyncio.get_running_loop()
-        results: list[dict[str, Any]] = []
-        for index, rel_path in enumerate(paths):
-            try:
-                result = await loop.run_in_executor(
-                    None,
-                    self._convert_one,
-                    root,
-                    rel_path,
-                )
-            except Exception as exc:
-                # Defensive — a bug in a per-file conversion
-                # shouldn't abort the whole batch. Surface as
-                # an error result so the UI shows the specific
-                # file that failed, not a silent drop.
-                logger.exception(
-                    "DocConvert: unhandled error converting %s",
-                    rel_path,
-                )
-                result = self._fail(
-                    rel_path,
-                    f"Internal error: {exc}",
-                )
-            results.append(result)
+        cfg = self._config.doc_convert_config
+        pool = ConvertPool(
+            cfg,
+            workers=self._workers,
+            libreoffice_instances=int(
+                cfg.get("libreoffice_max_instances", 2)
+            ),
+            file_timeout=float(cfg.get("file_timeout_seconds", 600)),
+        )
+        completed = 0
+
+        async def _on_result(result: dict[str, Any]) -> None:
+            nonlocal completed
+            index = completed
+            completed += 1
             await self._send_convert_event({
                 "stage": "file",
                 "index": index,
@@ -673,11 +766,50 @@ class DocConvert:
                 "result": result,
             })
 
+        self._active_pools.add(pool)
+        try:
+            results = await pool.convert(root, paths, _on_result)
+        except Exception as exc:
+            # Defensive — a pool failure (spawn refused, pipe
+            # setup error) must still end the batch with a
+            # complete event naming every file, not leave the
+            # UI stuck on "Converting…".
+            logger.exception("DocConvert: conversion pool failed")
+            results = [
+                self._fail(rel_path, f"Internal error: {exc}")
+                for rel_path in paths
+            ]
+        finally:
+            self._active_pools.discard(pool)
+
         await self._send_convert_event({
             "stage": "complete",
             "results": results,
+            "cancelled": pool.cancelled,
         })
 
+    def cancel_conversion(self) -> dict[str, Any]:
+        """Cancel every in-flight background conversion batch.
+
+        Kills the worker processes (and any LibreOffice they
+        launched). Files in flight or not yet started finish
+        as ``skipped`` with the message ``Cancelled``; the
+        batch's ``complete`` event still arrives. Files that
+        already converted keep their output.
+
+        Returns ``{"status": "cancelled", "batches": N}``, or
+        ``{"status": "idle"}`` when nothing was running.
+        """
+        restricted = self._check_localhost_only()
+        if restricted is not None:
+            return restricted
+        pools = list(self._active_pools)
+        if not pools:
+            return {"status": "idle"}
+        for pool in pools:
+            pool.cancel()
+        return {"status": "cancelled", "batches": len(pools)}
+
     async def _send_convert_event(
         self,
         data: dict[str, Any],
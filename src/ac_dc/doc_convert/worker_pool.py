@@ -0,0 +1,455 @@
+"""Bounded process pool for background document conversion.
+
+``_convert_files_background`` used to convert one file at a
+time on the default thread executor. A batch of a hundred
+PDFs and decks through PyMuPDF and LibreOffice ran serially,
+and a wedged conversion held the batch hostage until
+LibreOffice's own timeout (if the hang was in soffice at
+all — a PyMuPDF page loop has no timeout).
+
+:class:`ConvertPool` runs ``DocConvert._convert_one`` in a
+fixed number of child processes instead.
+
+Design points:
+
+- **Slots, not a ProcessPoolExecutor.** Each worker is a
+  :class:`_Slot` — one spawn-context child plus a duplex
+  pipe, the same shape as
+  :class:`~ac_dc.doc_index.enrichment_worker.EnrichmentWorker`.
+  ``concurrent.futures`` can't kill the one worker that is
+  stuck on a file; a slot can. A file that overruns
+  ``file_timeout`` gets an error result, its child is
+  killed (with any soffice it launched — each child leads
+  its own process group) and the slot respawns on its next
+  file. The rest of the batch carries on.
+
+- **Threads drive the slots.** Every slot is serviced by a
+  thread of a pool-owned executor that blocks on the pipe,
+  so the event loop only sees one awaitable per file and
+  stays responsive, and the server's default executor is
+  not tied up for the length of a batch.
+
+- **Cancellation.** :meth:`ConvertPool.cancel` kills every
+  child. In-flight files and files not yet started come back
+  as ``skipped`` results with the message ``Cancelled``, so
+  the ``complete`` event still lists every requested path.
+
+- **LibreOffice cap.** ``soffice`` is by far the heaviest
+  thing a conversion launches. A permit is held around the
+  soffice call in
+  :class:`~ac_dc.doc_convert.pdf_pipeline.PdfPipeline`, so
+  at most ``libreoffice_instances`` run at once whatever the
+  worker count. The semaphore lives in the parent: a child
+  asks its slot's driver thread for a permit over the pipe
+  and hands it back the same way, so taking, returning and
+  reclaiming a permit all happen in one process under one
+  lock. A child killed at any point — waiting, holding or
+  releasing — can't leak a permit; killing a slot that holds
+  one returns it.
+
+- **Converter factory as a dotted path.** A child builds its
+  converter by importing ``factory`` and calling it with the
+  config snapshot and the LibreOffice permit. The default
+  builds a :class:`~ac_dc.doc_convert.service.DocConvert`
+  over a frozen copy of ``doc_convert_config``; tests pass a
+  light stand-in. Strings survive spawn pickling.
+
+Governing spec: ``specs4/4-features/doc-convert.md``
+§ Progress Events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+# Default converter constructor, as ``module:attribute``.
+_DEFAULT_FACTORY = "ac_dc.doc_convert.worker_pool:build_converter"
+
+# Message carried by results for files the user cancelled.
+CANCELLED_MESSAGE = "Cancelled"
+
+# Pipe messages a child sends mid-conversion to take and hand
+# back a LibreOffice permit. Anything else is a result dict.
+_PERMIT_ACQUIRE = "permit-acquire"
+_PERMIT_RELEASE = "permit-release"
+
+# How often a driver thread waiting for a permit rechecks
+# cancellation and the file deadline.
+_PERMIT_POLL_SECONDS = 0.1
+
+
+def _load_factory(factory: str) -> Any:
+    module_name, _, attr = factory.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class _ConfigView:
+    """Stand-in for ConfigManager inside a worker process.
+
+    DocConvert only reads ``doc_convert_config``; the child
+    gets a snapshot taken when the batch started rather than
+    re-reading config files from disk.
+    """
+
+    def __init__(self, doc_convert_config: dict[str, Any]) -> None:
+        self.doc_convert_config = doc_convert_config
+
+
+class LibreOfficePermit:
+    """Child-side context manager around one soffice permit.
+
+    Entering asks the parent for a permit over the slot's pipe
+    and blocks until it is granted; exiting hands it back. The
+    parent does the semaphore bookkeeping, so it always knows
+    whether a child it kills is holding one.
+    """
+
+    def __init__(self, conn: Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> "LibreOfficePermit":
+        self._conn.send(_PERMIT_ACQUIRE)
+        self._conn.recv()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._conn.send(_PERMIT_RELEASE)
+
+
+def build_converter(
+    doc_convert_config: dict[str, Any],
+    libreoffice_slots: Any,
+) -> Any:
+    """Default child-side factory: a DocConvert over a config snapshot."""
+    from .service import DocConvert
+
+    return DocConvert(
+        _ConfigView(doc_convert_config),
+        libreoffice_slots=libreoffice_slots,
+    )
+
+
+def _slot_main(
+    conn: Connection,
+    factory: str,
+    doc_convert_config: dict[str, Any],
+) -> None:
+    """Child process entry point: convert files until told to stop.
+
+    Requests are ``(root, rel_path)``; replies are result
+    dicts. A ``None`` request (or a closed pipe) ends the
+    loop.
+    """
+    # Lead a process group so a kill from the parent also
+    # reaches any soffice this child launched.
+    if hasattr(os, "setsid"):
+        try:
+            os.setsid()
+        except OSError:
+            pass
+    converter = _load_factory(factory)(
+        doc_convert_config, LibreOfficePermit(conn)
+    )
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+        root, rel_path = request
+        try:
+            result = converter._convert_one(Path(root), rel_path)
+        except Exception as exc:
+            result = {
+                "path": rel_path,
+                "status": "error",
+                "message": f"Internal error: {exc}",
+            }
+        conn.send(result)
+
+
+class _Slot:
+    """One conversion child, respawned on demand.
+
+    Used from a single driver thread at a time; only
+    :meth:`kill` is called from elsewhere (cancellation).
+    """
+
+    def __init__(self, pool: "ConvertPool") -> None:
+        self._pool = pool
+        self._process: Any = None
+        self._conn: Connection | None = None
+        # True while the child holds a permit of the pool's
+        # LibreOffice semaphore. Guarded by ``_kill_lock``.
+        self._holding_permit = False
+        # Cancellation kills from the event loop thread while
+        # the driver thread may be reaping the same child.
+        self._kill_lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            return
+        self._discard()
+        ctx = self._pool._ctx
+        parent_conn, child_conn = ctx.Pipe(duplex=True)
+        process = ctx.Process(
+            target=_slot_main,
+            args=(
+                child_conn,
+                self._pool._factory,
+                self._pool._config,
+            ),
+            name="ac-dc-doc-convert",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+
+    def convert(
+        self, root: Path, rel_path: str, timeout: float
+    ) -> dict[str, Any]:
+        """Convert one file in the child. Never raises."""
+        if self._pool.cancelled:
+            return _cancelled(rel_path)
+        try:
+            self._ensure_started()
+            assert self._conn is not None
+            self._conn.send((str(root), rel_path))
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._conn.poll(remaining):
+                    return self._timed_out(rel_path, timeout)
+                message = self._conn.recv()
+                if message == _PERMIT_ACQUIRE:
+                    if not self._grant_permit(deadline):
+                        if self._pool.cancelled:
+                            self._discard()
+                            return _cancelled(rel_path)
+                        return self._timed_out(rel_path, timeout)
+                elif message == _PERMIT_RELEASE:
+                    self._return_permit()
+                else:
+                    result: dict[str, Any] = message
+                    return result
+        except (EOFError, OSError, ValueError) as exc:
+            exitcode = (
+                self._process.exitcode
+                if self._process is not None else None
+            )
+            self._discard()
+            if self._pool.cancelled:
+                return _cancelled(rel_path)
+            logger.warning(
+                "DocConvert: worker died converting %s "
+                "(exitcode=%s): %s",
+                rel_path, exitcode, exc,
+            )
+            return {
+                "path": rel_path,
+                "status": "error",
+                "message": (
+                    f"Conversion worker crashed (exitcode={exitcode})"
+                ),
+            }
+
+    def _timed_out(self, rel_path: str, timeout: float) -> dict[str, Any]:
+        logger.warning(
+            "DocConvert: %s timed out after %.0fs; killing worker",
+            rel_path, timeout,
+        )
+        self.kill()
+        return {
+            "path": rel_path,
+            "status": "error",
+            "message": f"Conversion timed out after {timeout:.0f}s",
+        }
+
+    def _grant_permit(self, deadline: float) -> bool:
+        """Take a permit for the child and tell it to go ahead.
+
+        Returns False if the batch is cancelled or the file's
+        deadline passes first. Should the child die between the
+        take and the grant, the send fails and the caller's
+        error path discards the slot, which returns the permit.
+        """
+        semaphore = self._pool._semaphore
+        while True:
+            if self._pool.cancelled:
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if semaphore.acquire(
+                timeout=min(remaining, _PERMIT_POLL_SECONDS)
+            ):
+                break
+        with self._kill_lock:
+            self._holding_permit = True
+        assert self._conn is not None
+        self._conn.send(True)
+        return True
+
+    def _return_permit(self) -> None:
+        with self._kill_lock:
+            self._release_permit_locked()
+
+    def _release_permit_locked(self) -> None:
+        if self._holding_permit:
+            self._holding_permit = False
+            self._pool._semaphore.release()
+
+    def kill(self) -> None:
+        """Kill the child and its process group immediately."""
+        with self._kill_lock:
+            process = self._process
+            if process is None or process.pid is None:
+                return
+            if process.exitcode is None:
+                if hasattr(os, "killpg"):
+                    try:
+                        os.killpg(process.pid, signal.SIGKILL)
+                    except OSError:
+                        process.kill()
+                else:
+                    process.kill()
+                process.join(timeout=5)
+            # A dead holder never hands its soffice permit back.
+            self._release_permit_locked()
+
+    def _discard(self) -> None:
+        """Forget a dead (or killed) child."""
+        if self._process is not None:
+            self.kill()
+        if self._conn is not None:
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+    def close(self) -> None:
+        """Ask the child to exit; kill it if it doesn't."""
+        process, conn = self._process, self._conn
+        if conn is not None:
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                pass
+        if process is not None:
+            process.join(timeout=5)
+            if process.is_alive():
+                self.kill()
+        if conn is not None:
+            conn.close()
+        self._process = None
+        self._conn = None
+
+
+def _cancelled(rel_path: str) -> dict[str, Any]:
+    return {
+        "path": rel_path,
+        "status": "skipped",
+        "message": CANCELLED_MESSAGE,
+    }
+
+
+class ConvertPool:
+    """Convert one batch of files across a fixed set of worker processes.
+
+    One pool per batch: construct, await :meth:`convert`, done.
+    :meth:`cancel` may be called from any thread.
+    """
+
+    def __init__(
+        self,
+        doc_convert_config: dict[str, Any],
+        *,
+        workers: int,
+        libreoffice_instances: int,
+        file_timeout: float,
+        factory: str = _DEFAULT_FACTORY,
+    ) -> None:
+        self._config = dict(doc_convert_config)
+        self._workers = max(1, int(workers))
+        self._file_timeout = float(file_timeout)
+        self._factory = factory
+        self._ctx = multiprocessing.get_context("spawn")
+        # Parent-side: slots take and return permits on their
+        # children's behalf (see :class:`LibreOfficePermit`).
+        self._semaphore = threading.BoundedSemaphore(
+            max(1, int(libreoffice_instances))
+        )
+        self._cancel_event = threading.Event()
+        self._slots: list[_Slot] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """Stop the batch: kill in-flight conversions, skip the rest."""
+        self._cancel_event.set()
+        for slot in list(self._slots):
+            slot.kill()
+
+    async def convert(
+        self,
+        root: Path,
+        paths: list[str],
+        on_result: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> list[dict[str, Any]]:
+        """Convert ``paths``; return results in input order.
+
+        ``on_result`` is awaited on the event loop as each file
+        finishes, in completion order.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(paths)
+        queue: deque[tuple[int, str]] = deque(enumerate(paths))
+        count = min(self._workers, len(paths))
+        if count == 0:
+            return []
+        self._slots = [_Slot(self) for _ in range(count)]
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=count, thread_name_prefix="ac-dc-doc-convert",
+        )
+
+        async def _drive(slot: _Slot) -> None:
+            while queue:
+                index, rel_path = queue.popleft()
+                if self.cancelled:
+                    result = _cancelled(rel_path)
+                else:
+                    result = await loop.run_in_executor(
+                        executor, slot.convert,
+                        root, rel_path, self._file_timeout,
+                    )
+                results[index] = result
+                await on_result(result)
+
+        try:
+            await asyncio.gather(*(_drive(slot) for slot in self._slots))
+        finally:
+            await asyncio.gather(*(
+                loop.run_in_executor(executor, slot.close)
+                for slot in self._slots
+            ))
+            executor.shutdown(wait=False)
+        return [r for r in results if r is not None]
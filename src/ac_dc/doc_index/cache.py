@@ -4,9 +4,8 @@
 under ``.ac-dc/doc_cache/`` on top of the in-memory mtime cache
 that :class:`~ac_dc.base_cache.BaseCache` provides. Keyword
 enrichment (Layer 2.8.4) costs ~500ms per file and must survive
-server restarts; the symbol cache is in-memory only because
-tree-sitter re-parse is cheap enough that session-scoped caching
-suffices.
+server restarts. (The symbol cache persists too, but as a single
+pack file — see :mod:`ac_dc.symbol_index.cache`.)
 
 Design notes pinned by specs4/2-indexing/document-index.md:
 
@@ -67,9 +66,8 @@ logger = logging.getLogger(__name__)
 
 
 # Sidecar directory name under the per-repo ``.ac-dc4/`` working
-# directory. Separate from ``symbol_cache/`` (which doesn't
-# exist — symbol cache is in-memory only) so a future migration
-# that wanted to add on-disk symbol persistence wouldn't collide.
+# directory. Distinct from the symbol cache's
+# ``symbol_cache.json`` pack.
 #
 # The parent directory name (``.ac-dc4``) is imported from the
 # config module rather than hardcoded here — ``.ac-dc`` belongs
@@ -91,8 +89,7 @@ class DocCache(BaseCache[DocOutline]):
 
     Construct with a ``repo_root`` to enable on-disk persistence
     (sidecars live at ``{repo_root}/.ac-dc/doc_cache/``).
-    Construct with ``repo_root=None`` for pure in-memory caching
-    (matches :class:`~ac_dc.symbol_index.cache.SymbolCache`).
+    Construct with ``repo_root=None`` for pure in-memory caching.
 
     Lookup semantics match the base class, with one addition:
     :meth:`get` accepts an optional ``keyword_model`` argument
@@ -0,0 +1,350 @@
+"""Out-of-process KeyBERT host for keyword enrichment.
+
+KeyBERT, sentence-transformers and torch used to run inside
+the server process. The enrichment orchestrator's logging
+records why that is uncomfortable: segfaults in the OpenBLAS
+/ loky stack underneath ``extract_keywords`` (fatal to the
+RPC server and every open browser session), and a ~1.2GB
+steady-state RSS plus one-shot spikes large enough to draw
+the OOM killer.
+
+:class:`EnrichmentWorker` moves the model into one long-lived
+child process. It exposes the same ``extract_keywords``
+surface as a KeyBERT instance, so
+:class:`~ac_dc.doc_index.keyword_enricher.KeywordEnricher`
+holds it in place of the model and nothing downstream of the
+candidate lists changes.
+
+Design points:
+
+- **Spawn context, one child.** Same start method as the
+  symbol and doc index process pools — fork would copy the
+  server's threads and sockets. Requests travel over a duplex
+  :class:`multiprocessing.connection.Connection`, one at a
+  time under a lock; the enricher already batches sections
+  (across files, see
+  :meth:`KeywordEnricher.enrich_outlines`), so one request is
+  one large forward pass.
+
+- **Crashes are a failed batch, not a failed server.** A
+  child that dies mid-request (segfault, OOM kill) or stops
+  answering within ``request_timeout`` is reaped and the
+  call raises :class:`EnrichmentWorkerError`. The enricher's
+  existing batch-failure handling turns that into empty
+  keywords for the batch, and the next request starts a
+  fresh child. After ``max_restarts`` consecutive failures
+  without a successful request the worker stops respawning
+  and fails fast, so a model that crashes on load doesn't
+  loop forever.
+
+- **Memory threshold.** Every reply carries the child's RSS.
+  Above ``max_rss_mb`` the child is retired after the reply
+  is delivered and replaced on the next request — a leak or
+  a one-off allocation spike is shed without losing work.
+
+- **Model load happens in the child.** :meth:`start` spawns
+  the child and waits for it to construct the model; a
+  failure there (library missing, download failed) reports
+  back as ``False`` so the enricher degrades to unavailable
+  exactly as an in-process load failure would.
+
+- **Model factory as a dotted path.** The child builds its
+  model by importing ``factory`` (``"keybert:KeyBERT"`` by
+  default) and calling it with ``model=model_name``. A string
+  survives spawn pickling and lets tests substitute a light
+  stand-in.
+
+Governing spec: ``specs4/2-indexing/keyword-enrichment.md``
+§ Enrichment Worker Process.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# Default model constructor, as ``module:attribute``.
+_DEFAULT_FACTORY = "keybert:KeyBERT"
+
+# Model construction may include a first-run download of a
+# few hundred MB, so the startup wait is generous.
+_DEFAULT_LOAD_TIMEOUT = 600.0
+
+# Per-request wait. A forward pass over a large batch takes
+# seconds; minutes means the child is wedged.
+_DEFAULT_REQUEST_TIMEOUT = 300.0
+
+# Retire the child above this resident set size. Steady state
+# for a small sentence-transformer is ~1.2GB.
+_DEFAULT_MAX_RSS_MB = 3072
+
+# Consecutive failed starts/requests before giving up.
+_DEFAULT_MAX_RESTARTS = 3
+
+
+class EnrichmentWorkerError(RuntimeError):
+    """The worker process crashed, hung, or could not be started."""
+
+
+def rss_mb() -> int:
+    """Best-effort resident-set-size of this process in megabytes.
+
+    Reads /proc/self/status on Linux. Returns 0 on platforms
+    without /proc or when the file is unreadable. We avoid
+    pulling in psutil to keep the import surface small; the
+    /proc parse is trivial.
+    """
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    # Format: "VmRSS:    123456 kB"
+                    parts = line.split()
+                    if len(parts) >= 2:
+                        return int(parts[1]) // 1024
+    except Exception:
+        pass
+    return 0
+
+
+def _load_factory(factory: str) -> Any:
+    module_name, _, attr = factory.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _worker_main(conn: Connection, factory: str, model_name: str) -> None:
+    """Child process entry point: load the model, serve requests.
+
+    Replies are ``("ok", payload, rss_mb)`` or
+    ``("error", message, rss_mb)``. A ``None`` request (or a
+    closed pipe) ends the loop.
+    """
+    try:
+        model = _load_factory(factory)(model=model_name)
+    except Exception as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}", rss_mb()))
+        return
+    conn.send(("ok", None, rss_mb()))
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+        texts, kwargs = request
+        try:
+            raw = model.extract_keywords(texts, **kwargs)
+            # Plain tuples/floats — numpy scalars pickle, but
+            # needlessly drag numpy into the parent.
+            payload = [
+                [
+                    (str(e[0]), float(e[1]))
+                    if isinstance(e, tuple) and len(e) == 2 else e
+                    for e in entries
+                ] if isinstance(entries, list) else entries
+                for entries in (raw or [])
+            ]
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}", rss_mb()))
+            continue
+        conn.send(("ok", payload, rss_mb()))
+
+
+class EnrichmentWorker:
+    """A restartable child process hosting the keyword model.
+
+    Drop-in for a KeyBERT instance as far as
+    :class:`KeywordEnricher` is concerned: call
+    :meth:`extract_keywords` with the same arguments.
+    Thread-safe; requests are serialised.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        *,
+        factory: str = _DEFAULT_FACTORY,
+        max_rss_mb: int = _DEFAULT_MAX_RSS_MB,
+        load_timeout: float = _DEFAULT_LOAD_TIMEOUT,
+        request_timeout: float = _DEFAULT_REQUEST_TIMEOUT,
+        max_restarts: int = _DEFAULT_MAX_RESTARTS,
+    ) -> None:
+        self._model_name = model_name
+        self._factory = factory
+        self._max_rss_mb = max_rss_mb
+        self._load_timeout = load_timeout
+        self._request_timeout = request_timeout
+        self._max_restarts = max_restarts
+        self._lock = threading.Lock()
+        self._process: Any = None
+        self._conn: Connection | None = None
+        # Consecutive failures since the last successful
+        # request; reset on success.
+        self._failures = 0
+        # Lifetime counters, for logs and tests.
+        self.starts = 0
+        self.restarts = 0
+        self.last_rss_mb = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> bool:
+        """Spawn the child and wait for the model to load.
+
+        Returns True when the child is serving. False when the
+        model failed to load, the child died during startup,
+        or the restart budget is spent. Idempotent while the
+        child is alive.
+        """
+        with self._lock:
+            try:
+                self._ensure_started()
+            except EnrichmentWorkerError as exc:
+                logger.warning("Enrichment worker unavailable: %s", exc)
+                return False
+            return True
+
+    def close(self) -> None:
+        """Stop the child. A later request starts a new one.
+
+        Doesn't wait out an in-flight request: if one holds the
+        lock for more than a second the child is killed, and
+        that request fails as a crash would.
+        """
+        if self._lock.acquire(timeout=1.0):
+            try:
+                self._stop()
+            finally:
+                self._lock.release()
+            return
+        process = self._process
+        if process is not None:
+            process.kill()
+
+    def _ensure_started(self) -> None:
+        if self.is_running:
+            return
+        if self._process is not None:
+            # Died between requests.
+            self._stop()
+        if self._failures >= self._max_restarts:
+            raise EnrichmentWorkerError(
+                f"gave up after {self._failures} consecutive failures"
+            )
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe(duplex=True)
+        process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._factory, self._model_name),
+            name="ac-dc-enrichment",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        if self.starts:
+            self.restarts += 1
+        self.starts += 1
+        self._process = process
+        self._conn = parent_conn
+        logger.info(
+            "Enrichment worker started (pid=%s, model=%s)",
+            process.pid, self._model_name,
+        )
+        self._receive(self._load_timeout, "model load")
+
+    def _stop(self) -> None:
+        process, conn = self._process, self._conn
+        self._process = None
+        self._conn = None
+        if conn is not None:
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                pass
+            conn.close()
+        if process is not None:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+                process.join(timeout=5)
+
+    def _receive(self, timeout: float, what: str) -> Any:
+        """Wait for one reply; reap the child on any failure."""
+        assert self._conn is not None
+        try:
+            if not self._conn.poll(timeout):
+                raise EnrichmentWorkerError(
+                    f"{what} timed out after {timeout:.0f}s"
+                )
+            status, payload, child_rss = self._conn.recv()
+        except (EOFError, OSError) as exc:
+            exitcode = (
+                self._process.exitcode
+                if self._process is not None else None
+            )
+            self._fail()
+            raise EnrichmentWorkerError(
+                f"worker died during {what} (exitcode={exitcode})"
+            ) from exc
+        except EnrichmentWorkerError:
+            self._fail()
+            raise
+        self.last_rss_mb = child_rss
+        if status != "ok":
+            if what == "model load":
+                self._fail()
+            raise EnrichmentWorkerError(f"{what} failed: {payload}")
+        return payload
+
+    def _fail(self) -> None:
+        self._failures += 1
+        self._stop()
+
+    # ------------------------------------------------------------------
+    # KeyBERT surface
+    # ------------------------------------------------------------------
+
+    def extract_keywords(
+        self, texts: list[str], **kwargs: Any
+    ) -> list[list[tuple[str, float]]]:
+        """Run ``extract_keywords`` in the child process.
+
+        Raises :class:`EnrichmentWorkerError` when the child
+        crashes, hangs, or reports an error; the caller treats
+        that as a failed batch. Retires the child afterwards
+        when its RSS exceeds the threshold.
+        """
+        with self._lock:
+            self._ensure_started()
+            assert self._conn is not None
+            try:
+                self._conn.send((list(texts), kwargs))
+            except (OSError, ValueError) as exc:
+                self._fail()
+                raise EnrichmentWorkerError(
+                    f"worker pipe closed: {exc}"
+                ) from exc
+            result = self._receive(self._request_timeout, "extraction")
+            self._failures = 0
+            if self.last_rss_mb > self._max_rss_mb:
+                logger.info(
+                    "Enrichment worker RSS %dMB over %dMB limit; "
+                    "recycling",
+                    self.last_rss_mb, self._max_rss_mb,
+                )
+                self._stop()
+            return result  # type: ignore[no-any-return]
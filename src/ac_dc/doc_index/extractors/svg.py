@@ -52,6 +52,7 @@ from pathlib import Path
 from ac_dc.doc_index.extractors.base import BaseDocExtractor
 from ac_dc.doc_index.extractors.svg_geometry import (
     BBox,
+    BoxIndex,
     Matrix,
     box_contains,
     circle_bbox,
@@ -481,6 +482,13 @@ def _extract_containment_aware(
        at each level, with texts attached as leaves or as
        the shape's label.
 
+    Steps 2 and 3 query a :class:`BoxIndex` rather than
+    scanning every shape, so exported diagrams with thousands
+    of elements index in near-linear time. The index only
+    narrows the candidates. The exact predicates and the
+    ascending scan order are unchanged, and so are the results,
+    tie-breaks included.
+
     The emission follows three-level labeling:
 
     - **Level 1** — explicit group label (aria-label,
@@ -508,16 +516,22 @@ def _extract_containment_aware(
     # shape, find the smallest ancestor (= smallest larger
     # shape that contains it). Walk backwards through larger
     # shapes.
+    #
+    # Any shape containing this one also contains its top-left
+    # corner, so the spatial index's point query yields every
+    # possible parent.
+    box_index = BoxIndex([s.bbox for s in sorted_shapes])
     for i, shape in enumerate(sorted_shapes):
         # Candidates are shapes BEFORE i (larger area).
         # Among those that contain this shape, pick the
         # smallest — that's the immediate parent in the tree.
         parent_idx: int | None = None
         parent_area = float("inf")
-        for j in range(i):
+        for j in box_index.candidates(shape.bbox.x, shape.bbox.y):
+            if j >= i:
+                # Ascending order — the rest are smaller shapes.
+                break
             candidate = sorted_shapes[j]
-            if j == i:
-                continue
             # Exact-same-bbox case: treat the earlier one
             # (by sort order) as the parent. Avoids a
             # degenerate tree where two identical shapes
@@ -538,7 +552,8 @@ def _extract_containment_aware(
     for text in text_elements:
         best_idx: int | None = None
         best_area = float("inf")
-        for i, shape in enumerate(sorted_shapes):
+        for i in box_index.candidates(text.x, text.y):
+            shape = sorted_shapes[i]
             if point_in_box(shape.bbox, text.x, text.y):
                 if shape.bbox.area < best_area:
                     best_idx = i
@@ -31,6 +31,11 @@ Scope:
   strict-containment test that the containment-tree builder
   (2.8.3d) uses to decide which box is the parent of which.
 
+- **Spatial index.** :class:`BoxIndex` narrows containment
+  queries to the boxes near a point, so the containment-tree
+  builder stays near-linear on diagrams with thousands of
+  shapes.
+
 Coordinate system: all outputs are in root-canvas units
 (viewBox coordinates). Screen-space conversions are the
 frontend's concern, not the extractor's.
@@ -603,4 +608,122 @@ def point_in_box(
         and x <= box.right + eps
         and y >= box.y - eps
         and y <= box.bottom + eps
-    )
\ No newline at end of file
+    )
+
+# ---------------------------------------------------------------------------
+# Spatial index
+# ---------------------------------------------------------------------------
+
+
+# A box spanning more grid cells than this is kept in a side
+# list that every query scans instead of being copied into each
+# cell. Keeps index construction linear when a diagram has a
+# handful of canvas-sized background or swim-lane rects.
+_MAX_CELLS_PER_BOX = 64
+
+
+class BoxIndex:
+    """Uniform-grid index answering "which boxes may contain this point".
+
+    The containment-tree builder asks two questions per element —
+    which larger shapes contain this shape, and which shapes
+    contain this text anchor — and a linear scan per question
+    makes extraction quadratic in the element count. Both reduce
+    to point stabbing: any box that contains a shape also contains
+    the shape's top-left corner, so the candidates are the boxes
+    covering that point.
+
+    The canvas (the union of all boxes, grown by the containment
+    epsilon) is cut into roughly ``sqrt(n) × sqrt(n)`` cells and
+    each box is registered in every cell it overlaps. Boxes
+    covering more than :data:`_MAX_CELLS_PER_BOX` cells, and boxes
+    with non-finite coordinates, go in a side list scanned on
+    every query.
+
+    :meth:`candidates` returns a *superset* of the boxes that
+    satisfy :func:`point_in_box` for the query point, as indices
+    into the input sequence in ascending order. Callers apply the
+    exact predicate themselves, so results — including tie-breaks
+    that depend on scan order — are identical to a linear scan.
+    Degenerate boxes (zero width or height) are never returned;
+    they can't contain anything.
+    """
+
+    __slots__ = (
+        "_count", "_cells", "_always", "_min_x", "_min_y",
+        "_cell_w", "_cell_h", "_cols", "_rows",
+    )
+
+    def __init__(self, boxes: "list[BBox]") -> None:
+        eps = _CONTAINMENT_EPSILON
+        self._count = len(boxes)
+        self._cells: dict[int, list[int]] = {}
+        self._always: list[int] = []
+
+        gridded: list[tuple[int, float, float, float, float]] = []
+        for i, box in enumerate(boxes):
+            if box.width <= 0 or box.height <= 0:
+                continue
+            x0, y0 = box.x - eps, box.y - eps
+            x1, y1 = box.right + eps, box.bottom + eps
+            if not all(map(math.isfinite, (x0, y0, x1, y1))):
+                self._always.append(i)
+                continue
+            gridded.append((i, x0, y0, x1, y1))
+
+        if not gridded:
+            self._min_x = self._min_y = 0.0
+            self._cell_w = self._cell_h = 1.0
+            self._cols = self._rows = 1
+            return
+
+        self._min_x = min(g[1] for g in gridded)
+        self._min_y = min(g[2] for g in gridded)
+        span_x = max(g[3] for g in gridded) - self._min_x
+        span_y = max(g[4] for g in gridded) - self._min_y
+        side = max(1, math.isqrt(len(gridded)))
+        self._cols = side if span_x > 0 else 1
+        self._rows = side if span_y > 0 else 1
+        self._cell_w = span_x / self._cols if span_x > 0 else 1.0
+        self._cell_h = span_y / self._rows if span_y > 0 else 1.0
+
+        for i, x0, y0, x1, y1 in gridded:
+            c0, c1 = self._col(x0), self._col(x1)
+            r0, r1 = self._row(y0), self._row(y1)
+            if (c1 - c0 + 1) * (r1 - r0 + 1) > _MAX_CELLS_PER_BOX:
+                self._always.append(i)
+                continue
+            for r in range(r0, r1 + 1):
+                base = r * self._cols
+                for c in range(c0, c1 + 1):
+                    self._cells.setdefault(base + c, []).append(i)
+        self._always.sort()
+
+    def _col(self, x: float) -> int:
+        col = int(math.floor((x - self._min_x) / self._cell_w))
+        return min(max(col, 0), self._cols - 1)
+
+    def _row(self, y: float) -> int:
+        row = int(math.floor((y - self._min_y) / self._cell_h))
+        return min(max(row, 0), self._rows - 1)
+
+    def candidates(self, x: float, y: float) -> list[int]:
+        """Indices of boxes that may contain ``(x, y)``, ascending.
+
+        The returned list may be shared with the index — treat
+        it as read-only.
+        """
+        if not (math.isfinite(x) and math.isfinite(y)):
+            # Can't locate a cell; fall back to every box and
+            # let the exact predicate decide.
+            return list(range(self._count))
+        # Clamping puts out-of-canvas points in an edge cell;
+        # the exact predicate rejects the boxes found there.
+        cell = self._cells.get(
+            self._row(y) * self._cols + self._col(x)
+        )
+        if not cell:
+            return self._always
+        if not self._always:
+            return cell
+        return sorted(cell + self._always)
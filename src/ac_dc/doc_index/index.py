@@ -48,6 +48,12 @@ Design notes pinned by the test suite and spec:
   None from :meth:`index_file` without error. New format
   support (SVG in 2.8.3) is an entry in the registry plus
   a new extractor class, no orchestrator changes.
+- **Process-pool extraction** — a cold ``index_repo`` with at
+  least ``parallel_min_files`` cache misses shards extraction
+  across ``spawn``-started workers, mirroring the symbol
+  index. Workers return pickled outlines; the parent merges
+  them in file-list order and owns every cache write, so the
+  result is identical to a serial pass.
 - **Two formatters** — one instance for tier assembly
   (no line numbers; 2.8.1 doesn't emit line numbers yet),
   one reserved for future LSP-style consumers. Currently
@@ -57,9 +63,13 @@ Governing spec: ``specs4/2-indexing/document-index.md``.
 """
 from __future__ import annotations
 import logging
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
+from ac_dc.dir_map import DirectoryMap
 from ac_dc.doc_index.cache import DocCache
 from ac_dc.doc_index.extractors import EXTRACTORS, BaseDocExtractor
 from ac_dc.doc_index.formatter import DocFormatter
@@ -88,6 +98,87 @@ _EXCLUDED_DIRS: frozenset[str] = frozenset(
         "build",
     }
 )
+# Largest share of indexed outlines a pass may replace and
+# still update the reference graph incrementally. Matches
+# :data:`ac_dc.symbol_index.index._INCREMENTAL_MAX_FRACTION`.
+_INCREMENTAL_MAX_FRACTION = 0.5
+# Minimum number of cache misses before index_repo switches to
+# the process pool, and files per pool task. Match
+# :mod:`ac_dc.symbol_index.index`'s defaults; below the
+# threshold worker start-up costs more than it saves.
+_DEFAULT_PARALLEL_MIN_FILES = 256
+_DEFAULT_SHARD_SIZE = 64
+# Progress callback — ``(files_done, files_total)``. Invoked
+# from the thread running index_repo.
+ProgressCallback = Callable[[int, int], None]
+
+
+def _extract_outline(
+    extractor: BaseDocExtractor, rel: str, content: str
+) -> "DocOutline | None":
+    """Run ``extractor`` over ``content``; None when it raises.
+
+    Shared by the in-process pipeline and the pool workers so
+    both produce identical outlines.
+    """
+    try:
+        return extractor.extract(Path(rel), content)
+    except Exception as exc:
+        # Defensive — an extractor bug (malformed regex,
+        # unexpected content pattern) shouldn't crash the
+        # whole index pass. Log and return None so the
+        # file is simply absent from the index.
+        logger.warning(
+            "Doc extractor %s failed on %s: %s",
+            extractor.__class__.__name__,
+            rel,
+            exc,
+        )
+        return None
+
+
+# Per-process extractor registry for pool workers. Built on
+# the first shard a worker receives and reused for the rest.
+_worker_extractors: dict[str, BaseDocExtractor] | None = None
+
+
+def _extract_doc_shard(
+    repo_root: str | None,
+    rels: list[str],
+) -> list[tuple[str, "DocOutline | None", bool]]:
+    """Pool worker — extract one shard of documents.
+
+    Returns ``(rel, outline, readable)`` per file.
+    ``readable`` is False when the file couldn't be read (the
+    parent drops it from the index, as the in-process path
+    does); ``outline`` is None when the extractor failed.
+    Outlines travel back pickled — they are plain dataclasses.
+    """
+    global _worker_extractors
+    if _worker_extractors is None:
+        _worker_extractors = {
+            ext: cls() for ext, cls in EXTRACTORS.items()
+        }
+    root = Path(repo_root) if repo_root is not None else None
+    results: list[tuple[str, "DocOutline | None", bool]] = []
+    for rel in rels:
+        absolute = Path(rel)
+        if not absolute.is_absolute() and root is not None:
+            absolute = root / rel
+        try:
+            content = absolute.read_text(
+                encoding="utf-8", errors="replace"
+            )
+        except OSError:
+            results.append((rel, None, False))
+            continue
+        extractor = _worker_extractors[Path(rel).suffix.lower()]
+        results.append(
+            (rel, _extract_outline(extractor, rel, content), True)
+        )
+    return results
+
+
 class DocIndex:
     """Document-index orchestrator.
     Construct with an optional repo root. The root serves two
@@ -104,6 +195,10 @@ class DocIndex:
         repo_root: Path | str | None = None,
         enricher: "KeywordEnricher | None" = None,
         enrichment_config: "EnrichmentConfig | None" = None,
+        *,
+        workers: int = 1,
+        parallel_min_files: int = _DEFAULT_PARALLEL_MIN_FILES,
+        shard_size: int = _DEFAULT_SHARD_SIZE,
     ) -> None:
         """Initialise the orchestrator.
 
@@ -129,6 +224,16 @@ class DocIndex:
             enricher). Defaults to
             :class:`EnrichmentConfig`'s own defaults when
             None.
+        workers
+            Process-pool size for :meth:`index_repo`. 1 (the
+            default) keeps every extraction in-process; 0
+            means one worker per CPU.
+        parallel_min_files
+            Minimum number of cache misses before
+            :meth:`index_repo` uses the pool.
+        shard_size
+            Files per pool task, and the granularity of
+            progress reports.
         """
         self.repo_root: Path | None = (
             Path(repo_root) if repo_root is not None else None
@@ -147,11 +252,14 @@ class DocIndex:
         # is set. Signature hashes over the structural outline
         # (see DocCache._compute_signature_hash).
         self._cache = DocCache(self.repo_root)
-        # Reference index: rebuilt after each index_repo pass.
-        # Per-file index_file calls don't rebuild — would be
-        # incorrect (graph depends on ALL outlines) and
-        # wasteful.
+        # Reference index: updated after each index_repo pass.
+        # Per-file index_file calls don't touch it — the graph
+        # depends on ALL outlines — so the next pass diffs the
+        # outline map against ``_graph_outlines`` (the map the
+        # graph last reflected; None until the first build) and
+        # replays only what changed.
         self._ref_index = DocReferenceIndex()
+        self._graph_outlines: dict[str, "DocOutline"] | None = None
         # Extractor registry: one shared instance per
         # extension. Extractors are stateless across calls so
         # sharing is safe.
@@ -166,7 +274,26 @@ class DocIndex:
         # In-memory outline store. Keys are forward-slash
         # relative paths. Read-only snapshot within a request
         # window (D10); only index_file and index_repo mutate.
-        self._all_outlines: dict[str, "DocOutline"] = {}
+        # A DirectoryMap so dir-block accessors look up a
+        # directory's members instead of filtering every doc.
+        self._all_outlines: DirectoryMap["DocOutline"] = DirectoryMap()
+        # Per-directory dir-block caches — directory →
+        # (inputs key, value). The hash depends only on the
+        # members, their signatures and which of them are in
+        # Active; the rendered block also depends on the
+        # reference graph (a heading's ``←N`` incoming count
+        # moves when a document in another directory adds or
+        # drops a link to it), so it is additionally keyed on
+        # ``_graph_generation``, bumped whenever the graph is
+        # rebuilt or updated.
+        self._dir_block_cache: dict[str, tuple[tuple, str]] = {}
+        self._dir_hash_cache: dict[str, tuple[tuple, str]] = {}
+        self._graph_generation = 0
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        self._workers = workers
+        self._parallel_min_files = max(1, parallel_min_files)
+        self._shard_size = max(1, shard_size)
     # ------------------------------------------------------------------
     # Path normalisation
     # ------------------------------------------------------------------
@@ -312,19 +439,8 @@ class DocIndex:
             self._all_outlines.pop(rel, None)
             self._cache.invalidate(rel)
             return None
-        try:
-            outline = extractor.extract(Path(rel), content)
-        except Exception as exc:
-            # Defensive — an extractor bug (malformed regex,
-            # unexpected content pattern) shouldn't crash the
-            # whole index pass. Log and return None so the
-            # file is simply absent from the index.
-            logger.warning(
-                "Doc extractor %s failed on %s: %s",
-                extractor.__class__.__name__,
-                rel,
-                exc,
-            )
+        outline = _extract_outline(extractor, rel, content)
+        if outline is None:
             return None
         # Repo-file validation for link targets happens in the
         # extractor when it needs the set. For markdown, the
@@ -348,6 +464,7 @@ class DocIndex:
         self,
         file_list: list[str | Path] | None = None,
         keyword_model: str | None = None,
+        progress: ProgressCallback | None = None,
     ) -> None:
         """Index a file list, prune stale entries, rebuild refs.
         The canonical full-repo entry point. Order of
@@ -357,12 +474,17 @@ class DocIndex:
         2. Build the set of repo-relative paths for link
            validation. Passed through to extractors.
         3. Index each file (cache-aware via
-           :meth:`index_file`).
+           :meth:`index_file`), on the process pool when
+           enough of them miss the cache — see
+           :meth:`_index_parallel`.
         4. Prune entries in ``_all_outlines`` and the cache
            whose paths aren't in the new list. Must run BEFORE
-           the reference graph rebuild.
-        5. Rebuild the reference graph from the current
-           ``_all_outlines``.
+           the reference graph update.
+        5. Update the reference graph from the current
+           ``_all_outlines``. Incremental once built — only
+           replaced or removed outlines and the documents
+           linking to them are replayed. The first pass, or
+           one that replaced most outlines, rebuilds.
         Parameters
         ----------
         file_list
@@ -375,6 +497,9 @@ class DocIndex:
             Passed through to :meth:`index_file` for every
             file. 2.8.1 callers pass None; 2.8.4's enrichment
             pipeline passes the real model name.
+        progress
+            Optional ``(files_done, files_total)`` callback,
+            invoked after each shard of extraction.
         """
         if file_list is None:
             if self.repo_root is None:
@@ -411,22 +536,171 @@ class DocIndex:
         # Phase 3: index each file. Errors are swallowed at
         # index_file / _parse_and_store; this loop always
         # continues.
-        for rel in normalised:
-            self.index_file(
-                rel,
-                repo_files=repo_files,
-                keyword_model=keyword_model,
-            )
+        self._index_files(
+            normalised, repo_files, keyword_model, progress
+        )
         # Phase 4: prune stale entries. Run BEFORE the
         # reference graph rebuild — otherwise the rebuild
         # would include edges from/to files we're about to
         # drop.
         self._prune_stale(keep)
-        # Phase 5: rebuild the reference graph from the
-        # current outline set. The reference index's build()
-        # is idempotent — clears prior state and recomputes
-        # from scratch.
-        self._ref_index.build(list(self._all_outlines.values()))
+        # Phase 5: bring the reference graph in line with the
+        # current outline set.
+        self._update_ref_graph()
+        self._graph_outlines = dict(self._all_outlines)
+    def _index_files(
+        self,
+        rels: list[str],
+        repo_files: set[str],
+        keyword_model: str | None,
+        progress: ProgressCallback | None,
+    ) -> None:
+        """Index ``rels`` in order, on the pool when worthwhile."""
+        if self._workers > 1:
+            pending = self._pending_extractions(rels, keyword_model)
+            if len(pending) >= self._parallel_min_files:
+                try:
+                    self._index_parallel(
+                        rels, pending, repo_files,
+                        keyword_model, progress,
+                    )
+                    return
+                except (OSError, BrokenProcessPool) as exc:
+                    # Sandboxes without spawn rights, or a
+                    # worker killed mid-shard. Nothing was
+                    # merged yet, so the serial pass starts
+                    # from a clean slate.
+                    logger.warning(
+                        "Parallel doc indexing failed (%s); "
+                        "falling back to in-process indexing",
+                        exc,
+                    )
+        total = len(rels)
+        for done, rel in enumerate(rels, start=1):
+            self.index_file(
+                rel,
+                repo_files=repo_files,
+                keyword_model=keyword_model,
+            )
+            if progress is not None and (
+                done % self._shard_size == 0 or done == total
+            ):
+                progress(done, total)
+
+    def _pending_extractions(
+        self, rels: list[str], keyword_model: str | None
+    ) -> list[tuple[str, float]]:
+        """Return ``(rel, mtime)`` for files that miss the cache.
+
+        Unreadable files are excluded — :meth:`index_file`
+        drops those in-process.
+        """
+        pending: list[tuple[str, float]] = []
+        for rel in rels:
+            try:
+                mtime = self._absolute_path(rel).stat().st_mtime
+            except OSError:
+                continue
+            if self._cache.get(
+                rel, mtime, keyword_model=keyword_model
+            ) is None:
+                pending.append((rel, mtime))
+        return pending
+
+    def _index_parallel(
+        self,
+        rels: list[str],
+        pending: list[tuple[str, float]],
+        repo_files: set[str],
+        keyword_model: str | None,
+        progress: ProgressCallback | None,
+    ) -> None:
+        """Extract ``pending`` on a process pool, then merge.
+
+        Shards go to ``spawn``-started workers (fork is unsafe
+        in a server process running an event loop and
+        executor threads). Results are merged in ``rels``
+        order once every shard is back, so ``_all_outlines``
+        ends up identical to a serial pass; cache writes
+        happen here, in the parent.
+        """
+        total = len(rels)
+        done = total - len(pending)
+        mtimes = dict(pending)
+        shards = [
+            [rel for rel, _ in pending[i:i + self._shard_size]]
+            for i in range(0, len(pending), self._shard_size)
+        ]
+        repo_root = (
+            str(self.repo_root) if self.repo_root is not None else None
+        )
+        results: dict[str, tuple["DocOutline | None", bool]] = {}
+        with ProcessPoolExecutor(
+            max_workers=min(self._workers, len(shards)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = [
+                pool.submit(_extract_doc_shard, repo_root, shard)
+                for shard in shards
+            ]
+            for future in as_completed(futures):
+                shard_results = future.result()
+                for rel, outline, readable in shard_results:
+                    results[rel] = (outline, readable)
+                done += len(shard_results)
+                if progress is not None:
+                    progress(done, total)
+
+        for rel in rels:
+            outcome = results.get(rel)
+            if outcome is None:
+                # Not sent to the pool — cache hit or
+                # unreadable file.
+                self.index_file(
+                    rel,
+                    repo_files=repo_files,
+                    keyword_model=keyword_model,
+                )
+                continue
+            outline, readable = outcome
+            if not readable:
+                self._all_outlines.pop(rel, None)
+                self._cache.invalidate(rel)
+            elif outline is not None:
+                self._cache.put(
+                    rel, mtimes[rel], outline,
+                    keyword_model=keyword_model,
+                )
+                self._all_outlines[rel] = outline
+
+    def _update_ref_graph(self) -> None:
+        """Rebuild the reference graph, or update it incrementally.
+
+        Outline identity is the change signal — a cache hit
+        hands back the same object, a re-parse a new one.
+        In-place keyword enrichment keeps identity, which is
+        right: keywords don't affect links or headings.
+        """
+        graph_outlines = self._graph_outlines
+        if graph_outlines is None:
+            self._ref_index.build(list(self._all_outlines.values()))
+            self._graph_generation += 1
+            return
+        changed = [
+            outline for rel, outline in self._all_outlines.items()
+            if graph_outlines.get(rel) is not outline
+        ]
+        removed = set(graph_outlines) - set(self._all_outlines)
+        if not changed and not removed:
+            return
+        if (
+            len(changed) + len(removed)
+            > len(self._all_outlines) * _INCREMENTAL_MAX_FRACTION
+        ):
+            self._ref_index.build(list(self._all_outlines.values()))
+        else:
+            self._ref_index.update(changed, removed=removed)
+        self._graph_generation += 1
     def _walk_repo(self) -> list[str]:
         """Walk the repo root and return candidate file paths.
         Returns repo-relative paths (forward-slash normalised).
@@ -555,10 +829,40 @@ class DocIndex:
 
     def get_indexed_directories(self) -> list[str]:
         """Return a sorted list of directories with at least one indexed doc."""
-        dirs: set[str] = set()
-        for path in self._all_outlines:
-            dirs.add(self._dir_of(path))
-        return sorted(dirs)
+        return self._all_outlines.directories()
+
+    def _dir_members(
+        self, directory: str, exclude_active: set[str] | None
+    ) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return sorted ``(eligible, excluded)`` members of a directory."""
+        members = self._all_outlines.files_in(directory)
+        if not exclude_active:
+            return members, ()
+        eligible = tuple(p for p in members if p not in exclude_active)
+        excluded = tuple(p for p in members if p in exclude_active)
+        return eligible, excluded
+
+    def _dir_block_key(
+        self, directory: str, excluded: tuple[str, ...]
+    ) -> tuple[Any, ...]:
+        return (
+            self._all_outlines.dir_version(directory),
+            excluded,
+            self._graph_generation,
+        )
+
+    def get_dir_block_version(
+        self,
+        directory: str,
+        exclude_active: set[str] | None = None,
+    ) -> tuple[Any, ...]:
+        """Return a value that changes whenever the rendered block would.
+
+        Equal versions guarantee byte-identical output from
+        :meth:`get_dir_docs_block` for the same arguments.
+        """
+        _files, excluded = self._dir_members(directory, exclude_active)
+        return self._dir_block_key(directory, excluded)
 
     def get_dir_docs_block(
         self,
@@ -571,22 +875,23 @@ class DocIndex:
         (from :meth:`get_file_doc_block`) for documents in the
         directory, excluding those currently in Active full-text.
         Returns empty string when the directory has no eligible
-        files.
+        files. Cached per directory until a member changes, the
+        directory's share of the Active set does, or the
+        reference graph moves.
         """
-        excluded = exclude_active or set()
-        files = sorted(
-            path for path in self._all_outlines
-            if self._dir_of(path) == directory
-            and path not in excluded
-        )
-        if not files:
-            return ""
+        files, excluded = self._dir_members(directory, exclude_active)
+        key = self._dir_block_key(directory, excluded)
+        cached = self._dir_block_cache.get(directory)
+        if cached is not None and cached[0] == key:
+            return cached[1]
         blocks: list[str] = []
         for path in files:
             block = self.get_file_doc_block(path)
             if block:
                 blocks.append(block)
-        return "\n\n".join(blocks)
+        result = "\n\n".join(blocks)
+        self._dir_block_cache[directory] = (key, result)
+        return result
 
     def get_dir_signature_hash(
         self,
@@ -596,12 +901,11 @@ class DocIndex:
         """Return a stable hash over the directory's doc-outline contents."""
         import hashlib
 
-        excluded = exclude_active or set()
-        files = sorted(
-            path for path in self._all_outlines
-            if self._dir_of(path) == directory
-            and path not in excluded
-        )
+        files, excluded = self._dir_members(directory, exclude_active)
+        key = (self._all_outlines.dir_version(directory), excluded)
+        cached = self._dir_hash_cache.get(directory)
+        if cached is not None and cached[0] == key:
+            return cached[1]
         h = hashlib.sha256()
         for path in files:
             sig = self._cache.get_signature_hash(path) or ""
@@ -609,7 +913,9 @@ class DocIndex:
             h.update(b"\0")
             h.update(sig.encode("utf-8"))
             h.update(b"\0")
-        return h.hexdigest()
+        digest = h.hexdigest()
+        self._dir_hash_cache[directory] = (key, digest)
+        return digest
 
     def get_indexed_files(self) -> list[str]:
         """Return all repo-relative doc paths currently indexed."""
@@ -754,42 +1060,67 @@ class DocIndex:
         doesn't re-read the file, keeping this method
         synchronous and straightforward to test.
         """
-        if self._enricher is None:
-            return None
+        return self.enrich_files([(path, source_text)])[0]
 
-        rel = self._normalise_rel_path(path)
-        outline = self._all_outlines.get(rel)
-        if outline is None:
-            return None
+    def enrich_files(
+        self,
+        items: list[tuple[str | Path, str]],
+    ) -> "list[DocOutline | None]":
+        """Enrich several files in one model batch.
 
-        # Resolve mtime for the cache put. If the file has
-        # vanished between extraction and enrichment, skip —
-        # the next index_repo pass will prune the stale
-        # entry.
-        absolute = self._absolute_path(rel)
-        try:
-            mtime = absolute.stat().st_mtime
-        except OSError:
-            return None
+        Batch form of :meth:`enrich_single_file`: ``items``
+        pairs each path with its source text, the eligible
+        sections of every file go through one
+        :meth:`KeywordEnricher.enrich_outlines` call, and each
+        enriched outline then replaces its cache entry exactly
+        as the single-file path does. Results align with
+        ``items``; a path that would make
+        :meth:`enrich_single_file` return None is None here
+        and doesn't join the batch.
+        """
+        results: list[DocOutline | None] = [None] * len(items)
+        if self._enricher is None:
+            return results
+
+        batch: list[tuple[int, str, float, DocOutline, str]] = []
+        for i, (path, source_text) in enumerate(items):
+            rel = self._normalise_rel_path(path)
+            outline = self._all_outlines.get(rel)
+            if outline is None:
+                continue
+            # Resolve mtime for the cache put. If the file has
+            # vanished between extraction and enrichment, skip
+            # — the next index_repo pass will prune the stale
+            # entry.
+            try:
+                mtime = self._absolute_path(rel).stat().st_mtime
+            except OSError:
+                continue
+            batch.append((i, rel, mtime, outline, source_text))
+        if not batch:
+            return results
 
         # Run enrichment in place. The enricher's own
-        # ensure_loaded check gates; if it fails, the outline
-        # is returned unchanged and we still re-cache it so
-        # the orchestrator doesn't re-queue it forever.
-        self._enricher.enrich_outline(
-            outline,
-            source_text=source_text,
+        # ensure_loaded check gates; if it fails, the outlines
+        # are returned unchanged and we still re-cache them so
+        # the orchestrator doesn't re-queue them forever.
+        self._enricher.enrich_outlines(
+            [(outline, source_text) for *_, outline, source_text in batch],
             config=self._enrichment_config,
         )
 
-        # Replace the cache entry with the enriched outline
-        # and the current model name. Put handles sidecar
-        # persistence; prior entry is overwritten in place.
-        self._cache.put(
-            rel,
-            mtime,
-            outline,
-            keyword_model=self._enricher.model_name,
-        )
-
-        return outline
\ No newline at end of file
+        for i, rel, mtime, outline, _source in batch:
+            # Replace the cache entry with the enriched outline
+            # and the current model name. Put handles sidecar
+            # persistence; prior entry is overwritten in place.
+            self._cache.put(
+                rel,
+                mtime,
+                outline,
+                keyword_model=self._enricher.model_name,
+            )
+            # Enriched in place — same object, new keywords in
+            # the rendered block.
+            self._all_outlines.touch(rel)
+            results[i] = outline
+        return results
\ No newline at end of file
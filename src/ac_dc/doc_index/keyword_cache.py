@@ -0,0 +1,310 @@
+"""Per-section keyword cache for the enricher, with a pack file.
+
+:meth:`KeywordEnricher.enrich_outline` used to send every
+eligible section of a file through the sentence-transformer
+whenever that file needed enrichment. Editing one heading in
+a 200-section markdown file changes the file's mtime, which
+invalidates its :class:`DocCache` entry, which re-queues the
+whole file — and all 200 sections were re-embedded to recover
+keywords for the one that moved.
+
+:class:`KeywordCache` remembers the KeyBERT candidates for
+each section text, so only sections whose text actually
+changed reach the model.
+
+Design points:
+
+- **Keyed by (model, normalised text hash).** The key is the
+  model name plus a SHA-256 of the section text with line-end
+  whitespace and surrounding blank lines removed — editor
+  whitespace churn doesn't miss. A different model never
+  shares entries. The extraction parameters that shape the
+  raw candidate list (n-gram range, candidate count, MMR
+  diversity) are stored on each entry and must match for a
+  hit, so a config change re-extracts rather than serving
+  candidates computed under the old settings.
+
+- **Raw candidates, not final keywords.** The cached value is
+  KeyBERT's candidate list before the per-unit adaptive top-n
+  trim, the min-score filter and the corpus-aware filter. The
+  corpus filter is contrastive across a document's sections,
+  so a section's final keywords depend on its siblings; the
+  candidates don't. The TF-IDF fallback is never cached for
+  the same reason — its vectoriser is fitted on the
+  document's short sections as a corpus.
+
+- **Keyword results, not embeddings.** A cached candidate list
+  already encodes everything the section embedding was used
+  for, and a changed section's old embedding can't be reused.
+  Persisting 384-float vectors per section would multiply the
+  pack size for no saved model calls.
+
+- **One pack file, flushed per pass.** Same layout as
+  :mod:`ac_dc.symbol_index.cache`: one
+  ``.ac-dc4/keyword_cache.json`` read at construction,
+  :meth:`KeywordCache.flush` rewrites it atomically, and the
+  enrichment orchestrator calls it once per pass rather than
+  per file.
+
+- **Bounded, least-recently-used first out.** Old section
+  texts are never explicitly invalidated — there's no path
+  they belong to — so the cache evicts the least recently
+  used entries beyond ``max_entries``. Hits refresh recency,
+  and the pack is written in recency order so it survives a
+  restart.
+
+- **Thread-safe.** Enrichment runs on the aux executor while
+  the event loop reads :meth:`KeywordCache.stats` for status
+  broadcasts; a lock guards the entry map and counters.
+
+Governing spec: ``specs4/2-indexing/keyword-enrichment.md``
+§ Section Keyword Cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from ac_dc.config import _AC_DC_DIR
+
+logger = logging.getLogger(__name__)
+
+
+# Pack file name under the per-repo ``.ac-dc4/`` directory.
+_PACK_FILENAME = "keyword_cache.json"
+
+# Pack schema version. Bump when the serialised shape changes
+# — a mismatch discards the pack and the next pass re-extracts.
+_PACK_VERSION = 1
+
+# Default entry bound. An entry is a few short phrases plus a
+# hash, ~200 bytes serialised, so the default pack tops out
+# around 10MB — comfortably more sections than any one repo's
+# documentation has.
+_DEFAULT_MAX_ENTRIES = 50_000
+
+
+def normalise_section_text(text: str) -> str:
+    """Normalise section text for hashing.
+
+    Strips trailing whitespace from every line and leading /
+    trailing blank lines from the whole text. Interior blank
+    lines and indentation are kept — they are content.
+    """
+    return "\n".join(
+        line.rstrip() for line in text.strip("\n").split("\n")
+    ).strip("\n")
+
+
+def section_text_hash(text: str) -> str:
+    """SHA-256 hex digest of the normalised section text."""
+    return hashlib.sha256(
+        normalise_section_text(text).encode("utf-8")
+    ).hexdigest()
+
+
+class KeywordCache:
+    """Model-keyed cache of KeyBERT candidates per section text.
+
+    Construct with a ``repo_root`` to load and maintain the pack
+    file; with ``repo_root=None`` the cache is purely in-memory.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path | str | None = None,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._repo_root: Path | None = (
+            Path(repo_root) if repo_root is not None else None
+        )
+        self._max_entries = max(1, int(max_entries))
+        # key → {"params": str, "candidates": [[kw, score], ...]},
+        # least recently used first.
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # True when in-memory entries differ from the pack.
+        self._dirty = False
+        # Session counters — lookups since construction.
+        self._hits = 0
+        self._misses = 0
+        if self._repo_root is not None:
+            self._load_all()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(model: str, text: str) -> str:
+        return f"{model}\x00{section_text_hash(text)}"
+
+    def get(
+        self, model: str, text: str, params: str
+    ) -> list[tuple[str, float]] | None:
+        """Return cached candidates for ``text``, or None on a miss.
+
+        ``params`` is the caller's fingerprint of the extraction
+        settings; an entry recorded under different settings is
+        a miss. Every call counts towards :meth:`stats`.
+        """
+        key = self._key(model, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["params"] != params:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return [(kw, score) for kw, score in entry["candidates"]]
+
+    def put(
+        self,
+        model: str,
+        text: str,
+        params: str,
+        candidates: list[tuple[str, float]],
+    ) -> None:
+        """Record ``candidates`` for ``text``; evict beyond the bound."""
+        key = self._key(model, text)
+        with self._lock:
+            self._entries[key] = {
+                "params": params,
+                "candidates": [
+                    (str(kw), float(score)) for kw, score in candidates
+                ],
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Drop every entry and remove the pack file."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = False
+        pack = self._pack_path()
+        if pack is not None and pack.exists():
+            pack.unlink()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Session hit/miss counts, hit rate and entry count.
+
+        ``hit_rate`` is None until the first lookup so a status
+        display can tell "no enrichment yet" from "0% hits".
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": (
+                    round(self._hits / lookups, 3) if lookups else None
+                ),
+                "entries": len(self._entries),
+            }
+
+    # ------------------------------------------------------------------
+    # Pack persistence
+    # ------------------------------------------------------------------
+
+    def _pack_path(self) -> Path | None:
+        if self._repo_root is None:
+            return None
+        return self._repo_root / _AC_DC_DIR / _PACK_FILENAME
+
+    def flush(self) -> None:
+        """Rewrite the pack file if anything changed since the last write.
+
+        Written to a temp file and renamed into place so a crash
+        mid-write leaves the previous pack intact. Disk errors
+        are logged; the in-memory cache stays authoritative.
+        """
+        pack = self._pack_path()
+        if pack is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "version": _PACK_VERSION,
+                "entries": [
+                    [key, entry["params"], entry["candidates"]]
+                    for key, entry in self._entries.items()
+                ],
+            }
+            self._dirty = False
+        tmp_path = pack.with_suffix(".json.tmp")
+        try:
+            pack.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps(
+                    payload, ensure_ascii=False, separators=(",", ":")
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, pack)
+        except OSError as exc:
+            logger.warning(
+                "Failed to write keyword cache %s: %s", pack, exc
+            )
+            with self._lock:
+                self._dirty = True
+
+    def _load_all(self) -> None:
+        """Bulk-load the pack file.
+
+        A missing pack is a cold start. An unreadable pack or
+        a version mismatch is logged and ignored — the next
+        flush overwrites it. Malformed entries are skipped.
+        """
+        pack = self._pack_path()
+        if pack is None:
+            return
+        try:
+            raw = pack.read_text(encoding="utf-8")
+        except OSError:
+            return
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            logger.warning(
+                "Ignoring corrupt keyword cache %s: %s", pack, exc
+            )
+            return
+        if not isinstance(payload, dict):
+            logger.warning("Ignoring keyword cache %s: not an object", pack)
+            return
+        if payload.get("version") != _PACK_VERSION:
+            logger.info(
+                "Keyword cache %s has version %r (expected %d); ignoring",
+                pack, payload.get("version"), _PACK_VERSION,
+            )
+            return
+        entries = payload.get("entries")
+        if not isinstance(entries, list):
+            return
+        # The pack is in recency order; keep the most recent
+        # entries if the bound shrank since it was written.
+        for item in entries[-self._max_entries:]:
+            try:
+                key, params, candidates = item
+                self._entries[str(key)] = {
+                    "params": str(params),
+                    "candidates": [
+                        (str(kw), float(score)) for kw, score in candidates
+                    ],
+                }
+            except (TypeError, ValueError) as exc:
+                logger.debug("Skipping keyword cache entry: %s", exc)
@@ -47,6 +47,27 @@ Design notes pinned here:
   cache; this module just holds the name as state for
   construction.
 
+- **Per-section candidate cache.** An optional
+  :class:`~ac_dc.doc_index.keyword_cache.KeywordCache` holds
+  KeyBERT's candidates per (model, section text). Only
+  sections whose text changed since they were last seen go
+  through the model; everything downstream of the candidate
+  list (adaptive top-n, min-score, corpus filter) re-runs on
+  every pass because it depends on config and siblings.
+
+- **Optional worker process.** With an
+  :class:`~ac_dc.doc_index.enrichment_worker.EnrichmentWorker`
+  attached, the model lives in a child process and the worker
+  stands in for it — same ``extract_keywords`` call, so a
+  crash there is just a failed batch. The availability probe
+  then only locates the libraries rather than importing them,
+  keeping torch out of the server process entirely.
+
+- **Cross-file batches.** :meth:`KeywordEnricher.enrich_outlines`
+  sends the long sections of several files through one
+  ``extract_keywords`` call; TF-IDF and the corpus filter
+  still work per document.
+
 - **No global singleton.** Each :class:`LLMService` constructs
   its own enricher. Parallel-agent mode (Layer 7) wants one
   per agent so the D10 "per-context-manager scoping"
@@ -56,6 +77,7 @@ Design notes pinned here:
 from __future__ import annotations
 
 import importlib
+import importlib.util
 import logging
 import re
 from dataclasses import dataclass
@@ -65,6 +87,8 @@ if TYPE_CHECKING:
     # Forward reference for type hints without paying the import
     # cost on module load. None of these are imported at runtime
     # by this file — the enricher holds them as Any.
+    from ac_dc.doc_index.enrichment_worker import EnrichmentWorker
+    from ac_dc.doc_index.keyword_cache import KeywordCache
     from ac_dc.doc_index.models import DocHeading, DocOutline, DocProseBlock
 
 
@@ -203,6 +227,8 @@ class KeywordEnricher:
     def __init__(
         self,
         model_name: str = _DEFAULT_MODEL_NAME,
+        cache: "KeywordCache | None" = None,
+        worker: "EnrichmentWorker | None" = None,
     ) -> None:
         """Initialise. Does NOT load the model yet — see
         :meth:`ensure_loaded`.
@@ -215,8 +241,17 @@ class KeywordEnricher:
             ``doc_index.keyword_model`` — the cache uses this
             string as part of its hit criterion, so mismatches
             force re-extraction.
+        cache:
+            Optional per-section candidate cache. When None,
+            every eligible long section goes through the model.
+        worker:
+            Optional out-of-process model host. When set, the
+            model is loaded in the worker's child process and
+            never imported here.
         """
         self._model_name = model_name
+        self._cache = cache
+        self._worker = worker
         # Tristate: None=unchecked, True=ready, False=unavailable.
         # Flipping to False is sticky — once we've observed the
         # library missing, we don't retry (avoids repeated
@@ -236,6 +271,11 @@ class KeywordEnricher:
         """The configured sentence-transformer model name."""
         return self._model_name
 
+    @property
+    def cache(self) -> "KeywordCache | None":
+        """The per-section candidate cache, if one is attached."""
+        return self._cache
+
     @property
     def is_loaded(self) -> bool:
         """True when the KeyBERT model is constructed and ready.
@@ -277,7 +317,24 @@ class KeywordEnricher:
         Separate method so tests can patch it. Checks for both
         KeyBERT (primary API) and sentence-transformers (the
         embedding model backend). Either missing → unavailable.
+
+        With a worker attached the modules are only located,
+        not imported — importing would load torch into the
+        server process the worker exists to keep it out of. A
+        broken install then surfaces as a failed model load in
+        the worker instead.
         """
+        if self._worker is not None:
+            for module_name in ("keybert", "sentence_transformers"):
+                if importlib.util.find_spec(module_name) is None:
+                    logger.info(
+                        "Keyword enrichment unavailable — %s is "
+                        "not installed. Install with: pip "
+                        "install 'ac-dc[docs]'",
+                        module_name,
+                    )
+                    return False
+            return True
         for module_name in ("keybert", "sentence_transformers"):
             try:
                 importlib.import_module(module_name)
@@ -330,6 +387,14 @@ class KeywordEnricher:
             return True
         if not self.is_available():
             return False
+        if self._worker is not None:
+            # The worker loads the model in its child process
+            # and stands in for it from here on.
+            if not self._worker.start():
+                self._available = False
+                return False
+            self._model = self._worker
+            return True
         try:
             # Lazy import so module load doesn't pay the cost
             # when the enricher is constructed but never used.
@@ -422,57 +487,84 @@ class KeywordEnricher:
             :class:`EnrichmentConfig`'s default values when
             None.
         """
+        self.enrich_outlines([(outline, source_text)], config)
+        return outline
+
+    def enrich_outlines(
+        self,
+        items: list[tuple["DocOutline", str]],
+        config: EnrichmentConfig | None = None,
+    ) -> list["DocOutline"]:
+        """Enrich several outlines with one KeyBERT batch.
+
+        ``items`` pairs each outline with its source text, as
+        :meth:`enrich_outline` takes them. The long sections of
+        every outline go through a single ``extract_keywords``
+        call — one large forward pass instead of one per file.
+        TF-IDF and the corpus-aware filter stay per outline:
+        both are contrastive against a document's own sections.
+
+        Returns the outlines, mutated in place, in input order.
+        """
+        outlines = [outline for outline, _ in items]
         cfg = config or EnrichmentConfig()
 
         # Graceful degradation: no keywords if the model isn't
         # ready. Callers can still call in a loop without
         # checking availability first; this just no-ops.
         if not self.ensure_loaded():
-            return outline
+            return outlines
 
-        # Step 1 — collect eligible units. Headings need their
-        # section text sliced from the source; prose blocks
-        # carry their text already.
-        units = self._collect_units(outline, source_text, cfg)
-        if not units:
-            return outline
+        # Step 1 — collect eligible units per outline. Headings
+        # need their section text sliced from the source; prose
+        # blocks carry their text already.
+        per_outline = [
+            self._collect_units(outline, source_text, cfg)
+            for outline, source_text in items
+        ]
 
         # Step 2 — partition by length. Below the TF-IDF
         # fallback threshold, use TF-IDF; at or above, use
         # KeyBERT embeddings. The two paths produce the same
         # shape (list of (keyword, score) tuples per unit) so
         # the downstream filter steps are uniform.
-        short_units: list[tuple[Any, str, int]] = []
         long_units: list[tuple[Any, str, int]] = []
-        for unit in units:
-            target, text, lines = unit
-            if len(text) < cfg.tfidf_fallback_chars:
-                short_units.append(unit)
-            else:
-                long_units.append(unit)
-
-        long_results = self._run_keybert_batch(long_units, cfg)
-        short_results = self._run_tfidf_batch(short_units, cfg)
+        short_per_outline: list[list[tuple[Any, str, int]]] = []
+        for units in per_outline:
+            short_units: list[tuple[Any, str, int]] = []
+            for unit in units:
+                if len(unit[1]) < cfg.tfidf_fallback_chars:
+                    short_units.append(unit)
+                else:
+                    long_units.append(unit)
+            short_per_outline.append(short_units)
 
-        # Index by target identity so we can stitch the two
-        # results back into outline order.
+        # Step 3 — one KeyBERT batch across every outline.
+        # Index by target identity so each outline can stitch
+        # its results back into document order.
         by_target: dict[int, list[tuple[str, float]]] = {}
+        long_results = self._run_keybert_batch(long_units, cfg)
         for unit, kws in zip(long_units, long_results):
             by_target[id(unit[0])] = kws
-        for unit, kws in zip(short_units, short_results):
-            by_target[id(unit[0])] = kws
 
-        # Step 5 — corpus-aware document-frequency filter.
-        # Operates on the whole document at once so filtering
-        # is contrastive against siblings.
-        filtered = self._apply_corpus_filter(units, by_target, cfg)
+        for units, short_units in zip(per_outline, short_per_outline):
+            if not units:
+                continue
+            short_results = self._run_tfidf_batch(short_units, cfg)
+            for unit, kws in zip(short_units, short_results):
+                by_target[id(unit[0])] = kws
 
-        # Step 6 — attach keywords in place.
-        for target, _text, _lines in units:
-            kws = filtered.get(id(target), [])
-            target.keywords = [kw for kw, _score in kws]
+            # Step 5 — corpus-aware document-frequency filter.
+            # Operates on the whole document at once so
+            # filtering is contrastive against siblings.
+            filtered = self._apply_corpus_filter(units, by_target, cfg)
 
-        return outline
+            # Step 6 — attach keywords in place.
+            for target, _text, _lines in units:
+                kws = filtered.get(id(target), [])
+                target.keywords = [kw for kw, _score in kws]
+
+        return outlines
 
     # ------------------------------------------------------------------
     # Unit collection
@@ -641,6 +733,11 @@ class KeywordEnricher:
         globally and then trim per-unit to the adaptive value
         and apply the min-score filter.
 
+        With a :class:`KeywordCache` attached, only units whose
+        text misses the cache are sent to KeyBERT; the rest
+        reuse their cached candidate lists. Trim and filter
+        run on both alike.
+
         Returns a list of keyword-score pairs aligned with
         ``units``. Empty list for units with zero keywords
         after filtering.
@@ -650,11 +747,62 @@ class KeywordEnricher:
         if self._model is None:
             return [[] for _ in units]
 
-        texts = [u[1] for u in units]
         # Use the max possible top-n so the adaptive per-unit
         # trim has enough candidates to choose from.
         global_top_n = cfg.top_n + _LARGE_SECTION_TOPN_BONUS
+        params = (
+            f"{cfg.ngram_range[0]}-{cfg.ngram_range[1]}"
+            f":{global_top_n}:{cfg.diversity}"
+        )
+
+        candidates: list[list[tuple[str, float]] | None] = [None] * len(units)
+        if self._cache is not None:
+            for i, unit in enumerate(units):
+                candidates[i] = self._cache.get(
+                    self._model_name, unit[1], params
+                )
+        missing = [i for i, c in enumerate(candidates) if c is None]
+        if missing:
+            extracted = self._extract_candidates(
+                [units[i][1] for i in missing], cfg, global_top_n
+            )
+            if extracted is None:
+                return [[] for _ in units]
+            for i, found in zip(missing, extracted):
+                candidates[i] = found
+                if self._cache is not None:
+                    self._cache.put(
+                        self._model_name, units[i][1], params, found
+                    )
+
+        results: list[list[tuple[str, float]]] = []
+        for (target, text, lines), found in zip(units, candidates):
+            # Per-unit top-n — adaptive bonus for large sections.
+            if lines >= _LARGE_SECTION_LINE_THRESHOLD:
+                per_unit_top_n = cfg.top_n + _LARGE_SECTION_TOPN_BONUS
+            else:
+                per_unit_top_n = cfg.top_n
+
+            # Min-score filter.
+            kept = [
+                (kw, score) for kw, score in (found or [])[:per_unit_top_n]
+                if score >= cfg.min_score
+            ]
+            results.append(kept)
+        return results
+
+    def _extract_candidates(
+        self,
+        texts: list[str],
+        cfg: EnrichmentConfig,
+        global_top_n: int,
+    ) -> list[list[tuple[str, float]]] | None:
+        """Run KeyBERT over ``texts``; normalised candidates per text.
 
+        Returns None when the KeyBERT call itself fails, so the
+        caller degrades the whole batch to empty keyword lists
+        and caches nothing.
+        """
         # Bracket the KeyBERT call with logs so a segfault
         # in the underlying sentence-transformers / joblib /
         # torch / OpenBLAS stack leaves a "we were inside
@@ -686,7 +834,7 @@ class KeywordEnricher:
             logger.warning(
                 "KeyBERT batch extraction failed: %s", exc
             )
-            return [[] for _ in units]
+            return None
         finally:
             logger.debug(
                 "KeyBERT.extract_keywords: exit batch_size=%d",
@@ -702,31 +850,22 @@ class KeywordEnricher:
             raw = [raw]
 
         results: list[list[tuple[str, float]]] = []
-        for (target, text, lines), candidates in zip(units, raw):
-            # Per-unit top-n — adaptive bonus for large sections.
-            if lines >= _LARGE_SECTION_LINE_THRESHOLD:
-                per_unit_top_n = cfg.top_n + _LARGE_SECTION_TOPN_BONUS
-            else:
-                per_unit_top_n = cfg.top_n
-
+        for _text, entries in zip(texts, raw):
             # Normalise: KeyBERT returns (keyword, score) tuples;
             # some callers return plain strings. Defensive
             # coercion to a uniform shape.
             normalised: list[tuple[str, float]] = []
-            for entry in candidates[:per_unit_top_n]:
+            for entry in entries[:global_top_n]:
                 if isinstance(entry, tuple) and len(entry) == 2:
                     kw, score = entry
                     normalised.append((str(kw), float(score)))
                 elif isinstance(entry, str):
                     normalised.append((entry, 1.0))
                 # else: malformed entry — skip silently.
-
-            # Min-score filter.
-            kept = [
-                (kw, score) for kw, score in normalised
-                if score >= cfg.min_score
-            ]
-            results.append(kept)
+            results.append(normalised)
+        # A short KeyBERT answer leaves the tail empty rather
+        # than misaligned.
+        results.extend([] for _ in range(len(texts) - len(results)))
         return results
 
     # ------------------------------------------------------------------
@@ -54,9 +54,16 @@ Design points pinned by the test suite:
   do. Lets doc → SVG pairs cluster together in the tier map.
 
 - **Rebuild is fully idempotent.** :meth:`build` clears all
-  internal state before processing. Orchestrator calls it after
-  every re-index pass; accumulating state across rebuilds would
-  produce stale edges to deleted files.
+  internal state before processing. Orchestrator calls it on
+  the first pass and whenever most files changed; accumulating
+  state across rebuilds would produce stale edges to deleted
+  files.
+
+- **Incremental updates match a rebuild.** Every edge and every
+  heading increment is recorded against the link's source
+  document, so :meth:`update` can retract and replay just the
+  documents a pass touched. Deduplication is per source, which
+  is what makes per-source replay exact.
 
 - **Input is authoritative, not validated.** The orchestrator
   (2.8.1f) assembles the outline list; this class trusts that
@@ -69,7 +76,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from ac_dc.doc_index.models import DocHeading, DocLink, DocOutline
@@ -132,8 +139,8 @@ class DocReferenceIndex:
     """In-memory graph of document-to-document references.
 
     Construct once, call :meth:`build` with a list of outlines,
-    then query. :meth:`build` is idempotent — the orchestrator
-    calls it after every re-index pass.
+    then query. :meth:`build` is idempotent; :meth:`update`
+    applies the outlines a later re-index pass changed.
 
     Queries are cheap — all the heavy work happens during build.
     The stability tracker calls :meth:`file_ref_count` and
@@ -159,6 +166,11 @@ class DocReferenceIndex:
         # clustering step must see every file or newly-created
         # files would never register.
         self._all_files: set[str] = set()
+        # Outline set the graph was built from, and the target
+        # headings each source's links incremented — the undo
+        # log :meth:`update` replays in reverse.
+        self._by_path: dict[str, "DocOutline"] = {}
+        self._heading_increments: dict[str, list["DocHeading"]] = {}
 
     # ------------------------------------------------------------------
     # Build
@@ -190,6 +202,7 @@ class DocReferenceIndex:
         self._outgoing = defaultdict(dict)
         self._incoming = defaultdict(dict)
         self._all_files = set()
+        self._heading_increments = {}
 
         # Reset every heading's incoming count. A previous build
         # left counts on headings we're about to recount; leaving
@@ -207,6 +220,7 @@ class DocReferenceIndex:
         by_path: dict[str, "DocOutline"] = {
             outline.file_path: outline for outline in outlines
         }
+        self._by_path = by_path
 
         # Per-source-heading dedup key set. Keys are
         # (source_file, source_heading_slug, target_file,
@@ -217,22 +231,100 @@ class DocReferenceIndex:
         seen_edges: set[tuple[str, str, str, str]] = set()
 
         for outline in outlines:
-            source_path = outline.file_path
-            # Build a heading-slug → DocHeading lookup for THIS
-            # outline. Also build reverse lookup from raw heading
-            # text to slug for the dedup key.
-            source_slug_to_heading = self._build_slug_map(
-                outline.headings
-            )
+            self._process_outline(outline, by_path, seen_edges)
+
+    def update(
+        self,
+        changed: list["DocOutline"],
+        removed: Iterable[str] = (),
+    ) -> None:
+        """Apply a re-index pass that replaced or dropped some outlines.
+
+        ``changed`` are outlines that are new or replaced since
+        the last build/update; ``removed`` are paths no longer
+        indexed. Only the affected sources are replayed: the
+        changed documents themselves plus every document with
+        a link into a changed or removed one (their heading
+        increments resolved against the old outline and must
+        be re-resolved against the new one).
+
+        Leaves the graph and every heading count exactly as
+        :meth:`build` over the resulting outline set would.
+        """
+        removed_set = set(removed)
+        changed_paths = {outline.file_path for outline in changed}
+        replay: set[str] = set(changed_paths)
+        for path in changed_paths | removed_set:
+            incoming = self._incoming.get(path)
+            if incoming:
+                replay.update(incoming)
+        replay -= removed_set
+
+        touched: set[str] = set()
+        for path in replay | removed_set:
+            touched |= self._retract(path)
+
+        for path in removed_set:
+            self._by_path.pop(path, None)
+        for outline in changed:
+            self._by_path[outline.file_path] = outline
+            self._reset_heading_counts(outline.headings)
 
-            for link in outline.links:
-                self._process_link(
-                    link=link,
-                    source_path=source_path,
-                    source_slug_to_heading=source_slug_to_heading,
-                    by_path=by_path,
-                    seen_edges=seen_edges,
-                )
+        # Fresh dedup set is safe — every key starts with the
+        # source path, and each replayed source was fully
+        # retracted above.
+        seen_edges: set[tuple[str, str, str, str]] = set()
+        for path in sorted(replay):
+            outline = self._by_path.get(path)
+            if outline is not None:
+                self._process_outline(outline, self._by_path, seen_edges)
+
+        # Same membership build() derives: every indexed outline
+        # plus every path some link still targets.
+        self._all_files.update(changed_paths)
+        for path in touched | removed_set:
+            if path not in self._by_path and not self._incoming.get(path):
+                self._all_files.discard(path)
+
+    def _retract(self, source: str) -> set[str]:
+        """Undo every edge and heading increment from ``source``.
+
+        Returns the targets the source had edges to so the
+        caller can re-check their membership.
+        """
+        targets = self._outgoing.pop(source, {})
+        for target in targets:
+            incoming = self._incoming.get(target)
+            if incoming is None:
+                continue
+            incoming.pop(source, None)
+            if not incoming:
+                del self._incoming[target]
+        for heading in self._heading_increments.pop(source, ()):
+            heading.incoming_ref_count -= 1
+        return set(targets)
+
+    def _process_outline(
+        self,
+        outline: "DocOutline",
+        by_path: dict[str, "DocOutline"],
+        seen_edges: set[tuple[str, str, str, str]],
+    ) -> None:
+        """Record every link in one outline."""
+        source_path = outline.file_path
+        # Build a heading-slug → DocHeading lookup for THIS
+        # outline. Also build reverse lookup from raw heading
+        # text to slug for the dedup key.
+        source_slug_to_heading = self._build_slug_map(outline.headings)
+
+        for link in outline.links:
+            self._process_link(
+                link=link,
+                source_path=source_path,
+                source_slug_to_heading=source_slug_to_heading,
+                by_path=by_path,
+                seen_edges=seen_edges,
+            )
 
     def _process_link(
         self,
@@ -309,6 +401,9 @@ class DocReferenceIndex:
         )
         if target_heading is not None:
             target_heading.incoming_ref_count += 1
+            self._heading_increments.setdefault(
+                source_path, []
+            ).append(target_heading)
 
     def _resolve_target_heading(
         self,
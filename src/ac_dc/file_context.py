@@ -33,10 +33,17 @@ Design points pinned by specs4/3-llm/context-model.md:
   (they can infer) and adding one would tempt the LLM to
   respect syntax constraints we can't verify.
 
-- **Tokens computed on demand.** No caching. The
-  :class:`~ac_dc.token_counter.TokenCounter` is cheap; caching
-  would require invalidation on every update and is not worth
-  the complexity.
+- **Per-file hash and token count cached alongside content.**
+  The stability tracker needs a content hash and a token count
+  for every selected file on every turn. Content only changes
+  through :meth:`FileContext.add_file` (and leaves through
+  :meth:`remove_file` / :meth:`clear`), so both are computed
+  lazily on first request and dropped whenever the content
+  they describe changes. A turn with 100k tokens of selected
+  files then hashes and counts nothing it already saw. The
+  fenced prompt rendering and its totals are still computed
+  on demand — they depend on selection order and are only
+  read by the breakdown and budget paths.
 
 Not thread-safe. The orchestrator drives file-context updates
 from a single executor; concurrent add/remove from multiple
@@ -45,6 +52,7 @@ threads is out of scope.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from typing import TYPE_CHECKING
 
@@ -92,6 +100,12 @@ class FileContext:
         self._repo = repo
         # Plain dict — insertion order is what we want.
         self._files: dict[str, str] = {}
+        # Lazily computed per-file metadata, invalidated by any
+        # add_file that changes the content. Token counts are
+        # keyed by the counter's model so a model switch never
+        # serves counts from a different tokenizer.
+        self._hashes: dict[str, str] = {}
+        self._token_counts: dict[str, tuple[str, int]] = {}
 
     # ------------------------------------------------------------------
     # Mutation
@@ -146,6 +160,15 @@ class FileContext:
             # traversal check, and encoding handling. Any failure
             # propagates (RepoError or similar).
             content = self._repo.get_file_content(key)
+        # Re-reads of an unchanged file (the streaming handler
+        # refreshes every modified file, the rebuild path re-adds
+        # the whole selection) keep their cached hash and count.
+        # String equality short-circuits on identity and length,
+        # so the comparison is far cheaper than the rehash it
+        # avoids.
+        if self._files.get(key) != content:
+            self._hashes.pop(key, None)
+            self._token_counts.pop(key, None)
         # dict.__setitem__ preserves existing insertion order
         # when the key is already present — matches our contract.
         self._files[key] = content
@@ -162,11 +185,15 @@ class FileContext:
         idiom is common enough that a silent no-op is useful.
         """
         key = _normalise_rel_path(path)
+        self._hashes.pop(key, None)
+        self._token_counts.pop(key, None)
         return self._files.pop(key, None) is not None
 
     def clear(self) -> None:
         """Drop every file from the context."""
         self._files.clear()
+        self._hashes.clear()
+        self._token_counts.clear()
 
     # ------------------------------------------------------------------
     # Query
@@ -198,6 +225,71 @@ class FileContext:
             return None
         return self._files.get(key)
 
+    def get_content_hash(self, path: str) -> str | None:
+        """Return the SHA-256 hex digest of a file's content.
+
+        None when the file isn't in the context. Computed on
+        first request and cached until the content changes —
+        the stability tracker asks for every selected file's
+        hash on every turn, and almost none of them changed.
+        """
+        try:
+            key = _normalise_rel_path(path)
+        except ValueError:
+            return None
+        content = self._files.get(key)
+        if content is None:
+            return None
+        digest = self._hashes.get(key)
+        if digest is None:
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            self._hashes[key] = digest
+        return digest
+
+    def get_content_token_counts(
+        self,
+        counter: "TokenCounter",
+        paths: list[str] | None = None,
+    ) -> dict[str, int]:
+        """Token counts of raw file content, cached per file.
+
+        Returns a dict keyed by the paths as given (``paths``
+        defaults to every file in insertion order). Paths not
+        in the context are omitted. Counts are of the bare
+        content, not the fenced block — this is what the
+        stability tracker records per ``file:`` item. Cache
+        misses are counted in a single
+        :meth:`~ac_dc.token_counter.TokenCounter.count_many`
+        call.
+        """
+        if paths is None:
+            paths = list(self._files)
+        model = counter.model
+        result: dict[str, int] = {}
+        missing: dict[str, str] = {}
+        for path in paths:
+            try:
+                key = _normalise_rel_path(path)
+            except ValueError:
+                continue
+            if key not in self._files:
+                continue
+            cached = self._token_counts.get(key)
+            if cached is not None and cached[0] == model:
+                result[path] = cached[1]
+            else:
+                missing[path] = key
+        if missing:
+            counts = counter.count_many(
+                [self._files[key] for key in missing.values()]
+            )
+            for (path, key), tokens in zip(missing.items(), counts):
+                self._token_counts[key] = (model, tokens)
+                result[path] = tokens
+        # Preserve the caller's order regardless of which
+        # entries were cache hits.
+        return {path: result[path] for path in paths if path in result}
+
     def get_files(self) -> list[str]:
         """Return the list of paths in insertion order.
 
@@ -0,0 +1,435 @@
+"""Persistent session index for the JSONL history store.
+
+:class:`~ac_dc.history_store.HistoryStore` keeps every message in
+one append-only ``history.jsonl``. Without an index, listing
+sessions or loading one session means reading and ``json.loads``-ing
+every line of a file that grows to hundreds of MB after months of
+use. :class:`HistoryIndex` maintains, per session:
+
+- the byte offset of each of its records (so a session load seeks
+  straight to its lines),
+- the summary the history browser shows (newest timestamp, count,
+  first-message preview and role).
+
+The index lives in memory and is mirrored to a sidecar
+``history.index.json`` next to the JSONL file.
+
+Validation and recovery:
+
+- The sidecar records the JSONL file's size and ``mtime_ns`` at the
+  point it was indexed, plus a hash of the bytes just before that
+  point (the *tail signature*).
+- Unchanged size and mtime → the index is current.
+- The file grew and the tail signature still matches → something
+  appended (our own unflushed appends from a previous run, or
+  another process); only the new tail is scanned.
+- Anything else (shrunk, rewritten, signature mismatch, corrupt or
+  missing sidecar) → full rescan. A full rescan is exactly the cost
+  the store paid on every read before the index existed, so a bad
+  sidecar can never make things slower than the old behaviour.
+
+Appends made through the owning store update the in-memory index
+directly. The sidecar is rewritten after every
+:data:`_FLUSH_EVERY_APPENDS` appends rather than on each one — a
+sidecar that lags the file by a few records only costs a short
+tail scan on the next start. The store flushes the remainder at
+shutdown and on session switch.
+
+Thread-safe — a single lock serialises refresh, append bookkeeping,
+and sidecar writes. The history store is touched from the event
+loop and from executor threads (agent archival, compaction).
+
+Governing spec: ``specs4/3-llm/history.md``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+# Sidecar format version. Bump when the on-disk shape changes;
+# a mismatched version triggers a full rescan rather than a
+# load attempt.
+_INDEX_VERSION = 1
+
+# Number of bytes hashed to form the tail signature. Large
+# enough to span the end of the last indexed record, so a
+# rewrite that happens to preserve the file size prefix
+# still fails validation.
+_TAIL_SIGNATURE_BYTES = 256
+
+# Appends between sidecar rewrites. The sidecar serialises
+# every offset in the history, so rewriting it per append
+# would reintroduce the O(history) cost the index removes.
+_FLUSH_EVERY_APPENDS = 32
+
+
+@dataclass
+class SessionEntry:
+    """Index entry for one session.
+
+    ``offsets`` are byte offsets of each record's line start
+    in write order. ``timestamp`` is the newest record's
+    timestamp; ``preview`` and ``first_role`` describe the
+    first record.
+    """
+
+    offsets: list[int] = field(default_factory=list)
+    timestamp: str = ""
+    preview: str = ""
+    first_role: str = "user"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "offsets": self.offsets,
+            "timestamp": self.timestamp,
+            "preview": self.preview,
+            "first_role": self.first_role,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SessionEntry":
+        offsets = data.get("offsets")
+        if not isinstance(offsets, list) or not all(
+            isinstance(o, int) for o in offsets
+        ):
+            raise ValueError("offsets must be a list of ints")
+        return cls(
+            offsets=list(offsets),
+            timestamp=str(data.get("timestamp", "")),
+            preview=str(data.get("preview", "")),
+            first_role=str(data.get("first_role", "user")),
+        )
+
+
+def make_preview(content: Any, max_chars: int) -> str:
+    """Truncate message content to a one-line preview.
+
+    Shared by the session summary and search hits so both
+    render identically. Non-string content yields an empty
+    preview.
+    """
+    if not isinstance(content, str):
+        return ""
+    preview = content[:max_chars]
+    if len(content) > max_chars:
+        preview = preview.rstrip() + "…"
+    return preview
+
+
+def parse_record_line(raw: bytes) -> dict[str, Any] | None:
+    """Decode one JSONL line into a record dict.
+
+    Blank lines, corrupt JSON (mid-write crashes), and
+    non-object values return None. Corrupt and non-object
+    lines are logged at warning level — the same discipline
+    as the store's full-file reader.
+    """
+    text = raw.decode("utf-8", errors="replace").strip()
+    if not text:
+        return None
+    try:
+        record = json.loads(text)
+    except json.JSONDecodeError as exc:
+        logger.warning("Skipping corrupt history record: %s", exc)
+        return None
+    if not isinstance(record, dict):
+        logger.warning("Skipping history record: not an object")
+        return None
+    return record
+
+
+def tail_signature(path: Path, size: int) -> str | None:
+    """Hash the bytes just before offset ``size`` in ``path``.
+
+    Used to confirm an already-indexed prefix of an
+    append-only file is unchanged before scanning only the
+    bytes after it. Returns ``""`` for an empty prefix and
+    None when the file can't supply ``size`` bytes.
+    """
+    if size <= 0:
+        return ""
+    start = max(0, size - _TAIL_SIGNATURE_BYTES)
+    try:
+        with path.open("rb") as fh:
+            fh.seek(start)
+            data = fh.read(size - start)
+    except OSError:
+        return None
+    if len(data) != size - start:
+        return None
+    return hashlib.sha1(data).hexdigest()
+
+
+class HistoryIndex:
+    """Session → offsets index over one history JSONL file.
+
+    Parameters
+    ----------
+    history_file:
+        The JSONL file being indexed. May not exist yet.
+    index_file:
+        Sidecar path. Created on first flush.
+    preview_chars:
+        Preview truncation length for session summaries.
+    """
+
+    def __init__(
+        self,
+        history_file: Path,
+        index_file: Path,
+        *,
+        preview_chars: int,
+    ) -> None:
+        self._history_file = history_file
+        self._index_file = index_file
+        self._preview_chars = preview_chars
+        self._lock = threading.RLock()
+        self._sessions: dict[str, SessionEntry] = {}
+        # Bookkeeping for the indexed prefix of the file.
+        self._size = 0
+        self._mtime_ns = 0
+        self._loaded = False
+        self._pending_appends = 0
+        # Signature of the bytes just before ``_size``.
+        self._stored_tail = ""
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Re-entrant lock guarding the index.
+
+        The owning store holds it across
+        ``ensure_current`` → write → ``note_append`` so no
+        concurrent refresh can scan a line the store is about
+        to record itself.
+        """
+        return self._lock
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def sessions(self) -> dict[str, SessionEntry]:
+        """Return a snapshot of the session map after validating it.
+
+        The dict is a copy; the entries are live and must be
+        treated as read-only.
+        """
+        with self._lock:
+            self._refresh()
+            return dict(self._sessions)
+
+    def offsets_for(self, session_id: str) -> list[int]:
+        """Return a copy of the record offsets for one session."""
+        with self._lock:
+            self._refresh()
+            entry = self._sessions.get(session_id)
+            return list(entry.offsets) if entry is not None else []
+
+    def ensure_current(self) -> None:
+        """Index any bytes written since the last refresh.
+
+        Called by the store before it appends, so records
+        written by another process land in the index before
+        our own record's offset is recorded.
+        """
+        with self._lock:
+            self._refresh()
+
+    def note_append(self, offset: int, record: dict[str, Any]) -> None:
+        """Record a line the owning store just appended.
+
+        ``offset`` is the byte position the line was written
+        at. The caller has already called
+        :meth:`ensure_current` under the same logical
+        operation, so the indexed prefix ends at ``offset``.
+        """
+        with self._lock:
+            self._add_record(offset, record)
+            try:
+                st = self._history_file.stat()
+            except OSError:
+                return
+            self._size = st.st_size
+            self._mtime_ns = st.st_mtime_ns
+            self._stored_tail = self._tail_signature(self._size) or ""
+            self._pending_appends += 1
+            if self._pending_appends >= _FLUSH_EVERY_APPENDS:
+                self._save()
+
+    def flush(self) -> None:
+        """Write the sidecar now if appends are pending."""
+        with self._lock:
+            if self._pending_appends:
+                self._save()
+
+    def iter_records_at(
+        self, offsets: list[int]
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the records at the given offsets, in order.
+
+        Opens the file once and seeks per record. Lines that no
+        longer parse (file rewritten underneath us between the
+        refresh and the read) are skipped.
+        """
+        if not offsets:
+            return
+        try:
+            fh = self._history_file.open("rb")
+        except OSError:
+            return
+        with fh:
+            for offset in offsets:
+                fh.seek(offset)
+                record = parse_record_line(fh.readline())
+                if record is not None:
+                    yield record
+
+    # ------------------------------------------------------------------
+    # Refresh / validation
+    # ------------------------------------------------------------------
+
+    def _refresh(self) -> None:
+        """Bring the index in line with the JSONL file on disk."""
+        if not self._loaded:
+            self._loaded = True
+            self._load_sidecar()
+        try:
+            st = self._history_file.stat()
+        except OSError:
+            # File missing — nothing indexed.
+            if self._sessions or self._size:
+                self._reset()
+            return
+        if st.st_size == self._size and st.st_mtime_ns == self._mtime_ns:
+            return
+        if st.st_size > self._size and self._tail_matches():
+            self._scan_from(self._size)
+        else:
+            self._reset()
+            self._scan_from(0)
+        self._size = st.st_size
+        self._mtime_ns = st.st_mtime_ns
+        self._save()
+
+    def _reset(self) -> None:
+        self._sessions = {}
+        self._size = 0
+        self._mtime_ns = 0
+
+    def _scan_from(self, start: int) -> None:
+        """Parse records from ``start`` to EOF into the index."""
+        try:
+            fh = self._history_file.open("rb")
+        except OSError:
+            return
+        with fh:
+            fh.seek(start)
+            offset = start
+            for raw in fh:
+                record = parse_record_line(raw)
+                if record is not None:
+                    self._add_record(offset, record)
+                offset += len(raw)
+
+    def _add_record(self, offset: int, record: dict[str, Any]) -> None:
+        sid = record.get("session_id")
+        if not isinstance(sid, str):
+            return
+        entry = self._sessions.get(sid)
+        if entry is None:
+            entry = SessionEntry(
+                preview=make_preview(
+                    record.get("content", "") or "", self._preview_chars
+                ),
+                first_role=record.get("role", "user"),
+            )
+            self._sessions[sid] = entry
+        entry.offsets.append(offset)
+        entry.timestamp = record.get("timestamp", "")
+
+    def _tail_signature(self, size: int) -> str | None:
+        return tail_signature(self._history_file, size)
+
+    def _tail_matches(self) -> bool:
+        """True when the indexed prefix is unchanged on disk."""
+        if self._size == 0:
+            return True
+        expected = self._stored_tail
+        if not expected:
+            return False
+        return self._tail_signature(self._size) == expected
+
+    # ------------------------------------------------------------------
+    # Sidecar persistence
+    # ------------------------------------------------------------------
+
+    def _load_sidecar(self) -> None:
+        """Populate the index from the sidecar, if valid."""
+        try:
+            raw = self._index_file.read_text(encoding="utf-8")
+        except OSError:
+            return
+        try:
+            data = json.loads(raw)
+            if not isinstance(data, dict):
+                raise ValueError("sidecar is not an object")
+            if data.get("version") != _INDEX_VERSION:
+                raise ValueError("sidecar version mismatch")
+            sessions = {
+                str(sid): SessionEntry.from_dict(entry)
+                for sid, entry in data.get("sessions", {}).items()
+            }
+            size = int(data["size"])
+            mtime_ns = int(data["mtime_ns"])
+            tail = str(data.get("tail", ""))
+        except (ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.warning(
+                "Ignoring unreadable history index %s: %s",
+                self._index_file, exc,
+            )
+            return
+        self._sessions = sessions
+        self._size = size
+        self._mtime_ns = mtime_ns
+        self._stored_tail = tail
+
+    def _save(self) -> None:
+        """Atomically rewrite the sidecar."""
+        tail = self._tail_signature(self._size)
+        if tail is None:
+            return
+        self._stored_tail = tail
+        payload = {
+            "version": _INDEX_VERSION,
+            "size": self._size,
+            "mtime_ns": self._mtime_ns,
+            "tail": tail,
+            "sessions": {
+                sid: entry.to_dict()
+                for sid, entry in self._sessions.items()
+            },
+        }
+        tmp_path = self._index_file.with_suffix(".json.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps(payload, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self._index_file)
+        except OSError as exc:
+            logger.warning(
+                "Failed to write history index %s: %s",
+                self._index_file, exc,
+            )
+            return
+        self._pending_appends = 0
@@ -0,0 +1,465 @@
+"""Full-text search index over conversation history.
+
+:meth:`HistoryStore.search_messages` used to lowercase and
+substring-scan every record on every keystroke from the history
+browser. :class:`HistorySearchIndex` keeps an on-disk inverted
+index instead — SQLite's FTS5 module, which stores per-token
+postings with positions (phrase queries), ranks with BM25, and
+supports prefix queries and incremental inserts. SQLite ships
+with the standard library, so this adds no dependency.
+
+Indexed sources:
+
+- ``history.jsonl`` — the main conversation store.
+- ``agents/{turn_id}/agent-NN.jsonl`` — agent turn archives.
+
+Each source's indexed extent (byte size, mtime, tail signature)
+is recorded in a ``sources`` table. Records appended through the
+owning store are inserted immediately; anything else (another
+process, a crash before insertion, a hand-edited file) is caught
+up on the next query by scanning only the bytes past the
+recorded extent, or by reindexing that one source when its
+indexed prefix no longer matches. Agent archives are
+reconciled against the filesystem once per store lifetime and
+then maintained by the append path.
+
+Query language, deliberately small:
+
+- Bare words match case-insensitively as *prefixes* of indexed
+  tokens, so results keep appearing while the user is still
+  typing a word.
+- ``"quoted text"`` matches an exact token sequence.
+- All terms must match (implicit AND).
+
+Queries with no word characters (``->``, ``{}``) fall back to the
+substring scan the store used before, as does everything when the
+interpreter's SQLite lacks FTS5.
+
+Governing spec: ``specs4/3-llm/history.md`` § Search.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from ac_dc.history_index import make_preview, parse_record_line, tail_signature
+
+logger = logging.getLogger(__name__)
+
+
+# Source key for the main store. Agent archives use their
+# path relative to the ``.ac-dc4/`` directory.
+MAIN_SOURCE = "history.jsonl"
+
+# Schema version stored in the ``meta`` table. A mismatch drops
+# and rebuilds every table — the index is a cache over the
+# JSONL files and can always be regenerated.
+_SCHEMA_VERSION = "1"
+
+# Word tokens, matching what FTS5's unicode61 tokenizer treats
+# as token characters closely enough for query construction.
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Quoted phrase in a query string.
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+
+
+def build_match_expression(query: str) -> str | None:
+    """Translate a user query into an FTS5 MATCH expression.
+
+    Returns None when the query contains no word tokens —
+    the caller falls back to substring search. Every token is
+    emitted as a double-quoted FTS5 string so user input can
+    never be interpreted as FTS5 operators.
+    """
+    terms: list[str] = []
+    for phrase in _PHRASE_RE.findall(query):
+        words = _WORD_RE.findall(phrase.lower())
+        if words:
+            terms.append('"' + " ".join(words) + '"')
+    remainder = _PHRASE_RE.sub(" ", query)
+    for word in _WORD_RE.findall(remainder.lower()):
+        terms.append(f'"{word}"*')
+    if not terms:
+        return None
+    return " ".join(terms)
+
+
+class HistorySearchIndex:
+    """FTS5-backed search over the main store and agent archives.
+
+    Parameters
+    ----------
+    ac_dc_dir:
+        The per-repo working directory holding
+        ``history.jsonl`` and ``agents/``.
+    db_path:
+        SQLite database file for the index.
+    preview_chars:
+        Preview truncation length for hits.
+
+    Construct once per :class:`HistoryStore`. When the database
+    can't be opened or FTS5 is unavailable, :attr:`available`
+    is False and the store keeps using its substring scan.
+    """
+
+    def __init__(
+        self,
+        ac_dc_dir: Path,
+        db_path: Path,
+        *,
+        preview_chars: int,
+    ) -> None:
+        self._ac_dc_dir = ac_dc_dir
+        self._db_path = db_path
+        self._preview_chars = preview_chars
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        # Agent archives are reconciled against the filesystem
+        # once; afterwards the append path keeps them current.
+        self._agents_reconciled = False
+        self._open_failed = False
+
+    # ------------------------------------------------------------------
+    # Connection / schema
+    # ------------------------------------------------------------------
+
+    @property
+    def available(self) -> bool:
+        """True when the index can serve queries."""
+        return self._connection() is not None
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._open_failed:
+            return self._conn
+        with self._lock:
+            if self._conn is not None or self._open_failed:
+                return self._conn
+            try:
+                conn = sqlite3.connect(
+                    str(self._db_path), check_same_thread=False
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._ensure_schema(conn)
+            except sqlite3.Error as exc:
+                logger.warning(
+                    "History search index unavailable (%s); "
+                    "falling back to substring search",
+                    exc,
+                )
+                self._open_failed = True
+                return None
+            self._conn = conn
+            return conn
+
+    @staticmethod
+    def _ensure_schema(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta "
+            "(key TEXT PRIMARY KEY, value TEXT)"
+        )
+        row = conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema'"
+        ).fetchone()
+        if row is not None and row[0] == _SCHEMA_VERSION:
+            return
+        conn.execute("DROP TABLE IF EXISTS messages")
+        conn.execute("DROP TABLE IF EXISTS sources")
+        conn.execute(
+            "CREATE VIRTUAL TABLE messages USING fts5("
+            "content, "
+            "message_id UNINDEXED, session_id UNINDEXED, "
+            "role UNINDEXED, timestamp UNINDEXED, "
+            "source UNINDEXED, turn_id UNINDEXED, "
+            "agent_idx UNINDEXED, "
+            "tokenize = 'unicode61', prefix = '2 3')"
+        )
+        conn.execute(
+            "CREATE TABLE sources ("
+            "path TEXT PRIMARY KEY, size INTEGER, "
+            "mtime_ns INTEGER, tail TEXT)"
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) "
+            "VALUES ('schema', ?)",
+            (_SCHEMA_VERSION,),
+        )
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    def note_append(
+        self,
+        source: str,
+        offset: int,
+        end: int,
+        record: dict[str, Any],
+    ) -> None:
+        """Index a record the owning store just appended.
+
+        ``offset`` and ``end`` bound the record's line. Only
+        inserted when ``offset`` is exactly where the
+        source's indexed extent ends. Otherwise something was
+        written in between that we haven't seen; the record is
+        left for the next query's catch-up scan so nothing is
+        indexed twice or skipped.
+        """
+        conn = self._connection()
+        if conn is None:
+            return
+        path = self._ac_dc_dir / source
+        with self._lock:
+            try:
+                row = conn.execute(
+                    "SELECT size FROM sources WHERE path = ?",
+                    (source,),
+                ).fetchone()
+                indexed = row[0] if row is not None else 0
+                if indexed != offset:
+                    return
+                self._insert(conn, source, record)
+                self._record_extent(conn, source, path, end)
+                conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning(
+                    "History search index update failed: %s", exc
+                )
+
+    def refresh(self) -> None:
+        """Catch the index up with every source on disk."""
+        conn = self._connection()
+        if conn is None:
+            return
+        with self._lock:
+            try:
+                self._sync_source(conn, MAIN_SOURCE)
+                if not self._agents_reconciled:
+                    self._reconcile_agents(conn)
+                    self._agents_reconciled = True
+                conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning(
+                    "History search index refresh failed: %s", exc
+                )
+
+    def _reconcile_agents(self, conn: sqlite3.Connection) -> None:
+        agents_dir = self._ac_dc_dir / "agents"
+        on_disk: set[str] = set()
+        if agents_dir.is_dir():
+            for path in agents_dir.glob("*/agent-*.jsonl"):
+                rel = path.relative_to(self._ac_dc_dir).as_posix()
+                on_disk.add(rel)
+                self._sync_source(conn, rel)
+        known = {
+            row[0] for row in conn.execute(
+                "SELECT path FROM sources WHERE path != ?",
+                (MAIN_SOURCE,),
+            )
+        }
+        for gone in known - on_disk:
+            self._drop_source(conn, gone)
+
+    def _sync_source(self, conn: sqlite3.Connection, source: str) -> None:
+        """Bring one source's rows in line with its file."""
+        path = self._ac_dc_dir / source
+        row = conn.execute(
+            "SELECT size, mtime_ns, tail FROM sources WHERE path = ?",
+            (source,),
+        ).fetchone()
+        try:
+            st = path.stat()
+        except OSError:
+            if row is not None:
+                self._drop_source(conn, source)
+            return
+        if row is not None:
+            size, mtime_ns, tail = row
+            if st.st_size == size and st.st_mtime_ns == mtime_ns:
+                return
+            if st.st_size > size and tail_signature(path, size) == tail:
+                end = self._scan(conn, source, path, size)
+                self._record_extent(conn, source, path, end)
+                return
+            self._drop_source(conn, source)
+        end = self._scan(conn, source, path, 0)
+        self._record_extent(conn, source, path, end)
+
+    def _scan(
+        self,
+        conn: sqlite3.Connection,
+        source: str,
+        path: Path,
+        start: int,
+    ) -> int:
+        """Index complete lines from ``start``; return where it stopped.
+
+        A trailing line without its newline is a write still in
+        progress — it's left for the next catch-up rather than
+        skipped as corrupt.
+        """
+        try:
+            fh = path.open("rb")
+        except OSError:
+            return start
+        end = start
+        with fh:
+            fh.seek(start)
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break
+                record = parse_record_line(raw)
+                if record is not None:
+                    self._insert(conn, source, record)
+                end += len(raw)
+        return end
+
+    @staticmethod
+    def _insert(
+        conn: sqlite3.Connection,
+        source: str,
+        record: dict[str, Any],
+    ) -> None:
+        content = record.get("content", "")
+        if not isinstance(content, str):
+            return
+        agent_idx = record.get("agent_idx")
+        conn.execute(
+            "INSERT INTO messages (content, message_id, session_id, "
+            "role, timestamp, source, turn_id, agent_idx) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                content,
+                record.get("id", ""),
+                record.get("session_id", ""),
+                record.get("role", "user"),
+                record.get("timestamp", ""),
+                source,
+                record.get("turn_id", ""),
+                agent_idx if isinstance(agent_idx, int) else None,
+            ),
+        )
+
+    @staticmethod
+    def _record_extent(
+        conn: sqlite3.Connection, source: str, path: Path, size: int
+    ) -> None:
+        """Record that ``source`` is indexed up to byte ``size``.
+
+        The mtime is only stored when ``size`` covers the whole
+        file; otherwise a zero mtime forces the next refresh to
+        look at the remaining bytes.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return
+        mtime_ns = st.st_mtime_ns if st.st_size == size else 0
+        conn.execute(
+            "INSERT OR REPLACE INTO sources (path, size, mtime_ns, tail) "
+            "VALUES (?, ?, ?, ?)",
+            (source, size, mtime_ns, tail_signature(path, size) or ""),
+        )
+
+    @staticmethod
+    def _drop_source(conn: sqlite3.Connection, source: str) -> None:
+        conn.execute("DELETE FROM messages WHERE source = ?", (source,))
+        conn.execute("DELETE FROM sources WHERE path = ?", (source,))
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        match: str,
+        *,
+        role: str | None = None,
+        session_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        include_agents: bool = True,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Run a MATCH expression and return ranked hits.
+
+        ``match`` comes from :func:`build_match_expression`.
+        Hits are ordered by BM25 relevance, newest first among
+        equal scores. ``since`` / ``until`` are inclusive ISO
+        8601 bounds compared lexicographically (the store's
+        timestamp format sorts chronologically).
+        """
+        conn = self._connection()
+        if conn is None:
+            return []
+        self.refresh()
+        clauses = ["messages MATCH ?"]
+        params: list[Any] = [match]
+        if role:
+            clauses.append("role = ?")
+            params.append(role)
+        if session_id:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp <= ?")
+            params.append(until)
+        if not include_agents:
+            clauses.append("source = ?")
+            params.append(MAIN_SOURCE)
+        sql = (
+            "SELECT message_id, session_id, role, timestamp, source, "
+            "turn_id, agent_idx, content, bm25(messages) AS score "
+            "FROM messages WHERE " + " AND ".join(clauses) +
+            " ORDER BY score, timestamp DESC, rowid DESC"
+            " LIMIT ? OFFSET ?"
+        )
+        params.append(-1 if limit is None else max(0, limit))
+        params.append(max(0, offset))
+        with self._lock:
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            except sqlite3.Error as exc:
+                logger.warning("History search query failed: %s", exc)
+                return []
+        hits: list[dict[str, Any]] = []
+        for (
+            message_id, sid, hit_role, timestamp, source,
+            turn_id, agent_idx, content, score,
+        ) in rows:
+            hit: dict[str, Any] = {
+                "session_id": sid,
+                "message_id": message_id,
+                "role": hit_role,
+                "content_preview": make_preview(
+                    content, self._preview_chars
+                ),
+                "timestamp": timestamp,
+                "source": "main" if source == MAIN_SOURCE else "agent",
+                # BM25 is negative-is-better; flip so callers
+                # see higher-is-better.
+                "score": -float(score),
+            }
+            if source != MAIN_SOURCE:
+                hit["turn_id"] = turn_id
+                hit["agent_idx"] = agent_idx
+            hits.append(hit)
+        return hits
@@ -23,8 +23,11 @@ Design points pinned by specs4/3-llm/history.md:
   user message before the LLM call starts — intentional so a
   mid-stream crash preserves user intent rather than losing it.
 - **Session IDs group messages.** No dedicated "session"
-  document exists on disk; sessions are emergent from the set
-  of records sharing a session_id. Listing sessions is a scan.
+  document exists in the JSONL; sessions are emergent from the
+  set of records sharing a session_id. A sidecar
+  :class:`~ac_dc.history_index.HistoryIndex` maps each session
+  to its record offsets and summary, so listing sessions and
+  loading one session seek instead of rescanning the file.
 - **Retrieval asymmetry.** Two read paths exist:
   ``get_session_messages`` returns full metadata for the history
   browser; ``get_session_messages_for_context`` returns a
@@ -47,6 +50,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from ac_dc.history_index import HistoryIndex, make_preview
+from ac_dc.history_search import (
+    MAIN_SOURCE,
+    HistorySearchIndex,
+    build_match_expression,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +70,8 @@ logger = logging.getLogger(__name__)
 # practice the caller (LLMService) composes the path from repo_root.
 
 _HISTORY_FILENAME = "history.jsonl"
+_HISTORY_INDEX_FILENAME = "history.index.json"
+_HISTORY_SEARCH_DB_FILENAME = "history_search.db"
 _IMAGES_DIRNAME = "images"
 
 # Agent turn archive layout. Per specs4/3-llm/history.md § Agent
@@ -145,8 +157,11 @@ class HistoryStore:
     (typically from :attr:`ConfigManager.ac_dc_dir`). Creates the
     JSONL file and images subdirectory if they don't exist.
 
-    All read methods open the JSONL file fresh each call — no
-    caching, no lock. The JSONL file format is forward-compatible:
+    Session listing and per-session reads go through a
+    :class:`~ac_dc.history_index.HistoryIndex` validated against
+    the JSONL file's size and mtime on every call, so external
+    appends and rewrites are still picked up. The JSONL file
+    format is forward-compatible:
     older records with missing fields are tolerated, newer records
     with extra fields round-trip through the JSON load.
     """
@@ -165,6 +180,20 @@ class HistoryStore:
         """
         self._ac_dc_dir = Path(ac_dc_dir)
         self._history_file = self._ac_dc_dir / _HISTORY_FILENAME
+        # Session → offsets index. Lazily loaded from its sidecar
+        # (or built by one scan) on first use.
+        self._index = HistoryIndex(
+            self._history_file,
+            self._ac_dc_dir / _HISTORY_INDEX_FILENAME,
+            preview_chars=_PREVIEW_MAX_CHARS,
+        )
+        # Full-text index over the main store and agent
+        # archives. The database opens lazily on first use.
+        self._search_index = HistorySearchIndex(
+            self._ac_dc_dir,
+            self._ac_dc_dir / _HISTORY_SEARCH_DB_FILENAME,
+            preview_chars=_PREVIEW_MAX_CHARS,
+        )
         self._images_dir = self._ac_dc_dir / _IMAGES_DIRNAME
         # Agents root — parent of per-turn subdirectories. Not
         # created here; we create it lazily on the first
@@ -549,16 +578,37 @@ class HistoryStore:
             if persisted_blocks:
                 record["agent_blocks"] = persisted_blocks
 
-        # Append one line. Open in append-text mode; on POSIX
-        # this is atomic for a single write call under the pipe
-        # buffer size (4096 bytes), which JSONL records easily
-        # fit within. Crashes mid-write leave a partial line
-        # that the reader's per-line try/except tolerates.
-        line = json.dumps(record, ensure_ascii=False)
-        with self._history_file.open("a", encoding="utf-8") as fh:
-            fh.write(line + "\n")
+        # Append one line. Open in append mode; on POSIX this is
+        # atomic for a single write call under the pipe buffer
+        # size (4096 bytes), which JSONL records easily fit
+        # within. Crashes mid-write leave a partial line that
+        # the reader's per-line try/except tolerates.
+        #
+        # The index lock spans refresh → write → bookkeeping so
+        # the offset we record is exactly where our line landed
+        # and a concurrent reader's refresh can't index it twice.
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._index.lock:
+            self._index.ensure_current()
+            data = line.encode("utf-8")
+            with self._history_file.open("ab") as fh:
+                offset = fh.tell()
+                fh.write(data)
+            self._index.note_append(offset, record)
+            self._search_index.note_append(
+                MAIN_SOURCE, offset, offset + len(data), record
+            )
         return record
 
+    def flush(self) -> None:
+        """Write the session index sidecar if appends are pending.
+
+        The sidecar is otherwise rewritten only every few dozen
+        appends. Called at shutdown and on session switch so
+        the next start doesn't re-scan the unflushed tail.
+        """
+        self._index.flush()
+
     # ------------------------------------------------------------------
     # Raw record iteration
     # ------------------------------------------------------------------
@@ -596,6 +646,20 @@ class HistoryStore:
                     )
         return records
 
+    def _session_records(
+        self, session_id: str
+    ) -> list[dict[str, Any]]:
+        """Return one session's records by seeking via the index.
+
+        Records whose ``session_id`` no longer matches (file
+        rewritten between index refresh and read) are dropped.
+        """
+        offsets = self._index.offsets_for(session_id)
+        return [
+            rec for rec in self._index.iter_records_at(offsets)
+            if rec.get("session_id") == session_id
+        ]
+
     # ------------------------------------------------------------------
     # Session listing
     # ------------------------------------------------------------------
@@ -620,39 +684,19 @@ class HistoryStore:
             the first ~100 chars of the first message's content;
             ``first_role`` is that first message's role.
         """
-        records = self._iter_records()
-        if not records:
-            return []
-
-        # Group by session_id, keeping first and last records.
-        first_by_session: dict[str, dict[str, Any]] = {}
-        last_by_session: dict[str, dict[str, Any]] = {}
-        count_by_session: dict[str, int] = {}
-        for rec in records:
-            sid = rec.get("session_id")
-            if not isinstance(sid, str):
-                continue
-            if sid not in first_by_session:
-                first_by_session[sid] = rec
-            last_by_session[sid] = rec
-            count_by_session[sid] = count_by_session.get(sid, 0) + 1
-
-        summaries: list[SessionSummary] = []
-        for sid, first in first_by_session.items():
-            last = last_by_session[sid]
-            content = first.get("content", "") or ""
-            preview = content[:_PREVIEW_MAX_CHARS]
-            if len(content) > _PREVIEW_MAX_CHARS:
-                preview = preview.rstrip() + "…"
-            summaries.append(
-                SessionSummary(
-                    session_id=sid,
-                    timestamp=last.get("timestamp", ""),
-                    message_count=count_by_session[sid],
-                    preview=preview,
-                    first_role=first.get("role", "user"),
-                )
+        # Summaries come straight from the session index — no
+        # record is parsed unless the JSONL changed since the
+        # last refresh.
+        summaries = [
+            SessionSummary(
+                session_id=sid,
+                timestamp=entry.timestamp,
+                message_count=len(entry.offsets),
+                preview=entry.preview,
+                first_role=entry.first_role,
             )
+            for sid, entry in self._index.sessions().items()
+        ]
 
         # Sort by latest-message timestamp descending (newest
         # first). ISO 8601 lexicographic sort matches
@@ -691,9 +735,7 @@ class HistoryStore:
         raises. The browser handles empty sessions gracefully.
         """
         result: list[dict[str, Any]] = []
-        for rec in self._iter_records():
-            if rec.get("session_id") != session_id:
-                continue
+        for rec in self._session_records(session_id):
             shape = dict(rec)
             refs = shape.get("image_refs")
             if isinstance(refs, list) and refs:
@@ -739,9 +781,7 @@ class HistoryStore:
         documented for backward compatibility).
         """
         result: list[dict[str, Any]] = []
-        for rec in self._iter_records():
-            if rec.get("session_id") != session_id:
-                continue
+        for rec in self._session_records(session_id):
             raw_content = rec.get("content", "")
             shape: dict[str, Any] = {
                 "role": rec.get("role", "user"),
@@ -798,56 +838,127 @@ class HistoryStore:
         query: str,
         *,
         role: str | None = None,
+        session_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        include_agents: bool = True,
         limit: int | None = None,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
-        """Case-insensitive substring search across message content.
+        """Ranked full-text search across message content.
+
+        Served by :class:`~ac_dc.history_search.HistorySearchIndex`.
+        Bare words match case-insensitively as token prefixes;
+        ``"quoted text"`` matches an exact phrase; all terms
+        must match. Queries with no word characters, or an
+        interpreter without SQLite FTS5, fall back to the
+        case-insensitive substring scan over the main store.
 
         Parameters
         ----------
         query:
-            Search term. Empty or whitespace-only queries return
+            Search text. Empty or whitespace-only queries return
             an empty list immediately (cheap guard so typing an
-            empty box in the UI doesn't scan the whole file).
+            empty box in the UI doesn't touch the index).
         role:
             Optional role filter — ``"user"`` or ``"assistant"``.
             System-event messages use ``role="user"`` so they
             match a user-role filter (intentional — users may
             want to search for commit messages recorded as system
             events).
-        limit:
-            Optional cap on returned hits. Hits are ordered by
-            write order (oldest first).
+        session_id:
+            Optional session filter.
+        since, until:
+            Optional inclusive ISO 8601 timestamp bounds.
+        include_agents:
+            When True (default), agent turn archives are
+            searched alongside the main store.
+        limit, offset:
+            Pagination over the ranked hit list.
 
         Returns
         -------
         list[dict]
-            One entry per matching message:
-            ``{session_id, message_id, role, content_preview, timestamp}``.
-            The preview is truncated to :data:`_PREVIEW_MAX_CHARS`
-            so a huge assistant message doesn't bloat the
-            response.
+            One entry per matching message, best match first:
+            ``{session_id, message_id, role, content_preview,
+            timestamp, source, score}``. Agent-archive hits
+            (``source == "agent"``) also carry ``turn_id`` and
+            ``agent_idx``. The preview is truncated to
+            :data:`_PREVIEW_MAX_CHARS` so a huge assistant
+            message doesn't bloat the response.
         """
-        needle = (query or "").strip().lower()
-        if not needle:
+        if not (query or "").strip():
             return []
+        match = build_match_expression(query)
+        if match is not None and self._search_index.available:
+            return self._search_index.search(
+                match,
+                role=role,
+                session_id=session_id,
+                since=since,
+                until=until,
+                include_agents=include_agents,
+                limit=limit,
+                offset=offset,
+            )
+        return self._substring_search(
+            query,
+            role=role,
+            session_id=session_id,
+            since=since,
+            until=until,
+            limit=limit,
+            offset=offset,
+        )
+
+    def _substring_search(
+        self,
+        query: str,
+        *,
+        role: str | None,
+        session_id: str | None,
+        since: str | None,
+        until: str | None,
+        limit: int | None,
+        offset: int,
+    ) -> list[dict[str, Any]]:
+        """Case-insensitive substring scan over the main store.
+
+        Fallback for queries the full-text index can't express.
+        Hits are in write order (oldest first); ``score`` is
+        always 0.
+        """
+        needle = query.strip().lower()
         hits: list[dict[str, Any]] = []
+        skipped = 0
         for rec in self._iter_records():
             if role and rec.get("role") != role:
                 continue
+            if session_id and rec.get("session_id") != session_id:
+                continue
+            timestamp = rec.get("timestamp", "")
+            if since and timestamp < since:
+                continue
+            if until and timestamp > until:
+                continue
             content = rec.get("content", "") or ""
             if not isinstance(content, str):
                 continue
             if needle not in content.lower():
                 continue
-            preview = content[:_PREVIEW_MAX_CHARS]
-            if len(content) > _PREVIEW_MAX_CHARS:
-                preview = preview.rstrip() + "…"
+            if skipped < offset:
+                skipped += 1
+                continue
             hits.append({
                 "session_id": rec.get("session_id", ""),
                 "message_id": rec.get("id", ""),
                 "role": rec.get("role", "user"),
-                "content_preview": preview,
-                "timestamp": rec.get("timestamp", ""),
+                "content_preview": make_preview(
+                    content, _PREVIEW_MAX_CHARS
+                ),
+                "timestamp": timestamp,
+                "source": "main",
+                "score": 0.0,
             })
             if limit is not None and len(hits) >= limit:
                 break
@@ -1027,10 +1138,19 @@ class HistoryStore:
         # Append one line. Same atomic-within-pipe-buffer guarantee
         # as the main store's append_message. Mid-write crashes
         # leave partial lines that the reader's per-line try/except
-        # tolerates.
-        line = json.dumps(record, ensure_ascii=False)
-        with agent_file.open("a", encoding="utf-8") as fh:
-            fh.write(line + "\n")
+        # tolerates. The write offset feeds the search index.
+        data = (json.dumps(record, ensure_ascii=False) + "\n").encode(
+            "utf-8"
+        )
+        with agent_file.open("ab") as fh:
+            offset = fh.tell()
+            fh.write(data)
+        self._search_index.note_append(
+            agent_file.relative_to(self._ac_dc_dir).as_posix(),
+            offset,
+            offset + len(data),
+            record,
+        )
         return record
 
     def get_turn_archive(
@@ -42,11 +42,13 @@ from ac_dc.llm._agents import (
     spawn_agents_for_turn,
 )
 from ac_dc.llm._breakdown import (
+    build_context_breakdown,
     get_context_breakdown,
     get_file_map_block,
     get_meta_block,
     print_init_hud,
     print_post_response_hud,
+    push_context_breakdown,
     user_excluded_paths,
 )
 from ac_dc.llm._commit import (
@@ -69,6 +71,7 @@ from ac_dc.llm._lifecycle import (
 from ac_dc.llm._doc_index_background import (
     build_doc_index_background,
     build_enrichment_config,
+    enrich_files_sync,
     enrich_one_file_sync,
     enrich_written_file,
     on_doc_file_written,
@@ -132,6 +135,7 @@ from ac_dc.llm._rpc_urls import (
     detect_and_fetch,
     detect_urls,
     fetch_url,
+    get_url_cache_stats,
     get_url_content,
     invalidate_url_cache,
     remove_fetched_url,
@@ -180,6 +184,7 @@ __all__ = [
     "broadcast_event",
     "broadcast_event_async",
     "build_agent_scope",
+    "build_context_breakdown",
     "build_and_set_review_context",
     "build_completion_result",
     "build_doc_index_background",
@@ -202,6 +207,7 @@ __all__ = [
     "detect_urls",
     "distribute_orphan_files",
     "end_review",
+    "enrich_files_sync",
     "enrich_one_file_sync",
     "enrich_written_file",
     "fetch_url",
@@ -220,6 +226,7 @@ __all__ = [
     "get_selected_files",
     "get_snippets",
     "get_turn_archive",
+    "get_url_cache_stats",
     "get_url_content",
     "history_get_session",
     "history_list_sessions",
@@ -234,6 +241,7 @@ __all__ = [
     "post_response",
     "print_init_hud",
     "print_post_response_hud",
+    "push_context_breakdown",
     "rebuild_cache",
     "rebuild_cache_impl",
     "rebuild_graduate_history",
@@ -43,6 +43,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("ac_dc.llm_service")
 
+_CACHED_TIERS = ("L0", "L1", "L2", "L3")
+
 
 # ---------------------------------------------------------------------------
 # Tiered content builder
@@ -97,6 +99,13 @@ def build_tiered_content(
     - ``file:`` entries for paths the user has excluded
       (tracker cleanup drops them on the next update cycle;
       this is a belt-and-suspenders guard for mid-cycle).
+
+    Rendered tiers are cached per tracker on
+    ``service._tier_render_cache`` and reused while the tier's
+    ordered members and each member's render version (index
+    block version, file content hash, message hash,
+    plain-files listing) are unchanged. A hit is the same
+    bytes a fresh render would produce.
     """
     if scope is None:
         scope = service._default_scope()
@@ -106,40 +115,8 @@ def build_tiered_content(
     if not all_items:
         return None
 
-    # Result skeleton — every tier gets an entry even when
-    # empty, so the assembler's `tiered_content.get(tier) or
-    # {}` fallback always finds the right shape.
-    result: dict[str, dict[str, Any]] = {
-        tier: {
-            "symbols": "",
-            "plain_files": "",
-            "files": "",
-            "history": [],
-            "graduated_files": [],
-            "graduated_history_indices": [],
-        }
-        for tier in ("L0", "L1", "L2", "L3")
-    }
-
     history = scope.context.get_history()
 
-    # Walk items once, dispatching by tier + prefix. Each
-    # tier builds lists of fragments first, then joins at
-    # the end so the fragment ordering is deterministic
-    # (sort by key for stability).
-    tier_symbol_fragments: dict[str, list[str]] = {
-        t: [] for t in ("L0", "L1", "L2", "L3")
-    }
-    tier_plain_files_fragments: dict[str, list[str]] = {
-        t: [] for t in ("L0", "L1", "L2", "L3")
-    }
-    tier_file_fragments: dict[str, list[str]] = {
-        t: [] for t in ("L0", "L1", "L2", "L3")
-    }
-    tier_history_entries: dict[
-        str, list[tuple[int, dict[str, Any]]]
-    ] = {t: [] for t in ("L0", "L1", "L2", "L3")}
-
     # Every dir-block's RENDERED bytes must be byte-identical
     # to the listing that ``_dir_block_active_items`` HASHES.
     # The provider caches the rendered bytes; the tracker
@@ -157,78 +134,199 @@ def build_tiered_content(
     #   - plain_files:   → subtract Active-loaded files, the
     #     index-covered set, AND the user-exclusion set.
     #
-    # We reproduce those exact terms here. Note ``selected_set``
-    # / ``active_excluded`` (picker selection ∪ user
-    # exclusions) is NOT what the hash uses for symbols/docs —
+    # We reproduce those exact terms here. Note the picker
+    # selection ∪ user exclusions is NOT what the hash uses
+    # for symbols/docs —
     # using it would strip binary-deselected or user-excluded
     # files from the rendered block while the hash kept them.
     # ``excluded_set`` is retained only for the ``file:``
     # belt-and-suspenders skip further down.
-    selected_set = set(scope.selected_files)
-    excluded_set = set(
-        getattr(service, "_excluded_index_files", [])
-    )
-    active_excluded = selected_set | excluded_set
-    plain_files_active = set(
-        scope.context.file_context.get_files()
+    renderer = _TierRenderer(
+        service,
+        scope,
+        history,
+        excluded_set=set(
+            getattr(service, "_excluded_index_files", [])
+        ),
+        plain_files_active=set(
+            scope.context.file_context.get_files()
+        ),
+        plain_files_user_excluded=_excluded_set(service),
     )
-    plain_files_user_excluded = _excluded_set(service)
 
+    # Bucket keys by tier, sorted so fragment ordering is
+    # deterministic.
+    tier_keys: dict[str, list[str]] = {t: [] for t in _CACHED_TIERS}
     for key in sorted(all_items.keys()):
         item = all_items[key]
         tier_name = getattr(
             item.tier, "value", str(item.tier)
         )
-        if tier_name not in ("L0", "L1", "L2", "L3"):
-            continue
+        if tier_name in tier_keys:
+            tier_keys[tier_name].append(key)
+
+    # Render each tier, or reuse the previous render when the
+    # tier's signature — its ordered members and a version
+    # for each member's rendered bytes — is unchanged. L0/L1
+    # typically sit still for dozens of turns, and the cache
+    # warmer rebuilds the same tiers between turns, so most
+    # builds are a signature walk plus a lookup. Keyed by
+    # tracker because each scope (main conversation per mode,
+    # each agent) has its own; weakly, so a discarded agent
+    # tracker takes its renders with it. Services without the
+    # cache attribute (test hosts, the replay harness) render
+    # every time.
+    render_cache = getattr(service, "_tier_render_cache", None)
+    tier_cache: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = (
+        render_cache.setdefault(scope.tracker, {})
+        if render_cache is not None else {}
+    )
+    result: dict[str, dict[str, Any]] = {}
+    for tier_name, keys in tier_keys.items():
+        signature = tuple(renderer.signature(key) for key in keys)
+        cached = tier_cache.get(tier_name)
+        if cached is None or cached[0] != signature:
+            cached = (signature, renderer.render(keys))
+            tier_cache[tier_name] = cached
+        result[tier_name] = _copy_tier(cached[1])
+    return result
+
+
+def _copy_tier(content: dict[str, Any]) -> dict[str, Any]:
+    """Fresh containers over a (possibly cached) tier render.
+
+    Strings are immutable and shared; lists and history dicts
+    are copied so a caller mutating its result can't corrupt
+    the cached render.
+    """
+    return {
+        "symbols": content["symbols"],
+        "plain_files": content["plain_files"],
+        "files": content["files"],
+        "history": [dict(msg) for msg in content["history"]],
+        "graduated_files": list(content["graduated_files"]),
+        "graduated_history_indices": list(
+            content["graduated_history_indices"]
+        ),
+    }
+
 
+class _TierRenderer:
+    """Per-build rendering state shared by every tier.
+
+    :meth:`signature` returns, per tracker key, a value that
+    changes whenever the key's rendered fragment would — an
+    index's block version, a file's content hash, a history
+    message's stability hash, or the plain-files listing
+    itself. :meth:`render` produces a tier's content dict.
+    Work common to both (the repo's directory listing, the
+    history hashes, each plain-files listing) is computed at
+    most once per build.
+    """
+
+    def __init__(
+        self,
+        service: "LLMService",
+        scope: "ConversationScope",
+        history: list[dict[str, Any]],
+        *,
+        excluded_set: set[str],
+        plain_files_active: set[str],
+        plain_files_user_excluded: set[str],
+    ) -> None:
+        self._service = service
+        self._scope = scope
+        self._history = history
+        self._excluded_set = excluded_set
+        self._plain_files_active = plain_files_active
+        self._plain_files_user_excluded = plain_files_user_excluded
+        self._by_dir: dict[str, list[str]] | None = None
+        self._plain_listings: dict[str, list[str] | None] = {}
+        self._history_hashes: list[str] | None = None
+
+    # ------------------------------------------------------------------
+    # Signatures
+    # ------------------------------------------------------------------
+
+    def signature(self, key: str) -> tuple[Any, ...]:
+        service = self._service
         if key.startswith("symbols:"):
-            directory = key[len("symbols:"):]
-            if service._symbol_index is None:
-                continue
-            # exclude_active MUST be the same set the hash
-            # uses — _dir_block_active_items hashes the block
-            # with exclude_active = file_context.get_files()
-            # (files actually loaded in Active), NOT the
-            # picker's selected ∪ excluded union. Passing the
-            # union here would strip binary-deselected and
-            # user-excluded files from the rendered bytes
-            # while the hash kept them, drifting the cached
-            # prefix between turns and forcing cold cache
-            # writes (same failure mode as the plain_files
-            # block).
-            block = service._symbol_index.get_dir_symbols_block(
-                directory, exclude_active=plain_files_active
+            return self._index_signature(
+                key, service._symbol_index, "get_dir_symbols_block"
+            )
+        if key.startswith("docs:"):
+            return self._index_signature(
+                key, service._doc_index, "get_dir_docs_block"
             )
-            if block:
-                tier_symbol_fragments[tier_name].append(block)
-        elif key.startswith("docs:"):
-            directory = key[len("docs:"):]
-            if service._doc_index is None:
-                continue
-            # Same exclude-set rule as the symbols branch:
-            # match _dir_block_active_items, which hashes
-            # docs blocks with exclude_active =
-            # file_context.get_files().
-            block = service._doc_index.get_dir_docs_block(
-                directory, exclude_active=plain_files_active
+        if key.startswith("plain_files:"):
+            listing = self._plain_listing(key[len("plain_files:"):])
+            return (key, tuple(listing) if listing else None)
+        if key.startswith("file:"):
+            path = key[len("file:"):]
+            if path in self._excluded_set:
+                return (key, None)
+            return (
+                key,
+                self._scope.context.file_context.get_content_hash(path),
             )
-            if block:
-                tier_symbol_fragments[tier_name].append(block)
-        elif key.startswith("plain_files:"):
-            directory = key[len("plain_files:"):]
-            if service._repo is None:
-                continue
+        if key.startswith("history:"):
+            hashes = self._history_stability_hashes()
             try:
-                by_dir = service._repo.get_files_by_directory()
-            except Exception as exc:
-                logger.debug(
-                    "Tier content for %s skipped: "
-                    "get_files_by_directory failed: %s",
-                    key,
-                    exc,
-                )
-                continue
+                idx = int(key[len("history:"):])
+            except ValueError:
+                return (key, None)
+            if 0 <= idx < len(hashes):
+                return (key, hashes[idx])
+            return (key, None)
+        # url:* and anything else render nothing.
+        return (key,)
+
+    def _index_signature(
+        self, key: str, index: Any, render_method: str
+    ) -> tuple[Any, ...]:
+        if index is None:
+            return (key, None)
+        directory = key[key.index(":") + 1:]
+        versioned = getattr(index, "get_dir_block_version", None)
+        if versioned is None:
+            # An index that can't version its blocks is
+            # compared by rendered value — correct, just not
+            # cheaper.
+            return (key, getattr(index, render_method)(
+                directory, exclude_active=self._plain_files_active
+            ))
+        # The index object itself rides in the signature so a
+        # replaced index can never match versions issued by its
+        # predecessor.
+        return (key, index, versioned(
+            directory, exclude_active=self._plain_files_active
+        ))
+
+    def _history_stability_hashes(self) -> list[str]:
+        if self._history_hashes is None:
+            self._history_hashes = [
+                h for h, _tokens in
+                self._scope.context.history_stability_items()
+            ]
+        return self._history_hashes
+
+    def _plain_listing(self, directory: str) -> list[str] | None:
+        """The sorted, subtracted plain-files listing (None on failure)."""
+        if directory in self._plain_listings:
+            return self._plain_listings[directory]
+        service = self._service
+        listing: list[str] | None = None
+        if service._repo is not None:
+            if self._by_dir is None:
+                try:
+                    self._by_dir = service._repo.get_files_by_directory()
+                except Exception as exc:
+                    logger.debug(
+                        "Tier content for plain_files skipped: "
+                        "get_files_by_directory failed: %s",
+                        exc,
+                    )
+                    self._by_dir = {}
             # MUST render byte-identical to the listing that
             # _dir_block_active_items hashes — same sort, same
             # subtractions. The tracker compares the SORTED,
@@ -240,79 +338,120 @@ def build_tiered_content(
             # bytes silently drift between turns — every
             # cache warm-up and roughly every other real turn
             # then pays a full cold cache write at 0% hit.
-            # The set subtracted here (active_excluded) already
-            # folds in selected + user-excluded files; covered
-            # (index-surfaced) files are subtracted explicitly
-            # to match the hash's `not in covered` clause.
+            # Covered (index-surfaced) files are subtracted
+            # explicitly to match the hash's `not in covered`
+            # clause.
             covered = _indexed_paths_in_dir(service, directory)
-            files_in_dir = sorted(
-                f for f in by_dir.get(directory, [])
-                if f not in plain_files_active
+            listing = sorted(
+                f for f in self._by_dir.get(directory, [])
+                if f not in self._plain_files_active
                 and f not in covered
-                and f not in plain_files_user_excluded
+                and f not in self._plain_files_user_excluded
             )
-            if files_in_dir:
-                tier_plain_files_fragments[tier_name].append(
-                    "\n".join(files_in_dir)
+        self._plain_listings[directory] = listing
+        return listing
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def render(self, keys: list[str]) -> dict[str, Any]:
+        """Render one tier's content dict from its sorted keys."""
+        service = self._service
+        symbol_fragments: list[str] = []
+        plain_files_fragments: list[str] = []
+        file_fragments: list[str] = []
+        history_entries: list[tuple[int, dict[str, Any]]] = []
+        graduated_files: list[str] = []
+        graduated_history: list[int] = []
+
+        for key in keys:
+            if key.startswith("symbols:"):
+                directory = key[len("symbols:"):]
+                if service._symbol_index is None:
+                    continue
+                # exclude_active MUST be the same set the hash
+                # uses — _dir_block_active_items hashes the block
+                # with exclude_active = file_context.get_files()
+                # (files actually loaded in Active), NOT the
+                # picker's selected ∪ excluded union. Passing the
+                # union here would strip binary-deselected and
+                # user-excluded files from the rendered bytes
+                # while the hash kept them, drifting the cached
+                # prefix between turns and forcing cold cache
+                # writes (same failure mode as the plain_files
+                # block).
+                block = service._symbol_index.get_dir_symbols_block(
+                    directory, exclude_active=self._plain_files_active
                 )
-        elif key.startswith("file:"):
-            path = key[len("file:"):]
-            if path in excluded_set:
-                logger.debug(
-                    "Tier content: skipping %s (excluded from "
-                    "index by user); tracker entry will be "
-                    "cleaned up on next update cycle",
-                    key,
+                if block:
+                    symbol_fragments.append(block)
+            elif key.startswith("docs:"):
+                directory = key[len("docs:"):]
+                if service._doc_index is None:
+                    continue
+                # Same exclude-set rule as the symbols branch:
+                # match _dir_block_active_items, which hashes
+                # docs blocks with exclude_active =
+                # file_context.get_files().
+                block = service._doc_index.get_dir_docs_block(
+                    directory, exclude_active=self._plain_files_active
                 )
-                continue
-            content = scope.context.file_context.get_content(path)
-            if content is None:
-                logger.debug(
-                    "Tier content for %s skipped: no "
-                    "content in file context (stale "
-                    "tracker entry, cleanup on next cycle)",
-                    key,
+                if block:
+                    symbol_fragments.append(block)
+            elif key.startswith("plain_files:"):
+                listing = self._plain_listing(key[len("plain_files:"):])
+                if listing:
+                    plain_files_fragments.append("\n".join(listing))
+            elif key.startswith("file:"):
+                path = key[len("file:"):]
+                if path in self._excluded_set:
+                    logger.debug(
+                        "Tier content: skipping %s (excluded from "
+                        "index by user); tracker entry will be "
+                        "cleaned up on next update cycle",
+                        key,
+                    )
+                    continue
+                content = self._scope.context.file_context.get_content(
+                    path
                 )
-                continue
-            tier_file_fragments[tier_name].append(
-                f"{path}\n```\n{content}\n```"
-            )
-            result[tier_name]["graduated_files"].append(path)
-        elif key.startswith("history:"):
-            try:
-                idx = int(key[len("history:"):])
-            except ValueError:
-                continue
-            if 0 <= idx < len(history):
-                tier_history_entries[tier_name].append(
-                    (idx, dict(history[idx]))
-                )
-                result[tier_name][
-                    "graduated_history_indices"
-                ].append(idx)
-        # url:* — intentionally skipped (URL tier entry is
-        # deferred).
-
-    # Finalise each tier. Symbols, plain_files and files join
-    # with blank lines between fragments. History is sorted
-    # by original index so multi-message tier content reads
-    # in conversation order.
-    for tier_name in ("L0", "L1", "L2", "L3"):
-        result[tier_name]["symbols"] = "\n\n".join(
-            tier_symbol_fragments[tier_name]
-        )
-        result[tier_name]["plain_files"] = "\n\n".join(
-            tier_plain_files_fragments[tier_name]
-        )
-        result[tier_name]["files"] = "\n\n".join(
-            tier_file_fragments[tier_name]
-        )
-        tier_history_entries[tier_name].sort(key=lambda p: p[0])
-        result[tier_name]["history"] = [
-            msg for _idx, msg in tier_history_entries[tier_name]
-        ]
-
-    return result
+                if content is None:
+                    logger.debug(
+                        "Tier content for %s skipped: no "
+                        "content in file context (stale "
+                        "tracker entry, cleanup on next cycle)",
+                        key,
+                    )
+                    continue
+                file_fragments.append(f"{path}\n```\n{content}\n```")
+                graduated_files.append(path)
+            elif key.startswith("history:"):
+                try:
+                    idx = int(key[len("history:"):])
+                except ValueError:
+                    continue
+                if 0 <= idx < len(self._history):
+                    history_entries.append(
+                        (idx, dict(self._history[idx]))
+                    )
+                    graduated_history.append(idx)
+            # url:* — intentionally skipped (URL tier entry is
+            # deferred).
+
+        # Symbols, plain_files and files join with blank lines
+        # between fragments. History is sorted by original
+        # index so multi-message tier content reads in
+        # conversation order.
+        history_entries.sort(key=lambda p: p[0])
+        return {
+            "symbols": "\n\n".join(symbol_fragments),
+            "plain_files": "\n\n".join(plain_files_fragments),
+            "files": "\n\n".join(file_fragments),
+            "history": [msg for _idx, msg in history_entries],
+            "graduated_files": graduated_files,
+            "graduated_history_indices": graduated_history,
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -21,6 +21,7 @@ import sys
 from typing import TYPE_CHECKING, Any
 
 from ac_dc.context_manager import Mode
+from ac_dc.llm._breakdown_cache import _MAP_SOURCES
 from ac_dc.llm._types import ConversationScope, _TIER_CONFIG_LOOKUP
 from ac_dc.stability_tracker import Tier
 
@@ -448,6 +449,49 @@ def get_meta_block(
 def get_context_breakdown(
     service: "LLMService",
     agent_tag: tuple[str, int] | None = None,
+) -> dict[str, Any]:
+    """Return the breakdown, publishing main-scope results to browsers.
+
+    Main-scope results are recorded as the published state and
+    stamped with its ``version``; when they differ from what
+    was last published, the change is pushed as a
+    ``contextBreakdownDelta`` (or a first ``contextBreakdown``
+    checkpoint) so every connected Context tab updates without
+    refetching. Agent-scope results are returned unchanged.
+    """
+    result = build_context_breakdown(service, agent_tag)
+    push = _publish(service, result)
+    if push is not None:
+        from ac_dc.llm._lifecycle import broadcast_event
+        broadcast_event(service, *push)
+    return result
+
+
+async def push_context_breakdown(service: "LLMService") -> None:
+    """Recompute the main breakdown and await its push.
+
+    Called by post-response work once tier state has settled,
+    ahead of ``postResponseComplete``, so the delta reaches
+    browsers before the event that used to trigger their
+    refetch.
+    """
+    result = build_context_breakdown(service)
+    push = _publish(service, result)
+    if push is not None:
+        await service._broadcast_event_async(*push)
+
+
+def _publish(
+    service: "LLMService", result: dict[str, Any]
+) -> tuple[str, dict[str, Any]] | None:
+    if result.get("scope") != "main":
+        return None
+    return service._breakdown_cache.publish(result)
+
+
+def build_context_breakdown(
+    service: "LLMService",
+    agent_tag: tuple[str, int] | None = None,
 ) -> dict[str, Any]:
     """Return the full context/token/tier breakdown for the UI.
 
@@ -544,21 +588,30 @@ def get_context_breakdown(
     # dir-block tracker entries (``symbols:<dir>``,
     # ``docs:<dir>``). The aggregate token total is
     # computed below as the sum of per-file block tokens.
-    symbol_map = ""
+    #
+    # Per-file blocks are rendered first and token-counted in
+    # one count_many batch — a large repo has thousands.
+    # Per-file rows come from the service's breakdown cache,
+    # which re-renders and recounts only directories whose
+    # dir-block version moved since the last call.
+    cache = service._breakdown_cache
     symbol_map_files = 0
     symbol_map_details: list[dict[str, Any]] = []
     try:
         if context.mode == Mode.DOC:
-            all_paths = list(
-                service._doc_index._all_outlines.keys()
+            primary_kind, primary_index = "docs", service._doc_index
+        else:
+            primary_kind, primary_index = (
+                "symbols", service._symbol_index
             )
-            symbol_map_files = len(all_paths)
-            for path in all_paths:
-                if path in excluded_set:
-                    continue
-                block = service._doc_index.get_file_doc_block(path)
-                if not block:
-                    continue
+        if primary_index is not None:
+            symbol_map_files = len(
+                getattr(primary_index, _MAP_SOURCES[primary_kind][0])
+            )
+            for path, tokens in cache.map_details(
+                primary_kind, primary_index, excluded_set,
+                service._counter,
+            ):
                 name = (
                     path.rsplit("/", 1)[-1]
                     if "/" in path
@@ -567,34 +620,8 @@ def get_context_breakdown(
                 symbol_map_details.append({
                     "name": name,
                     "path": path,
-                    "tokens": service._counter.count(block),
+                    "tokens": tokens,
                 })
-        else:
-            if service._symbol_index is not None:
-                all_paths = list(
-                    service._symbol_index._all_symbols.keys()
-                )
-                symbol_map_files = len(all_paths)
-                for path in all_paths:
-                    if path in excluded_set:
-                        continue
-                    block = (
-                        service._symbol_index.get_file_symbol_block(
-                            path
-                        )
-                    )
-                    if not block:
-                        continue
-                    name = (
-                        path.rsplit("/", 1)[-1]
-                        if "/" in path
-                        else path
-                    )
-                    symbol_map_details.append({
-                        "name": name,
-                        "path": path,
-                        "tokens": service._counter.count(block),
-                    })
     except Exception as exc:
         logger.debug(
             "Symbol map details enumeration failed: %s", exc
@@ -614,33 +641,20 @@ def get_context_breakdown(
     if service._cross_ref_enabled:
         try:
             if context.mode == Mode.DOC:
-                if service._symbol_index is not None:
-                    for path in (
-                        service._symbol_index._all_symbols.keys()
-                    ):
-                        if path in excluded_set:
-                            continue
-                        block = (
-                            service._symbol_index
-                            .get_file_symbol_block(path)
-                        )
-                        if block:
-                            secondary_map_tokens += (
-                                service._counter.count(block)
-                            )
+                secondary_kind, secondary_index = (
+                    "symbols", service._symbol_index
+                )
             else:
-                for path in (
-                    service._doc_index._all_outlines.keys()
-                ):
-                    if path in excluded_set:
-                        continue
-                    block = service._doc_index.get_file_doc_block(
-                        path
+                secondary_kind, secondary_index = (
+                    "docs", service._doc_index
+                )
+            if secondary_index is not None:
+                secondary_map_tokens = sum(
+                    tokens for _, tokens in cache.map_details(
+                        secondary_kind, secondary_index,
+                        excluded_set, service._counter,
                     )
-                    if block:
-                        secondary_map_tokens += (
-                            service._counter.count(block)
-                        )
+                )
         except Exception as exc:
             logger.debug(
                 "Secondary aggregate map fetch failed: %s",
@@ -648,19 +662,26 @@ def get_context_breakdown(
             )
 
     # File tokens — per-file detail.
+    # Counts are cached per file by the FileContext until the
+    # content changes, so unchanged selections cost a lookup.
     file_details: list[dict[str, Any]] = []
     files_tokens = 0
-    for path in file_context.get_files():
-        content = file_context.get_content(path)
-        if content:
-            tokens = service._counter.count(content)
-            files_tokens += tokens
-            name = path.rsplit("/", 1)[-1] if "/" in path else path
-            file_details.append({
-                "name": name,
-                "path": path,
-                "tokens": tokens,
-            })
+    file_paths = [
+        path for path in file_context.get_files()
+        if file_context.get_content(path)
+    ]
+    file_counts = file_context.get_content_token_counts(
+        service._counter, file_paths
+    )
+    for path in file_paths:
+        tokens = file_counts.get(path, 0)
+        files_tokens += tokens
+        name = path.rsplit("/", 1)[-1] if "/" in path else path
+        file_details.append({
+            "name": name,
+            "path": path,
+            "tokens": tokens,
+        })
 
     # URL tokens + per-URL details.
     url_details: list[dict[str, Any]] = []
@@ -936,6 +957,19 @@ def get_context_breakdown(
             "mode": mode_label,
         })
 
+    # Token-count memo effectiveness. The service counter
+    # renders breakdown/tier content; the context manager's
+    # counts history. Summed so the HUD shows one figure.
+    memo = {"hits": 0, "misses": 0, "entries": 0, "capacity": 0}
+    memo_counters = {
+        id(c): c for c in (service._counter, context.counter)
+    }
+    for counter in memo_counters.values():
+        for key, value in counter.cache_stats().items():
+            memo[key] += value
+    lookups = memo["hits"] + memo["misses"]
+    memo["hit_rate"] = memo["hits"] / lookups if lookups else None
+
     return {
         "scope": scope_label,
         "model": model,
@@ -963,6 +997,7 @@ def get_context_breakdown(
         },
         "promotions": promotions,
         "demotions": demotions,
+        "token_count_cache": memo,
         "session_totals": {
             "prompt": st.get("input_tokens", 0),
             "completion": st.get("output_tokens", 0),
@@ -0,0 +1,279 @@
+"""Incremental state behind the context breakdown and its pushed deltas.
+
+:func:`ac_dc.llm._breakdown.get_context_breakdown` used to
+rebuild its whole answer from scratch on every call: render
+every indexed file's map block, token-count the lot, then do
+the same again for the cross-reference map. The Context tab
+and Token HUD call it after every turn, on every selection
+change and mode switch, so a large repo paid an O(files)
+render-and-count for a panel that usually moved by a handful
+of rows.
+
+:class:`BreakdownCache` (one per :class:`LLMService`) keeps
+two things between calls:
+
+- **Per-directory map details.** Each directory's
+  ``(path, tokens)`` rows are memoised against the index's
+  :meth:`get_dir_block_version` for the caller's exclusion
+  set — the same version the dir-block render caches key on.
+  Only directories whose version moved are re-rendered and
+  counted, in one ``count_many`` batch. Indexes without the
+  D36 dir-block surface (test stubs, plain-dict stores) fall
+  back to the full per-file walk.
+- **The last published main-scope breakdown.** Every main
+  breakdown computed is diffed against the one the browsers
+  last saw. The first publish is a full ``contextBreakdown``
+  checkpoint; later ones are ``contextBreakdownDelta``
+  patches carrying only changed top-level fields, changed
+  breakdown counters, upserted/removed detail rows (keyed by
+  path or URL) and upserted/removed tier blocks. Each push
+  carries ``base_version``/``version`` so a client that
+  missed one resyncs with a plain RPC fetch, the same
+  recovery the chunk emitter's checkpoints give streaming.
+
+Agent scopes stay RPC-only — their tabs fetch on demand and
+there is one published state per service, not per scope.
+
+Governing spec: :doc:`specs4/5-webapp/viewers-hud` § Pushed
+updates.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ac_dc.dir_map import dir_of
+
+if TYPE_CHECKING:
+    from ac_dc.token_counter import TokenCounter
+
+
+# Per-kind render surface: the index store attribute and the
+# per-file block getter the breakdown counts.
+_MAP_SOURCES: dict[str, tuple[str, str]] = {
+    "symbols": ("_all_symbols", "get_file_symbol_block"),
+    "docs": ("_all_outlines", "get_file_doc_block"),
+}
+
+# Breakdown detail lists patched row-by-row, with the field
+# that identifies a row.
+_KEYED_LISTS: dict[str, str] = {
+    "symbol_map_details": "path",
+    "file_details": "path",
+    "url_details": "url",
+}
+
+# Top-level fields that are never diffed as plain values.
+_STRUCTURED = frozenset({"breakdown", "blocks", "version"})
+
+
+class _MapDetails:
+    """Per-directory ``(path, tokens)`` rows for one index."""
+
+    __slots__ = ("index", "dirs")
+
+    def __init__(self, index: Any) -> None:
+        self.index = index
+        self.dirs: dict[str, tuple[Any, list[tuple[str, int]]]] = {}
+
+
+class BreakdownCache:
+    """Map-detail memo plus the last breakdown pushed to browsers."""
+
+    def __init__(self) -> None:
+        self._maps: dict[str, _MapDetails] = {}
+        self.version = 0
+        self._published: dict[str, Any] | None = None
+
+    # ------------------------------------------------------------------
+    # Map details
+    # ------------------------------------------------------------------
+
+    def map_details(
+        self,
+        kind: str,
+        index: Any,
+        excluded: set[str],
+        counter: "TokenCounter",
+    ) -> list[tuple[str, int]]:
+        """Return ``(path, tokens)`` for every rendered file block.
+
+        ``kind`` is ``"symbols"`` or ``"docs"``. Files in
+        ``excluded`` and files whose block renders empty are
+        omitted. Rows come out grouped by directory in sorted
+        order on the incremental path, in store order on the
+        fallback path.
+        """
+        store_attr, getter_name = _MAP_SOURCES[kind]
+        store = getattr(index, store_attr)
+        get_block = getattr(index, getter_name)
+        if not (
+            hasattr(store, "files_in")
+            and hasattr(index, "get_dir_block_version")
+        ):
+            return _count_blocks(
+                counter,
+                [p for p in list(store.keys()) if p not in excluded],
+                get_block,
+            )
+
+        cached = self._maps.get(kind)
+        if cached is None or cached.index is not index:
+            cached = _MapDetails(index)
+            self._maps[kind] = cached
+        fresh: dict[str, tuple[Any, list[tuple[str, int]]]] = {}
+        stale: dict[str, Any] = {}
+        stale_paths: list[str] = []
+        for directory in store.directories():
+            version = (
+                index.get_dir_block_version(
+                    directory, exclude_active=excluded
+                ),
+                counter.model,
+            )
+            entry = cached.dirs.get(directory)
+            if entry is not None and entry[0] == version:
+                fresh[directory] = entry
+                continue
+            stale[directory] = version
+            stale_paths.extend(
+                p for p in store.files_in(directory)
+                if p not in excluded
+            )
+        if stale:
+            rows = _count_blocks(counter, stale_paths, get_block)
+            by_dir: dict[str, list[tuple[str, int]]] = {
+                d: [] for d in stale
+            }
+            for path, tokens in rows:
+                by_dir[dir_of(path)].append((path, tokens))
+            for directory, version in stale.items():
+                fresh[directory] = (version, by_dir[directory])
+        # Vanished directories fall out here.
+        cached.dirs = fresh
+        return [
+            row for directory in sorted(fresh)
+            for row in fresh[directory][1]
+        ]
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def publish(
+        self, breakdown: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]] | None:
+        """Record ``breakdown`` as what browsers see; return the push.
+
+        Stamps ``breakdown["version"]`` with the resulting
+        published version. Returns ``(event_name, payload)`` —
+        a ``contextBreakdown`` checkpoint on first publish, a
+        ``contextBreakdownDelta`` afterwards — or None when
+        nothing changed since the last publish.
+        """
+        previous = self._published
+        if previous is None:
+            self.version += 1
+            breakdown["version"] = self.version
+            self._published = breakdown
+            return "contextBreakdown", {
+                "scope": "main",
+                "version": self.version,
+                "breakdown": breakdown,
+            }
+        delta = breakdown_delta(previous, breakdown)
+        if delta is None:
+            breakdown["version"] = self.version
+            self._published = breakdown
+            return None
+        delta["scope"] = "main"
+        delta["base_version"] = self.version
+        self.version += 1
+        delta["version"] = self.version
+        breakdown["version"] = self.version
+        self._published = breakdown
+        return "contextBreakdownDelta", delta
+
+
+def breakdown_delta(
+    old: dict[str, Any], new: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Patch turning breakdown ``old`` into ``new``; None if equal.
+
+    Shape: ``set`` (changed top-level fields), ``breakdown``
+    (changed scalar breakdown fields), ``details`` (per keyed
+    list, a :func:`_list_patch`), and ``blocks`` (a list patch
+    over tier blocks keyed by ``name``, or None).
+    """
+    top = {
+        key: value for key, value in new.items()
+        if key not in _STRUCTURED and old.get(key) != value
+    }
+    old_bd = old.get("breakdown") or {}
+    scalars: dict[str, Any] = {}
+    details: dict[str, Any] = {}
+    for key, value in (new.get("breakdown") or {}).items():
+        row_key = _KEYED_LISTS.get(key)
+        if row_key is None:
+            if old_bd.get(key) != value:
+                scalars[key] = value
+            continue
+        patch = _list_patch(old_bd.get(key) or [], value, row_key)
+        if patch is not None:
+            details[key] = patch
+    blocks = _list_patch(
+        old.get("blocks") or [], new.get("blocks") or [], "name"
+    )
+    if not (top or scalars or details or blocks):
+        return None
+    return {
+        "set": top,
+        "breakdown": scalars,
+        "details": details,
+        "blocks": blocks,
+    }
+
+
+def _list_patch(
+    old: list[dict[str, Any]],
+    new: list[dict[str, Any]],
+    key: str,
+) -> dict[str, Any] | None:
+    """Upsert/remove patch between two keyed lists; None if equal.
+
+    Applying the patch replaces upserted rows in place,
+    appends unseen ones, drops removed keys, and — only when
+    that would not already reproduce ``new``'s sequence —
+    reorders to ``order``.
+    """
+    old_by_key = {row[key]: row for row in old}
+    new_keys = [row[key] for row in new]
+    new_key_set = set(new_keys)
+    upsert = [row for row in new if old_by_key.get(row[key]) != row]
+    remove = [k for k in old_by_key if k not in new_key_set]
+    expected = [k for k in old_by_key if k in new_key_set]
+    expected.extend(k for k in new_keys if k not in old_by_key)
+    if not upsert and not remove and expected == new_keys:
+        return None
+    patch: dict[str, Any] = {"upsert": upsert, "remove": remove}
+    if expected != new_keys:
+        patch["order"] = new_keys
+    return patch
+
+
+def _count_blocks(
+    counter: "TokenCounter",
+    paths: list[str],
+    get_block: Any,
+) -> list[tuple[str, int]]:
+    """Render ``paths``' blocks and count them in one batch."""
+    rendered: list[tuple[str, str]] = []
+    for path in paths:
+        block = get_block(path)
+        if block:
+            rendered.append((path, block))
+    counts = counter.count_many([block for _, block in rendered])
+    return [
+        (path, tokens)
+        for (path, _), tokens in zip(rendered, counts)
+    ]
@@ -0,0 +1,248 @@
+"""Coalescing, delta-encoding stream chunk emitter.
+
+Extracted alongside :mod:`ac_dc.llm._streaming` — the worker
+thread in :func:`~ac_dc.llm._streaming.run_completion_sync`
+feeds every accumulated-content update through a
+:class:`StreamChunkEmitter`, which decides when and how to
+push it to the browser.
+
+Two costs motivated this:
+
+- **Bandwidth.** Sending the full accumulated reply on every
+  token delta is O(n²) bytes per stream, multiplied by the
+  number of connected collab browsers. A 20k-token answer
+  pushes hundreds of MB through jrpc-oo.
+- **Event-loop pressure.** One ``run_coroutine_threadsafe``
+  per token floods the loop with callbacks that each
+  serialise and send a frame.
+
+The emitter coalesces updates on a time / size window and,
+between periodic full-content checkpoints, sends append-only
+deltas as ``streamDelta(request_id, offset, text)``.
+Checkpoints go out on the existing
+``streamChunk(request_id, full_content)`` channel, so:
+
+- The first emission of a stream is always a checkpoint —
+  clients start from a known full state.
+- A checkpoint fires at least every ``checkpoint_seconds``
+  while deltas are flowing. A client that reconnected
+  mid-stream, or that missed a delta, discards deltas whose
+  offset doesn't match its buffer and resyncs on the next
+  checkpoint.
+- The final emission is always a checkpoint, so the last
+  ``streamChunk`` a client sees carries the full reply
+  before ``streamComplete``.
+
+Coalesced text never waits on the next token: an update held
+back by the window arms a trailing flush that fires when the
+window closes, so a short chunk followed by a long provider
+pause still reaches the browser promptly.
+
+Negotiation is by capability. jrpc-oo only routes
+``AcApp.streamDelta`` to remotes that registered the method,
+so a browser bundle that predates the delta protocol still
+receives the checkpoints (at coarser granularity) and the
+final full content.
+
+Governing spec: :doc:`specs4/3-llm/streaming` § Chunk
+Delivery Semantics.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+# Scheduling callback — ``(event_name, *args) -> None``.
+# Supplied by the worker thread; wraps
+# ``run_coroutine_threadsafe`` onto the captured main loop.
+ScheduleEvent = Callable[..., None]
+
+# Timer callback — ``(delay_seconds, callback) -> handle``,
+# where the handle has a ``cancel()`` method. Supplied by the
+# worker thread; runs the callback on the main loop after the
+# delay.
+CallLater = Callable[[float, Callable[[], None]], Any]
+
+
+class StreamChunkEmitter:
+    """Per-request chunk emitter used by the streaming worker.
+
+    One instance belongs to one worker thread for the
+    lifetime of one LLM call. The scheduling callback is
+    responsible for crossing onto the event loop. The
+    trailing flush fires on whatever thread ``call_later``
+    runs callbacks on, so flushes are serialised by an
+    internal lock.
+
+    Parameters
+    ----------
+    request_id:
+        Stream request ID carried on every emitted event.
+    schedule:
+        ``schedule(event_name, *args)`` — fires one
+        server-push event. Must not block.
+    delta_enabled:
+        When False every flush is a full-content
+        ``streamChunk`` (legacy wire format, but still
+        coalesced).
+    coalesce_seconds:
+        Minimum interval between flushes. Zero disables
+        time-based coalescing — every update flushes.
+    coalesce_chars:
+        Pending-text size that forces a flush even inside the
+        time window, so a fast burst doesn't sit unsent.
+    checkpoint_seconds:
+        Maximum interval between full-content checkpoints
+        while deltas are flowing.
+    call_later:
+        Arms the trailing flush for text held back by the
+        coalescing window. None disables it — held text then
+        waits for the next update or :meth:`finish`.
+    clock:
+        Monotonic clock; injectable for tests.
+    """
+
+    def __init__(
+        self,
+        request_id: str,
+        schedule: ScheduleEvent,
+        *,
+        delta_enabled: bool = True,
+        coalesce_seconds: float = 0.05,
+        coalesce_chars: int = 2048,
+        checkpoint_seconds: float = 5.0,
+        call_later: CallLater | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._request_id = request_id
+        self._schedule = schedule
+        self._delta_enabled = delta_enabled
+        self._coalesce_seconds = max(0.0, coalesce_seconds)
+        self._coalesce_chars = max(1, coalesce_chars)
+        self._checkpoint_seconds = max(0.0, checkpoint_seconds)
+        self._call_later = call_later
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Latest accumulated content, and the armed trailing
+        # flush (if any) that will send it.
+        self._latest = ""
+        self._trailing: Any = None
+        self._finished = False
+        # Length of the content every client has been sent,
+        # either via a checkpoint or a chain of deltas.
+        self._sent_len = 0
+        # None until the first flush — the first update is
+        # flushed immediately so time-to-first-token isn't
+        # delayed by the coalescing window.
+        self._last_flush: float | None = None
+        self._last_checkpoint: float | None = None
+        self._last_was_checkpoint = False
+        # Counters for observability and tests.
+        self.checkpoints_sent = 0
+        self.deltas_sent = 0
+
+    def feed(self, full_content: str) -> None:
+        """Record a new accumulated-content value.
+
+        Flushes when the coalescing window has elapsed, when
+        the pending text exceeds ``coalesce_chars``, or when
+        this is the first update of the stream. Otherwise the
+        text is held and a trailing flush is armed for the end
+        of the window.
+        """
+        with self._lock:
+            if self._finished:
+                return
+            pending = len(full_content) - self._sent_len
+            if pending <= 0:
+                return
+            self._latest = full_content
+            now = self._clock()
+            if (
+                self._last_flush is None
+                or now - self._last_flush >= self._coalesce_seconds
+                or pending >= self._coalesce_chars
+            ):
+                self._flush(full_content, now, force_checkpoint=False)
+            elif self._trailing is None and self._call_later is not None:
+                delay = self._last_flush + self._coalesce_seconds - now
+                self._trailing = self._call_later(
+                    max(0.0, delay), self._flush_trailing
+                )
+
+    def finish(self, full_content: str) -> None:
+        """Flush any remaining text as a final checkpoint.
+
+        Called once when the stream ends — naturally, on
+        cancel, or on error. No-op when nothing was ever
+        produced, or when the last emission was already a
+        checkpoint of the complete content.
+        """
+        with self._lock:
+            self._finished = True
+            self._cancel_trailing()
+            if not full_content:
+                return
+            if (
+                self._last_was_checkpoint
+                and self._sent_len == len(full_content)
+            ):
+                return
+            self._flush(
+                full_content, self._clock(), force_checkpoint=True
+            )
+
+    def _flush_trailing(self) -> None:
+        """Send text held back since the last flush.
+
+        A late callback — one that lost the race with a flush
+        or :meth:`finish` — finds nothing pending and returns.
+        """
+        with self._lock:
+            self._trailing = None
+            if self._finished or len(self._latest) <= self._sent_len:
+                return
+            self._flush(
+                self._latest, self._clock(), force_checkpoint=False
+            )
+
+    def _cancel_trailing(self) -> None:
+        if self._trailing is not None:
+            self._trailing.cancel()
+            self._trailing = None
+
+    def _flush(
+        self,
+        full_content: str,
+        now: float,
+        *,
+        force_checkpoint: bool,
+    ) -> None:
+        # Caller holds ``self._lock``.
+        self._cancel_trailing()
+        checkpoint = (
+            force_checkpoint
+            or not self._delta_enabled
+            or self._last_checkpoint is None
+            or now - self._last_checkpoint >= self._checkpoint_seconds
+        )
+        if checkpoint:
+            self._emit("streamChunk", self._request_id, full_content)
+            self._last_checkpoint = now
+            self.checkpoints_sent += 1
+        else:
+            self._emit(
+                "streamDelta",
+                self._request_id,
+                self._sent_len,
+                full_content[self._sent_len:],
+            )
+            self.deltas_sent += 1
+        self._last_was_checkpoint = checkpoint
+        self._sent_len = len(full_content)
+        self._last_flush = now
+
+    def _emit(self, event_name: str, *args: Any) -> None:
+        self._schedule(event_name, *args)
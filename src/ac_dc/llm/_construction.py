@@ -27,6 +27,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ac_dc.url_service import URLCache, URLService
+from ac_dc.url_service.http_client import HTTPClient
 
 if TYPE_CHECKING:
     from ac_dc.llm_service import LLMService
@@ -43,7 +44,8 @@ def build_url_service(service: "LLMService") -> URLService:
     """Construct the URL service from config values.
 
     Wires the filesystem cache (from ``url_cache`` app config),
-    the smaller model name, and the SymbolIndex class. When
+    a pooled HTTP client and the fetch fan-out width (same
+    section), the smaller model name, and the SymbolIndex class. When
     the config omits a cache path, the cache uses a
     system-temp-directory default. When the symbol index
     isn't available (pre-deferred-init or tests that skip
@@ -53,11 +55,12 @@ def build_url_service(service: "LLMService") -> URLService:
     cache_config = service._config.url_cache_config
     cache_path = cache_config.get("path")
     ttl_hours = cache_config.get("ttl_hours", 24)
-    if cache_path:
-        cache = URLCache(Path(cache_path), ttl_hours=ttl_hours)
-    else:
-        default_path = Path(tempfile.gettempdir()) / "ac-dc-url-cache"
-        cache = URLCache(default_path, ttl_hours=ttl_hours)
+    max_bytes = cache_config["max_size_mb"] * 1024 * 1024
+    if not cache_path:
+        cache_path = Path(tempfile.gettempdir()) / "ac-dc-url-cache"
+    cache = URLCache(
+        Path(cache_path), ttl_hours=ttl_hours, max_bytes=max_bytes,
+    )
 
     # Lazy symbol-index class import — avoids paying the
     # tree-sitter grammar load cost when the URL service
@@ -79,6 +82,10 @@ def build_url_service(service: "LLMService") -> URLService:
         smaller_model=service._config.smaller_model,
         symbol_index_cls=symbol_index_cls,
         summarizer_timeout=service._config.aux_request_timeout_seconds,
+        http_client=HTTPClient(
+            max_per_host=cache_config["max_connections_per_host"],
+        ),
+        max_concurrent_fetches=cache_config["max_concurrent_fetches"],
     )
 
 
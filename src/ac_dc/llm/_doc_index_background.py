@@ -10,11 +10,18 @@ Phases:
 
 1. **Structural extraction** — walk the repo's file list,
    filter to doc-index extensions, call
-   :meth:`DocIndex.index_repo` on the aux executor. Emits
-   ``startupProgress`` events at 0% (start) and 100% (end).
+   :meth:`DocIndex.index_repo` on the aux executor (which
+   shards extraction over a process pool on a large cold
+   build). Emits ``startupProgress`` events at 0% (start),
+   per shard, and 100% (end).
    Flips ``_doc_index_ready`` on success.
-2. **Keyword enrichment** — per-file loop that reads source
-   text from disk and calls :meth:`DocIndex.enrich_single_file`.
+2. **Keyword enrichment** — batched loop that reads source
+   text from disk and calls :meth:`DocIndex.enrich_files`, a
+   few files per model call (``keywords_batch_files``). The
+   model itself runs in the enrichment worker process when
+   ``keywords_out_of_process`` is set.
+   Sections whose text is unchanged reuse cached KeyBERT
+   candidates; the cache pack is flushed once per pass.
    Emits ``doc_enrichment_queued`` / ``doc_enrichment_file_done``
    / ``doc_enrichment_complete`` events so the frontend's
    progress overlay can render. Sets
@@ -36,6 +43,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from ac_dc.doc_index.enrichment_worker import rss_mb
 from ac_dc.doc_index.keyword_enricher import EnrichmentConfig
 
 if TYPE_CHECKING:
@@ -143,10 +151,30 @@ async def build_doc_index_background(
 
         assert service._main_loop is not None
         loop = service._main_loop
+
+        # Progress arrives per shard from the executor thread
+        # running index_repo (extraction itself is sharded
+        # across a process pool on a large cold build); hop
+        # back onto the event loop to send it. 100% is
+        # reserved for the completion event below.
+        def _on_progress(done: int, total: int) -> None:
+            asyncio.run_coroutine_threadsafe(
+                send_doc_index_progress(
+                    service,
+                    stage="doc_index",
+                    message=(
+                        f"Indexing documentation... {done}/{total}"
+                    ),
+                    percent=min(99, 100 * done // max(total, 1)),
+                ),
+                loop,
+            )
+
         await loop.run_in_executor(
             service._aux_executor,
-            service._doc_index.index_repo,
-            doc_files,
+            lambda: service._doc_index.index_repo(
+                doc_files, progress=_on_progress
+            ),
         )
 
         service._doc_index_ready = True
@@ -198,16 +226,16 @@ async def run_enrichment_background(
     """Enrich every queued doc-index file in the aux executor.
 
     Called by :func:`build_doc_index_background` after
-    structural extraction completes. Per-file operation:
+    structural extraction completes. Per-batch operation:
 
-    1. Read source text (disk I/O — batched with the
+    1. Read source texts (disk I/O — batched with the
        GIL-heavy extraction in the same executor task).
-    2. Call :meth:`DocIndex.enrich_single_file` with the
-       source text.
-    3. Emit a progress event so the frontend's dialog
-       header bar advances.
+    2. Call :meth:`DocIndex.enrich_files` with the batch, so
+       every long section in it shares one model call.
+    3. Emit a progress event per file so the frontend's
+       dialog header bar advances.
 
-    Yields to the event loop between files via
+    Yields to the event loop between batches via
     ``await asyncio.sleep(0)`` so WebSocket traffic flows
     during long enrichment runs.
 
@@ -222,6 +250,10 @@ async def run_enrichment_background(
     - ``doc_enrichment_complete`` — fired on completion;
       the bar fades out
 
+    On completion the section keyword cache is flushed and
+    the status is re-broadcast with its hit rate (see
+    :func:`~ac_dc.llm._lifecycle.broadcast_enrichment_status`).
+
     Sets ``_doc_index_enriched = True`` on completion so
     ``get_mode`` reports the new state. Non-fatal — if
     enrichment fails mid-loop, the flag stays False and
@@ -258,6 +290,7 @@ async def run_enrichment_background(
     if not queue:
         service._doc_index_enriched = True
         service._enrichment_status = "complete"
+        service._broadcast_enrichment_status()
         await send_doc_index_progress(
             service,
             stage="doc_enrichment_complete",
@@ -278,65 +311,74 @@ async def run_enrichment_background(
         percent=0,
     )
 
-    for idx, rel_path in enumerate(queue, start=1):
-        # Log BEFORE dispatching so any mid-file crash
+    # Files go to the model in batches: every long section of
+    # a batch is one extract_keywords call, which amortises
+    # the forward pass (and, out of process, the pipe round
+    # trip) across files.
+    batch_files = service._config.doc_index_config["keywords_batch_files"]
+    done = 0
+    for start in range(0, total, batch_files):
+        batch = queue[start:start + batch_files]
+        # Log BEFORE dispatching so any mid-batch crash
         # (OOM kill, segfault in the native KeyBERT /
         # torch / OpenBLAS stack, joblib worker death)
-        # leaves a clear "last attempted file" trace.
-        # Without this, a mid-file crash looks like a
-        # crash after the previous file's success log.
+        # leaves a clear "last attempted files" trace.
         #
-        # RSS is logged per file because the OOM mode
+        # RSS is logged per batch because the OOM mode
         # observed in the field — kernel SIGKILL during
         # KeyBERT's MMR cosine-similarity step on a
         # 1.4MB SVG prose block — manifested as a single
         # transient spike on top of the steady-state
-        # baseline. Per-file RSS lets us tell a creeping
-        # leak (would climb across many files) from a
-        # one-shot allocation spike (jumps on a single
-        # large input) at a glance.
-        #
-        # Steady-state RSS for KeyBERT + sentence-
-        # transformers is ~1.2GB after the first few
-        # files — PyTorch's caching allocator and
-        # joblib's loky workers reach their working set
-        # and plateau. That's not a leak; it's the cost
-        # of running the model in-process.
-        rss_mb = _rss_mb()
+        # baseline. With the model in-process, steady-state
+        # RSS is ~1.2GB (PyTorch's caching allocator and
+        # joblib's loky workers plateau — not a leak); with
+        # the enrichment worker it stays in the child, which
+        # recycles itself past its own threshold.
         logger.info(
-            "Enrichment: starting file %d/%d (rss=%dMB): %s",
-            idx, total, rss_mb, rel_path,
+            "Enrichment: starting files %d-%d/%d (rss=%dMB): %s",
+            start + 1, start + len(batch), total, rss_mb(),
+            ", ".join(batch),
         )
         try:
             await loop.run_in_executor(
                 service._aux_executor,
-                enrich_one_file_sync,
+                enrich_files_sync,
                 service,
-                rel_path,
+                batch,
             )
         except Exception as exc:
             logger.warning(
                 "Enrichment failed for %s: %s",
-                rel_path, exc,
+                ", ".join(batch), exc,
             )
         else:
             logger.debug(
-                "Enrichment: completed file %d/%d: %s",
-                idx, total, rel_path,
+                "Enrichment: completed files %d-%d/%d",
+                start + 1, start + len(batch), total,
             )
 
-        percent = int((idx / total) * 100)
-        await send_doc_index_progress(
-            service,
-            stage="doc_enrichment_file_done",
-            message=f"Enriched {rel_path}",
-            percent=percent,
-        )
+        for rel_path in batch:
+            done += 1
+            await send_doc_index_progress(
+                service,
+                stage="doc_enrichment_file_done",
+                message=f"Enriched {rel_path}",
+                percent=int((done / total) * 100),
+            )
         await asyncio.sleep(0)
 
+    # One pack write per pass, on the aux executor so it
+    # serialises with any deferred single-file enrichment.
+    cache = service._enricher.cache
+    if cache is not None:
+        await loop.run_in_executor(service._aux_executor, cache.flush)
+        logger.info(
+            "Keyword enrichment: section cache %s", cache.stats()
+        )
     service._doc_index_enriched = True
     service._enrichment_status = "complete"
     logger.info("Keyword enrichment: complete")
+    service._broadcast_enrichment_status()
     await send_doc_index_progress(
         service,
         stage="doc_enrichment_complete",
@@ -345,85 +387,79 @@ async def run_enrichment_background(
     )
 
 
-def _rss_mb() -> int:
-    """Best-effort resident-set-size in megabytes.
+def enrich_one_file_sync(
+    service: "LLMService",
+    rel_path: str,
+) -> None:
+    """Read source text and run enrichment for one file. Executor-side.
 
-    Reads /proc/self/status on Linux. Returns 0 on platforms
-    without /proc or when the file is unreadable — the log
-    line still fires with rss=0 and per-file timing data is
-    preserved. We avoid pulling in psutil to keep the import
-    surface small; the /proc parse is trivial.
+    Single-file form of :func:`enrich_files_sync`, used by the
+    post-write hook.
     """
-    try:
-        with open("/proc/self/status", "r") as f:
-            for line in f:
-                if line.startswith("VmRSS:"):
-                    # Format: "VmRSS:    123456 kB"
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        return int(parts[1]) // 1024
-    except Exception:
-        pass
-    return 0
+    enrich_files_sync(service, [rel_path])
 
 
-def enrich_one_file_sync(
+def enrich_files_sync(
     service: "LLMService",
-    rel_path: str,
+    rel_paths: list[str],
 ) -> None:
-    """Read source text and run enrichment. Executor-side.
+    """Read source texts and enrich them as one batch. Executor-side.
 
     Split out as a named function so ``run_in_executor`` has
-    something to call without a closure. The read + enrich
-    pair runs on a single worker thread so the disk I/O is
+    something to call without a closure. The reads + enrich
+    run on a single worker thread so the disk I/O is
     adjacent to the GIL-heavy extraction work rather than
     ping-ponging across threads.
 
-    Missing files (deleted between structural extraction
-    and enrichment) are handled by the enricher itself.
+    Files that can't be read are dropped from the batch;
+    files deleted between structural extraction and
+    enrichment are handled by :meth:`DocIndex.enrich_files`.
     """
     if service._repo is None:
         return
     # Bracket the enrichment call with PID/TID logs so a
     # segfault in the native KeyBERT/sentence-transformers
-    # stack leaves a "last seen alive" marker for this
-    # specific file. Logged at debug to avoid spamming the
-    # steady-state log.
+    # stack (in-process mode) leaves a "last seen alive"
+    # marker for this specific batch. Logged at debug to
+    # avoid spamming the steady-state log.
     import os as _os
     import threading as _threading
     logger.debug(
-        "enrich_one_file_sync: enter rel_path=%s pid=%d tid=%d",
-        rel_path, _os.getpid(), _threading.get_ident(),
+        "enrich_files_sync: enter rel_paths=%s pid=%d tid=%d",
+        rel_paths, _os.getpid(), _threading.get_ident(),
     )
-    try:
-        source_text = service._repo.get_file_content(rel_path)
-    except Exception as exc:
-        logger.debug(
-            "Enrichment source read failed for %s: %s",
-            rel_path, exc,
-        )
+    items: list[tuple[str, str]] = []
+    for rel_path in rel_paths:
+        try:
+            source_text = service._repo.get_file_content(rel_path)
+        except Exception as exc:
+            logger.debug(
+                "Enrichment source read failed for %s: %s",
+                rel_path, exc,
+            )
+            continue
+        # Log source size before dispatch so a one-shot spike
+        # on an unusually large file is attributable to the
+        # input rather than to model state. Threshold of 100KB
+        # is well above ordinary markdown sections; SVG
+        # extracts that exceed it are the prime suspects for
+        # the memory profile that triggers OOM.
+        size_kb = len(source_text) // 1024
+        if size_kb > 100:
+            logger.info(
+                "enrich_files_sync: large input rel_path=%s "
+                "size=%dKB",
+                rel_path, size_kb,
+            )
+        items.append((rel_path, source_text))
+    if not items:
         return
-    # Log source size before dispatch so a one-shot spike
-    # on an unusually large file is attributable to the
-    # input rather than to model state. Threshold of 100KB
-    # is well above ordinary markdown sections; SVG
-    # extracts that exceed it are the prime suspects for
-    # the memory profile that triggers OOM.
-    size_kb = len(source_text) // 1024
-    if size_kb > 100:
-        logger.info(
-            "enrich_one_file_sync: large input rel_path=%s "
-            "size=%dKB",
-            rel_path, size_kb,
-        )
     try:
-        service._doc_index.enrich_single_file(
-            rel_path, source_text=source_text
-        )
+        service._doc_index.enrich_files(items)
     finally:
         logger.debug(
-            "enrich_one_file_sync: exit rel_path=%s pid=%d tid=%d",
-            rel_path, _os.getpid(), _threading.get_ident(),
+            "enrich_files_sync: exit rel_paths=%s pid=%d tid=%d",
+            rel_paths, _os.getpid(), _threading.get_ident(),
         )
 
 
@@ -521,7 +557,8 @@ async def enrich_written_file(
     Coroutine wrapper so the post-write hook can
     ``ensure_future`` without constructing a lambda.
     Delegates to :func:`enrich_one_file_sync` which reads the
-    file and runs the enricher on the worker thread.
+    file and runs the enricher on the worker thread, then
+    flushes the section keyword cache on the same executor.
     """
     if service._main_loop is None:
         try:
@@ -537,6 +574,14 @@ async def enrich_written_file(
             service,
             rel_path,
         )
+        cache = (
+            service._enricher.cache
+            if service._enricher is not None else None
+        )
+        if cache is not None:
+            await loop.run_in_executor(
+                service._aux_executor, cache.flush
+            )
     except Exception as exc:
         logger.warning(
             "Deferred enrichment failed for %s: %s",
@@ -453,6 +453,19 @@ async def post_response(
     # continues to use ``streamComplete`` for response
     # finalisation. Two events with two distinct purposes,
     # neither one blocking the other's UX.
+    #
+    # The main scope's settled breakdown is pushed first
+    # (usually as a small delta), so browsers with a push
+    # already applied can skip the refetch entirely.
+    if (
+        scope.context is service._context
+        and service._event_callback is not None
+    ):
+        try:
+            from ac_dc.llm._breakdown import push_context_breakdown
+            await push_context_breakdown(service)
+        except Exception:
+            logger.exception("Context breakdown push failed")
     await service._broadcast_event_async(
         "postResponseComplete", request_id,
     )
@@ -536,7 +549,16 @@ def broadcast_enrichment_status(service: "LLMService") -> None:
     change actually occurs — the handler's same-mode
     short-circuit applies, so cross-reference state is
     preserved.
+
+    ``enrichment_cache`` carries the per-section keyword
+    cache's session hit/miss counts and hit rate (None when
+    no cache is attached), so a status readout can show how
+    much of a pass skipped the model.
     """
+    cache = (
+        service._enricher.cache
+        if service._enricher is not None else None
+    )
     broadcast_event(
         service,
         "modeChanged",
@@ -544,5 +566,8 @@ def broadcast_enrichment_status(service: "LLMService") -> None:
             "mode": service._context.mode.value,
             "cross_ref_enabled": service._cross_ref_enabled,
             "enrichment_status": service._enrichment_status,
+            "enrichment_cache": (
+                cache.stats() if cache is not None else None
+            ),
         },
     )
\ No newline at end of file
@@ -204,6 +204,14 @@ def start_review(
     }
     service._review_active = True
 
+    # Warm the review-context cache: render nothing yet, but
+    # queue every changed file's diff on the cache's pool so
+    # the first turn with a selection finds them ready.
+    service._review_cache.reset(parent_commit, branch_tip)
+    service._review_cache.prefetch(
+        service._repo, parent_commit, branch_tip, changed_files
+    )
+
     # Broadcast review state to all clients.
     service._broadcast_event(
         "reviewStarted", get_review_state(service)
@@ -287,6 +295,7 @@ def end_review(service: "LLMService") -> dict[str, Any]:
     }
     service._review_active = False
     service._context.clear_review_context()
+    service._review_cache.clear()
 
     service._broadcast_event(
         "reviewEnded", get_review_state(service)
@@ -386,8 +395,11 @@ def build_and_set_review_context(
     """Build the review context block and attach to context manager.
 
     Called from ``_stream_chat`` on every request during
-    review mode. Rebuilds from scratch so the reverse-diff
-    set reflects the CURRENT file selection.
+    review mode. The header (summary, commits, pre-change
+    symbol map) and each file's diff section come from
+    :attr:`service._review_cache`, prefilled at review entry,
+    so a turn only concatenates the sections for the CURRENT
+    file selection. See :mod:`ac_dc.llm._review_cache`.
 
     Review mode is main-conversation-only per
     :doc:`specs4/4-features/code-review` § "Limitations —
@@ -402,96 +414,27 @@ def build_and_set_review_context(
     if not state.get("active") or service._repo is None:
         return
 
-    parts: list[str] = []
-
-    # 1. Summary block.
-    branch = state.get("branch") or "(unknown)"
-    parent = (state.get("parent_commit") or "")[:7]
-    tip = (state.get("branch_tip") or "")[:7]
-    stats = state.get("stats") or {}
-    commit_count = stats.get("commit_count", 0)
-    files_changed = stats.get("files_changed", 0)
-    additions = stats.get("additions", 0)
-    deletions = stats.get("deletions", 0)
-    summary_line = (
-        f"## Review: {branch} (merge-base {parent} → {tip})\n"
-        f"{commit_count} commits, "
-        f"{files_changed} files changed, "
-        f"+{additions} -{deletions}"
-    )
-    parts.append(summary_line)
-
-    # 2. Commits list.
-    commits = state.get("commits") or []
-    if commits:
-        commit_lines = ["## Commits"]
-        for i, commit in enumerate(commits, start=1):
-            short = commit.get("short_sha") or (
-                (commit.get("sha") or "")[:7]
-            )
-            msg = (
-                (commit.get("message") or "")
-                .split("\n", 1)[0]
-            )
-            author = commit.get("author") or "?"
-            date = (
-                commit.get("relative_date")
-                or commit.get("date")
-                or ""
-            )
-            commit_lines.append(
-                f"{i}. {short} {msg} ({author}, {date})"
-            )
-        parts.append("\n".join(commit_lines))
-
-    # 3. Pre-change symbol map.
-    pre_map = state.get("pre_change_symbol_map") or ""
-    if pre_map:
-        parts.append(
-            "## Pre-Change Symbol Map\n"
-            "Symbol map from the parent commit (before the "
-            "reviewed changes). Compare against the current "
-            "symbol map in the repository structure above.\n\n"
-            + pre_map
-        )
+    cache = service._review_cache
+    parts: list[str] = [cache.header(state)]
 
-    # 4. Reverse diffs for every selected file that's also
-    # in the review's changed-files set.
-    changed_files_entries = state.get("changed_files") or []
+    # Diffs for every selected file that's also in the
+    # review's changed-files set.
     changed_paths = {
-        f.get("path"): f for f in changed_files_entries
+        f.get("path"): f for f in state.get("changed_files") or []
         if f.get("path")
     }
+    parent = state.get("parent_commit") or ""
+    tip = state.get("branch_tip") or ""
     diff_blocks: list[str] = []
-    base_sha = state.get("parent_commit")
-    tip_sha = state.get("branch_tip")
     for path in scope.selected_files:
-        if path not in changed_paths:
-            continue
-        try:
-            diff_result = service._repo.get_review_file_diff(
-                path,
-                base_commit=base_sha,
-                head_commit=tip_sha,
-            )
-        except Exception as exc:
-            logger.debug(
-                "Review diff fetch failed for %s: %s",
-                path, exc,
-            )
-            continue
-        diff_text = diff_result.get("diff") or ""
-        if not diff_text:
+        entry = changed_paths.get(path)
+        if entry is None:
             continue
-        entry = changed_paths[path]
-        add_ct = entry.get("additions", 0)
-        del_ct = entry.get("deletions", 0)
-        diff_blocks.append(
-            f"### {path} (+{add_ct} -{del_ct})\n"
-            "```diff\n"
-            f"{diff_text}"
-            "\n```"
+        block = cache.diff_block(
+            service._repo, parent, tip, path, entry
         )
+        if block:
+            diff_blocks.append(block)
     if diff_blocks:
         parts.append(
             "## Diffs (selected files)\n"
@@ -502,4 +445,4 @@ def build_and_set_review_context(
         )
 
     review_text = "\n\n".join(parts)
-    scope.context.set_review_context(review_text)
\ No newline at end of file
+    scope.context.set_review_context(review_text)
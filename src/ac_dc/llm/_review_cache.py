@@ -0,0 +1,305 @@
+"""Rendered review-context pieces, cached for the life of a review.
+
+:func:`ac_dc.llm._review.build_and_set_review_context` runs on
+every chat request during review mode. It used to rebuild the
+whole block from scratch each time — re-render the commit list
+and spawn one ``git diff <parent> <tip> -- <path>`` subprocess
+per selected changed file. On a large review branch with a few
+dozen files selected that was a few dozen subprocesses and a
+megabyte or so of string building per turn, for text that
+cannot change while the review is active.
+
+:class:`ReviewContextCache` (one per :class:`LLMService`) keeps
+the pieces between turns:
+
+- **Per-file diff blocks, keyed by (parent, tip, path).** Both
+  SHAs are full commit IDs and the diff runs against the object
+  database, so a key's value never changes — there is nothing
+  to invalidate, only memory to release. Each entry is the
+  fully rendered ``### path (+a -d)`` section, fenced, ready to
+  join.
+- **The header, keyed by (parent, tip).** Summary line, commit
+  list and pre-change symbol map are fixed at review entry.
+
+:meth:`ReviewContextCache.prefetch` is called from
+``start_review`` with every changed file; it fans the diffs out
+over a small thread pool and returns immediately. Entries are
+stored as futures, so a turn that arrives before the prefetch
+finishes waits on the in-flight diff instead of running a
+second one. A path the prefetch never saw (or one whose diff
+failed) is computed inline on first use. Failures are not
+cached — the next turn retries.
+
+:meth:`ReviewContextCache.reset` drops entries for any other
+(parent, tip) pair and cancels their queued diffs; ``end_review``
+clears everything.
+
+Governing spec: :doc:`specs4/4-features/code-review` § Review
+Context in LLM Messages.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable
+
+logger = logging.getLogger("ac_dc.llm_service")
+
+
+# Worker threads for the review-entry prefetch. Each diff is
+# one short git subprocess; a handful in flight saturates the
+# object-database reads without starving the other executors.
+_PREFETCH_WORKERS = 4
+
+
+def render_review_header(state: dict[str, Any]) -> str:
+    """Render the summary, commit list, and pre-change symbol map.
+
+    Everything in the review block except the per-file diffs —
+    the parts that depend only on review state captured at
+    entry.
+    """
+    parts: list[str] = []
+
+    # 1. Summary block.
+    branch = state.get("branch") or "(unknown)"
+    parent = (state.get("parent_commit") or "")[:7]
+    tip = (state.get("branch_tip") or "")[:7]
+    stats = state.get("stats") or {}
+    commit_count = stats.get("commit_count", 0)
+    files_changed = stats.get("files_changed", 0)
+    additions = stats.get("additions", 0)
+    deletions = stats.get("deletions", 0)
+    parts.append(
+        f"## Review: {branch} (merge-base {parent} → {tip})\n"
+        f"{commit_count} commits, "
+        f"{files_changed} files changed, "
+        f"+{additions} -{deletions}"
+    )
+
+    # 2. Commits list.
+    commits = state.get("commits") or []
+    if commits:
+        commit_lines = ["## Commits"]
+        for i, commit in enumerate(commits, start=1):
+            short = commit.get("short_sha") or (
+                (commit.get("sha") or "")[:7]
+            )
+            msg = (commit.get("message") or "").split("\n", 1)[0]
+            author = commit.get("author") or "?"
+            date = (
+                commit.get("relative_date")
+                or commit.get("date")
+                or ""
+            )
+            commit_lines.append(
+                f"{i}. {short} {msg} ({author}, {date})"
+            )
+        parts.append("\n".join(commit_lines))
+
+    # 3. Pre-change symbol map.
+    pre_map = state.get("pre_change_symbol_map") or ""
+    if pre_map:
+        parts.append(
+            "## Pre-Change Symbol Map\n"
+            "Symbol map from the parent commit (before the "
+            "reviewed changes). Compare against the current "
+            "symbol map in the repository structure above.\n\n"
+            + pre_map
+        )
+
+    return "\n\n".join(parts)
+
+
+def render_diff_block(
+    repo: Any,
+    parent: str | None,
+    tip: str | None,
+    path: str,
+    entry: dict[str, Any],
+) -> str:
+    """Run the per-file diff and render its section.
+
+    Returns an empty string when the file has no textual diff
+    (mode-only changes). Exceptions from the repo propagate so
+    the cache can decline to store them.
+    """
+    diff_result = repo.get_review_file_diff(
+        path, base_commit=parent, head_commit=tip,
+    )
+    diff_text = diff_result.get("diff") or ""
+    if not diff_text:
+        return ""
+    add_ct = entry.get("additions", 0)
+    del_ct = entry.get("deletions", 0)
+    return (
+        f"### {path} (+{add_ct} -{del_ct})\n"
+        "```diff\n"
+        f"{diff_text}"
+        "\n```"
+    )
+
+
+_DiffKey = tuple[str, str, str]
+
+
+class ReviewContextCache:
+    """Memoised header and per-file diff blocks for the active review."""
+
+    def __init__(self, max_workers: int = _PREFETCH_WORKERS) -> None:
+        self._max_workers = max(1, int(max_workers))
+        self._lock = threading.Lock()
+        self._diffs: dict[_DiffKey, Future[str]] = {}
+        self._header: tuple[tuple[str, str], str] | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        # Diff subprocesses actually started, for logs and tests.
+        self.diffs_computed = 0
+
+    def __len__(self) -> int:
+        return len(self._diffs)
+
+    # ------------------------------------------------------------------
+    # Header
+    # ------------------------------------------------------------------
+
+    def header(self, state: dict[str, Any]) -> str:
+        """Return the rendered header for ``state``, from cache when valid."""
+        key = (
+            state.get("parent_commit") or "",
+            state.get("branch_tip") or "",
+        )
+        with self._lock:
+            cached = self._header
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = render_review_header(state)
+        with self._lock:
+            self._header = (key, text)
+        return text
+
+    # ------------------------------------------------------------------
+    # Diffs
+    # ------------------------------------------------------------------
+
+    def prefetch(
+        self,
+        repo: Any,
+        parent: str,
+        tip: str,
+        changed_files: Iterable[dict[str, Any]],
+    ) -> None:
+        """Queue a diff for every changed file not already cached.
+
+        Returns immediately; the diffs run on the cache's own
+        pool so review entry doesn't wait on them.
+        """
+        with self._lock:
+            executor = self._executor
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="ac-dc-review",
+                )
+                self._executor = executor
+            for entry in changed_files:
+                path = entry.get("path")
+                if not path:
+                    continue
+                key = (parent, tip, path)
+                if key in self._diffs:
+                    continue
+                self._diffs[key] = executor.submit(
+                    self._compute, repo, parent, tip, path, entry,
+                )
+
+    def diff_block(
+        self,
+        repo: Any,
+        parent: str,
+        tip: str,
+        path: str,
+        entry: dict[str, Any],
+    ) -> str:
+        """Return the rendered diff section for ``path``.
+
+        Waits on a prefetched diff if one is in flight,
+        otherwise computes inline. A failed diff is logged,
+        evicted, and rendered as empty.
+        """
+        key = (parent, tip, path)
+        owner = False
+        with self._lock:
+            future = self._diffs.get(key)
+            if future is None:
+                future = Future()
+                self._diffs[key] = future
+                owner = True
+        if owner:
+            try:
+                future.set_result(
+                    self._compute(repo, parent, tip, path, entry)
+                )
+            except Exception as exc:
+                future.set_exception(exc)
+        try:
+            return future.result()
+        except Exception as exc:
+            logger.debug(
+                "Review diff fetch failed for %s: %s", path, exc
+            )
+            with self._lock:
+                if self._diffs.get(key) is future:
+                    del self._diffs[key]
+            return ""
+
+    def _compute(
+        self,
+        repo: Any,
+        parent: str,
+        tip: str,
+        path: str,
+        entry: dict[str, Any],
+    ) -> str:
+        with self._lock:
+            self.diffs_computed += 1
+        return render_diff_block(repo, parent, tip, path, entry)
+
+    # ------------------------------------------------------------------
+    # Lifetime
+    # ------------------------------------------------------------------
+
+    def reset(self, parent: str | None, tip: str | None) -> None:
+        """Drop every entry that doesn't belong to ``(parent, tip)``.
+
+        Queued diffs for dropped entries are cancelled; ones
+        already running finish and are discarded.
+        """
+        with self._lock:
+            stale = [
+                key for key in self._diffs
+                if key[0] != parent or key[1] != tip
+            ]
+            for key in stale:
+                self._diffs.pop(key).cancel()
+            if self._header is not None and self._header[0] != (
+                parent or "", tip or "",
+            ):
+                self._header = None
+
+    def clear(self) -> None:
+        """Drop everything, cancelling queued diffs."""
+        with self._lock:
+            for future in self._diffs.values():
+                future.cancel()
+            self._diffs.clear()
+            self._header = None
+
+    def close(self) -> None:
+        """Clear and release the prefetch pool. Non-blocking."""
+        self.clear()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
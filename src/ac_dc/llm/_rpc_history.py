@@ -43,12 +43,30 @@ def history_search(
     query: str,
     role: str | None = None,
     limit: int = 50,
+    offset: int = 0,
+    session_id: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    include_agents: bool = True,
 ) -> list[dict[str, Any]]:
-    """Search conversation history across all sessions."""
+    """Ranked full-text search across all sessions.
+
+    ``offset``/``limit`` page through the ranked hits;
+    ``session_id`` and the ``since``/``until`` ISO timestamp
+    bounds narrow the search. Agent turn archives are included
+    unless ``include_agents`` is False.
+    """
     if service._history_store is None:
         return []
     return service._history_store.search_messages(
-        query, role=role, limit=limit
+        query,
+        role=role,
+        session_id=session_id,
+        since=since,
+        until=until,
+        include_agents=include_agents,
+        limit=limit,
+        offset=offset,
     )
 
 
@@ -171,6 +189,7 @@ def load_session_into_context(
     )
     if not messages:
         return {"error": f"Session {session_id} not found or empty"}
+    service._history_store.flush()
     service._context.clear_history()
     service._context.set_history(messages)
     service._session_id = session_id
@@ -121,7 +121,13 @@ def shutdown(service: "LLMService") -> None:
     Non-blocking: cancel the cache warmer and tear down all
     three executors with ``wait=False``. In-flight work is
     abandoned — users see a stream interruption, the OS
-    reclaims thread/file handles on process exit.
+    reclaims thread/file handles on process exit. The keyword
+    enrichment worker process, if one was started, is asked
+    to exit (it is a daemon process, so it dies with us
+    regardless). The URL service drops its fetch threads and
+    pooled connections, and the review-context cache its
+    prefetch pool. The history store writes out its pending
+    session-index appends.
     """
     warmer = getattr(service, "_cache_warmer", None)
     if warmer is not None:
@@ -135,6 +141,22 @@ def shutdown(service: "LLMService") -> None:
 
     service._aux_executor.shutdown(wait=False)
 
+    worker = getattr(service, "_enrichment_worker", None)
+    if worker is not None:
+        worker.close()
+
+    url_service = getattr(service, "_url_service", None)
+    if url_service is not None:
+        url_service.close()
+
+    review_cache = getattr(service, "_review_cache", None)
+    if review_cache is not None:
+        review_cache.close()
+
+    history_store = getattr(service, "_history_store", None)
+    if history_store is not None:
+        history_store.flush()
+
 
 # ---------------------------------------------------------------------------
 # Collaboration guard
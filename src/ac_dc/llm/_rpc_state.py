@@ -371,6 +371,7 @@ def new_session(service: "LLMService") -> dict[str, Any]:
         return restricted
     if service._history_store is not None:
         from ac_dc.history_store import HistoryStore
+        service._history_store.flush()
         service._session_id = HistoryStore.new_session_id()
     else:
         service._session_id = (
@@ -12,9 +12,10 @@ Three groupings:
   :func:`detect_and_fetch`. The async ones run the blocking
   HTTP / git-clone / LLM summarization in the aux executor
   so the event loop stays responsive.
-- **Read-only query** — :func:`get_url_content`. Returns the
-  stored content dict or a sentinel error. No localhost
-  gate — reading URL state is safe for any caller.
+- **Read-only query** — :func:`get_url_content`,
+  :func:`get_url_cache_stats`. Return the stored content dict
+  (or a sentinel error) and the cache's size and counters. No
+  localhost gate — reading URL state is safe for any caller.
 - **Mutation** — :func:`invalidate_url_cache`,
   :func:`remove_fetched_url`, :func:`clear_url_cache`.
   Localhost-only.
@@ -139,6 +140,11 @@ def get_url_content(
 # ---------------------------------------------------------------------------
 
 
+def get_url_cache_stats(service: "LLMService") -> dict[str, Any]:
+    """Return URL cache size, budget and hit/miss/eviction counters."""
+    return service._url_service.cache_stats()
+
+
 def invalidate_url_cache(
     service: "LLMService",
     url: str,
@@ -29,6 +29,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 from typing import TYPE_CHECKING, Any
 
 from ac_dc.context_manager import Mode
@@ -166,6 +167,23 @@ def _indexed_paths_in_dir(
     return covered
 
 
+def _with_token_counts(
+    service: "LLMService",
+    rows: list[tuple[str, float, str]],
+) -> list[tuple[str, float, int]]:
+    """Replace each row's rendered block with its token count.
+
+    One :meth:`TokenCounter.count_many` call for the whole
+    enumeration — a large repo has hundreds of dir-blocks,
+    and the batch encoder spreads them across cores.
+    """
+    counts = service._counter.count_many([block for _, _, block in rows])
+    return [
+        (key, mtime, tokens)
+        for (key, mtime, _), tokens in zip(rows, counts)
+    ]
+
+
 def _enumerate_dir_blocks(
     service: "LLMService",
 ) -> list[tuple[str, float, int]]:
@@ -216,7 +234,9 @@ def _enumerate_dir_blocks(
 
     excluded = _excluded_set(service)
     mode = service._context.mode
-    keys: list[tuple[str, float, int]] = []
+    # (key, mtime, rendered block) — counted in one batch at
+    # the end.
+    rows: list[tuple[str, float, str]] = []
 
     # symbols:<dir> — code mode only
     if mode == Mode.CODE and service._symbol_index is not None:
@@ -241,12 +261,9 @@ def _enumerate_dir_blocks(
                 block = service._symbol_index.get_dir_symbols_block(
                     directory
                 )
-                tokens = (
-                    service._counter.count(block) if block else 0
-                )
             except Exception:
-                tokens = 0
-            keys.append((f"symbols:{directory}", mtime, tokens))
+                block = ""
+            rows.append((f"symbols:{directory}", mtime, block))
 
     # docs:<dir> — doc mode only
     if mode == Mode.DOC:
@@ -267,10 +284,9 @@ def _enumerate_dir_blocks(
             mtime = repo.get_directory_mtime(directory)
             try:
                 block = service._doc_index.get_dir_docs_block(directory)
-                tokens = service._counter.count(block) if block else 0
             except Exception:
-                tokens = 0
-            keys.append((f"docs:{directory}", mtime, tokens))
+                block = ""
+            rows.append((f"docs:{directory}", mtime, block))
 
     # plain_files:<dir> — subtract files already covered by
     # the active-mode index, and drop user-excluded files.
@@ -290,14 +306,11 @@ def _enumerate_dir_blocks(
         if not leftover:
             continue
         mtime = repo.get_directory_mtime(directory)
-        block = "\n".join(leftover)
-        try:
-            tokens = service._counter.count(block) if block else 0
-        except Exception:
-            tokens = 0
-        keys.append((f"plain_files:{directory}", mtime, tokens))
+        rows.append(
+            (f"plain_files:{directory}", mtime, "\n".join(leftover))
+        )
 
-    return keys
+    return _with_token_counts(service, rows)
 
 
 # ---------------------------------------------------------------------------
@@ -403,8 +416,12 @@ def _dir_block_active_items(
     dir-block — the block hash changes, the entry shows up
     in active_items with the new hash, and the membrane
     cascade demotes the block to Active to re-ride flux.
+
+    Blocks are rendered first and token-counted in a single
+    batch at the end.
     """
     items: dict[str, dict[str, Any]] = {}
+    blocks: dict[str, str] = {}
 
     active_excluded = set(scope.context.file_context.get_files())
     user_excluded = _excluded_set(service)
@@ -427,10 +444,8 @@ def _dir_block_active_items(
                 )
             except Exception:
                 continue
-            tokens = (
-                service._counter.count(block) if block else 0
-            )
-            items[key] = {"hash": sig, "tokens": tokens}
+            items[key] = {"hash": sig}
+            blocks[key] = block
         elif key.startswith("docs:"):
             directory = key[len("docs:"):]
             try:
@@ -442,10 +457,8 @@ def _dir_block_active_items(
                 )
             except Exception:
                 continue
-            tokens = (
-                service._counter.count(block) if block else 0
-            )
-            items[key] = {"hash": sig, "tokens": tokens}
+            items[key] = {"hash": sig}
+            blocks[key] = block
         elif key.startswith("plain_files:"):
             directory = key[len("plain_files:"):]
             try:
@@ -460,14 +473,15 @@ def _dir_block_active_items(
                 and f not in user_excluded
             )
             block = "\n".join(files_in_dir)
-            tokens = (
-                service._counter.count(block) if block else 0
-            )
             sig = hashlib.sha256(
                 block.encode("utf-8")
             ).hexdigest()
-            items[key] = {"hash": sig, "tokens": tokens}
+            items[key] = {"hash": sig}
+            blocks[key] = block
 
+    counts = service._counter.count_many(list(blocks.values()))
+    for key, tokens in zip(blocks, counts):
+        items[key]["tokens"] = tokens
     return items
 
 
@@ -487,12 +501,14 @@ def update_stability(
     Order of operations:
 
     0. Defensive excluded-files removal from the tracker.
-    1. Selected files — full content hash, ``file:{path}``.
+    1. Selected files — full content hash, ``file:{path}``
+       (cached by the file context until the content changes).
     2. Dir-blocks — current signature hash + tokens. Files
        currently in Active full-text are excluded from the
        block, so a file moving in/out of Active changes the
        parent directory's hash and re-rides flux.
-    3. History messages.
+    3. History messages (hash and tokens cached per message
+       by the context manager).
     4. Run tracker.update().
 
     Spec: :doc:`specs-reference/3-llm/cache-tiering`
@@ -518,32 +534,30 @@ def update_stability(
 
     active_items: dict[str, dict[str, Any]] = {}
 
-    for path in scope.selected_files:
-        content = scope.context.file_context.get_content(path)
-        if content:
-            h = hashlib.sha256(
-                content.encode("utf-8")
-            ).hexdigest()
-            active_items[f"file:{path}"] = {
-                "hash": h,
-                "tokens": service._counter.count(content),
-            }
+    # Selected files and history messages — hashes and token
+    # counts are cached by the file context and the context
+    # manager alongside the content they describe, so an
+    # unchanged selection or history costs no rehashing here.
+    file_context = scope.context.file_context
+    file_paths = [
+        path for path in scope.selected_files
+        if file_context.get_content(path)
+    ]
+    file_tokens = file_context.get_content_token_counts(
+        service._counter, file_paths
+    )
+    for path in file_paths:
+        active_items[f"file:{path}"] = {
+            "hash": file_context.get_content_hash(path),
+            "tokens": file_tokens[path],
+        }
 
     active_items.update(_dir_block_active_items(service, scope))
 
-    history = scope.context.get_history()
-    for i, msg in enumerate(history):
-        role = msg.get("role", "user")
-        content = msg.get("content", "") or ""
-        if not isinstance(content, str):
-            content = str(content)
-        h = hashlib.sha256(
-            f"{role}:{content}".encode("utf-8")
-        ).hexdigest()
-        active_items[f"history:{i}"] = {
-            "hash": h,
-            "tokens": service._counter.count(msg),
-        }
+    for i, (h, tokens) in enumerate(
+        scope.context.history_stability_items()
+    ):
+        active_items[f"history:{i}"] = {"hash": h, "tokens": tokens}
 
     existing_files: set[str] | None = None
     if service._repo is not None:
@@ -554,6 +568,14 @@ def update_stability(
             )
         except Exception:
             pass
+    # Opt-in turn recording for offline tuning — see
+    # ``ac_dc.stability_replay``. Read per call so a developer
+    # can toggle it without restarting the server.
+    record_path = os.environ.get("AC_DC_STABILITY_RECORD")
+    if record_path:
+        from ac_dc.stability_replay import append_snapshot
+
+        append_snapshot(record_path, active_items, existing_files)
     scope.tracker.update(
         active_items, existing_files=existing_files
     )
@@ -614,7 +636,7 @@ def seed_cross_reference_items(service: "LLMService") -> None:
 
     excluded = _excluded_set(service)
     mode = service._context.mode
-    keys: list[tuple[str, float, int]] = []
+    rows: list[tuple[str, float, str]] = []
 
     if mode == Mode.CODE:
         try:
@@ -638,12 +660,9 @@ def seed_cross_reference_items(service: "LLMService") -> None:
                 block = service._doc_index.get_dir_docs_block(
                     directory
                 )
-                tokens = (
-                    service._counter.count(block) if block else 0
-                )
             except Exception:
-                tokens = 0
-            keys.append((f"docs:{directory}", mtime, tokens))
+                block = ""
+            rows.append((f"docs:{directory}", mtime, block))
     else:
         if service._symbol_index is None:
             return
@@ -668,13 +687,11 @@ def seed_cross_reference_items(service: "LLMService") -> None:
                 block = service._symbol_index.get_dir_symbols_block(
                     directory
                 )
-                tokens = (
-                    service._counter.count(block) if block else 0
-                )
             except Exception:
-                tokens = 0
-            keys.append((f"symbols:{directory}", mtime, tokens))
+                block = ""
+            rows.append((f"symbols:{directory}", mtime, block))
 
+    keys = _with_token_counts(service, rows)
     if keys:
         service._stability_tracker.cross_ref_seed_dir_blocks(keys)
 
@@ -12,9 +12,9 @@ streamed response to edit application:
   persists the response, spawns agent sub-tasks, and builds
   the completion result. Full per-request pipeline.
 - :func:`run_completion_sync` — blocking LiteLLM call. Runs
-  in the worker thread. Emits streaming chunks via the
-  event callback, accumulates usage, extracts cost,
-  classifies exceptions.
+  in the worker thread. Emits coalesced, delta-encoded
+  streaming chunks via :class:`StreamChunkEmitter`,
+  accumulates usage, extracts cost, classifies exceptions.
 - :func:`build_completion_result` — parses the response for
   edit / agent / shell blocks, applies edits via
   :class:`EditPipeline` (gated on review mode), auto-adds
@@ -44,11 +44,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from ac_dc.context_manager import Mode
 from ac_dc.edit_protocol import EditResult, parse_text
 from ac_dc.history_store import HistoryStore
+from ac_dc.llm._chunk_emitter import StreamChunkEmitter
 from ac_dc.llm._helpers import (
     RetryCancelled,
     _classify_litellm_error,
@@ -597,6 +598,19 @@ async def stream_chat(
                 "Post-response processing for %s failed: %s",
                 request_id, exc,
             )
+    elif (
+        scope.context is service._context
+        and service._event_callback is not None
+    ):
+        # A cancelled or failed turn still left the user
+        # message (and any partial reply) in history. The
+        # Context tab skips its refetch once it tracks
+        # pushes, so publish the breakdown here too.
+        try:
+            from ac_dc.llm._breakdown import push_context_breakdown
+            await push_context_breakdown(service)
+        except Exception:
+            logger.exception("Context breakdown push failed")
 
     # Return the completion result so agent spawning's
     # asyncio.gather can collect files_modified /
@@ -980,6 +994,45 @@ def run_completion_sync(
                 # exit the loop.
                 continue
 
+    # Chunk emitter — coalesces per-token updates on a
+    # time/size window and sends append-only deltas between
+    # full-content checkpoints. One scheduled broadcast per
+    # flush rather than per token.
+    def _schedule_chunk_event(event_name: str, *args: Any) -> None:
+        asyncio.run_coroutine_threadsafe(
+            service._broadcast_event_async(event_name, *args),
+            loop,
+        )
+
+    # Trailing flush for text held back by the coalescing
+    # window. The sleep runs on the main loop; cancelling the
+    # concurrent future cancels it, and a completed sleep
+    # invokes the callback on the loop thread.
+    def _call_later_on_loop(
+        delay: float, callback: Callable[[], None]
+    ) -> Any:
+        handle = asyncio.run_coroutine_threadsafe(
+            asyncio.sleep(delay), loop,
+        )
+
+        def _on_done(fut: Any) -> None:
+            if not fut.cancelled() and fut.exception() is None:
+                callback()
+
+        handle.add_done_callback(_on_done)
+        return handle
+
+    streaming_cfg = service._config.streaming_config
+    emitter = StreamChunkEmitter(
+        request_id,
+        _schedule_chunk_event,
+        delta_enabled=streaming_cfg["delta_chunks"],
+        coalesce_seconds=streaming_cfg["coalesce_ms"] / 1000.0,
+        coalesce_chars=streaming_cfg["coalesce_chars"],
+        checkpoint_seconds=streaming_cfg["checkpoint_seconds"],
+        call_later=_call_later_on_loop,
+    )
+
     # Arm the first-chunk watchdog before iteration begins.
     timer = threading.Timer(
         first_chunk_timeout,
@@ -1029,15 +1082,9 @@ def run_completion_sync(
                         service._request_accumulators[request_id] = (
                             full_content
                         )
-                        # Fire chunk callback with FULL content.
-                        asyncio.run_coroutine_threadsafe(
-                            service._broadcast_event_async(
-                                "streamChunk",
-                                request_id,
-                                full_content,
-                            ),
-                            loop,
-                        )
+                        # Coalesced, delta-encoded broadcast —
+                        # see StreamChunkEmitter.
+                        emitter.feed(full_content)
             except (AttributeError, IndexError):
                 pass  # malformed chunk — skip
 
@@ -1089,6 +1136,10 @@ def run_completion_sync(
         )
     finally:
         timer.cancel()
+        # Final checkpoint on every exit path — natural end,
+        # cancel, watchdog, or mid-stream error — so clients
+        # hold the complete partial reply.
+        emitter.finish(full_content)
 
     # Normalise usage into a plain dict for the return.
     request_usage = dict(empty_usage)
@@ -1262,9 +1313,10 @@ async def detect_and_fetch_urls(
 
     Runs before prompt assembly so fetched content lands in
     the context manager's URL section by assembly time.
-    Sequential per-URL via the aux executor; bounded by the
-    per-message cap to keep this at a few hundred ms worst
-    case.
+    New URLs (at most the per-message cap) are fetched
+    concurrently on the URL service's fetch executor, so the
+    wait is the slowest fetch rather than the sum. Each URL
+    still gets its own ``url_fetch`` / ``url_ready`` pair.
     """
     if scope is None:
         scope = service._default_scope()
@@ -1277,12 +1329,14 @@ async def detect_and_fetch_urls(
     assert service._main_loop is not None
     loop = service._main_loop
 
-    for url in urls:
-        # Skip already-fetched (session-level memoisation).
-        existing = service._url_service.get_url_content(url)
-        if existing.error != "URL not yet fetched":
-            continue
+    # Skip already-fetched (session-level memoisation).
+    pending = [
+        url for url in urls
+        if service._url_service.get_url_content(url).error
+        == "URL not yet fetched"
+    ]
 
+    async def _fetch_one(url: str) -> None:
         name = _display_name(url)
 
         # Fire fetch-start event.
@@ -1292,10 +1346,10 @@ async def detect_and_fetch_urls(
             {"stage": "url_fetch", "url": name},
         )
 
-        # Blocking fetch in aux executor.
+        # Blocking fetch on the URL service's fetch executor.
         try:
             await loop.run_in_executor(
-                service._aux_executor,
+                service._url_service.fetch_executor,
                 fetch_url_sync,
                 service,
                 url,
@@ -1304,7 +1358,7 @@ async def detect_and_fetch_urls(
             logger.warning(
                 "URL fetch raised for %s: %s", url, exc
             )
-            continue
+            return
 
         # Fire fetch-ready event.
         await service._broadcast_event_async(
@@ -1313,6 +1367,8 @@ async def detect_and_fetch_urls(
             {"stage": "url_ready", "url": name},
         )
 
+    await asyncio.gather(*(_fetch_one(url) for url in pending))
+
     # Attach the formatted URL context to the context
     # manager. Runs every turn (not gated on `urls` being
     # non-empty) so chip-fetched URLs and carryover URLs
@@ -93,13 +93,16 @@ import hashlib
 import json
 import logging
 import time
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
 
 from ac_dc.agent_factory import build_agent_context_manager
 from ac_dc.context_manager import ContextManager, Mode
+from ac_dc.doc_index.enrichment_worker import EnrichmentWorker
 from ac_dc.doc_index.index import DocIndex
+from ac_dc.doc_index.keyword_cache import KeywordCache
 from ac_dc.doc_index.keyword_enricher import (
     EnrichmentConfig,
     KeywordEnricher,
@@ -114,6 +117,7 @@ from ac_dc.edit_protocol import (
 )
 from ac_dc.file_context import FileContext
 from ac_dc.history_compactor import HistoryCompactor, TopicBoundary
+from ac_dc.llm._breakdown_cache import BreakdownCache
 from ac_dc.llm._helpers import (
     _build_compaction_event_text,
     _build_topic_detector,
@@ -124,6 +128,7 @@ from ac_dc.llm._helpers import (
     _parse_agent_tag,
     _resolve_max_output_tokens,
 )
+from ac_dc.llm._review_cache import ReviewContextCache
 from ac_dc.llm._types import (
     ArchivalAppend,
     ConversationScope,
@@ -235,17 +240,38 @@ class LLMService:
         # enrich_single_file degrades to a no-op. Enrichment
         # config is built from the config manager's doc_index
         # section so hot-reloaded thresholds take effect on
-        # next request.
+        # next request. The per-section candidate cache shares
+        # the repo's .ac-dc4/ directory so unchanged sections
+        # skip the model across restarts too. With
+        # keywords_out_of_process the model runs in a child
+        # process the worker restarts on crash or RSS breach,
+        # so a native-stack segfault can't take the server down.
         enrichment_config = self._build_enrichment_config()
+        doc_index_cfg = self._config.doc_index_config
+        keyword_model = doc_index_cfg.get(
+            "keyword_model", "BAAI/bge-small-en-v1.5"
+        )
+        self._enrichment_worker: EnrichmentWorker | None = (
+            EnrichmentWorker(
+                keyword_model,
+                max_rss_mb=doc_index_cfg["keywords_worker_max_rss_mb"],
+            )
+            if doc_index_cfg["keywords_out_of_process"] else None
+        )
         self._enricher = KeywordEnricher(
-            model_name=self._config.doc_index_config.get(
-                "keyword_model", "BAAI/bge-small-en-v1.5"
+            model_name=keyword_model,
+            cache=KeywordCache(
+                repo.root if repo is not None else None
             ),
+            worker=self._enrichment_worker,
         )
         self._doc_index = DocIndex(
             repo_root=repo.root if repo is not None else None,
             enricher=self._enricher,
             enrichment_config=enrichment_config,
+            workers=doc_index_cfg["workers"],
+            parallel_min_files=doc_index_cfg["parallel_min_files"],
+            shard_size=doc_index_cfg["shard_size"],
         )
         # Readiness flags — flip during the background build
         # (2.8.2b). Cross-reference toggle gates on
@@ -401,6 +427,11 @@ class LLMService:
             "pre_change_symbol_map": "",
         }
 
+        # Rendered review header and per-file diff sections,
+        # prefilled by start_review and reused by every turn of
+        # the review. See :mod:`ac_dc.llm._review_cache`.
+        self._review_cache = ReviewContextCache()
+
         # Executors. Three pools, isolated by deadline class:
         #
         # - ``_stream_executor`` — user-facing streaming LLM calls.
@@ -697,6 +728,20 @@ class LLMService:
         # the UI always reflects the latest cycle.
         self._last_tier_changes: list[str] = []
 
+        # Rendered tier content per stability tracker, reused
+        # by ``_assembly.build_tiered_content`` while a tier's
+        # members and their render versions are unchanged.
+        # Weak on the tracker so agent scopes' renders go with
+        # their trackers.
+        self._tier_render_cache: weakref.WeakKeyDictionary[
+            Any, dict[str, Any]
+        ] = weakref.WeakKeyDictionary()
+
+        # Per-directory map-detail memo and the last main-scope
+        # breakdown pushed to browsers. See
+        # :mod:`ac_dc.llm._breakdown_cache`.
+        self._breakdown_cache = BreakdownCache()
+
         # Readiness flag. When deferred_init=True, chat_streaming
         # rejects with a friendly message until
         # complete_deferred_init fires.
@@ -917,6 +962,11 @@ class LLMService:
         from ac_dc.llm._rpc_urls import get_url_content
         return get_url_content(self, url)
 
+    def get_url_cache_stats(self) -> dict[str, Any]:
+        """Delegate to :func:`ac_dc.llm._rpc_urls.get_url_cache_stats`."""
+        from ac_dc.llm._rpc_urls import get_url_cache_stats
+        return get_url_cache_stats(self)
+
     def invalidate_url_cache(self, url: str) -> dict[str, Any]:
         """Delegate to :func:`ac_dc.llm._rpc_urls.invalidate_url_cache`."""
         from ac_dc.llm._rpc_urls import invalidate_url_cache
@@ -1082,10 +1132,18 @@ class LLMService:
         query: str,
         role: str | None = None,
         limit: int = 50,
+        offset: int = 0,
+        session_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        include_agents: bool = True,
     ) -> list[dict[str, Any]]:
         """Delegate to :func:`ac_dc.llm._rpc_history.history_search`."""
         from ac_dc.llm._rpc_history import history_search
-        return history_search(self, query, role, limit)
+        return history_search(
+            self, query, role, limit, offset,
+            session_id, since, until, include_agents,
+        )
 
     def history_list_sessions(
         self, limit: int | None = None
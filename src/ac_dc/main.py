@@ -312,8 +312,15 @@ async def _heavy_init(
     await _send_progress(event_callback, "symbol_index",
                          "Initializing symbol parser...", 10)
     try:
+        index_cfg = config.symbol_index_config
         symbol_index = await loop.run_in_executor(
-            None, lambda: SymbolIndex(repo.root)
+            None,
+            lambda: SymbolIndex(
+                repo.root,
+                workers=index_cfg["workers"],
+                parallel_min_files=index_cfg["parallel_min_files"],
+                shard_size=index_cfg["shard_size"],
+            ),
         )
     except Exception as exc:
         logger.warning("Symbol index construction failed: %s", exc)
@@ -352,51 +359,33 @@ async def _heavy_init(
                 None, repo.get_flat_file_list
             )
             file_list = [f for f in flat.split("\n") if f]
-            # Seed the import resolver's file set BEFORE
-            # per-file indexing so _resolve_imports_for_file
-            # can populate Import.resolved_target correctly.
-            # Without this, every resolver lookup during
-            # per-file indexing returns None (the resolver's
-            # file set is empty), every import gets
-            # resolved_target=None, and cross-file
-            # Go-to-Definition silently fails. The full
-            # index_repo path does this via set_files; the
-            # batched path here has to replicate it.
-            await loop.run_in_executor(
-                None,
-                lambda: symbol_index._resolver.set_files(file_list),
-            )
-            batch_size = 20
-            total = len(file_list)
-            for i in range(0, total, batch_size):
-                batch = file_list[i:i + batch_size]
-                await loop.run_in_executor(
-                    None,
-                    lambda b=batch: [symbol_index.index_file(f) for f in b]
-                )
-                await asyncio.sleep(0)  # yield for WebSocket pings
-                pct = 50 + int(40 * min(i + batch_size, total) / max(total, 1))
-                await _send_progress(
-                    event_callback, "indexing",
-                    f"Indexing repository... {min(i + batch_size, total)}/{total}",
-                    pct,
+
+            # Progress arrives per shard from the executor
+            # thread running index_repo; hop back onto the
+            # event loop to send it.
+            def _on_progress(done: int, total: int) -> None:
+                pct = 50 + int(40 * done / max(total, 1))
+                asyncio.run_coroutine_threadsafe(
+                    _send_progress(
+                        event_callback, "indexing",
+                        f"Indexing repository... {done}/{total}",
+                        pct,
+                    ),
+                    loop,
                 )
-            # Resolve cross-file call-site targets now that every
-            # file's imports are in place. index_repo does this
-            # automatically; the batched path has to call it
-            # explicitly. Without it, call sites keep
-            # target_file=None and references / Go-to-Def on
-            # function calls fall back to symbol-name lookups
-            # that may miss the mark.
-            await loop.run_in_executor(
-                None, symbol_index._resolve_call_sites,
-            )
-            # Build reference index after all files
+
+            # index_repo seeds the import resolver's file set,
+            # indexes every file (sharded across a process pool
+            # on a cold start of a large repo — see
+            # app.json ``symbol_index``), resolves cross-file
+            # call sites, and builds the reference index. It
+            # runs on an executor thread, so the event loop
+            # stays free for WebSocket pings throughout.
             await loop.run_in_executor(
                 None,
-                lambda: symbol_index._ref_index.build(
-                    list(symbol_index._all_symbols.values())
-                )
+                lambda: symbol_index.index_repo(
+                    file_list, progress=_on_progress
+                ),
             )
         except Exception as exc:
             logger.warning("Repository indexing failed: %s", exc)
@@ -21,6 +21,7 @@ the pre-split monolith.
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Callable
 
@@ -34,7 +35,9 @@ from .diffs import DiffsMixin
 from .commits import CommitsMixin
 from .branches import BranchesMixin
 from .commit_graph import CommitGraphMixin
+from .graph_cache import CommitGraphCache
 from .tree import TreeMixin
+from .git_state import GitSnapshot, GitStateMixin
 from .review import ReviewMixin
 from .search import SearchMixin
 from .tex_preview import TexPreviewMixin
@@ -44,6 +47,7 @@ logger = logging.getLogger(__name__)
 
 class Repo(
     PathMixin,
+    GitStateMixin,
     LocksMixin,
     SubprocessMixin,
     FilesMixin,
@@ -129,6 +133,17 @@ class Repo(
         self._post_write_callback: (
             "Callable[[str], None] | None"
         ) = None
+        # Shared git-state snapshot — listing, status, numstat.
+        # Built lazily by :class:`GitStateMixin` and dropped on
+        # post-write, deletion, and any mutating git command.
+        self._git_snapshot: GitSnapshot | None = None
+        self._git_snapshot_lock = threading.RLock()
+        # Commit-graph pages for the review selector, sliced
+        # from one tip-keyed walk persisted under ``.ac-dc4/``.
+        # See :mod:`ac_dc.repo.graph_cache`.
+        self._commit_graph_cache = CommitGraphCache(
+            self._run_git, root
+        )
 
     def _check_localhost_only(self) -> dict[str, Any] | None:
         """Return an error dict when the caller is non-localhost.
@@ -14,12 +14,14 @@ from .errors import (
     COMMIT_GRAPH_DEFAULT_LIMIT,
     COMMIT_LOG_DEFAULT_LIMIT,
 )
+from .graph_cache import CommitGraphCache
 
 
 class CommitGraphMixin:
     """Commit graph rendering data and range queries."""
 
     _root: Path
+    _commit_graph_cache: CommitGraphCache
 
     def _run_git(self, args: list[str], **kwargs: Any) -> Any: ...  # type: ignore[empty-body]
     def list_branches(self) -> dict[str, object]: ...  # type: ignore[empty-body]
@@ -40,16 +42,18 @@ class CommitGraphMixin:
         """Return paginated commit graph data for the review selector.
 
         Used by the git-graph UI that replaces the old branch-dropdown
-        flow in review mode. Returns commits plus branch tip data so
-        the frontend can render the lane layout client-side.
+        flow in review mode. Returns commits with their precomputed
+        lanes plus branch tip data. Served from the repository's
+        :class:`CommitGraphCache`, so a deep page costs the same as
+        the first.
 
         Parameters
         ----------
         limit:
             Page size. Default :data:`COMMIT_GRAPH_DEFAULT_LIMIT`.
         offset:
-            Skip this many commits before returning the page. Used
-            for scroll-loading additional commits.
+            Index of the first commit in the page. Used for
+            scroll-loading additional commits.
         include_remote:
             When True, includes remote branches in the graph. The
             default is local-only because most users don't care about
@@ -61,59 +65,17 @@ class CommitGraphMixin:
             - ``commits``: list of dicts with keys ``sha``,
               ``short_sha``, ``message``, ``author``, ``date`` (ISO
               8601), ``relative_date`` (e.g., "2 days ago"),
-              ``parents`` (list of parent SHAs)
+              ``parents`` (list of parent SHAs), ``lane`` (column
+              index) and ``edges`` (cross-lane links, each
+              ``{"sha", "lane", "merge"}``)
             - ``branches``: list of dicts with keys ``name``, ``sha``
               (tip commit), ``is_current``, ``is_remote``
             - ``has_more``: ``True`` when there are more commits
               beyond this page
+            - ``branch_lanes``: branch name → lane index
         """
-        # --all traverses all refs; without it we only get HEAD's
-        # ancestry, which isn't enough for a multi-branch graph.
-        # --topo-order keeps the topological order stable so lane
-        # assignment on the client side is deterministic.
-        # %x00 is a literal NUL used as field separator — safer than
-        # any printable character because commit subjects can contain
-        # anything.
-        # Note: --max-count + --skip gives us paging. Getting
-        # has_more right requires fetching one extra commit and
-        # checking whether we got it; we do this with `limit + 1`.
-        scope = ["--all"] if include_remote else ["--branches"]
-        format_str = "%H%x00%h%x00%s%x00%an%x00%aI%x00%ar%x00%P"
-        args = [
-            "log",
-            *scope,
-            "--topo-order",
-            f"--skip={offset}",
-            f"--max-count={limit + 1}",
-            f"--format={format_str}",
-        ]
-        result = self._run_git(args, check=True)
-
-        commits: list[dict[str, object]] = []
-        for line in result.stdout.splitlines():
-            if not line:
-                continue
-            parts = line.split("\x00")
-            if len(parts) != 7:
-                continue
-            sha, short_sha, message, author, date, relative_date, parents_raw = parts
-            parents = parents_raw.split() if parents_raw else []
-            commits.append({
-                "sha": sha,
-                "short_sha": short_sha,
-                "message": message,
-                "author": author,
-                "date": date,
-                "relative_date": relative_date,
-                "parents": parents,
-            })
-
-        # Check for has_more by examining the over-fetch.
-        has_more = len(commits) > limit
-        if has_more:
-            commits = commits[:limit]
-
-        # Branches — reuse list_all_branches when include_remote,
+        # Branches first — the lane assignment is seeded from
+        # them. Reuse list_all_branches when include_remote,
         # otherwise just local.
         if include_remote:
             branches = self.list_all_branches()
@@ -129,10 +91,22 @@ class CommitGraphMixin:
                 for b in local["branches"]  # type: ignore[index]
             ]
 
+        # Pages are slices of one cached topo-ordered walk,
+        # re-validated against the ref tips on every call — see
+        # :mod:`ac_dc.repo.graph_cache`. The scope mirrors the
+        # old ``--all`` / ``--branches`` choice: without --all
+        # we only get local branch ancestry.
+        page = self._commit_graph_cache.page(
+            "all" if include_remote else "branches",
+            offset,
+            limit,
+            branches,
+        )
         return {
-            "commits": commits,
+            "commits": page["commits"],
             "branches": branches,
-            "has_more": has_more,
+            "has_more": page["has_more"],
+            "branch_lanes": page["branch_lanes"],
         }
 
     def get_commit_log(
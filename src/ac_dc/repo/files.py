@@ -40,6 +40,7 @@ class FilesMixin:
     def _get_write_lock(self, path: str | Path) -> asyncio.Lock: ...  # type: ignore[empty-body]
     def _fire_post_write(self, path: str | Path) -> None: ...  # type: ignore[empty-body]
     def _run_git(self, args: list[str], **kwargs: Any) -> Any: ...  # type: ignore[empty-body]
+    def _invalidate_git_snapshot(self) -> None: ...  # type: ignore[empty-body]
 
     # ------------------------------------------------------------------
     # File read operations
@@ -338,6 +339,7 @@ class FilesMixin:
                 absolute.unlink()
             except OSError as exc:
                 raise RepoError(f"Failed to delete {path}: {exc}") from exc
+            self._invalidate_git_snapshot()
             # Drop the lock entry — no further callers will contend on
             # this path until a new file is created under the same
             # name (which will create a fresh lock on demand).
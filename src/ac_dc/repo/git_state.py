@@ -0,0 +1,286 @@
+"""Shared snapshot of git's view of the working tree.
+
+The file listing (``ls-files`` tracked + untracked), porcelain
+status, and staged/unstaged numstat are read by several callers
+in quick succession — the stability update, dir-block
+enumeration, the file picker's tree refresh — and each used to
+spawn its own git subprocesses, so one turn paid for the same
+four or five invocations several times over.
+
+:class:`GitStateMixin` caches the results in one snapshot and
+hands it to every caller until something could have changed it.
+Validation is two-tiered because the two halves of the snapshot
+go stale for different reasons:
+
+- **Listing** (tracked, untracked, on-disk filter) — keyed on
+  the stat of ``.git/index``, ``HEAD``, ``logs/HEAD`` and
+  ``info/exclude``, plus the mtimes of every directory holding a
+  listed file (and the root), of every immediate subdirectory of
+  those that holds no listed file (an empty or ignored
+  directory, where the next new file would land), and the stat
+  of every listed ``.gitignore``. Creating, deleting or renaming
+  a file bumps its directory's mtime; staging or committing
+  rewrites the index. Checking costs one ``scandir`` per listed
+  directory plus one ``stat`` per directory rather than two
+  subprocesses plus one ``stat`` per file. A file created two or
+  more levels below a directory with no listed files (``mkdir
+  -p a/b`` then ``a/b/f``) changes none of those mtimes and is
+  picked up at the next invalidation.
+- **Worktree status** (porcelain status and numstat) — also
+  keyed on the ``(mtime_ns, size)`` of every listed file, since
+  an in-place content edit changes neither the index nor the
+  directory. ``git status`` stats the same files internally, so
+  this check is strictly cheaper than the calls it replaces.
+
+Explicit invalidation covers our own changes without waiting on
+timestamps: :meth:`_fire_post_write`, file deletion, and every
+git command that mutates the index, HEAD or the working tree
+(``add``, ``commit``, ``reset``, ``checkout``, ...) drop the
+snapshot. On filesystems with coarse timestamps an *external*
+same-size edit inside one timestamp tick can go unnoticed until
+the next invalidation — the same racy window git itself guards
+against with a re-check, accepted here because the cached data
+is advisory (listings and badges), not something we write back.
+
+Thread-safe — the stability update runs on an executor thread
+while RPC handlers run on the event loop. A single lock
+serialises rebuilds so concurrent callers share one set of git
+invocations instead of racing to run their own.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# Git subcommands that can change the index, HEAD, or the
+# working tree. Running any of them through ``_run_git`` drops
+# the snapshot. Read-only commands (``ls-files``, ``status``,
+# ``diff``, ``log``, ``show``, ...) never invalidate.
+_MUTATING_GIT_COMMANDS = frozenset({
+    "add", "am", "apply", "checkout", "cherry-pick", "clean",
+    "commit", "merge", "mv", "pull", "read-tree", "rebase",
+    "reset", "restore", "revert", "rm", "stash", "switch",
+    "update-index",
+})
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """``(mtime_ns, size)`` for a path, or None when it's absent."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class GitSnapshot:
+    """One consistent read of git's view of the working tree.
+
+    ``files`` is the sorted union of tracked and untracked
+    (non-ignored) paths; ``existing`` is the subset present on
+    disk. The status fields are filled lazily by
+    :meth:`GitStateMixin._git_worktree_state` — callers that
+    only need the listing never pay for ``git status``.
+    """
+
+    listing_signature: tuple[Any, ...]
+    tracked: list[str]
+    untracked: list[str]
+    files: list[str]
+    existing: list[str]
+    worktree_signature: tuple[Any, ...] | None = None
+    status_porcelain: str | None = None
+    staged_numstat: str = ""
+    unstaged_numstat: str = ""
+
+
+class GitStateMixin:
+    """Snapshot cache over the repo's listing and status calls.
+
+    Mixed into :class:`Repo` ahead of the mixins that forward-
+    declare its methods, so the ``_run_git`` declaration below
+    is type-checking only — a runtime stub here would shadow
+    :class:`SubprocessMixin`'s implementation. Reads
+    ``self._root``, ``self._git_snapshot`` and
+    ``self._git_snapshot_lock``.
+    """
+
+    _root: Path
+    _git_snapshot: GitSnapshot | None
+    _git_snapshot_lock: threading.RLock
+
+    if TYPE_CHECKING:
+        def _run_git(self, args: list[str], **kwargs: Any) -> Any: ...
+
+    # ------------------------------------------------------------------
+    # Public-to-the-package accessors
+    # ------------------------------------------------------------------
+
+    def _git_listing(self) -> GitSnapshot:
+        """Return a snapshot whose listing is current.
+
+        Reuses the cached snapshot when its listing signature
+        still matches; otherwise runs ``ls-files`` (tracked and
+        untracked) once and replaces it.
+        """
+        with self._git_snapshot_lock:
+            snap = self._git_snapshot
+            if snap is not None and (
+                self._listing_signature(snap.files)
+                == snap.listing_signature
+            ):
+                return snap
+            snap = self._build_git_listing()
+            self._git_snapshot = snap
+            return snap
+
+    def _git_worktree_state(self) -> GitSnapshot:
+        """Return a snapshot whose status and numstat are current.
+
+        Builds on :meth:`_git_listing` — a listing change
+        implies a new snapshot and therefore fresh status.
+        """
+        with self._git_snapshot_lock:
+            snap = self._git_listing()
+            signature = self._worktree_signature(snap.files)
+            if snap.status_porcelain is not None and (
+                snap.worktree_signature == signature
+            ):
+                return snap
+            # --no-optional-locks stops status from refreshing
+            # the index's stat cache on disk — that write would
+            # bump the index mtime and invalidate the very
+            # snapshot we're filling.
+            snap.status_porcelain = self._run_git(
+                ["--no-optional-locks", "status", "--porcelain"],
+                check=True,
+            ).stdout
+            snap.staged_numstat = self._run_git(
+                ["diff", "--cached", "--numstat"], check=True
+            ).stdout
+            snap.unstaged_numstat = self._run_git(
+                ["diff", "--numstat"], check=True
+            ).stdout
+            snap.worktree_signature = signature
+            return snap
+
+    def _invalidate_git_snapshot(self) -> None:
+        """Drop the cached snapshot; the next reader rebuilds."""
+        with self._git_snapshot_lock:
+            self._git_snapshot = None
+
+    def _note_git_command(self, args: list[str]) -> None:
+        """Invalidate after a git command that mutates state."""
+        if args and args[0] in _MUTATING_GIT_COMMANDS:
+            self._invalidate_git_snapshot()
+
+    # ------------------------------------------------------------------
+    # Snapshot construction and signatures
+    # ------------------------------------------------------------------
+
+    def _build_git_listing(self) -> GitSnapshot:
+        # Signature inputs that don't depend on the listing are
+        # read before git runs, so a change racing the
+        # subprocess is seen as a mismatch next time rather
+        # than baked into the snapshot.
+        git_sig = self._git_dir_signature()
+        tracked = self._run_git(
+            ["ls-files"], check=True
+        ).stdout.splitlines()
+        untracked = self._run_git(
+            ["ls-files", "--others", "--exclude-standard"],
+            check=True,
+        ).stdout.splitlines()
+        files = sorted(set(tracked) | set(untracked))
+        existing = [rel for rel in files if (self._root / rel).exists()]
+        return GitSnapshot(
+            listing_signature=(
+                git_sig, self._tree_signature(files)
+            ),
+            tracked=tracked,
+            untracked=untracked,
+            files=files,
+            existing=existing,
+        )
+
+    def _git_dir(self) -> Path:
+        """Locate the git directory (``.git`` may be a worktree file)."""
+        entry = self._root / ".git"
+        if entry.is_file():
+            try:
+                text = entry.read_text(encoding="utf-8").strip()
+            except OSError:
+                return entry
+            if text.startswith("gitdir:"):
+                target = Path(text[len("gitdir:"):].strip())
+                if not target.is_absolute():
+                    target = self._root / target
+                return target
+        return entry
+
+    def _git_dir_signature(self) -> tuple[Any, ...]:
+        git_dir = self._git_dir()
+        return tuple(
+            _stat_key(git_dir / name)
+            for name in ("index", "HEAD", "logs/HEAD", "info/exclude")
+        )
+
+    def _tree_signature(self, files: list[str]) -> tuple[Any, ...]:
+        """Directory mtimes plus every ``.gitignore`` stat.
+
+        Covers each directory holding a listed file and each of
+        their subdirectories that holds none, so a first file
+        written into an empty directory is noticed.
+        """
+        dirs: set[str] = {""}
+        ignores: list[str] = []
+        for rel in files:
+            idx = rel.rfind("/")
+            while idx != -1:
+                parent = rel[:idx]
+                if parent in dirs:
+                    break
+                dirs.add(parent)
+                idx = parent.rfind("/")
+            if rel == ".gitignore" or rel.endswith("/.gitignore"):
+                ignores.append(rel)
+        root = self._root
+        unlisted: list[tuple[str, Any]] = []
+        for d in dirs:
+            try:
+                with os.scandir(root / d if d else root) as it:
+                    for entry in it:
+                        if entry.name == ".git":
+                            continue
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        sub = f"{d}/{entry.name}" if d else entry.name
+                        if sub not in dirs:
+                            unlisted.append(
+                                (sub, _stat_key(Path(entry.path)))
+                            )
+            except OSError:
+                continue
+        return (
+            tuple(
+                (d, _stat_key(root / d if d else root))
+                for d in sorted(dirs)
+            ),
+            tuple(sorted(unlisted)),
+            tuple((rel, _stat_key(root / rel)) for rel in ignores),
+        )
+
+    def _listing_signature(self, files: list[str]) -> tuple[Any, ...]:
+        return (self._git_dir_signature(), self._tree_signature(files))
+
+    def _worktree_signature(self, files: list[str]) -> tuple[Any, ...]:
+        root = self._root
+        return (
+            self._git_dir_signature(),
+            tuple(_stat_key(root / rel) for rel in files),
+        )
@@ -0,0 +1,568 @@
+"""Persistent commit-graph cache behind :meth:`Repo.get_commit_graph`.
+
+The review selector pages through the commit graph as the user
+scrolls. Each page used to be its own ``git log --topo-order
+--skip=N --max-count=M``. ``--skip`` doesn't seek — git walks
+and topo-sorts every earlier commit again and throws them
+away — so on a 200k-commit repository each page was slower
+than the last, and a deep page cost a full history walk.
+
+:class:`CommitGraphCache` walks the history once and serves
+every page by slicing.
+
+Design points:
+
+- **Keyed by ref tips.** Each scope (``"branches"`` for local
+  branches, ``"all"`` for every ref plus ``HEAD``) records the
+  ``refname → commit`` map its rows were walked from. Every
+  page request re-reads the tips with one ``for-each-ref``; an
+  unchanged map serves straight from memory.
+
+- **Extended incrementally.** When the tips move, the cache
+  checks that nothing it holds became unreachable — one
+  ``rev-list --count <old tips> --not <new tips>`` — and, if so,
+  adds ``git log <new tips> --not <old tips>`` on the newest
+  end. New commits are never ancestors of old ones, so the
+  result is still a valid topological order. Rows are stored
+  oldest-first, so an extension is an in-place append and row
+  positions never shift. A rewind (force-push, rebase, deleted
+  unmerged branch) or a tip whose objects are gone falls back
+  to a full walk.
+
+- **Walks the tips, not ``--all``/``--branches``.** The log is
+  fed the exact SHAs the cache was keyed on via ``--stdin``,
+  so a ref moving mid-walk can't leave rows and tips out of
+  step.
+
+- **Relative dates at serve time.** ``%ar`` is relative to the
+  moment git ran; a cached copy would drift. Rows store the
+  ISO date and :func:`relative_date` renders git's wording
+  for each page.
+
+- **Lanes precomputed.** :func:`assign_lanes` is the same
+  forward walk the webapp's ``computeGraphLayout`` does, run
+  once over the whole history per (rows, branches) and
+  memoised. Each served commit carries its ``lane`` and
+  cross-lane ``edges``; the response carries ``branch_lanes``.
+  Because every branch tip is known up front, lanes no longer
+  shift as deeper pages load.
+
+- **One pack file.** Same layout as the symbol and keyword
+  caches: ``.ac-dc4/commit_graph.json``, read on first use and
+  rewritten atomically. A full walk writes it straight away;
+  an extension only schedules a write
+  :data:`_FLUSH_DELAY_SECONDS` later on a background thread,
+  so a burst of commits costs one rewrite rather than one per
+  tip move. A stale pack is harmless — its tips are validated
+  like any other cached state, and the next start extends
+  from them.
+
+Governing spec: ``specs4/4-features/code-review.md`` § Commit
+Graph Data.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from ac_dc.config import _AC_DC_DIR
+
+logger = logging.getLogger(__name__)
+
+
+# Pack file name under the per-repo ``.ac-dc4/`` directory.
+_PACK_FILENAME = "commit_graph.json"
+
+# Pack schema version. Bump when the serialised shape changes
+# — a mismatch discards the pack and the next request re-walks.
+# Version 2 stores rows oldest-first.
+_PACK_VERSION = 2
+
+# Delay between an extension and the background pack rewrite
+# it schedules. Further extensions inside the window share the
+# one write.
+_FLUSH_DELAY_SECONDS = 30.0
+
+# A first walk of a very large history can outlast the default
+# git timeout; it happens once per repository.
+_FULL_WALK_TIMEOUT_SECONDS = 300
+
+# ``git log`` format for cached rows. NUL-separated — subjects
+# can contain anything printable.
+_LOG_FORMAT = "%H%x00%h%x00%s%x00%an%x00%aI%x00%P"
+
+# for-each-ref format for tips. Annotated tags are peeled to
+# their commit; refs to trees or blobs are skipped, as
+# ``git log --all`` skips them.
+_TIP_FORMAT = (
+    "%(objecttype)%00%(objectname)%00"
+    "%(*objecttype)%00%(*objectname)%00%(refname)"
+)
+
+# sha, short_sha, subject, author, ISO date, parent SHAs
+_Row = tuple[str, str, str, str, str, tuple[str, ...]]
+
+
+def relative_date(iso_date: str, now: float | None = None) -> str:
+    """Render ``iso_date`` the way ``git log --format=%ar`` does.
+
+    A port of git's ``show_date_relative``: seconds under 90,
+    minutes under 90, hours under 36, days under 14, weeks under
+    70 days, months under a year, "N years, M months" under five
+    years, then years. Unparseable dates render empty.
+    """
+    try:
+        stamp = datetime.fromisoformat(iso_date).timestamp()
+    except (TypeError, ValueError):
+        return ""
+    if now is None:
+        now = time.time()
+    if now < stamp:
+        return "in the future"
+    diff = int(now - stamp)
+    if diff < 90:
+        return _ago(diff, "second")
+    diff = (diff + 30) // 60
+    if diff < 90:
+        return _ago(diff, "minute")
+    diff = (diff + 30) // 60
+    if diff < 36:
+        return _ago(diff, "hour")
+    diff = (diff + 12) // 24
+    if diff < 14:
+        return _ago(diff, "day")
+    if diff < 70:
+        return _ago((diff + 3) // 7, "week")
+    if diff < 365:
+        return _ago((diff + 15) // 30, "month")
+    if diff < 1825:
+        total_months = (diff * 12 * 2 + 365) // (365 * 2)
+        years, months = divmod(total_months, 12)
+        if months:
+            return (
+                f"{_plural(years, 'year')}, "
+                f"{_ago(months, 'month')}"
+            )
+        return _ago(years, "year")
+    return _ago((diff + 183) // 365, "year")
+
+
+def _plural(count: int, unit: str) -> str:
+    return f"{count} {unit}" if count == 1 else f"{count} {unit}s"
+
+
+def _ago(count: int, unit: str) -> str:
+    return f"{_plural(count, unit)} ago"
+
+
+def _timestamp(iso_date: str | None) -> float:
+    try:
+        return datetime.fromisoformat(iso_date or "").timestamp()
+    except ValueError:
+        return 0.0
+
+
+def assign_lanes(
+    rows: list[_Row],
+    index: dict[str, int],
+    branches: list[dict[str, Any]],
+) -> tuple[list[int], list[list[tuple[str, int, bool]]], dict[str, int]]:
+    """Assign every row a lane, mirroring the webapp's layout walk.
+
+    Branches are seeded onto lanes newest-tip-first (tips at
+    the same commit share a lane); each commit takes the lane
+    a child claimed for it, or a fresh one; its first parent
+    inherits that lane unless already claimed, in which case a
+    cross-lane edge is recorded; merge parents always get an
+    edge, claiming a fresh lane if needed.
+
+    Returns per-row lanes, per-row edges as ``(target_sha,
+    target_lane, is_merge)``, and ``branch name → lane``.
+    """
+    def _tip_date(branch: dict[str, Any]) -> float:
+        i = index.get(branch["sha"])
+        return _timestamp(rows[i][4]) if i is not None else 0.0
+
+    ordered = sorted(
+        (b for b in branches if isinstance(b.get("sha"), str)),
+        key=_tip_date,
+        reverse=True,
+    )
+    branch_lanes: dict[str, int] = {}
+    claims: dict[str, int] = {}
+    next_lane = 0
+    for branch in ordered:
+        lane = claims.get(branch["sha"])
+        if lane is None:
+            lane = next_lane
+            next_lane += 1
+            claims[branch["sha"]] = lane
+        branch_lanes[str(branch.get("name"))] = lane
+
+    lanes: list[int] = []
+    edges: list[list[tuple[str, int, bool]]] = []
+    for sha, _short, _msg, _author, _date, parents in rows:
+        lane = claims.get(sha)
+        if lane is None:
+            lane = next_lane
+            next_lane += 1
+        row_edges: list[tuple[str, int, bool]] = []
+        if parents:
+            first = parents[0]
+            claimed = claims.get(first)
+            if claimed is None:
+                claims[first] = lane
+            elif claimed != lane:
+                row_edges.append((first, claimed, False))
+            for merge_parent in parents[1:]:
+                merge_lane = claims.get(merge_parent)
+                if merge_lane is None:
+                    merge_lane = next_lane
+                    next_lane += 1
+                    claims[merge_parent] = merge_lane
+                row_edges.append((merge_parent, merge_lane, True))
+        lanes.append(lane)
+        edges.append(row_edges)
+    return lanes, edges, branch_lanes
+
+
+class _ScopeGraph:
+    """Rows for one scope plus the tips they were walked from.
+
+    ``rows`` is oldest-first — the reverse of ``git log`` order —
+    so :meth:`extend` appends. Pages and lanes are served
+    newest-first.
+    """
+
+    __slots__ = ("tips", "rows", "layout")
+
+    def __init__(self, tips: dict[str, str], rows: list[_Row]) -> None:
+        self.tips = tips
+        self.rows = rows
+        # (branches key, lanes, edges, branch_lanes) — memo for
+        # assign_lanes, newest-first; dropped whenever rows
+        # change.
+        self.layout: tuple[Any, ...] | None = None
+
+    def extend(self, tips: dict[str, str], added: list[_Row]) -> None:
+        """Append ``added`` (``git log`` order, newest first)."""
+        self.tips = tips
+        self.rows.extend(reversed(added))
+        self.layout = None
+
+
+class CommitGraphCache:
+    """Tip-keyed, incrementally extended commit history per scope.
+
+    ``run_git`` is the owning :class:`Repo`'s ``_run_git``.
+    With ``repo_root=None`` the cache is purely in-memory.
+    """
+
+    def __init__(
+        self,
+        run_git: Callable[..., Any],
+        repo_root: Path | str | None = None,
+    ) -> None:
+        self._run_git = run_git
+        self._repo_root: Path | None = (
+            Path(repo_root) if repo_root is not None else None
+        )
+        self._scopes: dict[str, _ScopeGraph] = {}
+        self._lock = threading.RLock()
+        self._loaded = False
+        # Pending background pack write, armed by an extension.
+        self._flush_timer: threading.Timer | None = None
+        # Serialises pack writes — a background write and a
+        # full walk's write share the temp file.
+        self._write_lock = threading.Lock()
+        # Walk counters, for logs and tests.
+        self.full_walks = 0
+        self.extensions = 0
+
+    def page(
+        self,
+        scope: str,
+        offset: int,
+        limit: int,
+        branches: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return one page of commits plus lane data.
+
+        ``scope`` is ``"branches"`` or ``"all"``. ``branches`` is
+        the branch list the response carries; it seeds the lane
+        assignment. Returns ``commits``, ``has_more`` and
+        ``branch_lanes``.
+        """
+        offset = max(0, int(offset))
+        limit = max(0, int(limit))
+        with self._lock:
+            graph = self._refresh(scope)
+            key = tuple(
+                (str(b.get("name")), b.get("sha")) for b in branches
+            )
+            if graph.layout is None or graph.layout[0] != key:
+                newest_first = graph.rows[::-1]
+                index = {row[0]: i for i, row in enumerate(newest_first)}
+                graph.layout = (
+                    key, *assign_lanes(newest_first, index, branches)
+                )
+            _, lanes, edges, branch_lanes = graph.layout
+            total = len(graph.rows)
+            end = offset + limit
+            selected = graph.rows[
+                max(0, total - end):max(0, total - offset)
+            ][::-1]
+            has_more = end < total
+        now = time.time()
+        commits: list[dict[str, object]] = []
+        for i, row in enumerate(selected, start=offset):
+            sha, short_sha, message, author, date, parents = row
+            commits.append({
+                "sha": sha,
+                "short_sha": short_sha,
+                "message": message,
+                "author": author,
+                "date": date,
+                "relative_date": relative_date(date, now),
+                "parents": list(parents),
+                "lane": lanes[i],
+                "edges": [
+                    {"sha": target, "lane": lane, "merge": merge}
+                    for target, lane, merge in edges[i]
+                ],
+            })
+        return {
+            "commits": commits,
+            "has_more": has_more,
+            "branch_lanes": dict(branch_lanes),
+        }
+
+    # ------------------------------------------------------------------
+    # Tips and walks
+    # ------------------------------------------------------------------
+
+    def _refresh(self, scope: str) -> _ScopeGraph:
+        """Bring ``scope`` up to date with the current tips."""
+        if not self._loaded:
+            self._loaded = True
+            self._load()
+        tips = self._read_tips(scope)
+        graph = self._scopes.get(scope)
+        if graph is not None and graph.tips == tips:
+            return graph
+        # Ref order, deduplicated — the order ``--branches`` /
+        # ``--all`` would feed the walk, so ties in the topo
+        # sort break the same way.
+        new_shas = list(dict.fromkeys(tips.values()))
+        if graph is not None and graph.rows and self._extends(
+            graph.tips, new_shas
+        ):
+            old_shas = list(dict.fromkeys(graph.tips.values()))
+            graph.extend(tips, self._walk(new_shas, exclude=old_shas))
+            self.extensions += 1
+            self._schedule_flush()
+            return graph
+        rows = self._walk(new_shas)
+        rows.reverse()
+        graph = _ScopeGraph(tips, rows)
+        self.full_walks += 1
+        self._scopes[scope] = graph
+        self.flush()
+        return graph
+
+    def _read_tips(self, scope: str) -> dict[str, str]:
+        patterns = ["refs/heads"] if scope == "branches" else []
+        result = self._run_git(
+            ["for-each-ref", f"--format={_TIP_FORMAT}", *patterns],
+            check=True,
+        )
+        tips: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            parts = line.split("\x00")
+            if len(parts) != 5:
+                continue
+            obj_type, obj_name, peeled_type, peeled_name, refname = parts
+            if obj_type == "commit":
+                tips[refname] = obj_name
+            elif obj_type == "tag" and peeled_type == "commit":
+                tips[refname] = peeled_name
+        if scope != "branches":
+            head = self._run_git(["rev-parse", "-q", "--verify", "HEAD"])
+            if head.returncode == 0 and head.stdout.strip():
+                tips["HEAD"] = head.stdout.strip()
+        return tips
+
+    def _extends(self, old_tips: dict[str, str], new_shas: list[str]) -> bool:
+        """True when every commit reachable from the old tips still is."""
+        still = set(new_shas)
+        gone = sorted(
+            sha for sha in set(old_tips.values()) if sha not in still
+        )
+        if not gone:
+            return True
+        if not new_shas:
+            return False
+        probe = self._run_git(
+            ["rev-list", "--count", "--stdin"],
+            input_data="\n".join(
+                [*gone, *(f"^{sha}" for sha in new_shas)]
+            ) + "\n",
+        )
+        return probe.returncode == 0 and probe.stdout.strip() == "0"
+
+    def _walk(
+        self, include: list[str], exclude: list[str] | None = None
+    ) -> list[_Row]:
+        """``git log --topo-order`` over ``include`` minus ``exclude``."""
+        if not include:
+            return []
+        revisions = [*include, *(f"^{sha}" for sha in exclude or [])]
+        result = self._run_git(
+            [
+                "log", "--topo-order",
+                f"--format={_LOG_FORMAT}", "--stdin",
+            ],
+            check=True,
+            timeout=_FULL_WALK_TIMEOUT_SECONDS,
+            input_data="\n".join(revisions) + "\n",
+        )
+        rows: list[_Row] = []
+        for line in result.stdout.splitlines():
+            parts = line.split("\x00")
+            if len(parts) != 6:
+                continue
+            sha, short_sha, message, author, date, parents_raw = parts
+            rows.append((
+                sha, short_sha, message, author, date,
+                tuple(parents_raw.split()),
+            ))
+        return rows
+
+    # ------------------------------------------------------------------
+    # Pack persistence
+    # ------------------------------------------------------------------
+
+    def _pack_path(self) -> Path | None:
+        if self._repo_root is None:
+            return None
+        return self._repo_root / _AC_DC_DIR / _PACK_FILENAME
+
+    def _schedule_flush(self) -> None:
+        """Arm the background pack write unless one is pending."""
+        if self._repo_root is None:
+            return
+        with self._lock:
+            if self._flush_timer is not None:
+                return
+            timer = threading.Timer(_FLUSH_DELAY_SECONDS, self.flush)
+            timer.daemon = True
+            self._flush_timer = timer
+        timer.start()
+
+    def flush(self) -> None:
+        """Rewrite the pack file with every scope's rows.
+
+        Cancels any pending background write. The rows are
+        snapshotted under the lock and serialised outside it,
+        so page requests aren't held up. Written to a temp file
+        and renamed into place so a crash mid-write leaves the
+        previous pack intact. Disk errors are logged; the
+        in-memory graph stays authoritative.
+        """
+        pack = self._pack_path()
+        if pack is None:
+            return
+        with self._lock:
+            timer, self._flush_timer = self._flush_timer, None
+            snapshot = {
+                name: (dict(graph.tips), list(graph.rows))
+                for name, graph in self._scopes.items()
+            }
+        if timer is not None:
+            timer.cancel()
+        payload: dict[str, Any] = {
+            "version": _PACK_VERSION,
+            "scopes": {
+                name: {
+                    "tips": tips,
+                    "rows": [
+                        [*row[:5], " ".join(row[5])] for row in rows
+                    ],
+                }
+                for name, (tips, rows) in snapshot.items()
+            },
+        }
+        tmp_path = pack.with_suffix(".json.tmp")
+        try:
+            with self._write_lock:
+                pack.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(
+                    json.dumps(payload, separators=(",", ":")),
+                    encoding="utf-8",
+                )
+                os.replace(tmp_path, pack)
+        except OSError as exc:
+            logger.warning(
+                "Failed to write commit graph cache %s: %s", pack, exc
+            )
+
+    def _load(self) -> None:
+        """Bulk-load the pack file.
+
+        A missing pack is a cold start. An unreadable pack or a
+        version mismatch is logged and ignored — the next walk
+        overwrites it. Malformed scopes are skipped.
+        """
+        pack = self._pack_path()
+        if pack is None:
+            return
+        try:
+            raw = pack.read_text(encoding="utf-8")
+        except OSError:
+            return
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            logger.warning(
+                "Ignoring corrupt commit graph cache %s: %s", pack, exc
+            )
+            return
+        if not isinstance(payload, dict):
+            return
+        if payload.get("version") != _PACK_VERSION:
+            logger.info(
+                "Commit graph cache %s has version %r "
+                "(expected %d); ignoring",
+                pack, payload.get("version"), _PACK_VERSION,
+            )
+            return
+        scopes = payload.get("scopes")
+        if not isinstance(scopes, dict):
+            return
+        for name, entry in scopes.items():
+            try:
+                tips = {
+                    str(ref): str(sha)
+                    for ref, sha in entry["tips"].items()
+                }
+                rows: list[_Row] = [
+                    (
+                        str(sha), str(short), str(msg), str(author),
+                        str(date), tuple(str(parents).split()),
+                    )
+                    for sha, short, msg, author, date, parents
+                    in entry["rows"]
+                ]
+            except (KeyError, TypeError, ValueError, AttributeError) as exc:
+                logger.debug(
+                    "Skipping commit graph cache scope %s: %s", name, exc
+                )
+                continue
+            self._scopes[str(name)] = _ScopeGraph(tips, rows)
@@ -27,6 +27,8 @@ class LocksMixin:
     _write_locks: dict[str, asyncio.Lock]
     _post_write_callback: "Callable[[str], None] | None"
 
+    def _invalidate_git_snapshot(self) -> None: ...  # type: ignore[empty-body]
+
     def _normalise_rel_path(self, path: str | Path) -> str:  # noqa: D401
         """Forward-declared — implemented in PathMixin."""
         ...  # type: ignore[empty-body]
@@ -67,7 +69,11 @@ class LocksMixin:
         successful write into a user-visible write error. The
         user saved their file successfully; that contract is
         preserved regardless of what happens downstream.
+
+        Drops the shared git-state snapshot first, so a callback
+        (or any later reader) that lists files sees the write.
         """
+        self._invalidate_git_snapshot()
         callback = self._post_write_callback
         if callback is None:
             return
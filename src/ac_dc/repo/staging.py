@@ -31,6 +31,7 @@ class StagingMixin:
     def _get_write_lock(self, path: str | Path) -> asyncio.Lock: ...  # type: ignore[empty-body]
     def _fire_post_write(self, path: str | Path) -> None: ...  # type: ignore[empty-body]
     def _run_git(self, args: list[str], **kwargs: Any) -> Any: ...  # type: ignore[empty-body]
+    def _invalidate_git_snapshot(self) -> None: ...  # type: ignore[empty-body]
 
     # ------------------------------------------------------------------
     # Git staging
@@ -209,6 +210,7 @@ class StagingMixin:
                             f"Failed to discard {rel}: {exc}"
                         ) from exc
                     self._write_locks.pop(rel, None)
+                    self._invalidate_git_snapshot()
                 # Directories are left alone — callers that want to
                 # discard an untracked directory should use a shell
                 # ``rm -rf`` or ``git clean -fd`` deliberately.
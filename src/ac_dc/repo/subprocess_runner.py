@@ -22,6 +22,8 @@ class SubprocessMixin:
 
     _root: Path
 
+    def _note_git_command(self, args: list[str]) -> None: ...  # type: ignore[empty-body]
+
     def _run_git(
         self,
         args: list[str],
@@ -130,6 +132,11 @@ class SubprocessMixin:
                 stderr=stderr_decoded,
             )
 
+        # A mutating command (add, commit, checkout, ...) may have
+        # changed the index or working tree even when it exits
+        # non-zero — drop the shared git-state snapshot either way.
+        self._note_git_command(args)
+
         if check and result.returncode != 0:
             stderr = result.stderr
             if isinstance(stderr, bytes):
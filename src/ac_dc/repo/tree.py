@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from .errors import BINARY_PROBE_BYTES
+from .git_state import GitSnapshot
 
 
 class TreeMixin:
@@ -20,6 +21,8 @@ class TreeMixin:
     @staticmethod
     def _is_binary_bytes(data: bytes) -> bool: ...  # type: ignore[empty-body]
     def _run_git(self, args: list[str], **kwargs: Any) -> Any: ...  # type: ignore[empty-body]
+    def _git_listing(self) -> GitSnapshot: ...  # type: ignore[empty-body]
+    def _git_worktree_state(self) -> GitSnapshot: ...  # type: ignore[empty-body]
 
     # ------------------------------------------------------------------
     # File tree and flat listing
@@ -42,23 +45,16 @@ class TreeMixin:
         repo-relative filenames. Top-level files use empty
         string as the directory key. Directories with no
         eligible files after filtering are omitted entirely.
+
+        Reads the shared git-state snapshot, so calling this
+        alongside :meth:`get_flat_file_list` in one turn costs
+        one set of ``ls-files`` invocations.
         """
-        tracked = self._run_git(
-            ["ls-files"],
-            check=True,
-        ).stdout.splitlines()
-        untracked = self._run_git(
-            ["ls-files", "--others", "--exclude-standard"],
-            check=True,
-        ).stdout.splitlines()
-        all_files = sorted(set(tracked) | set(untracked))
         skip = skip_paths or set()
         by_dir: dict[str, list[str]] = {}
-        for rel in all_files:
+        for rel in self._git_listing().existing:
             if rel in skip:
                 continue
-            if not (self._root / rel).exists():
-                continue
             idx = rel.rfind("/")
             directory = rel[:idx] if idx != -1 else ""
             by_dir.setdefault(directory, []).append(rel)
@@ -131,27 +127,17 @@ class TreeMixin:
         commits, nothing untracked) or when every listed file
         has been deleted on disk.
 
-        Cost note: one ``Path.exists()`` (stat) per listed
-        file per call. On a 5K-file repo, this is well under
-        10ms. The picker's :meth:`get_file_tree` deliberately
-        keeps deleted files visible with a "deleted" badge so
-        the user can recover them — that path uses a different
-        source set and is unaffected.
+        Cost note: served from the shared git-state snapshot
+        (:mod:`ac_dc.repo.git_state`). A rebuild costs two
+        ``ls-files`` calls plus one ``Path.exists()`` per listed
+        file; a reuse costs one ``stat`` per directory, since a
+        deletion bumps its directory's mtime. The picker's
+        :meth:`get_file_tree` deliberately keeps deleted files
+        visible with a "deleted" badge so the user can recover
+        them — that path uses a different source set and is
+        unaffected.
         """
-        tracked = self._run_git(
-            ["ls-files"],
-            check=True,
-        ).stdout.splitlines()
-        untracked = self._run_git(
-            ["ls-files", "--others", "--exclude-standard"],
-            check=True,
-        ).stdout.splitlines()
-        all_files = sorted(set(tracked) | set(untracked))
-        existing = [
-            rel for rel in all_files
-            if (self._root / rel).exists()
-        ]
-        return "\n".join(existing)
+        return "\n".join(self._git_listing().existing)
 
     def _count_lines(self, absolute: Path) -> int:
         """Count newlines in a file for the tree-line-count badge.
@@ -330,41 +316,24 @@ class TreeMixin:
         Root node name matches the repo root's basename, so the UI
         can display it as the tree root header.
         """
-        # Candidate file set: tracked ∪ untracked (non-ignored).
-        tracked = set(
-            self._run_git(["ls-files"], check=True).stdout.splitlines()
-        )
-        untracked_raw = self._run_git(
-            ["ls-files", "--others", "--exclude-standard"],
-            check=True,
-        ).stdout.splitlines()
-        all_files = sorted(tracked | set(untracked_raw))
+        # Candidate file set (tracked ∪ untracked non-ignored),
+        # status, and numstat all come from the shared git-state
+        # snapshot — repeated refreshes with nothing changed
+        # spawn no git processes.
+        snap = self._git_worktree_state()
+        all_files = snap.files
 
         # Status — the four classification lists.
-        status_result = self._run_git(
-            ["status", "--porcelain"],
-            check=True,
-        )
         modified, staged, untracked, deleted = self._parse_porcelain_status(
-            status_result.stdout
+            snap.status_porcelain or ""
         )
 
         # Diff stats — staged and unstaged. We merge additions and
         # deletions across both so the picker shows the total churn
         # per file. Staged numbers take precedence when a file
         # appears in both (which happens for partially-staged edits).
-        staged_stats = self._parse_numstat(
-            self._run_git(
-                ["diff", "--cached", "--numstat"],
-                check=True,
-            ).stdout
-        )
-        unstaged_stats = self._parse_numstat(
-            self._run_git(
-                ["diff", "--numstat"],
-                check=True,
-            ).stdout
-        )
+        staged_stats = self._parse_numstat(snap.staged_numstat)
+        unstaged_stats = self._parse_numstat(snap.unstaged_numstat)
         diff_stats: dict[str, dict[str, int]] = {}
         for source in (unstaged_stats, staged_stats):
             for path, entry in source.items():
@@ -0,0 +1,795 @@
+"""Offline replay of stability-tracker turns — tuning without a live session.
+
+Drives :meth:`StabilityTracker.update` and
+:func:`~ac_dc.llm._assembly.build_tiered_content` over a sequence
+of recorded (or synthesised) turns exactly as
+:func:`~ac_dc.llm._stability.update_stability` and the streaming
+handler do, once per :class:`~ac_dc.cache_membrane.FluxConfig`,
+and reports what a provider's prefix cache would have charged.
+Judging a ``cache_membrane`` tuning change used to require real
+sessions and real money; this runs in seconds.
+
+Turn sources:
+
+- **Active-items snapshots** — JSONL, one object per turn:
+  ``{"active_items": {key: {"hash", "tokens"}}, "existing_files":
+  [...] | null}``. A live session appends one line per update
+  when ``AC_DC_STABILITY_RECORD`` names a file (see
+  :func:`append_snapshot`), so these are the faithful source —
+  real dir-block hashes and token counts included.
+- **History JSONL plus a selected-file timeline** — a
+  ``history.jsonl`` from ``.ac-dc4/``. Each exchange (a user
+  record and the replies that follow) becomes one turn whose
+  active items are every ``history:{i}`` up to the end of the
+  exchange plus ``file:{path}`` for the files selected at that
+  user record (its ``files`` field, or an override timeline).
+  File contents are read from ``--repo``; dir-blocks aren't
+  reconstructed, so this source understates cached mass.
+- **Synthetic** — :func:`synthetic_turns` models a large repo:
+  thousands of ``symbols:`` / ``plain_files:`` dir-blocks, a
+  drifting selection with edits, and growing history.
+
+Cache accounting mirrors the prompt layout (system, L0, L1, L2,
+L3, then Active, with a breakpoint after each cached tier). A
+tier's tokens are a cache *read* when its rendered content and
+every tier above it are byte-identical to the previous request,
+else a cache *write*; Active is uncached input. The system
+prompt is treated as a stable head outside the tracked tiers
+and not counted. Minimum-cacheable thresholds and cache TTLs are
+ignored — the comparison between configs, not the absolute
+bill, is the point.
+
+Tier content is rendered through the real
+:func:`build_tiered_content` against :class:`_ReplayService`, a
+host exposing just the service attributes that function reads.
+Blocks render as ``key#hash`` stand-ins — recorded snapshots
+carry hashes, not text — so a tier's bytes change exactly when
+its membership or a member's hash does, which is all the prefix
+comparison needs. Token figures come from the recorded counts.
+
+Usage::
+
+    python -m ac_dc.stability_replay snapshots.jsonl
+    python -m ac_dc.stability_replay --history .ac-dc4/history.jsonl --repo .
+    python -m ac_dc.stability_replay --synthetic --files 20000 --turns 40 \\
+        --config baseline.json --config tuned.json
+
+Config files hold the ``cache_tiering`` dict shape accepted by
+:meth:`FluxConfig.from_dict`; with none given, the defaults run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from ac_dc.cache_membrane import FluxConfig
+from ac_dc.context_manager import Mode
+from ac_dc.stability_tracker import StabilityTracker, Tier
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the JSONL file a live session
+# appends active-items snapshots to. Unset → no recording.
+RECORD_ENV = "AC_DC_STABILITY_RECORD"
+
+# Cached tiers in prompt order — a change in one invalidates the
+# provider's prefix for it and every tier after it.
+_CACHED_TIERS = (Tier.L0, Tier.L1, Tier.L2, Tier.L3)
+
+_DIR_BLOCK_PREFIXES = ("symbols:", "docs:", "plain_files:")
+
+_TIER_RANK = {
+    Tier.ACTIVE: 0, Tier.L3: 1, Tier.L2: 2, Tier.L1: 3, Tier.L0: 4,
+}
+
+# Relative per-token prices used for the single cost figure:
+# cache reads at a tenth of base input, writes at a 25% premium
+# (Anthropic's published ratios; other providers are similar).
+_READ_COST = 0.1
+_WRITE_COST = 1.25
+
+
+# ---------------------------------------------------------------------------
+# Turns
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ReplayTurn:
+    """One tracker update's input."""
+
+    active_items: dict[str, dict[str, Any]]
+    existing_files: set[str] | None = None
+
+
+def append_snapshot(
+    path: str | Path,
+    active_items: dict[str, dict[str, Any]],
+    existing_files: set[str] | None = None,
+) -> None:
+    """Append one turn to a snapshot JSONL file.
+
+    Called by :func:`~ac_dc.llm._stability.update_stability`
+    when :data:`RECORD_ENV` is set. Failures are logged, never
+    raised — recording is a diagnostic and must not break a
+    live turn.
+    """
+    record = {
+        "active_items": active_items,
+        "existing_files": (
+            sorted(existing_files) if existing_files is not None else None
+        ),
+    }
+    try:
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+    except OSError as exc:
+        logger.warning("Stability snapshot not recorded to %s: %s", path, exc)
+
+
+def load_snapshots(path: str | Path) -> list[ReplayTurn]:
+    """Read turns from a snapshot JSONL file; malformed lines skip."""
+    turns: list[ReplayTurn] = []
+    with open(path, encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                items = record["active_items"]
+            except (ValueError, KeyError, TypeError):
+                logger.warning("%s:%d: not a snapshot record", path, lineno)
+                continue
+            existing = record.get("existing_files")
+            turns.append(ReplayTurn(
+                active_items=items,
+                existing_files=(
+                    set(existing) if isinstance(existing, list) else None
+                ),
+            ))
+    return turns
+
+
+def _message_hash(role: str, content: Any) -> str:
+    """The tracker identity of a history message.
+
+    Same as :meth:`ContextManager.history_stability_items`.
+    """
+    text = content if isinstance(content, str) else str(content or "")
+    return hashlib.sha256(f"{role}:{text}".encode("utf-8")).hexdigest()
+
+
+def _load_timeline(path: str | Path) -> dict[int, list[str]]:
+    """``{"turn": n, "files": [...]}`` lines → turn → selection."""
+    timeline: dict[int, list[str]] = {}
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                timeline[int(record["turn"])] = list(record["files"])
+            except (ValueError, KeyError, TypeError):
+                continue
+    return timeline
+
+
+def turns_from_history(
+    history_path: str | Path,
+    *,
+    counter: Any,
+    repo_root: str | Path | None = None,
+    session_id: str | None = None,
+    files_timeline: dict[int, list[str]] | None = None,
+) -> list[ReplayTurn]:
+    """Rebuild per-exchange turns from a history JSONL file.
+
+    ``session_id`` defaults to the session of the last record.
+    The selection for exchange ``k`` is ``files_timeline``'s
+    latest entry at or before ``k`` when a timeline is given,
+    else the user record's ``files`` list. Selected files are
+    read from ``repo_root``; without it, or for files missing
+    on disk, no ``file:`` item is produced.
+    """
+    records: list[dict[str, Any]] = []
+    with open(history_path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and "role" in record:
+                records.append(record)
+    if not records:
+        return []
+    if session_id is None:
+        session_id = records[-1].get("session_id")
+    records = [r for r in records if r.get("session_id") == session_id]
+
+    # Split into exchanges: each user record opens one.
+    exchanges: list[list[dict[str, Any]]] = []
+    for record in records:
+        if record.get("role") == "user" or not exchanges:
+            exchanges.append([])
+        exchanges[-1].append(record)
+
+    root = Path(repo_root) if repo_root is not None else None
+    file_items: dict[str, dict[str, Any] | None] = {}
+
+    def _file_item(path: str) -> dict[str, Any] | None:
+        if path not in file_items:
+            item = None
+            if root is not None:
+                try:
+                    text = (root / path).read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError):
+                    text = None
+                if text is not None:
+                    item = {
+                        "hash": hashlib.sha256(
+                            text.encode("utf-8")
+                        ).hexdigest(),
+                        "tokens": counter.count(text),
+                    }
+            file_items[path] = item
+        return file_items[path]
+
+    turns: list[ReplayTurn] = []
+    history: list[dict[str, Any]] = []
+    selection: list[str] = []
+    for k, exchange in enumerate(exchanges):
+        if files_timeline is not None:
+            if k in files_timeline:
+                selection = files_timeline[k]
+        else:
+            files = exchange[0].get("files")
+            selection = list(files) if isinstance(files, list) else []
+        for record in exchange:
+            role = record.get("role", "user")
+            content = record.get("content", "")
+            history.append({
+                "hash": _message_hash(role, content),
+                "tokens": counter.count_message(
+                    {"role": role, "content": content}
+                ),
+            })
+        items: dict[str, dict[str, Any]] = {}
+        for path in selection:
+            item = _file_item(path)
+            if item is not None:
+                items[f"file:{path}"] = dict(item)
+        for i, entry in enumerate(history):
+            items[f"history:{i}"] = dict(entry)
+        turns.append(ReplayTurn(active_items=items))
+    return turns
+
+
+def synthetic_turns(
+    *,
+    files: int = 5000,
+    dirs: int | None = None,
+    turns: int = 30,
+    selected: int = 6,
+    edits_per_turn: int = 2,
+    selection_churn: float = 0.2,
+    message_tokens: int = 400,
+    seed: int = 0,
+) -> list[ReplayTurn]:
+    """Generate a large-repo workload.
+
+    ``files`` are spread over ``dirs`` directories (default one
+    per 25 files) with a skewed size distribution. Every
+    directory contributes a ``symbols:<dir>`` block sized from
+    its files; one in five also carries a ``plain_files:<dir>``
+    listing. Each turn keeps ``selected`` files in Active
+    full-text — replacing each with probability
+    ``selection_churn`` — edits ``edits_per_turn`` of them, and
+    appends a user/assistant exchange to history. As in a live
+    session, a selected file is subtracted from its directory's
+    block, and an edit also changes the block's signature.
+    Deterministic for a given ``seed``.
+    """
+    rng = random.Random(seed)
+    if dirs is None:
+        dirs = max(1, files // 25)
+    dir_names = [f"pkg{d // 40}/mod{d}" for d in range(dirs)]
+    # Zipf-ish directory populations — a few large packages,
+    # many small ones, like a real tree.
+    weights = [1.0 / (1 + d % 97) for d in range(dirs)]
+    paths: list[str] = []
+    sizes: dict[str, int] = {}
+    for i in range(files):
+        directory = rng.choices(dir_names, weights)[0]
+        path = f"{directory}/f{i}.py"
+        paths.append(path)
+        sizes[path] = int(rng.lognormvariate(6.5, 1.0)) + 20
+    by_dir: dict[str, list[str]] = {}
+    for path in paths:
+        by_dir.setdefault(path.rsplit("/", 1)[0], []).append(path)
+    plain_dirs = {d for d in by_dir if rng.random() < 0.2}
+
+    versions: dict[str, int] = {}
+    selection = rng.sample(paths, min(selected, len(paths)))
+    history: list[dict[str, Any]] = []
+    result: list[ReplayTurn] = []
+    for turn in range(turns):
+        if turn:
+            selection = [
+                rng.choice(paths) if rng.random() < selection_churn else p
+                for p in selection
+            ]
+            selection = list(dict.fromkeys(selection))
+            for path in rng.sample(
+                selection, min(edits_per_turn, len(selection))
+            ):
+                versions[path] = versions.get(path, 0) + 1
+        active = set(selection)
+        items: dict[str, dict[str, Any]] = {}
+        for path in selection:
+            items[f"file:{path}"] = {
+                "hash": _digest(f"{path}@{versions.get(path, 0)}"),
+                "tokens": sizes[path],
+            }
+        for directory, members in by_dir.items():
+            remaining = [p for p in members if p not in active]
+            if not remaining:
+                continue
+            signature = _digest("|".join(
+                f"{p}@{versions.get(p, 0)}" for p in remaining
+            ))
+            items[f"symbols:{directory}"] = {
+                "hash": signature,
+                "tokens": sum(sizes[p] // 8 + 4 for p in remaining),
+            }
+            if directory in plain_dirs:
+                items[f"plain_files:{directory}"] = {
+                    "hash": _digest("\n".join(remaining)),
+                    "tokens": 3 * len(remaining),
+                }
+        for role in ("user", "assistant"):
+            n = len(history)
+            history.append({
+                "hash": _digest(f"{role}:{n}"),
+                "tokens": int(rng.expovariate(1 / message_tokens)) + 5,
+            })
+        for i, entry in enumerate(history):
+            items[f"history:{i}"] = dict(entry)
+        result.append(ReplayTurn(active_items=items))
+    return result
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# build_tiered_content host
+# ---------------------------------------------------------------------------
+
+
+def _stand_in(tracker: StabilityTracker, key: str) -> str:
+    item = tracker.get_all_items().get(key)
+    if item is None:
+        return ""
+    return f"{key}#{item.content_hash}"
+
+
+class _ReplayIndex:
+    """Dir-block renderer over the tracker's recorded items.
+
+    ``_all_symbols`` / ``_all_outlines`` stay empty — plain-files
+    stand-ins aren't path listings, so nothing is "covered".
+    """
+
+    def __init__(self, tracker: StabilityTracker, prefix: str) -> None:
+        self._tracker = tracker
+        self._prefix = prefix
+        self._all_symbols: dict[str, Any] = {}
+        self._all_outlines: dict[str, Any] = {}
+
+    def get_dir_symbols_block(
+        self, directory: str, exclude_active: set[str] | None = None
+    ) -> str:
+        return _stand_in(self._tracker, self._prefix + directory)
+
+    get_dir_docs_block = get_dir_symbols_block
+
+
+class _ReplayRepo:
+    def __init__(self, tracker: StabilityTracker) -> None:
+        self._tracker = tracker
+
+    def get_files_by_directory(self) -> dict[str, list[str]]:
+        listing: dict[str, list[str]] = {}
+        for key in self._tracker.get_all_items():
+            if key.startswith("plain_files:"):
+                directory = key[len("plain_files:"):]
+                listing[directory] = [_stand_in(self._tracker, key)]
+        return listing
+
+
+class _ReplayFileContext:
+    def __init__(self, tracker: StabilityTracker) -> None:
+        self._tracker = tracker
+        self.selected: list[str] = []
+
+    def get_files(self) -> list[str]:
+        return list(self.selected)
+
+    def get_content(self, path: str) -> str | None:
+        return _stand_in(self._tracker, f"file:{path}") or None
+
+    def get_content_hash(self, path: str) -> str | None:
+        item = self._tracker.get_all_items().get(f"file:{path}")
+        return item.content_hash if item is not None else None
+
+
+class _ReplayContext:
+    mode = Mode.CODE
+
+    def __init__(self, tracker: StabilityTracker) -> None:
+        self._tracker = tracker
+        self.file_context = _ReplayFileContext(tracker)
+        self.history_length = 0
+
+    def history_stability_items(self) -> list[tuple[str, int]]:
+        items = self._tracker.get_all_items()
+        result = []
+        for i in range(self.history_length):
+            item = items.get(f"history:{i}")
+            result.append(
+                (item.content_hash, item.tokens) if item else ("", 0)
+            )
+        return result
+
+    def get_history(self) -> list[dict[str, Any]]:
+        return [
+            {"role": "user", "content": _stand_in(
+                self._tracker, f"history:{i}"
+            )}
+            for i in range(self.history_length)
+        ]
+
+
+class _ReplayService:
+    """The attributes :func:`build_tiered_content` reads, backed by a tracker."""
+
+    def __init__(self, tracker: StabilityTracker) -> None:
+        from ac_dc.llm._types import ConversationScope
+
+        self._context = _ReplayContext(tracker)
+        self._symbol_index = _ReplayIndex(tracker, "symbols:")
+        self._doc_index = _ReplayIndex(tracker, "docs:")
+        self._repo = _ReplayRepo(tracker)
+        self._excluded_index_files: list[str] = []
+        self._cross_ref_enabled = False
+        self._tier_render_cache: weakref.WeakKeyDictionary[
+            Any, dict[str, Any]
+        ] = weakref.WeakKeyDictionary()
+        self._scope = ConversationScope(
+            context=self._context, tracker=tracker, session_id="replay",
+        )
+
+    def _default_scope(self) -> Any:
+        return self._scope
+
+    def begin_turn(self, turn: ReplayTurn) -> None:
+        selected = [
+            key[len("file:"):] for key in turn.active_items
+            if key.startswith("file:")
+        ]
+        self._context.file_context.selected = selected
+        self._scope.selected_files = selected
+        self._context.history_length = sum(
+            1 for key in turn.active_items if key.startswith("history:")
+        )
+
+
+# ---------------------------------------------------------------------------
+# Simulation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ReplayReport:
+    """Totals for one config over one turn sequence."""
+
+    name: str
+    turns: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    uncached_tokens: int = 0
+    promotions: int = 0
+    demotions: int = 0
+    update_seconds: list[float] = field(default_factory=list)
+    build_seconds: list[float] = field(default_factory=list)
+    per_turn: list[dict[str, int]] = field(default_factory=list)
+
+    @property
+    def hit_rate(self) -> float:
+        total = (
+            self.cache_read_tokens + self.cache_write_tokens
+            + self.uncached_tokens
+        )
+        return self.cache_read_tokens / total if total else 0.0
+
+    @property
+    def relative_cost(self) -> float:
+        """Input cost in base-token units (reads 0.1×, writes 1.25×)."""
+        return (
+            self.cache_read_tokens * _READ_COST
+            + self.cache_write_tokens * _WRITE_COST
+            + self.uncached_tokens
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        updates = self.update_seconds or [0.0]
+        return {
+            "name": self.name,
+            "turns": self.turns,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "uncached_tokens": self.uncached_tokens,
+            "hit_rate": round(self.hit_rate, 4),
+            "relative_cost": round(self.relative_cost, 1),
+            "promotions": self.promotions,
+            "demotions": self.demotions,
+            "update_ms_mean": round(statistics.fmean(updates) * 1e3, 3),
+            "update_ms_p95": round(_percentile(updates, 0.95) * 1e3, 3),
+            "update_ms_max": round(max(updates) * 1e3, 3),
+            "build_ms_mean": round(
+                statistics.fmean(self.build_seconds or [0.0]) * 1e3, 3
+            ),
+            "per_turn": self.per_turn,
+        }
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _tier_digest(content: dict[str, Any]) -> str:
+    return _digest(json.dumps(content, sort_keys=True, default=str))
+
+
+def simulate(
+    turns: Iterable[ReplayTurn],
+    config: FluxConfig | None = None,
+    *,
+    name: str = "default",
+    warmup: int = 0,
+    cache_target_tokens: int = 0,
+    seed_dir_blocks: bool = True,
+) -> ReplayReport:
+    """Replay ``turns`` through a fresh tracker under ``config``.
+
+    With ``seed_dir_blocks`` the first turn's dir-block items
+    are seeded across L0–L3 by
+    :meth:`StabilityTracker.initialize_dir_blocks` before its
+    update, as a live session's startup does. Recorded turns
+    carry no directory mtimes, so every block seeds as equally
+    cold and the split falls back to key order and token
+    mass. The first ``warmup`` turns run but are left out of
+    the totals.
+    """
+    from ac_dc.llm._assembly import build_tiered_content
+
+    tracker = StabilityTracker(
+        cache_target_tokens=cache_target_tokens, flux_config=config
+    )
+    service = _ReplayService(tracker)
+    report = ReplayReport(name=name)
+    previous: dict[Tier, str] = {}
+    for index, turn in enumerate(turns):
+        if index == 0 and seed_dir_blocks:
+            tracker.initialize_dir_blocks([
+                (key, 0.0, int(item.get("tokens", 0)))
+                for key, item in turn.active_items.items()
+                if key.startswith(_DIR_BLOCK_PREFIXES)
+            ])
+        before = {
+            key: item.tier for key, item in tracker.get_all_items().items()
+        }
+        start = time.perf_counter()
+        tracker.update(turn.active_items, existing_files=turn.existing_files)
+        updated = time.perf_counter()
+        service.begin_turn(turn)
+        tiered = build_tiered_content(service) or {}
+        built = time.perf_counter()
+
+        items = tracker.get_all_items()
+        tier_tokens = {tier: 0 for tier in Tier}
+        for item in items.values():
+            tier_tokens[item.tier] += item.tokens
+        read = write = 0
+        intact = True
+        digests: dict[Tier, str] = {}
+        for tier in _CACHED_TIERS:
+            digests[tier] = _tier_digest(tiered.get(tier.value, {}))
+            intact = intact and digests[tier] == previous.get(tier)
+            if intact:
+                read += tier_tokens[tier]
+            else:
+                write += tier_tokens[tier]
+        previous = digests
+        promotions = demotions = 0
+        for key, item in items.items():
+            old = before.get(key)
+            if old is None or old == item.tier:
+                continue
+            if _TIER_RANK[item.tier] > _TIER_RANK[old]:
+                promotions += 1
+            else:
+                demotions += 1
+
+        if index < warmup:
+            continue
+        report.turns += 1
+        report.cache_read_tokens += read
+        report.cache_write_tokens += write
+        report.uncached_tokens += tier_tokens[Tier.ACTIVE]
+        report.promotions += promotions
+        report.demotions += demotions
+        report.update_seconds.append(updated - start)
+        report.build_seconds.append(built - updated)
+        report.per_turn.append({
+            "read": read,
+            "write": write,
+            "uncached": tier_tokens[Tier.ACTIVE],
+            "promotions": promotions,
+            "demotions": demotions,
+        })
+    return report
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m ac_dc.stability_replay",
+        description=(
+            "Replay recorded or synthetic turns through the stability "
+            "tracker and compare flux configs by simulated cache cost."
+        ),
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "snapshots", nargs="?",
+        help=f"Active-items snapshot JSONL (recorded via ${RECORD_ENV})",
+    )
+    source.add_argument("--history", help="history.jsonl to rebuild turns from")
+    source.add_argument(
+        "--synthetic", action="store_true",
+        help="Generate a synthetic large-repo workload",
+    )
+    parser.add_argument("--repo", help="Repo root for reading selected files")
+    parser.add_argument("--session", help="History session id (default: latest)")
+    parser.add_argument(
+        "--files-timeline",
+        help='JSONL of {"turn": n, "files": [...]} selection changes',
+    )
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--dirs", type=int, default=None)
+    parser.add_argument("--turns", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--config", action="append", default=[],
+        help="FluxConfig JSON file (repeatable; default config if none)",
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=0,
+        help="Leading turns to run but exclude from totals",
+    )
+    parser.add_argument(
+        "--no-seed", action="store_true",
+        help="Start from an empty tracker instead of seeding dir-blocks",
+    )
+    parser.add_argument(
+        "--emit", help="Also write the turns as a snapshot JSONL",
+    )
+    parser.add_argument(
+        "--json", action="store_true",
+        help="Print full reports (with per-turn rows) as JSON",
+    )
+    return parser
+
+
+def _load_turns(args: argparse.Namespace) -> list[ReplayTurn]:
+    if args.synthetic:
+        return synthetic_turns(
+            files=args.files, dirs=args.dirs, turns=args.turns,
+            seed=args.seed,
+        )
+    if args.history:
+        from ac_dc.token_counter import TokenCounter
+
+        timeline = (
+            _load_timeline(args.files_timeline)
+            if args.files_timeline else None
+        )
+        return turns_from_history(
+            args.history,
+            counter=TokenCounter("anthropic/claude-sonnet-4-5"),
+            repo_root=args.repo,
+            session_id=args.session,
+            files_timeline=timeline,
+        )
+    return load_snapshots(args.snapshots)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    turns = _load_turns(args)
+    if not turns:
+        print("No turns to replay.", file=sys.stderr)
+        return 1
+    if args.emit:
+        with open(args.emit, "w", encoding="utf-8"):
+            pass
+        for turn in turns:
+            append_snapshot(args.emit, turn.active_items, turn.existing_files)
+
+    configs: list[tuple[str, FluxConfig]] = []
+    for path in args.config:
+        with open(path, encoding="utf-8") as fh:
+            configs.append((
+                os.path.basename(path), FluxConfig.from_dict(json.load(fh))
+            ))
+    if not configs:
+        configs.append(("default", FluxConfig()))
+
+    reports = [
+        simulate(
+            turns, config, name=name, warmup=args.warmup,
+            seed_dir_blocks=not args.no_seed,
+        )
+        for name, config in configs
+    ]
+    if args.json:
+        print(json.dumps([r.to_dict() for r in reports], indent=2))
+        return 0
+    print(
+        f"{len(turns)} turns, "
+        f"{max(len(t.active_items) for t in turns)} items at peak"
+    )
+    header = (
+        f"{'config':<20} {'read':>12} {'write':>12} {'uncached':>10} "
+        f"{'hit':>6} {'cost':>12} {'promo':>7} {'demo':>6} "
+        f"{'upd ms':>8} {'p95':>8}"
+    )
+    print(header)
+    for report in reports:
+        row = report.to_dict()
+        print(
+            f"{report.name[:20]:<20} {row['cache_read_tokens']:>12,} "
+            f"{row['cache_write_tokens']:>12,} {row['uncached_tokens']:>10,} "
+            f"{row['hit_rate']:>6.1%} {row['relative_cost']:>12,.0f} "
+            f"{row['promotions']:>7} {row['demotions']:>6} "
+            f"{row['update_ms_mean']:>8.2f} {row['update_ms_p95']:>8.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
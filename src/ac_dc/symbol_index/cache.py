@@ -1,16 +1,39 @@
-"""Symbol cache — in-memory mtime-based cache for FileSymbols.
+"""Symbol cache — mtime-based cache for FileSymbols with a pack file.
 
 Thin concrete subclass of :class:`~ac_dc.base_cache.BaseCache`
 specialised to :class:`~ac_dc.symbol_index.models.FileSymbols`.
 
 Design points:
 
-- **In-memory only.** Tree-sitter re-parse is cheap (~5ms per
-  file for typical sources); the cache exists primarily to
-  avoid redundant work within a single session, not across
-  sessions. The doc cache (Layer 2.7) adds disk sidecars
-  because KeyBERT enrichment costs ~500ms per file and is
-  worth persisting.
+- **One pack file, bulk-loaded.** Tree-sitter re-parse is ~5ms
+  per file, which is nothing for one file and minutes for a
+  40k-file monorepo on every server start. When constructed
+  with a ``repo_root`` the cache mirrors every entry into a
+  single ``.ac-dc4/symbol_cache.json`` pack, read once at
+  construction. Unlike the doc cache's one-sidecar-per-file
+  layout, a pack keeps startup to one open + one parse no
+  matter how many files the repo has. Puts and invalidations
+  only mark the pack dirty; :meth:`SymbolCache.flush` rewrites
+  it atomically, and the orchestrator calls that once at the
+  end of each multi-file pass.
+
+- **Mtime first, content hash second.** Entries record the
+  source file's mtime and a SHA-256 of its bytes. An mtime
+  match is a hit without touching the file. An mtime mismatch
+  with an identical content hash (``git checkout`` round trips,
+  editors that rewrite unchanged files, a fresh clone of the
+  same tree) lets the orchestrator re-stamp the entry instead
+  of re-parsing — see :meth:`SymbolCache.get_by_content`.
+
+- **Extraction-time state only.** The pack stores what the
+  extractors produced. Import ``resolved_target`` and call-site
+  ``target_file`` / ``target_symbol`` are filled in by the
+  orchestrator against the current repo file set, so they're
+  recomputed after load rather than trusted from disk.
+
+- **JSON, not pickle.** The pack lives inside the repository's
+  working directory; unpickling a file a checkout could supply
+  would execute arbitrary code.
 
 - **Signature hash from raw symbol data, not formatted output.**
   Per specs4/2-indexing/symbol-index.md, the signature hash
@@ -30,13 +53,42 @@ Governing spec: ``specs4/2-indexing/symbol-index.md#caching``.
 from __future__ import annotations
 
 import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
 
 from ac_dc.base_cache import BaseCache
-from ac_dc.symbol_index.models import FileSymbols, Symbol
+from ac_dc.config import _AC_DC_DIR
+from ac_dc.symbol_index.models import (
+    CallSite,
+    FileSymbols,
+    Import,
+    Parameter,
+    Symbol,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Pack file name under the per-repo ``.ac-dc4/`` directory.
+_PACK_FILENAME = "symbol_cache.json"
+
+# Pack schema version. Bump when the serialised shape changes
+# OR when an extractor change alters what it produces for the
+# same source — a mismatch discards the pack and the next pass
+# re-parses everything.
+_PACK_VERSION = 1
+
+
+def content_digest(source: bytes) -> str:
+    """SHA-256 hex digest of a source file's bytes."""
+    return hashlib.sha256(source).hexdigest()
 
 
 class SymbolCache(BaseCache[FileSymbols]):
-    """In-memory mtime-based cache for :class:`FileSymbols`.
+    """Mtime-based cache for :class:`FileSymbols`.
 
     Behaviour inherited from :class:`BaseCache`:
 
@@ -48,11 +100,188 @@ class SymbolCache(BaseCache[FileSymbols]):
     - ``get_signature_hash(path)`` exposes the structural hash
       for the stability tracker.
 
-    No disk persistence — ``_persist`` and ``_remove_persisted``
-    inherit the base class's no-op defaults. The cache is
-    rebuilt from scratch on every session start.
+    Construct with a ``repo_root`` to load and maintain the pack
+    file; with ``repo_root=None`` the cache is purely in-memory.
     """
 
+    def __init__(self, repo_root: Path | str | None = None) -> None:
+        super().__init__()
+        self._repo_root: Path | None = (
+            Path(repo_root) if repo_root is not None else None
+        )
+        # True when in-memory entries differ from the pack.
+        self._dirty = False
+        # Content-hash slot read by _decorate_entry during put.
+        self._pending_content_hash: str | None = None
+        if self._repo_root is not None:
+            self._load_all()
+
+    # ------------------------------------------------------------------
+    # Content-hash aware put / lookup
+    # ------------------------------------------------------------------
+
+    def put(  # type: ignore[override]
+        self,
+        path: str | Path,
+        mtime: float,
+        value: FileSymbols,
+        content_hash: str | None = None,
+    ) -> None:
+        """Store FileSymbols with the source's content hash.
+
+        ``content_hash`` (from :func:`content_digest`) lets a
+        later mtime-mismatched lookup fall back to
+        :meth:`get_by_content`. Entries stored without one only
+        ever hit on mtime.
+        """
+        self._pending_content_hash = content_hash
+        try:
+            super().put(path, mtime, value)
+        finally:
+            self._pending_content_hash = None
+
+    def get_by_content(
+        self, path: str | Path, content_hash: str
+    ) -> FileSymbols | None:
+        """Return the entry for ``path`` if its source bytes match.
+
+        Ignores mtime. The caller re-stamps the entry with the
+        file's current mtime via :meth:`put` so subsequent
+        lookups hit on mtime alone.
+        """
+        entry = self._entries.get(self._normalise_path(path))
+        if entry is None or entry.get("content_hash") != content_hash:
+            return None
+        return entry.get("value")  # type: ignore[no-any-return]
+
+    # ------------------------------------------------------------------
+    # Pack persistence
+    # ------------------------------------------------------------------
+
+    def _pack_path(self) -> Path | None:
+        if self._repo_root is None:
+            return None
+        return self._repo_root / _AC_DC_DIR / _PACK_FILENAME
+
+    def _decorate_entry(
+        self,
+        entry: dict[str, Any],
+        path: str | Path,
+        value: FileSymbols,
+    ) -> None:
+        del path, value  # unused here
+        entry["content_hash"] = self._pending_content_hash
+
+    def _persist(self, key: str, entry: dict[str, Any]) -> None:
+        """Mark the pack stale; :meth:`flush` writes it."""
+        del key, entry
+        self._dirty = True
+
+    def _remove_persisted(self, key: str) -> None:
+        del key
+        self._dirty = True
+
+    def _clear_persisted(self) -> None:
+        pack = self._pack_path()
+        self._dirty = False
+        if pack is not None and pack.exists():
+            pack.unlink()
+
+    def flush(self) -> None:
+        """Rewrite the pack file if anything changed since the last write.
+
+        Written to a temp file and renamed into place so a crash
+        mid-write leaves the previous pack intact. Disk errors
+        are logged; the in-memory cache stays authoritative.
+        """
+        pack = self._pack_path()
+        if pack is None or not self._dirty:
+            return
+        payload = {
+            "version": _PACK_VERSION,
+            "entries": {
+                key: {
+                    "mtime": entry["mtime"],
+                    "content_hash": entry.get("content_hash"),
+                    "signature_hash": entry["signature_hash"],
+                    "symbols": _file_symbols_to_json(entry["value"]),
+                }
+                for key, entry in self._entries.items()
+            },
+        }
+        tmp_path = pack.with_suffix(".json.tmp")
+        try:
+            pack.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps(
+                    payload, ensure_ascii=False, separators=(",", ":")
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, pack)
+        except OSError as exc:
+            logger.warning(
+                "Failed to write symbol cache %s: %s", pack, exc
+            )
+            return
+        self._dirty = False
+
+    def _load_all(self) -> None:
+        """Bulk-load the pack file.
+
+        A missing pack is a cold start. An unreadable pack or
+        a version mismatch is logged and ignored — the next
+        flush overwrites it. Individual malformed entries are
+        skipped; a partial cache is better than no cache.
+        """
+        pack = self._pack_path()
+        if pack is None:
+            return
+        try:
+            raw = pack.read_text(encoding="utf-8")
+        except OSError:
+            return
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            logger.warning("Ignoring corrupt symbol cache %s: %s", pack, exc)
+            return
+        if not isinstance(payload, dict):
+            logger.warning("Ignoring symbol cache %s: not an object", pack)
+            return
+        if payload.get("version") != _PACK_VERSION:
+            logger.info(
+                "Symbol cache %s has version %r (expected %d); ignoring",
+                pack, payload.get("version"), _PACK_VERSION,
+            )
+            return
+        entries = payload.get("entries")
+        if not isinstance(entries, dict):
+            return
+        for key, data in entries.items():
+            try:
+                value = _file_symbols_from_json(data["symbols"])
+                mtime = float(data["mtime"])
+            except (KeyError, TypeError, ValueError) as exc:
+                logger.debug(
+                    "Skipping symbol cache entry %s: %s", key, exc
+                )
+                continue
+            content_hash = data.get("content_hash")
+            signature_hash = data.get("signature_hash")
+            self._entries[key] = {
+                "value": value,
+                "mtime": mtime,
+                "signature_hash": (
+                    signature_hash if isinstance(signature_hash, str)
+                    else self._compute_signature_hash(value)
+                ),
+                "content_hash": (
+                    content_hash if isinstance(content_hash, str)
+                    else None
+                ),
+            }
+
     # ------------------------------------------------------------------
     # Signature hashing
     # ------------------------------------------------------------------
@@ -155,4 +384,124 @@ class SymbolCache(BaseCache[FileSymbols]):
         ``cache.cached_paths`` when the context is specifically
         source files.
         """
-        return self.cached_paths
\ No newline at end of file
+        return self.cached_paths
+
+# ----------------------------------------------------------------------
+# Serialisation
+# ----------------------------------------------------------------------
+#
+# Hand-written rather than dataclasses.asdict so default-valued
+# fields are omitted (the pack for a large repo is dominated by
+# call sites and parameters) and so resolution-time fields never
+# reach disk.
+
+
+def _file_symbols_to_json(fs: FileSymbols) -> dict[str, Any]:
+    return {
+        "file_path": fs.file_path,
+        "symbols": [_symbol_to_json(s) for s in fs.symbols],
+        "imports": [_import_to_json(i) for i in fs.imports],
+    }
+
+
+def _import_to_json(imp: Import) -> dict[str, Any]:
+    out: dict[str, Any] = {"module": imp.module}
+    if imp.names:
+        out["names"] = list(imp.names)
+    if imp.alias is not None:
+        out["alias"] = imp.alias
+    if imp.level:
+        out["level"] = imp.level
+    if imp.line:
+        out["line"] = imp.line
+    return out
+
+
+def _param_to_json(p: Parameter) -> dict[str, Any]:
+    out: dict[str, Any] = {"name": p.name}
+    if p.type_annotation is not None:
+        out["type"] = p.type_annotation
+    if p.default is not None:
+        out["default"] = p.default
+    if p.is_vararg:
+        out["vararg"] = True
+    if p.is_kwarg:
+        out["kwarg"] = True
+    return out
+
+
+def _symbol_to_json(sym: Symbol) -> dict[str, Any]:
+    out: dict[str, Any] = {
+        "name": sym.name,
+        "kind": sym.kind,
+        "file_path": sym.file_path,
+        "range": list(sym.range),
+    }
+    if sym.parameters:
+        out["params"] = [_param_to_json(p) for p in sym.parameters]
+    if sym.return_type is not None:
+        out["returns"] = sym.return_type
+    if sym.bases:
+        out["bases"] = list(sym.bases)
+    if sym.children:
+        out["children"] = [_symbol_to_json(c) for c in sym.children]
+    if sym.is_async:
+        out["async"] = True
+    if sym.call_sites:
+        # [name, line, is_conditional] — targets are resolved
+        # after load.
+        out["calls"] = [
+            [cs.name, cs.line, int(cs.is_conditional)]
+            for cs in sym.call_sites
+        ]
+    if sym.instance_vars:
+        out["ivars"] = list(sym.instance_vars)
+    return out
+
+
+def _file_symbols_from_json(data: dict[str, Any]) -> FileSymbols:
+    return FileSymbols(
+        file_path=data["file_path"],
+        symbols=[_symbol_from_json(s) for s in data.get("symbols", [])],
+        imports=[
+            Import(
+                module=i["module"],
+                names=list(i.get("names", [])),
+                alias=i.get("alias"),
+                level=int(i.get("level", 0)),
+                line=int(i.get("line", 0)),
+            )
+            for i in data.get("imports", [])
+        ],
+    )
+
+
+def _symbol_from_json(data: dict[str, Any]) -> Symbol:
+    start_line, start_col, end_line, end_col = data["range"]
+    return Symbol(
+        name=data["name"],
+        kind=data["kind"],
+        file_path=data["file_path"],
+        range=(
+            int(start_line), int(start_col), int(end_line), int(end_col)
+        ),
+        parameters=[
+            Parameter(
+                name=p["name"],
+                type_annotation=p.get("type"),
+                default=p.get("default"),
+                is_vararg=bool(p.get("vararg", False)),
+                is_kwarg=bool(p.get("kwarg", False)),
+            )
+            for p in data.get("params", [])
+        ],
+        return_type=data.get("returns"),
+        bases=list(data.get("bases", [])),
+        children=[_symbol_from_json(c) for c in data.get("children", [])],
+        is_async=bool(data.get("async", False)),
+        call_sites=[
+            CallSite(name=name, line=int(line), is_conditional=bool(cond))
+            for name, line, cond in data.get("calls", [])
+        ],
+        instance_vars=list(data.get("ivars", [])),
+    )
@@ -11,7 +11,8 @@ Design notes pinned by the test suite and spec:
 
 - **Per-file pipeline** — check cache → parse → extract →
   post-process (import resolution) → store. mtime-based
-  caching means unchanged files are a no-op.
+  caching, with a content-hash fallback and an on-disk pack
+  that survives restarts, means unchanged files are a no-op.
 
 - **Multi-file pipeline** — index each file, prune stale
   entries (both in-memory and cache), resolve cross-file
@@ -45,10 +46,15 @@ Governing spec: ``specs4/2-indexing/symbol-index.md``.
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
-from ac_dc.symbol_index.cache import SymbolCache
+from ac_dc.dir_map import DirectoryMap
+from ac_dc.symbol_index.cache import SymbolCache, content_digest
 from ac_dc.symbol_index.compact_format import CompactFormatter
 from ac_dc.symbol_index.extractors import (
     BaseExtractor,
@@ -87,6 +93,114 @@ _EXTRACTOR_CLASSES: tuple[type[BaseExtractor], ...] = (
 )
 
 
+# Minimum number of cache misses before index_repo switches to
+# the process pool. Below this, pool start-up (each worker
+# imports tree-sitter and loads grammars) costs more than it
+# saves.
+_DEFAULT_PARALLEL_MIN_FILES = 256
+
+# Files per shard handed to a pool worker. Small enough for
+# even load balancing and frequent progress updates, large
+# enough that per-task pickling overhead stays negligible.
+_DEFAULT_SHARD_SIZE = 64
+
+# Largest share of indexed files a pass may affect and still
+# update the reference graph incrementally. Past this, one
+# full rebuild beats retracting and re-recording nearly every
+# file's edges individually.
+_INCREMENTAL_MAX_FRACTION = 0.5
+
+
+# Progress callback — ``(files_done, files_total)``. Invoked
+# from the thread running index_repo.
+ProgressCallback = Callable[[int, int], None]
+
+
+def _extract_source(
+    parser: TreeSitterParser,
+    extractor: BaseExtractor,
+    language: str,
+    source: bytes,
+    rel: str,
+) -> "FileSymbols | None":
+    """Parse ``source`` and run the extractor over it.
+
+    Shared by the in-process pipeline and the pool workers so
+    both produce identical FileSymbols. Returns None when the
+    grammar is unavailable or the extractor raises.
+    """
+    # Extractors that declare tree_optional=True (e.g.
+    # MATLAB) get tree=None and do their own regex-based
+    # extraction. The rest need a real tree.
+    if extractor.tree_optional:
+        tree = None
+    else:
+        tree = parser.parse(source, language)
+        if tree is None:
+            # Grammar unavailable — nothing to do.
+            return None
+
+    try:
+        return extractor.extract(tree, source, rel)
+    except Exception as exc:
+        # Defensive — an extractor bug shouldn't take
+        # down the whole index pass.
+        logger.warning(
+            "Extractor for %s failed on %s: %s",
+            language, rel, exc,
+        )
+        return None
+
+
+# Per-process extractor registry for pool workers. Built on
+# the first shard a worker receives and reused for the rest.
+_worker_extractors: dict[str, BaseExtractor] | None = None
+
+
+def _extract_shard(
+    repo_root: str | None,
+    items: list[tuple[str, str]],
+) -> list[tuple[str, "FileSymbols | None", str | None]]:
+    """Pool worker — extract one shard of files.
+
+    ``items`` holds ``(rel, language)`` pairs. Returns
+    ``(rel, file_symbols, content_hash)`` per file, where
+    ``content_hash`` is None when the source couldn't be read
+    (the parent drops the file from the index, as the
+    in-process path does). FileSymbols travel back pickled;
+    they are plain dataclasses. Import resolution is left to
+    the parent, which owns the resolver's file set.
+    """
+    global _worker_extractors
+    if _worker_extractors is None:
+        _worker_extractors = {}
+        for cls in _EXTRACTOR_CLASSES:
+            instance = cls()
+            if instance.language:
+                _worker_extractors[instance.language] = instance
+    parser = TreeSitterParser.instance()
+    root = Path(repo_root) if repo_root is not None else None
+    results: list[tuple[str, "FileSymbols | None", str | None]] = []
+    for rel, language in items:
+        absolute = Path(rel)
+        if not absolute.is_absolute() and root is not None:
+            absolute = root / rel
+        try:
+            source = absolute.read_bytes()
+        except OSError:
+            results.append((rel, None, None))
+            continue
+        results.append((
+            rel,
+            _extract_source(
+                parser, _worker_extractors[language], language,
+                source, rel,
+            ),
+            content_digest(source),
+        ))
+    return results
+
+
 class SymbolIndex:
     """Top-level symbol-index orchestrator.
 
@@ -96,7 +210,15 @@ class SymbolIndex:
     map is a read-only snapshot between re-index passes.
     """
 
-    def __init__(self, repo_root: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        repo_root: Path | str | None = None,
+        *,
+        workers: int = 1,
+        parallel_min_files: int = _DEFAULT_PARALLEL_MIN_FILES,
+        shard_size: int = _DEFAULT_SHARD_SIZE,
+        persist_cache: bool = True,
+    ) -> None:
         """Initialise the orchestrator.
 
         Parameters
@@ -107,18 +229,41 @@ class SymbolIndex:
             :meth:`index_file` and :meth:`index_repo` are
             resolved against this directory. When None,
             callers must pass absolute paths.
+        workers
+            Process-pool size for :meth:`index_repo`. 1 (the
+            default) keeps every parse in-process; 0 means
+            one worker per CPU.
+        parallel_min_files
+            Minimum number of files needing a parse before
+            :meth:`index_repo` uses the pool.
+        shard_size
+            Files per pool task, and the granularity of
+            progress reports.
+        persist_cache
+            When True (default) and ``repo_root`` is set, the
+            symbol cache is loaded from and flushed to its
+            pack file under ``.ac-dc4/`` so a restart on an
+            unchanged repo parses nothing.
         """
         self.repo_root: Path | None = (
             Path(repo_root) if repo_root is not None else None
         )
 
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        self._workers = workers
+        self._parallel_min_files = max(1, parallel_min_files)
+        self._shard_size = max(1, shard_size)
+
         # Shared tree-sitter parser — caches loaded
         # Language objects internally.
         self._parser = TreeSitterParser.instance()
 
         # Cache, reference index, resolver. Exposed as
         # underscored attributes for test introspection.
-        self._cache = SymbolCache()
+        self._cache = SymbolCache(
+            self.repo_root if persist_cache else None
+        )
         self._ref_index = ReferenceIndex()
         self._resolver = ImportResolver()
 
@@ -130,8 +275,34 @@ class SymbolIndex:
                 self._extractors[instance.language] = instance
 
         # In-memory per-file symbol store. Keys are
-        # forward-slash relative paths.
-        self._all_symbols: dict[str, "FileSymbols"] = {}
+        # forward-slash relative paths. A DirectoryMap so the
+        # dir-block accessors look up a directory's members
+        # instead of filtering every indexed path.
+        self._all_symbols: DirectoryMap["FileSymbols"] = DirectoryMap()
+
+        # Per-directory dir-block caches — directory →
+        # (inputs key, value). The hash depends only on the
+        # members, their signatures and which of them are in
+        # Active; the rendered block also depends on the
+        # reference graph (``←N`` counts and the
+        # ``references_to_symbol`` lookups reach across
+        # directories), so it is additionally keyed on
+        # ``_graph_generation``, bumped whenever the graph is
+        # rebuilt or updated.
+        self._dir_block_cache: dict[str, tuple[tuple, str]] = {}
+        self._dir_hash_cache: dict[str, tuple[tuple, str]] = {}
+        self._graph_generation = 0
+
+        # Incremental reference-graph bookkeeping. The graph
+        # is built in full once; after that index_repo only
+        # re-resolves and re-records the files a pass
+        # actually affected. ``_resolution_changed`` collects
+        # files whose import targets moved during the pass
+        # (a new module appeared, an imported one vanished).
+        # ``_graph_symbols`` is the FileSymbols map the graph
+        # currently reflects; None until the first build.
+        self._graph_symbols: dict[str, "FileSymbols"] | None = None
+        self._resolution_changed: set[str] = set()
 
         # Two formatter instances — context (LLM-facing)
         # and LSP (editor features, with line numbers).
@@ -212,8 +383,13 @@ class SymbolIndex:
             # the resolver's file set may have grown since
             # the cache entry was written. Cheap in any
             # case — it's a dict lookup per import.
-            self._resolve_imports_for_file(cached)
+            resolution_changed = self._resolve_imports_for_file(cached)
             self._all_symbols[rel] = cached
+            if resolution_changed:
+                self._resolution_changed.add(rel)
+                # Same object, new ``i→`` targets — the
+                # directory's rendered block is stale.
+                self._all_symbols.touch(rel)
             return cached
 
         return self._parse_and_store(
@@ -236,28 +412,28 @@ class SymbolIndex:
             self._cache.invalidate(rel)
             return None
 
-        # Extractors that declare tree_optional=True (e.g.
-        # future MATLAB) get tree=None and do their own
-        # regex-based extraction. The rest need a real tree.
-        if extractor.tree_optional:
-            tree = None
-        else:
-            tree = self._parser.parse(source, language)
-            if tree is None:
-                # Grammar unavailable — nothing to do.
-                return None
+        # mtime changed but the bytes didn't (checkout round
+        # trip, touch, fresh clone) — re-stamp, don't re-parse.
+        content_hash = content_digest(source)
+        reused = self._cache.get_by_content(rel, content_hash)
+        if reused is not None:
+            return self._store(rel, mtime, reused, content_hash)
 
-        try:
-            file_symbols = extractor.extract(tree, source, rel)
-        except Exception as exc:
-            # Defensive — an extractor bug shouldn't take
-            # down the whole index pass.
-            logger.warning(
-                "Extractor for %s failed on %s: %s",
-                language, rel, exc,
-            )
+        file_symbols = _extract_source(
+            self._parser, extractor, language, source, rel
+        )
+        if file_symbols is None:
             return None
+        return self._store(rel, mtime, file_symbols, content_hash)
 
+    def _store(
+        self,
+        rel: str,
+        mtime: float,
+        file_symbols: "FileSymbols",
+        content_hash: str | None,
+    ) -> "FileSymbols":
+        """Resolve imports, then store in cache and _all_symbols."""
         # Populate Import.resolved_target for the file's
         # own imports using the current resolver state.
         # The resolver's file set may not yet include all
@@ -268,13 +444,15 @@ class SymbolIndex:
         self._resolve_imports_for_file(file_symbols)
 
         # Store in both cache and in-memory map.
-        self._cache.put(rel, mtime, file_symbols)
+        self._cache.put(
+            rel, mtime, file_symbols, content_hash=content_hash
+        )
         self._all_symbols[rel] = file_symbols
         return file_symbols
 
     def _resolve_imports_for_file(
         self, file_symbols: "FileSymbols"
-    ) -> None:
+    ) -> bool:
         """Attach ``resolved_target`` to each Import object.
 
         The import resolver returns a repo-relative path
@@ -283,16 +461,29 @@ class SymbolIndex:
         reads via :func:`getattr` with a None default, so
         pre-resolver Import objects still work. A later
         model change could make this a real field.
+
+        Returns True when any import's target differs from
+        the one previously attached — the signal
+        :meth:`index_repo` uses to re-resolve an unchanged
+        file's call sites.
         """
+        changed = False
         for imp in file_symbols.imports:
             target = self._resolver.resolve(imp, file_symbols.file_path)
+            if getattr(imp, "resolved_target", None) != target:
+                changed = True
             setattr(imp, "resolved_target", target)
+        return changed
 
     # ------------------------------------------------------------------
     # Multi-file pipeline
     # ------------------------------------------------------------------
 
-    def index_repo(self, file_list: list[str | Path]) -> None:
+    def index_repo(
+        self,
+        file_list: list[str | Path],
+        progress: ProgressCallback | None = None,
+    ) -> None:
         """Index a list of files, prune stale entries, rebuild refs.
 
         The canonical full-repo entry point. Callers pass
@@ -309,11 +500,27 @@ class SymbolIndex:
         3. Index each file (cache-aware).
         4. Prune entries in ``_all_symbols`` and the cache
            whose paths aren't in the new list. Must run
-           BEFORE the reference index rebuild.
+           BEFORE the reference index update.
         5. Resolve cross-file call-site targets using the
            now-complete import and symbol maps.
-        6. Rebuild the reference graph from the current
+        6. Update the reference graph from the current
            ``_all_symbols``.
+        7. Flush the symbol cache's pack file.
+
+        Steps 5 and 6 are incremental once the graph has
+        been built: only files whose FileSymbols were
+        replaced, whose import targets moved, or that import
+        a replaced or removed file are re-resolved and
+        re-recorded — see :meth:`_affected_files`. A pass
+        that touches most of the repo (or the first pass)
+        falls back to a full rebuild, which is cheaper than
+        retracting nearly every edge one file at a time.
+
+        Step 3 runs on a process pool when the index was
+        constructed with ``workers > 1`` and at least
+        ``parallel_min_files`` files need parsing — see
+        :meth:`_index_parallel`. ``progress`` is called with
+        ``(files_done, files_total)`` after each shard.
         """
         # Step 1 — normalise and filter.
         normalised: list[str] = []
@@ -336,8 +543,7 @@ class SymbolIndex:
         # Step 3 — index each file. Errors inside
         # index_file are swallowed there (returns None);
         # the pass continues.
-        for rel in normalised:
-            self.index_file(rel)
+        self._index_files(normalised, progress)
 
         # Step 4 — prune stale entries. Done by diffing
         # the in-memory map and cache against the current
@@ -345,13 +551,167 @@ class SymbolIndex:
         # or moved file; its entries must go.
         self._prune_stale(keep)
 
-        # Step 5 — cross-file call-site resolution.
-        self._resolve_call_sites()
+        # Steps 5 and 6 — call-site resolution and the
+        # reference graph. Diffed against the map the graph
+        # last saw rather than a snapshot of this pass, so
+        # index_file / invalidate_file calls made between
+        # passes are picked up too.
+        graph_symbols = self._graph_symbols
+        if graph_symbols is None:
+            self._rebuild_graph()
+        else:
+            changed = {
+                rel for rel, fs in self._all_symbols.items()
+                if graph_symbols.get(rel) is not fs
+            }
+            removed = set(graph_symbols) - set(self._all_symbols)
+            affected = self._affected_files(changed, removed)
+            if (
+                len(affected) + len(removed)
+                > len(self._all_symbols) * _INCREMENTAL_MAX_FRACTION
+            ):
+                self._rebuild_graph()
+            elif affected or removed:
+                self._resolve_call_sites(affected)
+                self._ref_index.update(
+                    [self._all_symbols[rel] for rel in sorted(affected)],
+                    removed=removed,
+                )
+                self._graph_generation += 1
+        self._graph_symbols = dict(self._all_symbols)
+        self._resolution_changed = set()
+
+        # Step 7 — write the cache pack once for the whole
+        # pass (no-op when nothing changed).
+        self._cache.flush()
+
+    def _index_files(
+        self,
+        rels: list[str],
+        progress: ProgressCallback | None,
+    ) -> None:
+        """Index ``rels`` in order, on the pool when worthwhile."""
+        if self._workers > 1:
+            pending = self._pending_parses(rels)
+            if len(pending) >= self._parallel_min_files:
+                try:
+                    self._index_parallel(rels, pending, progress)
+                    return
+                except (OSError, BrokenProcessPool) as exc:
+                    # Sandboxes without fork/spawn rights, or a
+                    # worker killed mid-shard. Nothing was
+                    # merged yet, so the serial pass starts
+                    # from a clean slate.
+                    logger.warning(
+                        "Parallel symbol indexing failed (%s); "
+                        "falling back to in-process indexing",
+                        exc,
+                    )
+        total = len(rels)
+        for done, rel in enumerate(rels, start=1):
+            self.index_file(rel)
+            if progress is not None and (
+                done % self._shard_size == 0 or done == total
+            ):
+                progress(done, total)
+
+    def _pending_parses(
+        self, rels: list[str]
+    ) -> list[tuple[str, str, float]]:
+        """Return ``(rel, language, mtime)`` for files needing a parse.
+
+        Cache hits, unsupported languages, and unreadable files
+        are excluded — :meth:`index_file` handles those
+        in-process in microseconds. A stale-mtime entry whose
+        source bytes are unchanged is re-stamped here so it
+        counts as a hit too.
+        """
+        pending: list[tuple[str, str, float]] = []
+        for rel in rels:
+            language = language_for_file(rel)
+            if language is None or language not in self._extractors:
+                continue
+            absolute = self._absolute_path(rel)
+            try:
+                mtime = absolute.stat().st_mtime
+            except OSError:
+                continue
+            if self._cache.get(rel, mtime) is not None:
+                continue
+            if self._cache.has(rel):
+                try:
+                    content_hash = content_digest(absolute.read_bytes())
+                except OSError:
+                    continue
+                reused = self._cache.get_by_content(rel, content_hash)
+                if reused is not None:
+                    self._cache.put(
+                        rel, mtime, reused, content_hash=content_hash
+                    )
+                    continue
+            pending.append((rel, language, mtime))
+        return pending
 
-        # Step 6 — rebuild the reference graph from
-        # scratch. ReferenceIndex.build is idempotent —
-        # it clears prior state first.
-        self._ref_index.build(list(self._all_symbols.values()))
+    def _index_parallel(
+        self,
+        rels: list[str],
+        pending: list[tuple[str, str, float]],
+        progress: ProgressCallback | None,
+    ) -> None:
+        """Extract ``pending`` on a process pool, then merge.
+
+        Files are sharded across ``spawn``-started workers
+        (fork is unsafe here — the server process runs an
+        event loop and executor threads). Each worker returns
+        pickled FileSymbols for its shard. Results are merged
+        in ``rels`` order once every shard is back, so
+        ``_all_symbols`` ends up identical to a serial pass;
+        import resolution and cache writes happen here, in
+        the parent, against the resolver's full file set.
+        """
+        total = len(rels)
+        done = total - len(pending)
+        mtimes = {rel: mtime for rel, _, mtime in pending}
+        shards = [
+            [(rel, language) for rel, language, _ in
+             pending[i:i + self._shard_size]]
+            for i in range(0, len(pending), self._shard_size)
+        ]
+        repo_root = (
+            str(self.repo_root) if self.repo_root is not None else None
+        )
+        results: dict[str, tuple["FileSymbols | None", str | None]] = {}
+        with ProcessPoolExecutor(
+            max_workers=min(self._workers, len(shards)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = [
+                pool.submit(_extract_shard, repo_root, shard)
+                for shard in shards
+            ]
+            for future in as_completed(futures):
+                shard_results = future.result()
+                for rel, file_symbols, content_hash in shard_results:
+                    results[rel] = (file_symbols, content_hash)
+                done += len(shard_results)
+                if progress is not None:
+                    progress(done, total)
+
+        for rel in rels:
+            outcome = results.get(rel)
+            if outcome is None:
+                # Not sent to the pool — cache hit or
+                # unsupported file.
+                self.index_file(rel)
+                continue
+            file_symbols, content_hash = outcome
+            if content_hash is None:
+                self._all_symbols.pop(rel, None)
+                self._cache.invalidate(rel)
+            elif file_symbols is not None:
+                self._store(
+                    rel, mtimes[rel], file_symbols, content_hash
+                )
 
     def _prune_stale(self, keep: set[str]) -> None:
         """Remove in-memory and cached entries not in ``keep``.
@@ -372,7 +732,31 @@ class SymbolIndex:
             self._all_symbols.pop(path, None)
             self._cache.invalidate(path)
 
-    def _resolve_call_sites(self) -> None:
+    def _rebuild_graph(self) -> None:
+        """Resolve every call site and rebuild the graph from scratch."""
+        self._resolve_call_sites()
+        self._ref_index.build(list(self._all_symbols.values()))
+        self._graph_generation += 1
+
+    def _affected_files(
+        self, changed: set[str], removed: set[str]
+    ) -> set[str]:
+        """Files whose graph contributions a pass may have altered.
+
+        ``changed`` files carry new FileSymbols; files whose
+        import targets moved re-resolve their call sites; and
+        importers of a changed or removed file are included so
+        their edges are re-derived against the new state.
+        Restricted to files still indexed.
+        """
+        affected = changed | self._resolution_changed
+        for rel in changed | removed:
+            affected |= self._ref_index.files_referencing(rel)
+        return affected & self._all_symbols.keys()
+
+    def _resolve_call_sites(
+        self, paths: Iterable[str] | None = None
+    ) -> None:
         """Populate ``target_file`` on each call site.
 
         Strategy — for each file, build a map of
@@ -389,8 +773,26 @@ class SymbolIndex:
         resolution that's out of scope for Layer 2.7 —
         the reference graph handles those via import
         edges separately.
+
+        ``paths`` limits the pass to those files (default:
+        every indexed file). Files whose import targets moved
+        this pass have their previous resolutions cleared
+        first so no call site keeps pointing at a stale
+        target.
         """
-        for file_symbols in self._all_symbols.values():
+        if paths is None:
+            selected = list(self._all_symbols.values())
+        else:
+            selected = [
+                self._all_symbols[rel] for rel in paths
+                if rel in self._all_symbols
+            ]
+        for file_symbols in selected:
+            if file_symbols.file_path in self._resolution_changed:
+                for sym in file_symbols.all_symbols_flat:
+                    for cs in sym.call_sites:
+                        cs.target_file = None
+                        cs.target_symbol = None
             # Per-file imported-name → target map.
             import_map: dict[str, str] = {}
             for imp in file_symbols.imports:
@@ -569,10 +971,48 @@ class SymbolIndex:
         Used by the stability tracker at init time to enumerate
         the universe of `symbols:<dir>` keys.
         """
-        dirs: set[str] = set()
-        for path in self._all_symbols:
-            dirs.add(self._dir_of(path))
-        return sorted(dirs)
+        return self._all_symbols.directories()
+
+    def _dir_members(
+        self, directory: str, exclude_active: set[str] | None
+    ) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return ``(eligible, excluded)`` members of a directory.
+
+        Both sorted. ``excluded`` is the directory's share of
+        the Active set — the part of ``exclude_active`` that
+        can affect this directory's block, and so the part the
+        per-directory caches key on.
+        """
+        members = self._all_symbols.files_in(directory)
+        if not exclude_active:
+            return members, ()
+        eligible = tuple(p for p in members if p not in exclude_active)
+        excluded = tuple(p for p in members if p in exclude_active)
+        return eligible, excluded
+
+    def _dir_block_key(
+        self, directory: str, excluded: tuple[str, ...]
+    ) -> tuple[Any, ...]:
+        return (
+            self._all_symbols.dir_version(directory),
+            excluded,
+            self._graph_generation,
+        )
+
+    def get_dir_block_version(
+        self,
+        directory: str,
+        exclude_active: set[str] | None = None,
+    ) -> tuple[Any, ...]:
+        """Return a value that changes whenever the rendered block would.
+
+        Equal versions guarantee byte-identical output from
+        :meth:`get_dir_symbols_block` for the same arguments,
+        without rendering. Used by the tier builder's render
+        cache to recognise an unchanged tier.
+        """
+        _files, excluded = self._dir_members(directory, exclude_active)
+        return self._dir_block_key(directory, excluded)
 
     def get_dir_symbols_block(
         self,
@@ -588,21 +1028,24 @@ class SymbolIndex:
 
         D36 dir-block — one entry per source file in the directory
         minus any currently in Active full-text.
+
+        Cached per directory until a member is added, removed or
+        re-indexed, the directory's share of the Active set
+        changes, or the reference graph moves.
         """
-        excluded = exclude_active or set()
-        files = sorted(
-            path for path in self._all_symbols
-            if self._dir_of(path) == directory
-            and path not in excluded
-        )
-        if not files:
-            return ""
+        files, excluded = self._dir_members(directory, exclude_active)
+        key = self._dir_block_key(directory, excluded)
+        cached = self._dir_block_cache.get(directory)
+        if cached is not None and cached[0] == key:
+            return cached[1]
         blocks: list[str] = []
         for path in files:
             block = self.get_file_symbol_block(path)
             if block:
                 blocks.append(block)
-        return "\n\n".join(blocks)
+        result = "\n\n".join(blocks)
+        self._dir_block_cache[directory] = (key, result)
+        return result
 
     def get_dir_signature_hash(
         self,
@@ -616,15 +1059,18 @@ class SymbolIndex:
         Active full-text — content moving in or out of Active
         therefore changes the directory's hash, demoting the
         block to Active to re-ride flux on the next freeze.
+
+        Cached per directory; a member's signature only changes
+        when it is re-indexed, which bumps the directory's
+        version.
         """
         import hashlib
 
-        excluded = exclude_active or set()
-        files = sorted(
-            path for path in self._all_symbols
-            if self._dir_of(path) == directory
-            and path not in excluded
-        )
+        files, excluded = self._dir_members(directory, exclude_active)
+        key = (self._all_symbols.dir_version(directory), excluded)
+        cached = self._dir_hash_cache.get(directory)
+        if cached is not None and cached[0] == key:
+            return cached[1]
         h = hashlib.sha256()
         for path in files:
             sig = self._cache.get_signature_hash(path) or ""
@@ -632,7 +1078,9 @@ class SymbolIndex:
             h.update(b"\0")
             h.update(sig.encode("utf-8"))
             h.update(b"\0")
-        return h.hexdigest()
+        digest = h.hexdigest()
+        self._dir_hash_cache[directory] = (key, digest)
+        return digest
 
     def get_indexed_files(self) -> list[str]:
         """Return all repo-relative paths currently indexed.
@@ -40,6 +40,13 @@ Design notes:
   positives on languages where identifiers are case-sensitive
   (most of them) and mask genuine typos.
 
+- **Incremental maintenance.** Every edge and symbol reference
+  is recorded against the file it came from, so
+  :meth:`update` can retract one file's contributions and
+  re-record them without touching the rest of the graph. The
+  result is identical to a :meth:`build` over the same final
+  file set.
+
 - **Plain class, not a singleton.** The orchestrator builds
   one instance per session; tests construct fresh instances
   per case. No thread-safety guarantees — callers drive the
@@ -49,7 +56,7 @@ Design notes:
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from ac_dc.symbol_index.models import FileSymbols
@@ -59,9 +66,9 @@ class ReferenceIndex:
     """Cross-file reference graph.
 
     Built once from a list of :class:`FileSymbols` via
-    :meth:`build`. Queries work against the built graph; rebuild
-    after any source change that affects imports or call-site
-    resolution.
+    :meth:`build`, then kept current with :meth:`update` as
+    individual files change. Queries work against the current
+    graph.
     """
 
     def __init__(self) -> None:
@@ -93,6 +100,13 @@ class ReferenceIndex:
         # singleton components).
         self._all_files: set[str] = set()
 
+        # Files the graph was built from (as opposed to files
+        # that only appear as reference targets), and the
+        # symbol names each one's call sites resolved to. Lets
+        # update() retract a single file's contributions.
+        self._sources: set[str] = set()
+        self._symbols_by_source: dict[str, set[str]] = {}
+
     # ------------------------------------------------------------------
     # Build
     # ------------------------------------------------------------------
@@ -119,12 +133,15 @@ class ReferenceIndex:
         self._incoming = defaultdict(lambda: defaultdict(int))
         self._outgoing = defaultdict(lambda: defaultdict(int))
         self._all_files = set()
+        self._sources = set()
+        self._symbols_by_source = {}
 
         # First pass — record every file, even ones with no
         # outgoing references. Ensures isolated files appear
         # in connected_components output as singletons.
         for fs in file_symbols_list:
             self._all_files.add(fs.file_path)
+            self._sources.add(fs.file_path)
 
         # Second pass — collect edges from call sites and imports.
         for fs in file_symbols_list:
@@ -132,6 +149,70 @@ class ReferenceIndex:
             self._record_call_sites(source, fs)
             self._record_imports(source, fs)
 
+    def update(
+        self,
+        file_symbols_list: list["FileSymbols"],
+        removed: Iterable[str] = (),
+    ) -> None:
+        """Replace the contributions of some files.
+
+        Each FileSymbols in ``file_symbols_list`` has its
+        previous edges and symbol references (if any)
+        retracted and its current ones recorded. Paths in
+        ``removed`` are retracted only. Cost is proportional
+        to the edges of the files involved, not the repo.
+
+        Produces the same graph :meth:`build` would over the
+        resulting file set, provided every file whose
+        resolved call sites or imports changed is passed in —
+        the orchestrator tracks that.
+        """
+        removed_set = set(removed)
+        touched: set[str] = set(removed_set)
+        for fs in file_symbols_list:
+            touched |= self._retract(fs.file_path)
+        for path in removed_set:
+            touched |= self._retract(path)
+
+        for fs in file_symbols_list:
+            self._all_files.add(fs.file_path)
+            self._sources.add(fs.file_path)
+        for fs in file_symbols_list:
+            self._record_call_sites(fs.file_path, fs)
+            self._record_imports(fs.file_path, fs)
+
+        # A path stays known while it's a source or still has
+        # incoming edges — the same membership build() derives.
+        for path in touched:
+            if path not in self._sources and not self._incoming.get(path):
+                self._all_files.discard(path)
+
+    def _retract(self, source: str) -> set[str]:
+        """Remove every contribution recorded from ``source``.
+
+        Returns the targets it had edges to, plus ``source``
+        itself, so the caller can re-check their membership.
+        """
+        self._sources.discard(source)
+        targets = self._outgoing.pop(source, {})
+        for target in targets:
+            incoming = self._incoming.get(target)
+            if incoming is None:
+                continue
+            incoming.pop(source, None)
+            if not incoming:
+                del self._incoming[target]
+        for name in self._symbols_by_source.pop(source, ()):
+            kept = [
+                ref for ref in self._refs_to_symbol.get(name, ())
+                if ref[0] != source
+            ]
+            if kept:
+                self._refs_to_symbol[name] = kept
+            else:
+                self._refs_to_symbol.pop(name, None)
+        return set(targets) | {source}
+
     def _record_call_sites(
         self,
         source: str,
@@ -156,6 +237,9 @@ class ReferenceIndex:
                 self._refs_to_symbol[target_symbol].append(
                     (source, site.line)
                 )
+                self._symbols_by_source.setdefault(
+                    source, set()
+                ).add(target_symbol)
                 if target_file == source:
                     # Same-file reference counts for the
                     # symbol-name index (so find-references
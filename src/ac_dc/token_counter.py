@@ -33,12 +33,31 @@ defaults for the concrete numbers):
   not at module level. D10 wants multiple ``TokenCounter`` instances
   coexisting (one per context manager in agent mode) without
   sharing singletons.
+
+- **Memoised by content.** The same selected files, dir-blocks and
+  history messages are re-counted every turn and on every
+  breakdown RPC. Each counter keeps a bounded LRU of
+  ``(encoding, content hash) → count`` so an unchanged string is
+  hashed, not re-tokenised. Hashing runs at memory bandwidth;
+  BPE encoding is one to two orders of magnitude slower. Short
+  strings bypass the memo — encoding them is cheaper than the
+  bookkeeping.
+
+- **Batch counting.** :meth:`TokenCounter.count_many` hands every
+  memo miss in a list to tiktoken's ``encode_batch``, which
+  tokenises on a thread pool in native code with the GIL
+  released. Callers counting hundreds of dir-blocks or files in
+  one pass use it instead of a per-item loop.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Any
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +143,28 @@ _CHARS_PER_TOKEN_FALLBACK = 4
 # image is already accounted for.
 _IMAGE_TOKEN_ESTIMATE = 1000
 
+# Default capacity of the per-counter memo, in entries. Each
+# entry is a 16-byte digest plus an int, so 8192 entries cost
+# well under a megabyte while covering a large selection plus
+# every dir-block and a long history.
+_DEFAULT_MEMO_ENTRIES = 8192
+
+# Strings shorter than this are encoded directly. Below a few
+# hundred characters tiktoken is about as fast as hashing plus
+# the locked dict round-trip, and role names, short prompts and
+# headers would otherwise churn the LRU.
+_MEMO_MIN_CHARS = 256
+
+# count_many only reaches for the batch encoder when at least
+# this many strings need encoding — below it, thread-pool
+# dispatch costs more than it saves.
+_BATCH_MIN_ITEMS = 8
+
+# Threads handed to tiktoken's encode_batch. tiktoken defaults
+# to 8; capped at the core count so a small container doesn't
+# oversubscribe.
+_BATCH_THREADS = max(1, min(8, os.cpu_count() or 1))
+
 
 def _matches(model: str, markers: tuple[str, ...]) -> bool:
     """Case-insensitive substring match against a marker list.
@@ -217,12 +258,17 @@ class TokenCounter:
     additional counters is near-free.
 
     Thread-safety — the encoder is safe for concurrent ``encode``
-    calls (documented in tiktoken). The counter holds no mutable
-    state beyond the cached encoder, so multiple threads may share
-    one ``TokenCounter`` for read-only counting.
+    calls (documented in tiktoken). The only other mutable state
+    is the count memo, guarded by its own lock, so multiple
+    threads may share one ``TokenCounter``.
     """
 
-    def __init__(self, model: str) -> None:
+    def __init__(
+        self,
+        model: str,
+        *,
+        memo_entries: int = _DEFAULT_MEMO_ENTRIES,
+    ) -> None:
         """Initialise a counter for ``model``.
 
         Parameters
@@ -232,12 +278,24 @@ class TokenCounter:
             ``"anthropic/claude-sonnet-4-5"``. Used for limit
             lookups (max input / output / cache minimum); the
             tokenizer itself doesn't vary by model.
+        memo_entries:
+            Capacity of the content-hash count memo. 0 disables
+            memoisation.
         """
         self._model = model
         # Load eagerly so a missing tiktoken surfaces at construction
         # time rather than on first count. Logged once per counter
         # rather than once per call.
         self._encoding = _load_encoding()
+        # Part of the memo key so counts from different
+        # encodings can never be confused, even if a future
+        # change makes the encoding switchable per counter.
+        self._encoding_name = getattr(self._encoding, "name", "")
+        self._memo: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._memo_capacity = max(0, memo_entries)
+        self._memo_lock = threading.Lock()
+        self._memo_hits = 0
+        self._memo_misses = 0
 
     # ------------------------------------------------------------------
     # Model properties
@@ -352,6 +410,72 @@ class TokenCounter:
         # would understate budget and raising would be worse.
         return self._count_string(str(value))
 
+    def count_many(self, texts: Sequence[str]) -> list[int]:
+        """Count a batch of strings; same results as :meth:`count`.
+
+        Returns one count per input, in order. Memo hits are
+        answered from the cache; the remaining distinct strings
+        are tokenised together via the encoder's
+        ``encode_batch`` when there are enough of them to be
+        worth a thread pool (:data:`_BATCH_MIN_ITEMS`),
+        otherwise one by one. Falls back to the char estimate
+        without tiktoken, and to per-item encoding if the
+        batch call fails — a single bad string must not change
+        every other count.
+        """
+        results = [0] * len(texts)
+        if self._encoding is None:
+            for i, text in enumerate(texts):
+                if text:
+                    results[i] = len(text) // _CHARS_PER_TOKEN_FALLBACK
+            return results
+
+        # Distinct strings still needing an encode, with the
+        # result slots and memo key each one feeds.
+        pending: dict[str, tuple[list[int], tuple[str, bytes] | None]] = {}
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            slot = pending.get(text)
+            if slot is not None:
+                slot[0].append(i)
+                continue
+            key = None
+            if self._memo_capacity and len(text) >= _MEMO_MIN_CHARS:
+                key = self._memo_key(text)
+                cached = self._memo_lookup(key)
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            pending[text] = ([i], key)
+
+        if not pending:
+            return results
+        batch = list(pending)
+        counts = self._encode_lens(batch)
+        for text, count in zip(batch, counts):
+            indices, key = pending[text]
+            for i in indices:
+                results[i] = count
+            if key is not None:
+                self._memo_store(key, count)
+        return results
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit/miss counters and occupancy of the count memo.
+
+        Only strings long enough to be memoised are counted as
+        hits or misses. Surfaced in the Token HUD via the
+        context breakdown.
+        """
+        with self._memo_lock:
+            return {
+                "hits": self._memo_hits,
+                "misses": self._memo_misses,
+                "entries": len(self._memo),
+                "capacity": self._memo_capacity,
+            }
+
     def count_message(self, message: dict) -> int:
         """Count tokens in a single message dict.
 
@@ -383,6 +507,72 @@ class TokenCounter:
             return 0
         if self._encoding is None:
             return len(text) // _CHARS_PER_TOKEN_FALLBACK
+        if self._memo_capacity and len(text) >= _MEMO_MIN_CHARS:
+            return self._count_memoised(text)
+        return self._encode_len(text)
+
+    def _count_memoised(self, text: str) -> int:
+        """Look ``text`` up by content hash; encode on a miss.
+
+        The lock is released while encoding so concurrent
+        counters on other threads aren't serialised behind a
+        large file. Two threads missing on the same text both
+        encode it — harmless, they store the same value.
+        """
+        key = self._memo_key(text)
+        cached = self._memo_lookup(key)
+        if cached is not None:
+            return cached
+        result = self._encode_len(text)
+        self._memo_store(key, result)
+        return result
+
+    def _memo_key(self, text: str) -> tuple[str, bytes]:
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        return (self._encoding_name, digest)
+
+    def _memo_lookup(self, key: tuple[str, bytes]) -> int | None:
+        """Return the memoised count and record a hit or miss."""
+        with self._memo_lock:
+            cached = self._memo.get(key)
+            if cached is None:
+                self._memo_misses += 1
+                return None
+            self._memo.move_to_end(key)
+            self._memo_hits += 1
+            return cached
+
+    def _memo_store(self, key: tuple[str, bytes], count: int) -> None:
+        with self._memo_lock:
+            self._memo[key] = count
+            self._memo.move_to_end(key)
+            while len(self._memo) > self._memo_capacity:
+                self._memo.popitem(last=False)
+
+    def _encode_lens(self, texts: list[str]) -> list[int]:
+        """Token counts for ``texts``, batch-encoded when worthwhile."""
+        encode_batch = getattr(self._encoding, "encode_batch", None)
+        if encode_batch is not None and len(texts) >= _BATCH_MIN_ITEMS:
+            try:
+                return [
+                    len(tokens) for tokens in
+                    encode_batch(texts, num_threads=_BATCH_THREADS)
+                ]
+            except Exception as exc:
+                # Same failure modes as single encodes (special
+                # tokens, bad surrogates) — retry per item so
+                # only the offending string falls back.
+                logger.debug(
+                    "tiktoken encode_batch failed on %d inputs: %s; "
+                    "encoding individually",
+                    len(texts), exc,
+                )
+        return [self._encode_len(text) for text in texts]
+
+    def _encode_len(self, text: str) -> int:
+        """Encode with tiktoken, falling back to the char estimate."""
         try:
             return len(self._encoding.encode(text))
         except Exception as exc:
@@ -1,42 +1,67 @@
 """URL content cache — Layer 4.1.2.
 
-Filesystem-backed cache with TTL, one JSON sidecar per URL.
-Keyed by a hash prefix of the URL string so filenames are short
-and predictable regardless of URL structure. Entries include an
-embedded ``_cached_at`` timestamp (not filesystem mtime) so the
-cache survives file moves and backups.
-
-Why a filesystem cache rather than in-memory or SQLite:
-
+Single-file SQLite store for fetched URL records, with a TTL for
+freshness and a byte budget enforced by least-recently-used
+eviction.
+
+The cache used to keep one JSON sidecar per URL and parse the
+whole file on every lookup, and nothing but a startup TTL sweep
+ever removed an entry — a cache holding cloned-repo symbol maps
+grew without bound. The sidecar layout is gone; existing
+sidecars are imported on open (see *Migration* below).
+
+Why SQLite:
+
+- **Ships with the standard library.** Same choice as the
+  history search index (:mod:`ac_dc.history_search`); no new
+  dependency, and one file instead of thousands.
+- **Metadata-only lookups.** Each row carries ``cached_at``,
+  ``last_access``, ``hits`` and ``size`` beside the JSON
+  payload. Freshness is decided from the metadata columns; the
+  payload is only read (and parsed) for an entry that will be
+  returned.
+- **Eviction is a query.** Total size is tracked in memory;
+  when a write takes it over ``max_bytes`` the least recently
+  accessed rows are deleted until it fits.
 - **Survives server restart.** URLs fetched in one session
   remain available in the next. Critical for GitHub repo
   content — shallow cloning a 100 MB repo per session would
   be absurd.
-- **One file per entry.** Corrupt entries are isolated —
-  one bad write can't invalidate the whole cache. The spec's
-  "delete corrupt entries silently" rule lets us self-heal.
-- **No schema migrations.** The stored JSON is the dataclass
-  `to_dict()` output, with extra internal fields. Schema
-  evolution via the permissive `from_dict()`.
 
 Scope decisions pinned by specs4/4-features/url-content.md:
 
 - **Error results are never cached.** A URLContent with a
   non-None ``error`` field is refused by ``set()`` — retrying
-  a failed fetch should not hit a stale error. Documented in
-  the method docstring.
+  a failed fetch should not hit a stale error.
 - **Summaries added in place.** The summarizer calls ``set()``
   again with the populated ``summary`` field; the cache
   overwrites. No separate "update-summary" method.
 - **TTL is per-cache, not per-entry.** One ``ttl_hours``
-  value set at construction. Matches the ``url_cache.ttl_hours``
-  config field.
+  value set at construction. Expired entries stay stored —
+  the URL service revalidates them with the server (see
+  :meth:`URLCache.get_stale`) — until evicted by the byte
+  budget or removed by :meth:`URLCache.cleanup_expired`.
 - **fetched_at injected if missing.** Convenience for fetchers
   — they don't all remember to set the timestamp.
-- **Cleanup-expired is explicit.** Called on startup or via
-  RPC. No background task — the cache is bounded by URLs the
-  user actually fetches, which is tiny compared to filesystem
-  capacity.
+- **Stored shape unchanged.** Rows hold the dataclass
+  ``to_dict()`` output; ``get`` returns it with ``_cached_at``
+  added, exactly as the sidecars did. Schema evolution still
+  goes through the permissive ``from_dict()``.
+
+Migration: on open, every sidecar in the cache directory — a
+file named by the old layout's :func:`url_hash` scheme,
+``<16 hex>.json`` — is read once. Well-formed entries are
+inserted (keeping their original ``_cached_at``, so their TTL is
+unaffected) unless the database already has the URL, and the
+sidecar is deleted once the import is committed. The cache
+directory is user-configurable, so anything else is left alone:
+other JSON files are never touched, and a sidecar-named file
+that doesn't parse as an entry is logged and kept.
+
+A database that can't be opened is deleted and recreated once —
+it's a cache. If that fails too the cache degrades to always
+missing, the way the history search index falls back when
+SQLite is unavailable.
 """
 
 from __future__ import annotations
@@ -44,6 +69,9 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import re
+import sqlite3
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -57,18 +85,21 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-# Length of the hex prefix used for cache filenames. 16 hex
-# characters = 64 bits. At realistic URL-fetch volumes (a few
-# thousand distinct URLs per user per year), collision
-# probability is astronomically small. Using a shorter prefix
-# would risk collisions; longer would just make filenames less
-# readable during debugging.
+# Length of the hex prefix returned by :func:`url_hash`. 16 hex
+# characters = 64 bits — collision-free at realistic URL volumes.
 _HASH_PREFIX_LEN = 16
 
-# File extension for cached entries. Kept short and explicit
-# rather than ``.cache`` so developers inspecting the directory
-# can immediately tell the format.
-_CACHE_SUFFIX = ".json"
+# Database file name inside the cache directory.
+_DB_FILENAME = "url_cache.db"
+
+# Name of the per-URL sidecar files the previous layout wrote —
+# :func:`url_hash` plus ``.json``. Only used for migration.
+_LEGACY_NAME_RE = re.compile(r"^[0-9a-f]{16}\.json$")
+
+# Schema version stored in the ``meta`` table. A mismatch drops
+# and recreates the entries table — the cache can always be
+# refilled from the network.
+_SCHEMA_VERSION = "1"
 
 # Default TTL when construction doesn't specify. 24 hours
 # matches the spec's app-config default. Cache consumers (the
@@ -76,6 +107,11 @@ _CACHE_SUFFIX = ".json"
 # :meth:`ConfigManager.url_cache_config`.
 _DEFAULT_TTL_HOURS = 24
 
+# Default byte budget for stored payloads. A repo entry with a
+# symbol map is typically tens to hundreds of KB, so this holds
+# several hundred of them.
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
 
 # ---------------------------------------------------------------------------
 # URLCache
@@ -83,18 +119,13 @@ _DEFAULT_TTL_HOURS = 24
 
 
 def url_hash(url: str) -> str:
-    """Return the cache-key hash for a URL.
-
-    Deterministic — the same URL always produces the same hash.
-    Exposed as a module-level function (not a method) so
-    callers that just want to build a cache path can do so
-    without instantiating a cache. Used by the service's
-    in-memory fetched dict to key by the same hash the cache
-    uses.
-
-    Length is :data:`_HASH_PREFIX_LEN` hex chars (16 by
-    default, giving 64 bits of collision resistance — plenty
-    for realistic URL volumes).
+    """Return a short, deterministic hash of a URL.
+
+    The same URL always produces the same hash. Length is
+    :data:`_HASH_PREFIX_LEN` hex chars (64 bits). The sidecar
+    layout used it as the file name; the database keys by the
+    URL itself, so this survives for callers that want a
+    compact, filesystem-safe identifier.
     """
     return hashlib.sha256(url.encode("utf-8")).hexdigest()[
         :_HASH_PREFIX_LEN
@@ -102,46 +133,51 @@ def url_hash(url: str) -> str:
 
 
 class URLCache:
-    """Filesystem cache for :class:`URLContent` records.
+    """SQLite-backed cache for :class:`URLContent` records.
 
-    Construct with a directory path (created if missing) and a
-    TTL. Operations: ``get`` (None on miss or expiry),
-    ``set`` (refuses error records, injects cache timestamp),
-    ``invalidate`` (remove single entry), ``clear`` (remove
-    all entries), ``cleanup_expired`` (scan and remove stale).
+    Construct with a directory path (created if missing), a
+    TTL, and a byte budget. Operations: ``get`` (None on miss
+    or expiry), ``get_stale`` (as ``get``, ignoring expiry),
+    ``set`` (refuses error records, injects cache timestamp,
+    evicts to the budget), ``invalidate`` (remove single
+    entry), ``clear`` (remove all entries),
+    ``cleanup_expired`` (remove stale), ``stats``.
 
-    Thread-safety — not thread-safe. The URL service drives
-    cache access from a single executor; concurrent access
-    from multiple threads is out of scope.
+    Thread-safe — the URL service fetches concurrently. One
+    connection, serialised by a lock.
 
     Stored entries are plain dicts — the URL cache doesn't
     import :class:`URLContent` to keep the module dependency
-    graph minimal (fetchers that don't use the cache don't
-    need to pay for URLContent's import cost). Callers convert
-    dict ↔ URLContent at the boundary via
-    :meth:`URLContent.to_dict` / :meth:`URLContent.from_dict`.
+    graph minimal. Callers convert dict ↔ URLContent at the
+    boundary via :meth:`URLContent.to_dict` /
+    :meth:`URLContent.from_dict`.
     """
 
     def __init__(
         self,
         cache_dir: Path | str,
         ttl_hours: int | float = _DEFAULT_TTL_HOURS,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
     ) -> None:
         """Initialise against a cache directory.
 
         Parameters
         ----------
         cache_dir:
-            Directory to store cache files. Created if missing
+            Directory holding the database. Created if missing
             (parents included). Callers typically get this
             from :meth:`ConfigManager.url_cache_config`.
         ttl_hours:
             Hours after which a cached entry is treated as
             expired. Fractional hours accepted for test
-            convenience (a test that wants "expire after 100
-            ms" passes ``100 / 3600 / 1000``). Zero or negative
-            values mean every entry is immediately expired —
-            effectively disables the cache without removing it.
+            convenience. Zero or negative values mean every
+            entry is immediately expired — effectively disables
+            the cache without removing it.
+        max_bytes:
+            Budget for the summed payload sizes. A write that
+            exceeds it evicts least-recently-used entries. The
+            entry just written is never evicted by its own
+            write, even if it alone exceeds the budget.
         """
         self._dir = Path(cache_dir)
         # Create directory up-front rather than lazily. Errors
@@ -149,6 +185,19 @@ class URLCache:
         # fall back to an alternative cache location.
         self._dir.mkdir(parents=True, exist_ok=True)
         self._ttl_seconds = float(ttl_hours) * 3600.0
+        self._max_bytes = max(0, int(max_bytes))
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        # Sum of ``size`` over all rows; kept in step with
+        # every write so eviction doesn't need a SUM query.
+        self._total_bytes = 0
+        # Session counters, reported by :meth:`stats`.
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+        self._migrated = 0
+        self._open()
 
     # ------------------------------------------------------------------
     # Introspection
@@ -159,90 +208,314 @@ class URLCache:
         """Cache directory path. Stable for the lifetime of the cache."""
         return self._dir
 
+    @property
+    def db_path(self) -> Path:
+        return self._dir / _DB_FILENAME
+
     @property
     def ttl_seconds(self) -> float:
         """Current TTL in seconds. Exposed for tests and diagnostics."""
         return self._ttl_seconds
 
-    def _path_for(self, url: str) -> Path:
-        """Return the filesystem path for a URL's cache entry."""
-        return self._dir / f"{url_hash(url)}{_CACHE_SUFFIX}"
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def stats(self) -> dict[str, Any]:
+        """Size and session counters, for the stats RPC.
+
+        ``misses`` includes lookups that found an expired
+        entry; ``expired`` counts those separately.
+        ``migrated`` is the number of legacy sidecars imported
+        when this cache was opened.
+        """
+        with self._lock:
+            entries = 0
+            if self._conn is not None:
+                try:
+                    entries = self._conn.execute(
+                        "SELECT COUNT(*) FROM entries"
+                    ).fetchone()[0]
+                except sqlite3.Error as exc:
+                    logger.debug("URL cache count failed: %s", exc)
+            return {
+                "available": self._conn is not None,
+                "entries": entries,
+                "bytes": self._total_bytes,
+                "max_bytes": self._max_bytes,
+                "ttl_hours": self._ttl_seconds / 3600.0,
+                "hits": self._hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "evictions": self._evictions,
+                "migrated": self._migrated,
+            }
 
     # ------------------------------------------------------------------
-    # Core operations
+    # Connection / schema / migration
     # ------------------------------------------------------------------
 
-    def get(self, url: str) -> dict[str, Any] | None:
-        """Return the cached dict for ``url`` or None.
-
-        Miss, expired, or corrupt entries return None. Corrupt
-        entries are deleted as a side effect — the next fetch
-        will re-populate. Expired entries are NOT deleted here
-        (that's :meth:`cleanup_expired`'s job); they are just
-        invisible to ``get``.
-
-        Rationale for not auto-deleting expired entries:
-        leaving stale data in place costs nothing until
-        ``cleanup_expired`` runs (on startup), and avoids
-        churn on the filesystem when the same expired URL is
-        repeatedly queried (e.g., a user hovering the chip).
+    def _open(self) -> None:
+        for attempt in range(2):
+            conn: sqlite3.Connection | None = None
+            try:
+                conn = sqlite3.connect(
+                    str(self.db_path), check_same_thread=False
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._ensure_schema(conn)
+                self._total_bytes = conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()[0]
+            except sqlite3.Error as exc:
+                if conn is not None:
+                    conn.close()
+                if attempt == 0:
+                    logger.warning(
+                        "URL cache database %s unusable (%s); "
+                        "recreating",
+                        self.db_path, exc,
+                    )
+                    self._remove_db_files()
+                    continue
+                logger.warning(
+                    "URL cache unavailable (%s); caching disabled",
+                    exc,
+                )
+                return
+            self._conn = conn
+            break
+        self._migrate_sidecars()
+        with self._lock:
+            self._evict_locked(keep=None)
+
+    def _remove_db_files(self) -> None:
+        for suffix in ("", "-wal", "-shm"):
+            path = self._dir / f"{_DB_FILENAME}{suffix}"
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.debug("Failed to remove %s: %s", path, exc)
+
+    @staticmethod
+    def _ensure_schema(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta "
+            "(key TEXT PRIMARY KEY, value TEXT)"
+        )
+        row = conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema'"
+        ).fetchone()
+        if row is not None and row[0] == _SCHEMA_VERSION:
+            return
+        conn.execute("DROP TABLE IF EXISTS entries")
+        conn.execute(
+            "CREATE TABLE entries ("
+            "url TEXT PRIMARY KEY, "
+            "cached_at REAL NOT NULL, "
+            "last_access REAL NOT NULL, "
+            "hits INTEGER NOT NULL DEFAULT 0, "
+            "size INTEGER NOT NULL, "
+            "payload TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX entries_last_access ON entries (last_access)"
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) "
+            "VALUES ('schema', ?)",
+            (_SCHEMA_VERSION,),
+        )
+        conn.commit()
+
+    def _migrate_sidecars(self) -> None:
+        """Import and delete per-URL JSON files from the old layout.
+
+        Only files named like a sidecar are considered, and one is
+        deleted only after its entry is committed (or the database
+        already had the URL). Unreadable ones stay on disk.
         """
-        path = self._path_for(url)
-        if not path.is_file():
-            return None
+        if self._conn is None:
+            return
         try:
-            raw = path.read_text(encoding="utf-8")
+            sidecars = [
+                p for p in self._dir.iterdir()
+                if _LEGACY_NAME_RE.match(p.name) and p.is_file()
+            ]
         except OSError as exc:
-            logger.debug(
-                "URL cache read failed for %s: %s", url, exc
-            )
-            return None
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            # Corrupt entry — delete and return miss. Per
-            # specs4: "Delete corrupt entries (bad JSON)".
-            logger.warning(
-                "URL cache entry corrupt for %s: %s (removing)",
-                url, exc,
-            )
+            logger.warning("URL cache migration scan failed: %s", exc)
+            return
+        if not sidecars:
+            return
+        imported: list[Path] = []
+        with self._lock:
+            for path in sidecars:
+                data = self._read_sidecar(path)
+                if data is None:
+                    logger.warning(
+                        "URL cache: leaving unreadable sidecar %s "
+                        "in place", path,
+                    )
+                    continue
+                inserted = self._insert_migrated(data)
+                if inserted is None:
+                    continue
+                if inserted:
+                    self._migrated += 1
+                imported.append(path)
+            try:
+                self._conn.commit()
+            except sqlite3.Error as exc:
+                # Nothing was imported — keep every sidecar for
+                # the next start.
+                logger.warning("URL cache migration failed: %s", exc)
+                self._migrated = 0
+                try:
+                    self._conn.rollback()
+                    self._total_bytes = self._conn.execute(
+                        "SELECT COALESCE(SUM(size), 0) FROM entries"
+                    ).fetchone()[0]
+                except sqlite3.Error:
+                    pass
+                return
+        for path in imported:
             try:
                 path.unlink()
-            except OSError:
-                # Can't delete either — log and move on.
-                # The next write will overwrite.
+            except OSError as exc:
                 logger.debug(
-                    "Failed to unlink corrupt cache entry %s",
-                    path,
+                    "Failed to remove migrated sidecar %s: %s",
+                    path, exc,
                 )
+        logger.info(
+            "URL cache: migrated %d of %d sidecar entries into %s",
+            self._migrated, len(sidecars), self.db_path,
+        )
+
+    @staticmethod
+    def _read_sidecar(path: Path) -> dict[str, Any] | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
             return None
         if not isinstance(data, dict):
-            # JSON parsed but not a dict — treat as corrupt.
+            return None
+        if not isinstance(data.get("_cached_at"), (int, float)):
+            return None
+        if not isinstance(data.get("url"), str) or data.get("error"):
+            return None
+        return data
+
+    def _insert_migrated(self, data: dict[str, Any]) -> bool | None:
+        """Insert one sidecar entry.
+
+        Returns True when inserted, False when the database
+        already held the URL, None when the insert failed.
+        """
+        assert self._conn is not None
+        cached_at = float(data.pop("_cached_at"))
+        payload = json.dumps(data, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        try:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO entries "
+                "(url, cached_at, last_access, hits, size, payload) "
+                "VALUES (?, ?, ?, 0, ?, ?)",
+                (data["url"], cached_at, cached_at, size, payload),
+            )
+        except sqlite3.Error as exc:
             logger.warning(
-                "URL cache entry shape wrong for %s (got %s)",
-                url, type(data).__name__,
+                "URL cache migration insert failed: %s", exc
             )
-            try:
-                path.unlink()
-            except OSError:
-                pass
             return None
+        if cursor.rowcount:
+            self._total_bytes += size
+            return True
+        return False
 
-        cached_at = data.get("_cached_at")
-        if not isinstance(cached_at, (int, float)):
-            # Missing timestamp — legacy or corrupt. Treat as
-            # expired so it gets re-fetched.
-            logger.debug(
-                "URL cache entry missing _cached_at for %s",
-                url,
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Core operations
+    # ------------------------------------------------------------------
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """Return the cached dict for ``url`` or None.
+
+        Miss or expired entries return None. Freshness is
+        decided from the row's metadata; the payload is only
+        read for a hit. Expired entries are NOT deleted here —
+        they remain available to :meth:`get_stale` for
+        revalidation. A hit refreshes the entry's LRU position.
+        """
+        with self._lock:
+            found = self._lookup(url, ignore_ttl=False)
+            if found is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return found
+
+    def get_stale(self, url: str) -> dict[str, Any] | None:
+        """Return the cached dict for ``url`` regardless of age.
+
+        Same miss handling as :meth:`get`, without the TTL
+        check, and not counted in the hit/miss stats (it
+        follows a :meth:`get` miss). The URL service uses this
+        to revalidate an expired entry with the server (its
+        ``etag`` / ``last_modified``) instead of refetching it
+        outright.
+        """
+        with self._lock:
+            return self._lookup(url, ignore_ttl=True)
+
+    def _lookup(
+        self, url: str, *, ignore_ttl: bool
+    ) -> dict[str, Any] | None:
+        conn = self._conn
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT cached_at FROM entries WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            cached_at = row[0]
+            if not ignore_ttl and time.time() - cached_at > self._ttl_seconds:
+                self._expired += 1
+                return None
+            payload = conn.execute(
+                "SELECT payload FROM entries WHERE url = ?", (url,)
+            ).fetchone()[0]
+            conn.execute(
+                "UPDATE entries SET last_access = ?, hits = hits + 1 "
+                "WHERE url = ?",
+                (time.time(), url),
             )
+            conn.commit()
+        except sqlite3.Error as exc:
+            logger.debug("URL cache read failed for %s: %s", url, exc)
             return None
-
-        age = time.time() - cached_at
-        if age > self._ttl_seconds:
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError as exc:
+            logger.warning(
+                "URL cache entry corrupt for %s: %s (removing)",
+                url, exc,
+            )
+            self._delete_locked(url)
             return None
-
-        return data
+        data["_cached_at"] = cached_at
+        return data  # type: ignore[no-any-return]
 
     def set(
         self,
@@ -256,18 +529,20 @@ class URLCache:
         writing. Callers don't need to check this themselves;
         the cache enforces it.
 
-        Injects ``_cached_at`` (current unix time) for TTL
-        tracking. Also injects ``fetched_at`` as an ISO 8601
-        UTC string if missing or explicitly None — convenience
-        so fetchers don't all have to set it.
+        Records the current time as the entry's cache timestamp
+        (returned as ``_cached_at`` by :meth:`get`). Also
+        injects ``fetched_at`` as an ISO 8601 UTC string if
+        missing or explicitly None — convenience so fetchers
+        don't all have to set it.
 
-        Returns False on write failure (disk full, permission
-        denied). Caller decides whether to retry or surface
-        the error — the in-memory fetched dict still works
+        Returns False when the database is unavailable or the
+        write fails. The in-memory fetched dict still works
         without a cache hit.
 
         Overwrites existing entries — summary updates and
-        re-fetches both go through this single path.
+        re-fetches both go through this single path. Evicts
+        least-recently-used entries when the byte budget is
+        exceeded.
         """
         if content.get("error"):
             # Error records aren't cached. Retrying should hit
@@ -277,148 +552,146 @@ class URLCache:
         # Copy so we don't mutate the caller's dict. Fetchers
         # may still need the original record after caching.
         to_write = dict(content)
-        to_write["_cached_at"] = time.time()
+        to_write.pop("_cached_at", None)
         if not to_write.get("fetched_at"):
-            # Set fetched_at if missing or explicitly None.
-            # The fetcher usually sets this, but the cache is
-            # the last line of defence for records that
-            # arrive without it (e.g., from summary-only
-            # updates of older entries).
             to_write["fetched_at"] = (
                 datetime.now(timezone.utc)
                 .strftime("%Y-%m-%dT%H:%M:%SZ")
             )
+        payload = json.dumps(to_write, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        now = time.time()
 
-        path = self._path_for(url)
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                return False
+            try:
+                row = conn.execute(
+                    "SELECT size FROM entries WHERE url = ?", (url,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(url, cached_at, last_access, hits, size, payload) "
+                    "VALUES (?, ?, ?, 0, ?, ?)",
+                    (url, now, now, size, payload),
+                )
+                conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning(
+                    "URL cache write failed for %s: %s", url, exc
+                )
+                return False
+            self._total_bytes += size - (row[0] if row else 0)
+            self._evict_locked(keep=url)
+        return True
+
+    def _evict_locked(self, keep: str | None) -> None:
+        """Delete LRU entries until the total fits the budget."""
+        conn = self._conn
+        if conn is None or self._total_bytes <= self._max_bytes:
+            return
         try:
-            # json.dumps first, then atomic write — avoids
-            # leaving a truncated file if the write is
-            # interrupted. Temp file + rename is the POSIX
-            # atomic-write idiom; on Windows, rename is
-            # atomic too as long as the target exists or
-            # doesn't exist at the start (Python 3.3+ uses
-            # ReplaceFile under the hood via Path.replace).
-            payload = json.dumps(to_write, ensure_ascii=False)
-            tmp_path = path.with_suffix(
-                path.suffix + ".tmp"
+            rows = conn.execute(
+                "SELECT url, size FROM entries ORDER BY last_access"
+            ).fetchall()
+            victims: list[str] = []
+            for url, size in rows:
+                if self._total_bytes <= self._max_bytes:
+                    break
+                if url == keep:
+                    continue
+                victims.append(url)
+                self._total_bytes -= size
+            conn.executemany(
+                "DELETE FROM entries WHERE url = ?",
+                [(url,) for url in victims],
             )
-            tmp_path.write_text(payload, encoding="utf-8")
-            tmp_path.replace(path)
-            return True
-        except OSError as exc:
+            conn.commit()
+        except sqlite3.Error as exc:
+            logger.warning("URL cache eviction failed: %s", exc)
+            return
+        self._evictions += len(victims)
+        if victims:
+            logger.debug(
+                "URL cache evicted %d entries (now %d / %d bytes)",
+                len(victims), self._total_bytes, self._max_bytes,
+            )
+
+    def _delete_locked(self, url: str) -> bool:
+        conn = self._conn
+        if conn is None:
+            return False
+        try:
+            row = conn.execute(
+                "SELECT size FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            conn.commit()
+        except sqlite3.Error as exc:
             logger.warning(
-                "URL cache write failed for %s: %s", url, exc
+                "URL cache invalidate failed for %s: %s", url, exc
             )
             return False
+        self._total_bytes -= row[0]
+        return True
 
     def invalidate(self, url: str) -> bool:
         """Remove the cache entry for ``url``.
 
         Returns True if an entry existed and was removed,
-        False if there was no entry to remove. Missing files
-        are NOT an error — the outcome (no cache entry) is
-        the same whether we deleted one or never had one.
-        Matches :meth:`BaseCache.invalidate`'s contract from
-        Layer 2.
+        False if there was no entry to remove. Matches
+        :meth:`BaseCache.invalidate`'s contract from Layer 2.
         """
-        path = self._path_for(url)
-        if not path.exists():
-            return False
-        try:
-            path.unlink()
-            return True
-        except OSError as exc:
-            logger.warning(
-                "URL cache invalidate failed for %s: %s",
-                url, exc,
-            )
-            return False
+        with self._lock:
+            return self._delete_locked(url)
 
     def clear(self) -> int:
         """Remove every cached entry. Returns count removed.
 
-        Used by the "clear URL cache" RPC. Does not remove the
-        cache directory itself — just its contents. Walks the
-        directory and removes every file with the cache suffix;
-        non-cache files (if any got in there) are left alone.
+        Used by the "clear URL cache" RPC. The database file
+        and any unrelated files in the directory stay.
         """
-        count = 0
-        try:
-            for entry in self._dir.iterdir():
-                if not entry.is_file():
-                    continue
-                if entry.suffix != _CACHE_SUFFIX:
-                    continue
-                try:
-                    entry.unlink()
-                    count += 1
-                except OSError as exc:
-                    logger.debug(
-                        "URL cache clear: failed to unlink %s: %s",
-                        entry, exc,
-                    )
-        except OSError as exc:
-            logger.warning(
-                "URL cache clear iteration failed: %s", exc
-            )
-        return count
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                return 0
+            try:
+                count = conn.execute("DELETE FROM entries").rowcount
+                conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning("URL cache clear failed: %s", exc)
+                return 0
+            self._total_bytes = 0
+            return count
 
     def cleanup_expired(self) -> int:
-        """Remove expired and corrupt entries. Returns count removed.
+        """Remove expired entries. Returns count removed.
 
-        Called explicitly (typically on startup or via an
-        admin RPC). Walks the cache directory and removes any
-        entry older than the TTL, plus any entry that fails to
-        parse or has a missing timestamp.
-
-        Reads only the ``_cached_at`` field — doesn't need to
-        parse the full URLContent shape, so it's cheap even on
-        large caches.
+        Called explicitly — expired entries are otherwise kept
+        for revalidation until the byte budget evicts them.
+        A metadata-only query; no payload is read.
         """
-        count = 0
-        now = time.time()
-        try:
-            entries = list(self._dir.iterdir())
-        except OSError as exc:
-            logger.warning(
-                "URL cache cleanup iteration failed: %s", exc
-            )
-            return 0
-
-        for entry in entries:
-            if not entry.is_file():
-                continue
-            if entry.suffix != _CACHE_SUFFIX:
-                continue
-            if self._entry_is_stale(entry, now):
-                try:
-                    entry.unlink()
-                    count += 1
-                except OSError as exc:
-                    logger.debug(
-                        "URL cache cleanup: unlink %s failed: %s",
-                        entry, exc,
-                    )
-        return count
-
-    def _entry_is_stale(self, path: Path, now: float) -> bool:
-        """Return True if ``path`` is expired or corrupt.
-
-        Corrupt = can't read, can't parse, wrong shape, or
-        missing ``_cached_at``. Stale = age exceeds TTL.
-        Either way, the caller unlinks.
-        """
-        try:
-            raw = path.read_text(encoding="utf-8")
-        except OSError:
-            return True
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            return True
-        if not isinstance(data, dict):
-            return True
-        cached_at = data.get("_cached_at")
-        if not isinstance(cached_at, (int, float)):
-            return True
-        return (now - cached_at) > self._ttl_seconds
\ No newline at end of file
+        cutoff = time.time() - self._ttl_seconds
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                return 0
+            try:
+                freed = conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM entries "
+                    "WHERE cached_at < ?",
+                    (cutoff,),
+                ).fetchone()[0]
+                count = conn.execute(
+                    "DELETE FROM entries WHERE cached_at < ?",
+                    (cutoff,),
+                ).rowcount
+                conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning("URL cache cleanup failed: %s", exc)
+                return 0
+            self._total_bytes -= freed
+            return count
@@ -2,8 +2,9 @@
 
 Per-type fetch logic dispatched by :class:`~ac_dc.url_service.detection.URLType`:
 
-- **Web page** (``fetch_web_page``) — HTTP GET via stdlib
-  :mod:`urllib`, title extraction + main-content extraction via
+- **Web page** (``fetch_web_page``) — HTTP GET via the injected
+  :class:`~ac_dc.url_service.http_client.HTTPClient` (stdlib
+  :mod:`urllib` when none is passed), title extraction + main-content extraction via
   trafilatura (with a stdlib fallback when trafilatura is
   unavailable or fails).
 - **GitHub file** (``fetch_github_file``) — constructs the raw
@@ -45,6 +46,17 @@ Design decisions pinned here:
   field populated; the caller (URL service) refuses to cache
   error records.
 
+- **Optional pooled client.** ``fetch_web_page`` and
+  ``fetch_github_file`` take an optional ``client``. With one,
+  requests reuse keep-alive connections, accept compressed
+  bodies, and may be conditional: ``validators`` (the ``etag``
+  / ``last_modified`` recorded on the previous fetch) are sent
+  along, and a 304 propagates as
+  :class:`~ac_dc.url_service.http_client.NotModified` rather
+  than becoming an error record — the caller still holds the
+  content. Without a client the one-shot ``urlopen`` path is
+  used and no validators are recorded.
+
 - **No authentication for HTTPS.** Explicitly disabled via
   ``GIT_ASKPASS=/bin/true`` and ``GIT_TERMINAL_PROMPT=0``.
   Anonymous HTTPS succeeds for public repos; private-without-
@@ -68,6 +80,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from ac_dc.url_service.http_client import HTTPClient, NotModified
 from ac_dc.url_service.models import GitHubInfo, URLContent
 
 logger = logging.getLogger(__name__)
@@ -192,6 +205,31 @@ def _http_get(url: str) -> str:
         return raw.decode("latin-1")
 
 
+def _fetch_text(
+    url: str,
+    client: HTTPClient | None,
+    validators: dict[str, str | None] | None,
+) -> tuple[str, dict[str, str | None]]:
+    """Fetch ``url`` as text; return ``(text, validators)``.
+
+    The returned validators are the response's ``etag`` and
+    ``last_modified`` (empty without a client). Raises like
+    :func:`_http_get`, plus :class:`NotModified` when a
+    conditional request comes back 304.
+    """
+    if client is None:
+        return _http_get(url), {}
+    response = client.get(
+        url,
+        headers={"User-Agent": _USER_AGENT},
+        validators=validators,
+    )
+    return response.text(), {
+        "etag": response.etag,
+        "last_modified": response.last_modified,
+    }
+
+
 def _strip_html_tags(html: str) -> str:
     """Strip HTML tags and decode entities — the stdlib fallback.
 
@@ -257,7 +295,11 @@ def _extract_content(html: str) -> str:
     return _strip_html_tags(html)
 
 
-def fetch_web_page(url: str) -> URLContent:
+def fetch_web_page(
+    url: str,
+    client: HTTPClient | None = None,
+    validators: dict[str, str | None] | None = None,
+) -> URLContent:
     """Fetch a generic web page.
 
     Returns an :class:`URLContent` with ``content`` populated on
@@ -265,9 +307,15 @@ def fetch_web_page(url: str) -> URLContent:
     network issue). Error records should NOT be cached — the
     caller (URL service) enforces that via the cache's refusal
     to persist records with a non-empty error field.
+
+    ``client`` and ``validators`` are described in the module
+    docstring; :class:`NotModified` is the one exception that
+    escapes.
     """
     try:
-        html = _http_get(url)
+        html, response_validators = _fetch_text(url, client, validators)
+    except NotModified:
+        raise
     except urllib.error.HTTPError as exc:
         return URLContent(
             url=url,
@@ -299,6 +347,8 @@ def fetch_web_page(url: str) -> URLContent:
         title=title,
         content=content,
         fetched_at=_now_iso(),
+        etag=response_validators.get("etag"),
+        last_modified=response_validators.get("last_modified"),
     )
 
 
@@ -322,6 +372,8 @@ def _build_raw_url(info: GitHubInfo, branch: str) -> str:
 def fetch_github_file(
     url: str,
     info: GitHubInfo,
+    client: HTTPClient | None = None,
+    validators: dict[str, str | None] | None = None,
 ) -> URLContent:
     """Fetch a single file from GitHub via raw.githubusercontent.com.
 
@@ -332,6 +384,8 @@ def fetch_github_file(
 
     Returns :class:`URLContent` with ``content`` and ``title`` set
     (title is the filename), or ``error`` on total failure.
+    ``client`` and ``validators`` behave as in
+    :func:`fetch_web_page`.
     """
     if not info.path:
         return URLContent(
@@ -346,7 +400,11 @@ def fetch_github_file(
     raw_url = _build_raw_url(info, branch)
 
     try:
-        content = _http_get(raw_url)
+        content, response_validators = _fetch_text(
+            raw_url, client, validators
+        )
+    except NotModified:
+        raise
     except urllib.error.HTTPError as exc:
         # Fall back to master only when the original branch was the
         # implicit "main" default. If the caller passed an explicit
@@ -355,8 +413,12 @@ def fetch_github_file(
         if branch == "main" and info.branch is None:
             try:
                 raw_url = _build_raw_url(info, "master")
-                content = _http_get(raw_url)
+                content, response_validators = _fetch_text(
+                    raw_url, client, validators
+                )
                 branch = "master"  # for record-keeping
+            except NotModified:
+                raise
             except Exception:
                 return URLContent(
                     url=url,
@@ -391,6 +453,8 @@ def fetch_github_file(
         content=content,
         github_info=info,
         fetched_at=_now_iso(),
+        etag=response_validators.get("etag"),
+        last_modified=response_validators.get("last_modified"),
     )
 
 
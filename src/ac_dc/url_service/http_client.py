@@ -0,0 +1,425 @@
+"""Pooled HTTP client for the URL fetchers — Layer 4.1.3.
+
+The fetchers used to call :func:`urllib.request.urlopen` once
+per request: a fresh TCP (and TLS) handshake every time, no
+compressed transfer, and no way to ask the server whether a
+page we already hold has changed. :class:`HTTPClient` is the
+engine :class:`~ac_dc.url_service.service.URLService` hands to
+the fetchers instead.
+
+Design points:
+
+- **Stdlib only.** Built on :mod:`http.client` — the same
+  transport ``urllib`` drives underneath — so no new runtime
+  dependency. Brotli decoding is offered (``br`` in
+  ``Accept-Encoding``) only when the optional ``brotli``
+  package is importable; gzip and deflate always.
+
+- **Keep-alive pool, keyed by origin.** Idle connections are
+  kept per ``(scheme, host, port, proxy)`` and reused by the
+  next request to the same origin. A reused connection the
+  server has meanwhile closed fails on first use; that request
+  is retried once on a fresh connection. Responses marked
+  ``Connection: close`` aren't pooled.
+
+- **Per-host concurrency limit.** A bounded semaphore per
+  origin caps in-flight requests to one host at
+  ``max_per_host``, so fetching a batch of links to one site
+  doesn't open a connection per link. Overall concurrency is
+  the caller's business (the service's fetch executor).
+
+- **Conditional requests.** ``get`` accepts the ``etag`` /
+  ``last_modified`` validators recorded on an earlier fetch and
+  sends them as ``If-None-Match`` / ``If-Modified-Since``. A
+  ``304 Not Modified`` raises :class:`NotModified` — the caller
+  keeps the content it already has.
+
+- **urllib-compatible errors.** Status codes of 400 and above
+  raise :class:`urllib.error.HTTPError`; network failures,
+  timeouts and malformed responses raise
+  :class:`urllib.error.URLError`. The fetchers' existing error
+  mapping applies unchanged.
+
+- **Redirects and proxies.** 301/302/303/307/308 are followed
+  up to ``max_redirects`` hops. Proxies come from the
+  environment (:func:`urllib.request.getproxies`), as they do
+  for ``urlopen``: HTTPS is tunnelled with ``CONNECT``, plain
+  HTTP is sent to the proxy with an absolute URI.
+
+Thread-safe. One client is shared by every fetch a service
+runs.
+
+Governing spec: ``specs4/4-features/url-content.md#fetchers``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import logging
+import threading
+import urllib.error
+import urllib.request
+import zlib
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urljoin, urlsplit
+
+logger = logging.getLogger(__name__)
+
+try:  # pragma: no cover - depends on the environment
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+
+# ---------------------------------------------------------------------------
+# Module constants
+# ---------------------------------------------------------------------------
+
+
+# Default socket timeout, matching the legacy urlopen path.
+_DEFAULT_TIMEOUT_SECONDS = 30
+
+# In-flight requests allowed per origin. Two is what browsers
+# historically used for HTTP/1.1 and is polite to small sites.
+_DEFAULT_MAX_PER_HOST = 2
+
+# Redirect hops followed before giving up.
+_DEFAULT_MAX_REDIRECTS = 5
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+# Errors that mean a pooled connection went stale between
+# requests (server idle timeout). Worth one retry on a fresh
+# connection; anything else is a real failure.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _accept_encoding() -> str:
+    return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+
+# ---------------------------------------------------------------------------
+# Response model
+# ---------------------------------------------------------------------------
+
+
+class NotModified(Exception):
+    """The server answered 304 to a conditional request."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(f"Not modified: {url}")
+        self.url = url
+
+
+@dataclass
+class HTTPResponse:
+    """A completed response with the body already decoded.
+
+    ``url`` is the final URL after redirects. ``headers`` keys
+    are lower-cased. ``body`` has any ``Content-Encoding``
+    removed.
+    """
+
+    url: str
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag") or None
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified") or None
+
+    def text(self) -> str:
+        """Decode the body as text.
+
+        Uses the ``Content-Type`` charset when declared and
+        UTF-8 otherwise; latin-1 is the last resort, as in the
+        legacy fetch path, since it never fails.
+        """
+        charset = "utf-8"
+        content_type = self.headers.get("content-type", "")
+        for param in content_type.split(";")[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "charset" and value:
+                charset = value.strip().strip('"')
+        try:
+            return self.body.decode(charset)
+        except (LookupError, UnicodeDecodeError):
+            pass
+        try:
+            return self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            return self.body.decode("latin-1")
+
+
+def _decode_body(body: bytes, content_encoding: str) -> bytes:
+    """Undo ``Content-Encoding`` (applied in listed order)."""
+    codings = [
+        c.strip().lower()
+        for c in content_encoding.split(",")
+        if c.strip()
+    ]
+    for coding in reversed(codings):
+        if coding in ("gzip", "x-gzip"):
+            body = gzip.decompress(body)
+        elif coding == "deflate":
+            # RFC 9110 deflate is zlib-wrapped; some servers send
+            # a raw stream anyway.
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                body = zlib.decompress(body, -zlib.MAX_WBITS)
+        elif coding == "br" and brotli is not None:
+            body = brotli.decompress(body)
+        elif coding != "identity":
+            raise ValueError(f"unsupported content encoding {coding!r}")
+    return body
+
+
+# ---------------------------------------------------------------------------
+# HTTPClient
+# ---------------------------------------------------------------------------
+
+
+# (scheme, host, port, proxy) — the pool key.
+_OriginKey = tuple[str, str, int, str | None]
+
+
+class HTTPClient:
+    """Keep-alive, per-host-limited HTTP GET client."""
+
+    def __init__(
+        self,
+        *,
+        max_per_host: int = _DEFAULT_MAX_PER_HOST,
+        timeout: float = _DEFAULT_TIMEOUT_SECONDS,
+        max_redirects: int = _DEFAULT_MAX_REDIRECTS,
+    ) -> None:
+        self._max_per_host = max(1, int(max_per_host))
+        self._timeout = timeout
+        self._max_redirects = max_redirects
+        self._lock = threading.Lock()
+        self._idle: dict[_OriginKey, list[http.client.HTTPConnection]] = {}
+        self._limits: dict[_OriginKey, threading.BoundedSemaphore] = {}
+        # Lifetime counters, for logs and tests.
+        self.requests = 0
+        self.connections_opened = 0
+
+    # ------------------------------------------------------------------
+    # Public surface
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        validators: dict[str, str | None] | None = None,
+    ) -> HTTPResponse:
+        """GET ``url``, following redirects.
+
+        ``validators`` may carry ``etag`` and ``last_modified``
+        from an earlier response; when present the request is
+        conditional and a 304 raises :class:`NotModified`.
+        Raises ``HTTPError`` for error statuses and ``URLError``
+        for everything that prevented a response.
+        """
+        request_headers = {"Accept-Encoding": _accept_encoding()}
+        request_headers.update(headers or {})
+        if validators:
+            if validators.get("etag"):
+                request_headers["If-None-Match"] = str(validators["etag"])
+            if validators.get("last_modified"):
+                request_headers["If-Modified-Since"] = str(
+                    validators["last_modified"]
+                )
+
+        current = url
+        for _ in range(self._max_redirects + 1):
+            status, reason, message, body = self._request(
+                current, request_headers
+            )
+            location = message.get("Location")
+            if status in _REDIRECT_STATUSES and location:
+                current = urljoin(current, location)
+                continue
+            break
+        else:
+            raise urllib.error.URLError(
+                f"too many redirects (>{self._max_redirects})"
+            )
+
+        if status == 304:
+            raise NotModified(current)
+        if status >= 400:
+            raise urllib.error.HTTPError(
+                current, status, reason, message, None
+            )
+        response_headers = {k.lower(): v for k, v in message.items()}
+        try:
+            body = _decode_body(
+                body, response_headers.get("content-encoding", "")
+            )
+        except (OSError, EOFError, ValueError, zlib.error) as exc:
+            raise urllib.error.URLError(
+                f"undecodable response body: {exc}"
+            ) from exc
+        return HTTPResponse(
+            url=current,
+            status=status,
+            headers=response_headers,
+            body=body,
+        )
+
+    def close(self) -> None:
+        """Close every idle connection. Later requests reopen."""
+        with self._lock:
+            idle = [c for conns in self._idle.values() for c in conns]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+    @property
+    def idle_connections(self) -> int:
+        with self._lock:
+            return sum(len(conns) for conns in self._idle.values())
+
+    # ------------------------------------------------------------------
+    # Connection pool
+    # ------------------------------------------------------------------
+
+    def _request(
+        self, url: str, headers: dict[str, str]
+    ) -> tuple[int, str, Any, bytes]:
+        """One request/response exchange on a pooled connection."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise urllib.error.URLError(f"unsupported URL: {url}")
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = self._proxy_for(scheme, host)
+        key: _OriginKey = (scheme, host, port, proxy)
+
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        if proxy is not None and scheme == "http":
+            # Plain-HTTP proxies take the absolute URI.
+            target = f"http://{parts.netloc}{target}"
+
+        default_port = 443 if scheme == "https" else 80
+        request_headers = dict(headers)
+        request_headers["Host"] = (
+            host if port == default_port else f"{host}:{port}"
+        )
+
+        limit = self._limit_for(key)
+        limit.acquire()
+        try:
+            for attempt in range(2):
+                conn, reused = self._checkout(key)
+                try:
+                    conn.request(
+                        "GET", target, headers=request_headers
+                    )
+                    response = conn.getresponse()
+                    body = response.read()
+                except _STALE_CONNECTION_ERRORS as exc:
+                    conn.close()
+                    if reused and attempt == 0:
+                        logger.debug(
+                            "Pooled connection to %s went stale; "
+                            "retrying", host,
+                        )
+                        continue
+                    raise urllib.error.URLError(exc) from exc
+                except (OSError, http.client.HTTPException) as exc:
+                    conn.close()
+                    raise urllib.error.URLError(exc) from exc
+                with self._lock:
+                    self.requests += 1
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._checkin(key, conn)
+                return (
+                    response.status, response.reason,
+                    response.msg, body,
+                )
+            raise AssertionError("unreachable")  # pragma: no cover
+        finally:
+            limit.release()
+
+    def _limit_for(self, key: _OriginKey) -> threading.BoundedSemaphore:
+        with self._lock:
+            limit = self._limits.get(key)
+            if limit is None:
+                limit = threading.BoundedSemaphore(self._max_per_host)
+                self._limits[key] = limit
+            return limit
+
+    def _checkout(
+        self, key: _OriginKey
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)`` for ``key``."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+            self.connections_opened += 1
+        scheme, host, port, proxy = key
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(
+                    host, port, timeout=self._timeout
+                ), False
+            return http.client.HTTPConnection(
+                host, port, timeout=self._timeout
+            ), False
+        proxy_parts = urlsplit(proxy)
+        proxy_host = proxy_parts.hostname or ""
+        proxy_port = proxy_parts.port or 8080
+        if scheme == "https":
+            conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                proxy_host, proxy_port, timeout=self._timeout
+            )
+            conn.set_tunnel(host, port)
+            return conn, False
+        return http.client.HTTPConnection(
+            proxy_host, proxy_port, timeout=self._timeout
+        ), False
+
+    def _checkin(
+        self, key: _OriginKey, conn: http.client.HTTPConnection
+    ) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            # Never more idle than could be in flight at once.
+            if len(idle) < self._max_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    @staticmethod
+    def _proxy_for(scheme: str, host: str) -> str | None:
+        """Environment proxy for ``scheme``, honouring no_proxy."""
+        proxy = urllib.request.getproxies().get(scheme)
+        if not proxy:
+            return None
+        if urllib.request.proxy_bypass(host):
+            return None
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        return proxy
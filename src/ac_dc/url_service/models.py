@@ -104,7 +104,7 @@ class URLContent:
     - Fetchers set ``url``, ``url_type``, ``title``,
       ``content`` or ``readme``, ``symbol_map``,
       ``github_info``, ``fetched_at``, and optionally
-      ``description``.
+      ``description``, ``etag`` and ``last_modified``.
     - Failed fetches set ``error`` instead and leave other
       fields empty.
     - The summarizer sets ``summary`` and ``summary_type`` in
@@ -130,6 +130,12 @@ class URLContent:
     error: str | None = None
     summary: str | None = None
     summary_type: str | None = None
+    # HTTP validators from the response that produced
+    # ``content``; sent back on revalidation of an expired
+    # cache entry. None when the server sent none, or the
+    # fetch didn't go over HTTP (repo clones).
+    etag: str | None = None
+    last_modified: str | None = None
 
     def format_for_prompt(
         self,
@@ -47,12 +47,24 @@ Design points pinned by spec and tests:
 - **Synchronous by design.** All methods are blocking. The
   streaming handler schedules them via ``run_in_executor``
   because network I/O and git clones block the event loop if
-  called inline. The service doesn't wrap its own calls in
-  executor dispatch — that's the caller's responsibility.
+  called inline. The one exception is fan-out:
+  :meth:`URLService.fetch_many` runs several
+  :meth:`fetch_url` calls at once on the service's own
+  :attr:`~URLService.fetch_executor` (``max_concurrent_fetches``
+  threads), which the streaming handler also uses for its
+  per-URL fetches. Per-host politeness is the HTTP client's
+  job, not the executor's.
+
+- **Expired entries are revalidated, not refetched.** With an
+  HTTP client injected, an expired cache entry that recorded an
+  ``etag`` or ``last_modified`` is fetched conditionally. A 304
+  refreshes the entry's cache timestamp and returns the stored
+  content — summary included, so nothing is re-summarised. A
+  200 replaces it as a normal fetch would.
 
 - **Injection points, not hardcoded dependencies.** The
-  ``URLCache``, ``smaller_model`` name, and ``symbol_index_cls``
-  are all injected at construction. Tests pass stubs; the
+  ``URLCache``, ``smaller_model`` name, ``symbol_index_cls``
+  and ``http_client`` are all injected at construction. Tests pass stubs; the
   streaming handler passes real values from ``ConfigManager``
   and ``SymbolIndex``.
 """
@@ -60,6 +72,8 @@ Design points pinned by spec and tests:
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ac_dc.url_service.cache import URLCache
@@ -74,6 +88,7 @@ from ac_dc.url_service.fetchers import (
     fetch_github_repo,
     fetch_web_page,
 )
+from ac_dc.url_service.http_client import HTTPClient, NotModified
 from ac_dc.url_service.models import GitHubInfo, URLContent
 from ac_dc.url_service.summarizer import (
     SummaryType,
@@ -110,6 +125,11 @@ _DEFAULT_FORMAT_MAX_LENGTH = 50_000
 # text) because of the surrounding blank lines.
 _URL_SEPARATOR = "\n---\n"
 
+# Default width of the fetch executor used by fetch_many and
+# the streaming handler. Per-message URL volume is small (the
+# streaming cap is 3); the chip "fetch all" path can be larger.
+_DEFAULT_MAX_CONCURRENT_FETCHES = 4
+
 
 # ---------------------------------------------------------------------------
 # Parse GitHub info from a URL
@@ -195,6 +215,8 @@ class URLService:
         smaller_model: str | None = None,
         symbol_index_cls: Any = None,
         summarizer_timeout: float | None = None,
+        http_client: HTTPClient | None = None,
+        max_concurrent_fetches: int = _DEFAULT_MAX_CONCURRENT_FETCHES,
     ) -> None:
         """Construct the service.
 
@@ -228,11 +250,29 @@ class URLService:
             timeout — rely on provider defaults" (used by
             tests). Production construction passes
             ``config.aux_request_timeout_seconds``.
+        http_client:
+            Optional pooled :class:`HTTPClient` handed to the
+            web-page and GitHub-file fetchers. When None, those
+            fetchers use one-shot ``urlopen`` requests and
+            expired cache entries are refetched rather than
+            revalidated. Normal construction passes a client
+            sized from ``url_cache.max_connections_per_host``.
+        max_concurrent_fetches:
+            Width of the fetch executor used by
+            :meth:`fetch_many`. 1 fetches serially on the
+            calling thread.
         """
         self._cache = cache
         self._smaller_model = smaller_model
         self._symbol_index_cls = symbol_index_cls
         self._summarizer_timeout = summarizer_timeout
+        self._http_client = http_client
+        self._max_concurrent_fetches = max(1, int(max_concurrent_fetches))
+        # Created on first use — most sessions never fetch.
+        self._fetch_executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # Expired entries answered with a 304 this session.
+        self.revalidated = 0
         # Fetched results for the current session. Keyed by URL
         # string (exact match). Both successes and errors are
         # stored — the error field distinguishes.
@@ -279,9 +319,12 @@ class URLService:
         1. Cache check (if ``use_cache``). On hit: return
            immediately unless ``summarize=True`` and the cached
            entry lacks a summary — in that case, generate the
-           summary and update the cache in place.
+           summary and update the cache in place. An expired
+           entry with HTTP validators is kept for step 3.
         2. Classification.
-        3. Handler dispatch by type.
+        3. Handler dispatch by type — conditional when step 1
+           kept an expired entry; a 304 returns that entry
+           (see :meth:`_revalidated`).
         4. Cache write (if successful fetch and ``use_cache``).
         5. Summarization (if ``summarize=True`` and the fetch
            succeeded).
@@ -330,11 +373,31 @@ class URLService:
                 self._fetched[url] = content
                 return content
 
+        stale = (
+            self._stale_with_validators(url) if use_cache else None
+        )
+
         # Step 2 — classify.
         url_type = classify_url(url)
 
         # Step 3 — dispatch.
-        content = self._dispatch_fetch(url, url_type)
+        try:
+            content = self._dispatch_fetch(
+                url,
+                url_type,
+                validators=(
+                    {
+                        "etag": stale.etag,
+                        "last_modified": stale.last_modified,
+                    }
+                    if stale is not None else None
+                ),
+            )
+        except NotModified:
+            assert stale is not None
+            return self._revalidated(
+                stale, summarize, summary_type, user_text
+            )
 
         # Step 4 — cache write on success. The cache itself
         # refuses error records, so this is safe unconditionally.
@@ -353,10 +416,52 @@ class URLService:
         self._fetched[url] = content
         return content
 
+    def _stale_with_validators(self, url: str) -> URLContent | None:
+        """Return the expired cache entry for ``url`` if revalidatable.
+
+        Only meaningful with an HTTP client (the one-shot path
+        can't send conditional requests) and for entries that
+        recorded an ``etag`` or ``last_modified``. Called after
+        a :meth:`URLCache.get` miss, so any entry found here is
+        expired.
+        """
+        if self._http_client is None or self._cache is None:
+            return None
+        cached_dict = self._cache.get_stale(url)
+        if cached_dict is None:
+            return None
+        content = URLContent.from_dict(cached_dict)
+        if content.error or not (content.etag or content.last_modified):
+            return None
+        return content
+
+    def _revalidated(
+        self,
+        content: URLContent,
+        summarize: bool,
+        summary_type: SummaryType | None,
+        user_text: str | None,
+    ) -> URLContent:
+        """Adopt an expired entry the server confirmed unchanged.
+
+        Rewriting the entry restarts its TTL. The stored summary
+        is reused; one is generated only if requested and the
+        entry never had one.
+        """
+        assert self._cache is not None
+        self.revalidated += 1
+        logger.debug("URL not modified; reusing cache: %s", content.url)
+        if summarize and not content.summary:
+            content = self._summarize(content, summary_type, user_text)
+        self._cache.set(content.url, content.to_dict())
+        self._fetched[content.url] = content
+        return content
+
     def _dispatch_fetch(
         self,
         url: str,
         url_type: URLType,
+        validators: dict[str, str | None] | None = None,
     ) -> URLContent:
         """Route to the appropriate fetcher based on URL type.
 
@@ -364,7 +469,18 @@ class URLService:
         fetcher. Issue and PR URLs currently also go through the
         generic fetcher — a future enhancement could use the
         GitHub API for structured issue/PR data.
+
+        ``validators`` make the HTTP fetchers' request
+        conditional; :class:`NotModified` propagates to
+        :meth:`fetch_url`. The client and validators are only
+        passed when set, so the fetchers' plain single-URL
+        call shape is unchanged without a client.
         """
+        http_kwargs: dict[str, Any] = {}
+        if self._http_client is not None:
+            http_kwargs["client"] = self._http_client
+            if validators:
+                http_kwargs["validators"] = validators
         if url_type == URLType.GITHUB_REPO:
             info = _parse_github_info(url, url_type)
             return fetch_github_repo(
@@ -372,10 +488,10 @@ class URLService:
             )
         if url_type == URLType.GITHUB_FILE:
             info = _parse_github_info(url, url_type)
-            return fetch_github_file(url, info)
+            return fetch_github_file(url, info, **http_kwargs)
         # GitHub issues, PRs, documentation, generic — all go
         # through the web page fetcher.
-        content = fetch_web_page(url)
+        content = fetch_web_page(url, **http_kwargs)
         # Overwrite the url_type to match what classify_url said,
         # so callers can distinguish a fetched docs page from a
         # fetched generic page. The web fetcher sets url_type to
@@ -422,13 +538,13 @@ class URLService:
         summarize: bool = False,
         max_urls: int | None = None,
     ) -> list[URLContent]:
-        """Detect URLs in ``text`` and fetch each one sequentially.
+        """Detect URLs in ``text`` and fetch the new ones concurrently.
 
-        Convenience wrapper the streaming handler calls with the
-        user's prompt. Fetches are sequential rather than
-        parallel — per-message URL volume is small (typically
-        0–3), and serial fetching avoids hammering upstream
-        services when users paste a batch of links.
+        Convenience wrapper for callers holding raw text. New
+        URLs go through :meth:`fetch_many`, so a batch of links
+        costs roughly the slowest fetch rather than the sum;
+        the HTTP client's per-host limit keeps a batch of links
+        to one site from hammering it.
 
         Already-fetched URLs are skipped — if the URL is already
         in ``_fetched`` from an earlier turn, it's not re-fetched.
@@ -464,20 +580,80 @@ class URLService:
         if max_urls is not None:
             detected = detected[:max_urls]
 
-        results: list[URLContent] = []
-        for url in detected:
-            if url in self._fetched:
-                # Already fetched this session — reuse.
-                results.append(self._fetched[url])
-                continue
-            result = self.fetch_url(
+        # Already fetched this session — reuse.
+        pending = [url for url in detected if url not in self._fetched]
+        fetched = dict(zip(pending, self.fetch_many(
+            pending,
+            use_cache=use_cache,
+            summarize=summarize,
+            user_text=text,
+        )))
+        return [
+            fetched[url] if url in fetched else self._fetched[url]
+            for url in detected
+        ]
+
+    def fetch_many(
+        self,
+        urls: list[str],
+        use_cache: bool = True,
+        summarize: bool = False,
+        user_text: str | None = None,
+    ) -> list[URLContent]:
+        """Run :meth:`fetch_url` for each URL, concurrently.
+
+        Results come back in input order. A single URL, or a
+        service built with ``max_concurrent_fetches=1``, is
+        fetched on the calling thread. Must not be called from
+        a :attr:`fetch_executor` thread — it waits on that
+        executor.
+        """
+        if len(urls) <= 1 or self._max_concurrent_fetches <= 1:
+            return [
+                self.fetch_url(
+                    url,
+                    use_cache=use_cache,
+                    summarize=summarize,
+                    user_text=user_text,
+                )
+                for url in urls
+            ]
+        executor = self.fetch_executor
+        futures = [
+            executor.submit(
+                self.fetch_url,
                 url,
                 use_cache=use_cache,
                 summarize=summarize,
-                user_text=text,
+                user_text=user_text,
             )
-            results.append(result)
-        return results
+            for url in urls
+        ]
+        return [future.result() for future in futures]
+
+    @property
+    def fetch_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for concurrent fetches, created on first use."""
+        with self._executor_lock:
+            if self._fetch_executor is None:
+                self._fetch_executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrent_fetches,
+                    thread_name_prefix="ac-dc-url-fetch",
+                )
+            return self._fetch_executor
+
+    def close(self) -> None:
+        """Release the fetch executor and pooled connections.
+
+        Non-blocking, like the LLM service's shutdown: in-flight
+        fetches are abandoned. Called on server shutdown.
+        """
+        with self._executor_lock:
+            executor, self._fetch_executor = self._fetch_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if self._http_client is not None:
+            self._http_client.close()
 
     # ------------------------------------------------------------------
     # Retrieval and cache management
@@ -527,6 +703,23 @@ class URLService:
             "fetched_removed": fetched_removed,
         }
 
+    def cache_stats(self) -> dict[str, Any]:
+        """Return URL cache size and hit/miss/eviction counters.
+
+        The cache's own :meth:`URLCache.stats` plus this
+        session's count of expired entries revalidated with a
+        304. ``{"enabled": False, ...}`` when the service has
+        no cache.
+        """
+        stats: dict[str, Any] = (
+            {"enabled": True, **self._cache.stats()}
+            if self._cache is not None
+            else {"enabled": False}
+        )
+        stats["revalidated"] = self.revalidated
+        stats["fetched"] = len(self._fetched)
+        return stats
+
     def clear_url_cache(self) -> dict[str, Any]:
         """Remove all cached and in-memory fetched URLs.
 
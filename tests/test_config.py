@@ -361,6 +361,9 @@ def test_doc_convert_config_defaults(isolated_config_dir):
     assert ".docx" in dcc["extensions"]
     assert ".pdf" in dcc["extensions"]
     assert dcc["max_source_size_mb"] > 0
+    assert dcc["workers"] == 0
+    assert dcc["file_timeout_seconds"] > 0
+    assert dcc["libreoffice_max_instances"] >= 1
 def test_doc_index_config_defaults(isolated_config_dir):
     """doc_index_config returns all keyword-enricher fields."""
     cfg = ConfigManager()
@@ -373,12 +376,76 @@ def test_doc_index_config_defaults(isolated_config_dir):
     assert 0.0 <= dic["keywords_min_score"] <= 1.0
     assert 0.0 <= dic["keywords_diversity"] <= 1.0
     assert 0.0 <= dic["keywords_max_doc_freq"] <= 1.0
+    # Structural-pass process pool, same defaults as symbol_index.
+    assert dic["workers"] == 0
+    assert dic["parallel_min_files"] == 256
+    assert dic["shard_size"] == 64
+    # Enrichment worker process and cross-file batching.
+    assert dic["keywords_out_of_process"] is True
+    assert dic["keywords_worker_max_rss_mb"] == 3072
+    assert dic["keywords_batch_files"] == 8
+
+
+def test_streaming_config_defaults(isolated_config_dir):
+    """streaming_config enables delta chunks with a coalescing window."""
+    cfg = ConfigManager()
+    sc = cfg.streaming_config
+    assert sc["delta_chunks"] is True
+    assert sc["coalesce_ms"] >= 0
+    assert sc["coalesce_chars"] > 0
+    assert sc["checkpoint_seconds"] > 0
+
+
+def test_streaming_config_malformed_values_fall_back(isolated_config_dir):
+    """Garbage in the streaming section yields defaults, not errors."""
+    cfg = ConfigManager()
+    _ = cfg.app_config
+    cfg._app_config["streaming"] = {
+        "coalesce_ms": "soon",
+        "coalesce_chars": -1,
+        "checkpoint_seconds": None,
+    }
+    sc = cfg.streaming_config
+    assert sc["coalesce_ms"] == 50
+    assert sc["coalesce_chars"] == 2048
+    assert sc["checkpoint_seconds"] == 5.0
+
+
+def test_symbol_index_config_defaults(isolated_config_dir):
+    """symbol_index_config defaults to one worker per CPU."""
+    cfg = ConfigManager()
+    sic = cfg.symbol_index_config
+    assert sic["workers"] == 0
+    assert sic["parallel_min_files"] > 0
+    assert sic["shard_size"] > 0
+
+
+def test_symbol_index_config_malformed_values_fall_back(
+    isolated_config_dir,
+):
+    """Garbage in the symbol_index section yields defaults."""
+    cfg = ConfigManager()
+    _ = cfg.app_config
+    cfg._app_config["symbol_index"] = {
+        "workers": -3,
+        "parallel_min_files": "many",
+        "shard_size": 0,
+    }
+    sic = cfg.symbol_index_config
+    assert sic["workers"] == 0
+    assert sic["parallel_min_files"] == 256
+    assert sic["shard_size"] == 64
+
+
 def test_url_cache_config_defaults(isolated_config_dir):
     """url_cache_config returns path (possibly None) and ttl_hours."""
     cfg = ConfigManager()
     ucc = cfg.url_cache_config
     assert "path" in ucc
     assert ucc["ttl_hours"] > 0
+    assert ucc["max_size_mb"] == 256
+    assert ucc["max_concurrent_fetches"] == 4
+    assert ucc["max_connections_per_host"] == 2
 
 
 def test_agents_config_defaults(isolated_config_dir):
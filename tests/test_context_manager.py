@@ -440,6 +440,64 @@ class TestHistoryBasics:
         second = cm.history_token_count()
         assert second > first
 
+    def test_history_token_count_counts_each_message_once(
+        self, cm: ContextManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unchanged messages are not re-counted on later calls."""
+        counted: list[str] = []
+        original = cm.counter.count_message
+
+        def _spy(msg: dict[str, Any]) -> int:
+            counted.append(msg["content"])
+            return original(msg)
+
+        monkeypatch.setattr(cm.counter, "count_message", _spy)
+        cm.add_message("user", "one")
+        cm.add_message("assistant", "two")
+        cm.history_token_count()
+        cm.add_message("user", "three")
+        cm.history_token_count()
+        assert counted == ["one", "two", "three"]
+
+        # Replacing content or the whole history recounts.
+        cm.get_history()[0]["content"] = "one, edited"
+        cm.history_token_count()
+        assert counted[-1] == "one, edited"
+        cm.set_history([{"role": "user", "content": "fresh"}])
+        cm.history_token_count()
+        assert counted[-1] == "fresh"
+
+    def test_history_stability_items_cached_per_message(
+        self, cm: ContextManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Hashes match the tracker's identity and are reused."""
+        import hashlib
+
+        from ac_dc import context_manager as cm_module
+
+        hashed: list[bytes] = []
+
+        class _Hashlib:
+            @staticmethod
+            def sha256(data: bytes) -> Any:
+                hashed.append(data)
+                return hashlib.sha256(data)
+
+        monkeypatch.setattr(cm_module, "hashlib", _Hashlib)
+        cm.add_message("user", "one")
+        cm.add_message("assistant", "two")
+        items = cm.history_stability_items()
+        assert [h for h, _ in items] == [
+            hashlib.sha256(b"user:one").hexdigest(),
+            hashlib.sha256(b"assistant:two").hexdigest(),
+        ]
+        assert all(tokens > 0 for _, tokens in items)
+        assert sum(t for _, t in items) == cm.history_token_count()
+
+        cm.add_message("user", "three")
+        assert cm.history_stability_items()[:2] == items
+        assert hashed == [b"user:one", b"assistant:two", b"user:three"]
+
 
 # ---------------------------------------------------------------------------
 # History — stability tracker interaction
@@ -0,0 +1,91 @@
+"""Tests for ac_dc.dir_map — the directory-indexed path dict."""
+
+from __future__ import annotations
+
+import pytest
+
+from ac_dc.dir_map import DirectoryMap, dir_of
+
+
+def test_dir_of() -> None:
+    assert dir_of("top.py") == ""
+    assert dir_of("src/a/b.py") == "src/a"
+
+
+class TestMembership:
+    """The directory index follows every dict mutation."""
+
+    def test_files_in_sorted(self) -> None:
+        m: DirectoryMap[int] = DirectoryMap()
+        m["src/b.py"] = 1
+        m["src/a.py"] = 2
+        m["top.py"] = 3
+        m["src/sub/c.py"] = 4
+        assert m.files_in("src") == ("src/a.py", "src/b.py")
+        assert m.files_in("") == ("top.py",)
+        assert m.files_in("missing") == ()
+        assert m.directories() == ["", "src", "src/sub"]
+
+    def test_removal_paths(self) -> None:
+        m = DirectoryMap({"a/x": 1, "a/y": 2, "b/z": 3, "c/w": 4})
+        del m["a/x"]
+        assert m.pop("a/y") == 2
+        assert m.pop("a/y", None) is None
+        with pytest.raises(KeyError):
+            m.pop("a/y")
+        m.popitem()
+        assert len(m.directories()) == 1
+        m.clear()
+        assert m.directories() == []
+        assert m == {}
+
+    def test_setdefault_and_update(self) -> None:
+        m: DirectoryMap[int] = DirectoryMap()
+        assert m.setdefault("d/a", 1) == 1
+        assert m.setdefault("d/a", 2) == 1
+        m.update({"d/b": 2}, **{"e": 3})
+        m |= {"d/c": 4}
+        assert m.files_in("d") == ("d/a", "d/b", "d/c")
+        assert m.files_in("") == ("e",)
+
+    def test_plain_dict_copy(self) -> None:
+        m = DirectoryMap({"a/x": 1})
+        assert dict(m) == {"a/x": 1}
+
+
+class TestVersions:
+    """Versions move only for the affected directory."""
+
+    def test_add_replace_and_remove_bump(self) -> None:
+        m: DirectoryMap[object] = DirectoryMap()
+        assert m.dir_version("a") == 0
+        m["a/x"] = object()
+        v1 = m.dir_version("a")
+        m["a/x"] = object()
+        v2 = m.dir_version("a")
+        del m["a/x"]
+        v3 = m.dir_version("a")
+        assert 0 < v1 < v2 < v3
+
+    def test_identical_value_is_not_a_change(self) -> None:
+        value = object()
+        m = DirectoryMap({"a/x": value})
+        before = m.dir_version("a")
+        m["a/x"] = value
+        assert m.dir_version("a") == before
+
+    def test_other_directories_untouched(self) -> None:
+        m = DirectoryMap({"a/x": 1, "b/y": 2})
+        before = m.dir_version("b")
+        m["a/z"] = 3
+        m.touch("a/x")
+        assert m.dir_version("b") == before
+
+    def test_touch_bumps_member_only(self) -> None:
+        m = DirectoryMap({"a/x": 1})
+        before = m.dir_version("a")
+        m.touch("a/x")
+        assert m.dir_version("a") > before
+        after = m.dir_version("a")
+        m.touch("a/missing")
+        assert m.dir_version("a") == after
@@ -0,0 +1,235 @@
+"""Background conversion through the bounded worker pool.
+
+Covers:
+
+- :class:`TestConvertPool` — real spawned workers driven by a
+  stand-in converter: input-order results, per-file timeouts,
+  crashes, cancellation, and the LibreOffice instance cap
+  (including permits held by timed-out and cancelled
+  workers).
+- :class:`TestBackgroundConvert` — ``convert_files`` in
+  background mode end to end with the default converter, and
+  the ``cancel_conversion`` RPC.
+
+Governing spec: ``specs4/4-features/doc-convert.md``
+§ Progress Events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from ac_dc.doc_convert import DocConvert
+from ac_dc.doc_convert.worker_pool import CANCELLED_MESSAGE, ConvertPool
+
+from ._helpers import _assert_restricted, _StubCollab
+
+_FACTORY = "tests.test_doc_convert.test_parallel:_FakeConverter"
+
+
+class _FakeConverter:
+    """Child-side converter whose behaviour is the file's content.
+
+    ``ok`` succeeds, ``sleep`` hangs, ``crash`` kills the
+    process, ``lo:<seconds>`` holds a LibreOffice permit for
+    that long, ``lo-hang`` holds one forever.
+    """
+
+    def __init__(self, config: dict[str, Any], libreoffice_slots: Any):
+        self._slots = libreoffice_slots
+
+    def _convert_one(self, root: Path, rel_path: str) -> dict[str, Any]:
+        command = (root / rel_path).read_text().strip()
+        result: dict[str, Any] = {
+            "path": rel_path, "status": "ok", "pid": os.getpid(),
+        }
+        if command == "sleep":
+            time.sleep(60)
+        elif command == "crash":
+            os._exit(3)
+        elif command == "lo-hang":
+            with self._slots:
+                time.sleep(60)
+        elif command.startswith("lo:"):
+            with self._slots:
+                result["lo_start"] = time.time()
+                time.sleep(float(command[3:]))
+                result["lo_end"] = time.time()
+        return result
+
+
+def _files(root: Path, commands: list[str]) -> list[str]:
+    paths = []
+    for index, command in enumerate(commands):
+        name = f"f{index}.txt"
+        (root / name).write_text(command)
+        paths.append(name)
+    return paths
+
+
+async def _run(
+    root: Path,
+    commands: list[str],
+    *,
+    workers: int = 2,
+    libreoffice_instances: int = 2,
+    file_timeout: float = 30,
+    cancel_after: float | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    pool = ConvertPool(
+        {},
+        workers=workers,
+        libreoffice_instances=libreoffice_instances,
+        file_timeout=file_timeout,
+        factory=_FACTORY,
+    )
+    seen: list[dict[str, Any]] = []
+
+    async def _on_result(result: dict[str, Any]) -> None:
+        seen.append(result)
+
+    if cancel_after is not None:
+        asyncio.get_running_loop().call_later(cancel_after, pool.cancel)
+    results = await pool.convert(root, _files(root, commands), _on_result)
+    return results, seen
+
+
+class TestConvertPool:
+    async def test_results_in_input_order_across_workers(
+        self, scan_root: Path
+    ) -> None:
+        results, seen = await _run(scan_root, ["lo:0.3"] * 4)
+        assert [r["path"] for r in results] == [
+            "f0.txt", "f1.txt", "f2.txt", "f3.txt",
+        ]
+        assert all(r["status"] == "ok" for r in results)
+        assert len({r["pid"] for r in results}) == 2
+        assert sorted(r["path"] for r in seen) == [
+            r["path"] for r in results
+        ]
+
+    async def test_timeout_fails_file_and_respawns(
+        self, scan_root: Path
+    ) -> None:
+        results, _ = await _run(
+            scan_root, ["sleep", "ok"], workers=1, file_timeout=1,
+        )
+        assert results[0]["status"] == "error"
+        assert "timed out" in results[0]["message"]
+        assert results[1]["status"] == "ok"
+
+    async def test_crash_fails_file_only(self, scan_root: Path) -> None:
+        results, _ = await _run(scan_root, ["crash", "ok"], workers=1)
+        assert results[0]["status"] == "error"
+        assert "crashed" in results[0]["message"]
+        assert results[1]["status"] == "ok"
+
+    async def test_cancel_skips_in_flight_and_pending(
+        self, scan_root: Path
+    ) -> None:
+        results, seen = await _run(
+            scan_root, ["sleep", "ok", "ok"], workers=1, cancel_after=1.0,
+        )
+        assert [r["status"] for r in results] == ["skipped"] * 3
+        assert all(r["message"] == CANCELLED_MESSAGE for r in results)
+        assert len(seen) == 3
+
+    async def test_libreoffice_instances_capped(
+        self, scan_root: Path
+    ) -> None:
+        results, _ = await _run(
+            scan_root, ["lo:0.3"] * 3, workers=3, libreoffice_instances=1,
+        )
+        spans = sorted((r["lo_start"], r["lo_end"]) for r in results)
+        for (_, end), (start, _) in zip(spans, spans[1:]):
+            assert start >= end
+
+    async def test_killed_worker_returns_libreoffice_permit(
+        self, scan_root: Path
+    ) -> None:
+        results, _ = await _run(
+            scan_root, ["lo-hang", "lo:0"],
+            workers=1, libreoffice_instances=1, file_timeout=2,
+        )
+        assert results[0]["status"] == "error"
+        assert results[1]["status"] == "ok"
+
+    async def test_cancel_kills_permit_holder_and_returns_permit(
+        self, scan_root: Path
+    ) -> None:
+        pool = ConvertPool(
+            {},
+            workers=2,
+            libreoffice_instances=1,
+            file_timeout=30,
+            factory=_FACTORY,
+        )
+
+        async def _on_result(result: dict[str, Any]) -> None:
+            pass
+
+        task = asyncio.ensure_future(pool.convert(
+            scan_root, _files(scan_root, ["lo-hang", "lo-hang"]),
+            _on_result,
+        ))
+        # One child holds the only permit, the other waits on it.
+        for _ in range(200):
+            if any(slot._holding_permit for slot in pool._slots):
+                break
+            await asyncio.sleep(0.05)
+        [holder] = [s for s in pool._slots if s._holding_permit]
+        pool.cancel()
+        results = await task
+        assert [r["status"] for r in results] == ["skipped"] * 2
+        assert not holder._holding_permit
+        # The permit is back — and was never over-released.
+        assert pool._semaphore.acquire(blocking=False)
+        assert not pool._semaphore.acquire(blocking=False)
+
+
+class _RecordingCallback:
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+
+    async def __call__(self, name: str, data: dict[str, Any]) -> None:
+        assert name == "docConvertProgress"
+        self.events.append(data)
+
+
+class TestBackgroundConvert:
+    async def test_events_through_default_converter(
+        self, config, fake_repo, scan_root: Path
+    ) -> None:
+        (scan_root / "notes.txt").write_text("x")
+        callback = _RecordingCallback()
+        service = DocConvert(config, repo=fake_repo, event_callback=callback)
+        started = service.convert_files(["missing.docx", "notes.txt"])
+        assert started == {"status": "started", "count": 2}
+        for _ in range(300):
+            if callback.events and callback.events[-1]["stage"] == "complete":
+                break
+            await asyncio.sleep(0.1)
+        stages = [e["stage"] for e in callback.events]
+        assert stages == ["start", "file", "file", "complete"]
+        assert sorted(e["index"] for e in callback.events[1:3]) == [0, 1]
+        complete = callback.events[-1]
+        assert complete["cancelled"] is False
+        assert [r["path"] for r in complete["results"]] == [
+            "missing.docx", "notes.txt",
+        ]
+        assert complete["results"][0]["message"] == "File not found"
+        assert "Unsupported extension" in complete["results"][1]["message"]
+        assert service._active_pools == set()
+
+    def test_cancel_when_idle(self, doc_convert: DocConvert) -> None:
+        assert doc_convert.cancel_conversion() == {"status": "idle"}
+
+    def test_cancel_restricted_for_participants(
+        self, doc_convert: DocConvert
+    ) -> None:
+        doc_convert._collab = _StubCollab(is_localhost=False)
+        _assert_restricted(doc_convert.cancel_conversion())
@@ -0,0 +1,187 @@
+"""Scan cost — source-hash cache and git-listing enumeration.
+
+Covers:
+
+- :class:`TestSourceHashCache` — fingerprint hits and misses,
+  the racy-timestamp guard, pruning, and the pack file.
+- :class:`TestScanUsesCache` — a rescan of an unchanged tree
+  hashes nothing; an edited source is re-hashed and goes
+  stale.
+- :class:`TestGitEnumeration` — with a real :class:`Repo` the
+  scan follows git's listing (untracked included, ignored
+  excluded) and still applies the directory exclusions.
+
+Governing spec: ``specs4/4-features/doc-convert.md``
+§ Status Badges, § Directory Exclusions.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from ac_dc.config import _AC_DC_DIR
+from ac_dc.doc_convert import DocConvert
+from ac_dc.doc_convert import hash_cache as hash_cache_module
+from ac_dc.doc_convert.hash_cache import SourceHashCache
+from ac_dc.repo import Repo
+
+from ._helpers import _sha256_of, _write_output, _write_source
+
+
+def _settle(path: Path, seconds_ago: float = 60) -> None:
+    """Backdate ``path``'s mtime out of the racy window."""
+    stamp = time.time() - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+@pytest.fixture
+def hash_calls(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = hash_cache_module.hash_file
+
+    def _spy(path: Path) -> str:
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(hash_cache_module, "hash_file", _spy)
+    return calls
+
+
+class TestSourceHashCache:
+    def test_unchanged_file_hits(
+        self, scan_root: Path, hash_calls: list[Path]
+    ) -> None:
+        path = _write_source(scan_root, "a.pdf", b"one")
+        _settle(path)
+        cache = SourceHashCache(scan_root)
+        assert cache.hash("a.pdf", path) == _sha256_of(b"one")
+        assert cache.hash("a.pdf", path) == _sha256_of(b"one")
+        assert len(hash_calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_same_size_edit_misses(
+        self, scan_root: Path, hash_calls: list[Path]
+    ) -> None:
+        path = _write_source(scan_root, "a.pdf", b"one")
+        _settle(path, 120)
+        cache = SourceHashCache(scan_root)
+        cache.hash("a.pdf", path)
+        path.write_bytes(b"two")
+        _settle(path, 60)
+        assert cache.hash("a.pdf", path) == _sha256_of(b"two")
+        assert len(hash_calls) == 2
+
+    def test_racy_file_not_cached(
+        self, scan_root: Path, hash_calls: list[Path]
+    ) -> None:
+        path = _write_source(scan_root, "a.pdf", b"fresh")
+        cache = SourceHashCache(scan_root)
+        cache.hash("a.pdf", path)
+        cache.hash("a.pdf", path)
+        assert len(hash_calls) == 2
+        assert len(cache) == 0
+
+    def test_pack_round_trip_and_retain(
+        self, scan_root: Path, hash_calls: list[Path]
+    ) -> None:
+        a = _write_source(scan_root, "a.pdf", b"a")
+        b = _write_source(scan_root, "b.pdf", b"b")
+        _settle(a)
+        _settle(b)
+        cache = SourceHashCache(scan_root)
+        cache.hash("a.pdf", a)
+        cache.hash("b.pdf", b)
+        cache.retain({"a.pdf"})
+        cache.flush()
+        reloaded = SourceHashCache(scan_root)
+        assert len(reloaded) == 1
+        reloaded.hash("a.pdf", a)
+        assert len(hash_calls) == 2
+
+    def test_corrupt_or_old_pack_ignored(self, scan_root: Path) -> None:
+        pack = scan_root / _AC_DC_DIR / "doc_convert_hashes.json"
+        pack.parent.mkdir()
+        pack.write_text("{not json")
+        assert len(SourceHashCache(scan_root)) == 0
+        pack.write_text(json.dumps({
+            "version": 0, "entries": {"a.pdf": [1, 2, 3, "x"]},
+        }))
+        assert len(SourceHashCache(scan_root)) == 0
+
+
+class TestScanUsesCache:
+    def _converted(self, scan_root: Path, content: bytes) -> Path:
+        source = _write_source(scan_root, "docs/deck.pptx", content)
+        _settle(source, 120)
+        _write_output(
+            scan_root, "docs/deck.md",
+            f"source=deck.pptx sha256={_sha256_of(content)}",
+        )
+        return source
+
+    def test_rescan_hashes_nothing(
+        self, config, fake_repo, scan_root: Path, hash_calls: list[Path]
+    ) -> None:
+        self._converted(scan_root, b"deck")
+        first = DocConvert(config, repo=fake_repo).scan_convertible_files()
+        assert [e["status"] for e in first] == ["current"]
+        assert len(hash_calls) == 1
+        # A fresh service (e.g. after a restart) reads the pack.
+        second = DocConvert(config, repo=fake_repo).scan_convertible_files()
+        assert second == first
+        assert len(hash_calls) == 1
+
+    def test_edited_source_rehashed(
+        self, config, fake_repo, scan_root: Path, hash_calls: list[Path]
+    ) -> None:
+        source = self._converted(scan_root, b"deck")
+        service = DocConvert(config, repo=fake_repo)
+        service.scan_convertible_files()
+        source.write_bytes(b"edit")
+        _settle(source, 60)
+        entries = service.scan_convertible_files()
+        assert [e["status"] for e in entries] == ["stale"]
+        assert len(hash_calls) == 2
+
+
+class TestGitEnumeration:
+    @pytest.fixture
+    def git_root(self, tmp_path: Path) -> Path:
+        root = tmp_path / "repo"
+        root.mkdir()
+        subprocess.run(
+            ["git", "init", "-q"], cwd=root, check=True,
+        )
+        return root
+
+    def test_follows_git_listing(self, config, git_root: Path) -> None:
+        (git_root / ".gitignore").write_text("ignored/\n")
+        _write_source(git_root, "docs/a.pdf", b"a")
+        _write_source(git_root, "ignored/b.pdf", b"b")
+        _write_source(git_root, "build/c.pdf", b"c")
+        _write_source(git_root, ".github/d.pdf", b"d")
+        _write_source(git_root, ".hidden/e.pdf", b"e")
+        service = DocConvert(config, repo=Repo(git_root))
+        paths = [e["path"] for e in service.scan_convertible_files()]
+        assert paths == [".github/d.pdf", "docs/a.pdf"]
+
+    def test_falls_back_to_walk_when_listing_fails(
+        self, config, git_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _write_source(git_root, "a.pdf", b"a")
+        repo = Repo(git_root)
+
+        def _boom() -> str:
+            raise RuntimeError("git unavailable")
+
+        monkeypatch.setattr(repo, "get_flat_file_list", _boom)
+        service = DocConvert(config, repo=repo)
+        assert [e["path"] for e in service.scan_convertible_files()] == [
+            "a.pdf",
+        ]
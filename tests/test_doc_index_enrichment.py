@@ -40,7 +40,8 @@ class _StubEnricher:
     """Records calls, populates keywords per-unit deterministically.
 
     The stub mimics :class:`KeywordEnricher`'s public surface:
-    :attr:`model_name` + :meth:`enrich_outline`. It doesn't
+    :attr:`model_name` + :meth:`enrich_outline` (and its batch
+    form :meth:`enrich_outlines`). It doesn't
     check eligibility — if a heading/prose block is passed in
     and has empty keywords, the stub populates them with a
     single deterministic entry derived from the heading text
@@ -77,6 +78,16 @@ class _StubEnricher:
                     block.keywords = ["prose-kw"]
         return outline
 
+    def enrich_outlines(
+        self,
+        items: list[tuple[Any, str]],
+        config: Any = None,
+    ) -> list[Any]:
+        return [
+            self.enrich_outline(outline, source_text, config)
+            for outline, source_text in items
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -400,6 +411,16 @@ class TestQueueEnrichment:
                 # Deliberately do not touch keywords.
                 return outline
 
+            def enrich_outlines(
+                self,
+                items: list[tuple[Any, str]],
+                config: Any = None,
+            ) -> list[Any]:
+                return [
+                    self.enrich_outline(outline, source_text, config)
+                    for outline, source_text in items
+                ]
+
         enricher_v1 = _PassthroughEnricher()
         index_v1 = DocIndex(
             repo_root=repo_root, enricher=enricher_v1
@@ -509,6 +530,20 @@ class TestEnrichSingleFile:
         )
         assert result is before
 
+    def test_cached_dir_block_shows_new_keywords(
+        self,
+        index_with_enricher: DocIndex,
+        repo_root: Path,
+    ) -> None:
+        """In-place enrichment invalidates the directory's block."""
+        source = "# Intro\n\n" + ("line\n" * 10)
+        _write(repo_root / "a.md", source)
+        index_with_enricher.index_file("a.md")
+        before = index_with_enricher.get_dir_docs_block("")
+        assert "kw-for-Intro" not in before
+        index_with_enricher.enrich_single_file("a.md", source_text=source)
+        assert "kw-for-Intro" in index_with_enricher.get_dir_docs_block("")
+
     def test_enriched_file_no_longer_in_queue(
         self,
         index_with_enricher: DocIndex,
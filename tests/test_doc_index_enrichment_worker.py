@@ -0,0 +1,153 @@
+"""Tests for the out-of-process enrichment worker.
+
+Real child processes (spawn context) host light stand-in
+models defined below, named to the worker by dotted path —
+KeyBERT itself is never loaded. Covers startup and model-load
+failure, crash and hang recovery, the RSS recycling
+threshold, the restart budget, and the enricher using the
+worker in place of an in-process model.
+
+Governing spec: ``specs4/2-indexing/keyword-enrichment.md``
+§ Enrichment Worker Process.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from ac_dc.doc_index.enrichment_worker import (
+    EnrichmentWorker,
+    EnrichmentWorkerError,
+)
+from ac_dc.doc_index.keyword_enricher import KeywordEnricher
+from ac_dc.doc_index.models import DocHeading, DocOutline
+
+
+_MODULE = __name__
+
+
+class _EchoModel:
+    """First word of each text as its keyword; some words misbehave."""
+
+    def __init__(self, model: str) -> None:
+        self.model = model
+
+    def extract_keywords(
+        self, texts: list[str], **kwargs: object
+    ) -> list[list[tuple[str, float]]]:
+        for text in texts:
+            if text == "crash":
+                os._exit(11)
+            if text == "hang":
+                time.sleep(60)
+            if text == "raise":
+                raise ValueError("bad input")
+        return [[(text.split()[0].lower(), 0.9)] for text in texts]
+
+
+class _BrokenModel:
+    def __init__(self, model: str) -> None:
+        raise ImportError("no keybert here")
+
+
+def _worker(**kwargs: object) -> EnrichmentWorker:
+    kwargs.setdefault("factory", f"{_MODULE}:_EchoModel")
+    return EnrichmentWorker("test/model", **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def worker():
+    w = _worker()
+    yield w
+    w.close()
+
+
+class TestLifecycle:
+    def test_extracts_in_child(self, worker: EnrichmentWorker) -> None:
+        assert worker.start() is True
+        assert worker.extract_keywords(["Alpha one", "Beta two"]) == [
+            [("alpha", 0.9)], [("beta", 0.9)],
+        ]
+        assert worker.starts == 1
+        assert worker.last_rss_mb >= 0
+
+    def test_model_load_failure(self) -> None:
+        worker = _worker(factory=f"{_MODULE}:_BrokenModel")
+        assert worker.start() is False
+        assert worker.is_running is False
+
+    def test_gives_up_after_restart_budget(self) -> None:
+        worker = _worker(
+            factory=f"{_MODULE}:_BrokenModel", max_restarts=2
+        )
+        assert worker.start() is False
+        assert worker.start() is False
+        assert worker.start() is False
+        assert worker.starts == 2
+
+    def test_model_error_keeps_child(
+        self, worker: EnrichmentWorker
+    ) -> None:
+        with pytest.raises(EnrichmentWorkerError, match="bad input"):
+            worker.extract_keywords(["raise"])
+        assert worker.is_running
+        assert worker.extract_keywords(["Gamma"]) == [[("gamma", 0.9)]]
+        assert worker.starts == 1
+
+
+class TestRecovery:
+    def test_crash_fails_batch_then_restarts(
+        self, worker: EnrichmentWorker
+    ) -> None:
+        with pytest.raises(EnrichmentWorkerError, match="died"):
+            worker.extract_keywords(["crash"])
+        assert worker.is_running is False
+        assert worker.extract_keywords(["Delta"]) == [[("delta", 0.9)]]
+        assert worker.restarts == 1
+
+    def test_hang_times_out(self) -> None:
+        worker = _worker(request_timeout=1.0)
+        try:
+            with pytest.raises(EnrichmentWorkerError, match="timed out"):
+                worker.extract_keywords(["hang"])
+            assert worker.is_running is False
+            assert worker.extract_keywords(["Eta"]) == [[("eta", 0.9)]]
+        finally:
+            worker.close()
+
+    def test_rss_threshold_recycles_child(self) -> None:
+        worker = _worker(max_rss_mb=1)
+        try:
+            assert worker.extract_keywords(["Zeta"]) == [[("zeta", 0.9)]]
+            # Reply delivered, then the child was retired.
+            assert worker.is_running is False
+            worker.extract_keywords(["Theta"])
+            assert worker.restarts == 1
+        finally:
+            worker.close()
+
+
+class TestEnricherWithWorker:
+    def test_worker_stands_in_for_model(
+        self, worker: EnrichmentWorker
+    ) -> None:
+        enricher = KeywordEnricher(model_name="test/model", worker=worker)
+        enricher._available = True
+        assert enricher.ensure_loaded() is True
+        assert enricher.is_loaded
+
+        heading = DocHeading(text="Tiers", level=1, start_line=1)
+        outline = DocOutline(file_path="a.md", headings=[heading])
+        body = "Tiering keeps prompts stable across many turns. " * 5
+        enricher.enrich_outline(outline, source_text="# Tiers\n" + body)
+        assert heading.keywords == ["tiering"]
+
+    def test_failed_load_marks_unavailable(self) -> None:
+        worker = _worker(factory=f"{_MODULE}:_BrokenModel")
+        enricher = KeywordEnricher(worker=worker)
+        enricher._available = True
+        assert enricher.ensure_loaded() is False
+        assert enricher.is_available() is False
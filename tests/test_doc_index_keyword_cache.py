@@ -0,0 +1,176 @@
+"""Tests for the per-section keyword cache.
+
+Covers :class:`ac_dc.doc_index.keyword_cache.KeywordCache` on
+its own — keying, parameter matching, the LRU bound, stats and
+pack persistence — and its use by
+:meth:`KeywordEnricher._run_keybert_batch`, where only sections
+whose text changed may reach the model.
+
+Governing spec: ``specs4/2-indexing/keyword-enrichment.md``
+§ Section Keyword Cache.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from ac_dc.config import _AC_DC_DIR
+from ac_dc.doc_index.keyword_cache import (
+    KeywordCache,
+    normalise_section_text,
+)
+from ac_dc.doc_index.keyword_enricher import KeywordEnricher
+from ac_dc.doc_index.models import DocHeading, DocOutline
+
+
+_MODEL = "test/model"
+_PARAMS = "1-2:5:0.5"
+
+
+class _CountingKeyBERT:
+    """Returns one keyword per text, named after its first word."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def extract_keywords(
+        self, texts: list[str], **kwargs: object
+    ) -> list[list[tuple[str, float]]]:
+        self.batches.append(list(texts))
+        return [[(text.split()[0].lower(), 0.9)] for text in texts]
+
+
+def _section(word: str) -> str:
+    return f"{word} " + "explains the tiered cache in some depth. " * 5
+
+
+def _outline_and_source(words: list[str]) -> tuple[DocOutline, str]:
+    lines: list[str] = []
+    headings: list[DocHeading] = []
+    for word in words:
+        headings.append(
+            DocHeading(text=word, level=2, start_line=len(lines) + 1)
+        )
+        lines.extend([f"## {word}", _section(word)])
+    return (
+        DocOutline(file_path="guide.md", headings=headings),
+        "\n".join(lines),
+    )
+
+
+class TestNormalisation:
+    def test_line_end_whitespace_ignored(self) -> None:
+        assert normalise_section_text("\n\na  \nb\t\n\n") == "a\nb"
+
+    def test_interior_structure_kept(self) -> None:
+        assert normalise_section_text("a\n\n  b") == "a\n\n  b"
+
+
+class TestLookup:
+    def test_miss_then_hit(self) -> None:
+        cache = KeywordCache()
+        assert cache.get(_MODEL, "text", _PARAMS) is None
+        cache.put(_MODEL, "text", _PARAMS, [("kw", 0.7)])
+        assert cache.get(_MODEL, "text  \n", _PARAMS) == [("kw", 0.7)]
+
+    def test_model_and_params_isolate_entries(self) -> None:
+        cache = KeywordCache()
+        cache.put(_MODEL, "text", _PARAMS, [("kw", 0.7)])
+        assert cache.get("other/model", "text", _PARAMS) is None
+        assert cache.get(_MODEL, "text", "1-1:5:0.5") is None
+
+    def test_lru_bound(self) -> None:
+        cache = KeywordCache(max_entries=2)
+        cache.put(_MODEL, "a", _PARAMS, [])
+        cache.put(_MODEL, "b", _PARAMS, [])
+        assert cache.get(_MODEL, "a", _PARAMS) == []
+        cache.put(_MODEL, "c", _PARAMS, [])
+        assert len(cache) == 2
+        assert cache.get(_MODEL, "b", _PARAMS) is None
+        assert cache.get(_MODEL, "a", _PARAMS) == []
+
+    def test_stats(self) -> None:
+        cache = KeywordCache()
+        assert cache.stats()["hit_rate"] is None
+        cache.put(_MODEL, "a", _PARAMS, [])
+        cache.get(_MODEL, "a", _PARAMS)
+        cache.get(_MODEL, "b", _PARAMS)
+        assert cache.stats() == {
+            "hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1,
+        }
+
+
+class TestPersistence:
+    def test_flush_and_reload(self, tmp_path: Path) -> None:
+        cache = KeywordCache(tmp_path)
+        cache.put(_MODEL, "a", _PARAMS, [("alpha", 0.8)])
+        cache.put(_MODEL, "b", _PARAMS, [("beta", 0.6)])
+        cache.flush()
+        reloaded = KeywordCache(tmp_path, max_entries=1)
+        # Recency order survives: only the newest fits.
+        assert reloaded.get(_MODEL, "a", _PARAMS) is None
+        assert reloaded.get(_MODEL, "b", _PARAMS) == [("beta", 0.6)]
+
+    def test_flush_skipped_when_clean(self, tmp_path: Path) -> None:
+        KeywordCache(tmp_path).flush()
+        assert not (tmp_path / _AC_DC_DIR / "keyword_cache.json").exists()
+
+    def test_version_mismatch_ignored(self, tmp_path: Path) -> None:
+        pack = tmp_path / _AC_DC_DIR / "keyword_cache.json"
+        pack.parent.mkdir(parents=True)
+        pack.write_text(json.dumps({"version": 0, "entries": []}))
+        assert len(KeywordCache(tmp_path)) == 0
+
+    def test_corrupt_pack_ignored(self, tmp_path: Path) -> None:
+        pack = tmp_path / _AC_DC_DIR / "keyword_cache.json"
+        pack.parent.mkdir(parents=True)
+        pack.write_text("{not json")
+        assert len(KeywordCache(tmp_path)) == 0
+
+
+class TestEnricherIntegration:
+    def _enricher(self) -> tuple[KeywordEnricher, _CountingKeyBERT]:
+        enricher = KeywordEnricher(model_name=_MODEL, cache=KeywordCache())
+        fake = _CountingKeyBERT()
+        enricher._available = True
+        enricher._model = fake
+        return enricher, fake
+
+    def test_only_changed_sections_reach_model(self) -> None:
+        enricher, fake = self._enricher()
+        outline, source = _outline_and_source(["Alpha", "Beta", "Gamma"])
+        enricher.enrich_outline(outline, source_text=source)
+        assert len(fake.batches[0]) == 3
+
+        outline, source = _outline_and_source(["Alpha", "Delta", "Gamma"])
+        enricher.enrich_outline(outline, source_text=source)
+        assert fake.batches[1] == [_section("Delta")]
+        assert [h.keywords for h in outline.headings] == [
+            ["alpha"], ["delta"], ["gamma"],
+        ]
+        assert enricher.cache is not None
+        assert enricher.cache.stats()["hits"] == 2
+
+    def test_fully_cached_outline_skips_model(self) -> None:
+        enricher, fake = self._enricher()
+        for _ in range(2):
+            outline, source = _outline_and_source(["Alpha", "Beta"])
+            enricher.enrich_outline(outline, source_text=source)
+        assert len(fake.batches) == 1
+        assert [h.keywords for h in outline.headings] == [
+            ["alpha"], ["beta"],
+        ]
+
+    def test_failed_batch_is_not_cached(self) -> None:
+        enricher, _ = self._enricher()
+
+        def _boom(texts: list[str], **kwargs: object) -> None:
+            raise RuntimeError("model crashed")
+
+        enricher._model.extract_keywords = _boom  # type: ignore[method-assign]
+        outline, source = _outline_and_source(["Alpha"])
+        enricher.enrich_outline(outline, source_text=source)
+        assert outline.headings[0].keywords == []
+        assert enricher.cache is not None
+        assert len(enricher.cache) == 0
@@ -870,6 +870,38 @@ class TestKeybertFailure:
         assert heading.keywords == []
 
 
+# ---------------------------------------------------------------------------
+# Cross-file batching
+# ---------------------------------------------------------------------------
+
+
+class TestEnrichOutlines:
+    def test_one_keybert_call_across_outlines(self) -> None:
+        """Long sections of every outline share one batch."""
+        enricher = KeywordEnricher()
+        fake = _FakeKeyBERT(results=[
+            [("alpha", 0.9)], [("beta", 0.9)],
+        ])
+        _install_fake_keybert(enricher, fake)
+        body = "prose describing the subject at some length. " * 5
+        items = []
+        headings = []
+        for name in ("Alpha", "Beta"):
+            heading = DocHeading(text=name, level=1, start_line=1)
+            headings.append(heading)
+            items.append((
+                DocOutline(file_path=f"{name}.md", headings=[heading]),
+                f"# {name}\n{name} {body}",
+            ))
+
+        result = enricher.enrich_outlines(items)
+
+        assert [o.file_path for o in result] == ["Alpha.md", "Beta.md"]
+        assert len(fake.calls) == 1
+        assert len(fake.calls[0]["texts"]) == 2  # type: ignore[arg-type]
+        assert [h.keywords for h in headings] == [["alpha"], ["beta"]]
+
+
 # ---------------------------------------------------------------------------
 # is_section_eligible
 # ---------------------------------------------------------------------------
@@ -16,12 +16,16 @@ Covers:
   non-None requires match on cache lookup.
 - **Reference graph integration** — incoming counts populated,
   cross-doc edges formed.
+- **Process-pool extraction** — parity with a serial pass,
+  per-shard progress, warm passes and pool failures stay
+  in-process.
 Uses real filesystem via ``tmp_path`` — no mock for the disk
 layer because the integration between cache, extractor, and
 reference index is part of the contract, and mocks would miss
 ordering / path-normalisation issues.
 """
 from __future__ import annotations
+import os
 from pathlib import Path
 import pytest
 from ac_dc.doc_index.extractors.markdown import MarkdownExtractor
@@ -420,6 +424,74 @@ class TestStaleRemoval:
         assert index._ref_index.file_ref_count("a.md") == 0
 
 
+# ---------------------------------------------------------------------------
+# Incremental reference graph
+# ---------------------------------------------------------------------------
+
+
+def _heading_counts(index: DocIndex) -> dict[str, int]:
+    return {
+        f"{path}#{h.text}": h.incoming_ref_count
+        for path, outline in sorted(index._all_outlines.items())
+        for h in outline.all_headings_flat
+    }
+
+
+class TestIncrementalReferenceGraph:
+    """Later passes replay only the changed documents' links."""
+
+    def _write_docs(self, repo_root: Path) -> list[str]:
+        files = []
+        for i in range(6):
+            nxt = (i + 1) % 6
+            _write(
+                repo_root / f"d{i}.md",
+                f"# Doc {i}\n\n## Usage\n\n"
+                f"[next](d{nxt}.md#usage)\n",
+            )
+            files.append(f"d{i}.md")
+        return files
+
+    def test_edit_updates_instead_of_rebuilding(
+        self,
+        index: DocIndex,
+        repo_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        files = self._write_docs(repo_root)
+        index.index_repo(files)
+        assert _heading_counts(index)["d3.md#Usage"] == 1
+
+        builds: list[int] = []
+        original = index._ref_index.build
+        monkeypatch.setattr(
+            index._ref_index, "build",
+            lambda outlines: builds.append(1) or original(outlines),
+        )
+        # d3's Usage heading renamed; d2's #usage link falls
+        # back to the document-level heading.
+        path = repo_root / "d3.md"
+        st = path.stat()
+        _write(path, "# Doc 3\n\n## Howto\n\n[next](d4.md#usage)\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        index.index_repo(files)
+
+        assert builds == []
+        counts = _heading_counts(index)
+        assert counts["d3.md#Doc 3"] == 1
+        assert counts["d3.md#Howto"] == 0
+        assert counts["d4.md#Usage"] == 1
+
+        fresh = DocIndex(repo_root)
+        fresh.index_repo(files)
+        assert _heading_counts(fresh) == counts
+        assert sorted(
+            sorted(c) for c in index._ref_index.connected_components()
+        ) == sorted(
+            sorted(c) for c in fresh._ref_index.connected_components()
+        )
+
+
 # ---------------------------------------------------------------------------
 # Invalidation
 # ---------------------------------------------------------------------------
@@ -617,6 +689,72 @@ class TestSignatureHash:
         assert h1 == h2
 
 
+class TestDirBlockCache:
+    """Per-directory blocks and hashes are cached until an input moves."""
+
+    def test_repeat_reads_skip_rendering(
+        self,
+        index: DocIndex,
+        repo_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _write(repo_root / "docs" / "a.md", "# A\n")
+        _write(repo_root / "docs" / "b.md", "# B\n")
+        _write(repo_root / "top.md", "# Top\n")
+        index.index_repo(["docs/a.md", "docs/b.md", "top.md"])
+        calls: list[str] = []
+        original = index.get_file_doc_block
+
+        def _spy(path):  # type: ignore[no-untyped-def]
+            calls.append(path)
+            return original(path)
+
+        monkeypatch.setattr(index, "get_file_doc_block", _spy)
+        first = index.get_dir_docs_block("docs")
+        assert index.get_dir_docs_block("docs") == first
+        assert calls == ["docs/a.md", "docs/b.md"]
+        assert index.get_indexed_directories() == ["", "docs"]
+
+    def test_edit_and_exclusion_invalidate(
+        self, index: DocIndex, repo_root: Path
+    ) -> None:
+        path = repo_root / "docs" / "a.md"
+        _write(path, "# A\n")
+        _write(repo_root / "docs" / "b.md", "# B\n")
+        index.index_repo(["docs/a.md", "docs/b.md"])
+        digest = index.get_dir_signature_hash("docs")
+        assert "# A" in index.get_dir_docs_block("docs")
+        assert "# A" not in index.get_dir_docs_block("docs", {"docs/a.md"})
+
+        st = path.stat()
+        _write(path, "# Renamed\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        index.index_file("docs/a.md")
+        assert "# Renamed" in index.get_dir_docs_block("docs")
+        assert index.get_dir_signature_hash("docs") != digest
+
+    def test_cross_directory_link_invalidates_target_block(
+        self, index: DocIndex, repo_root: Path
+    ) -> None:
+        source = repo_root / "x" / "a.md"
+        _write(source, "# A\n")
+        _write(repo_root / "y" / "b.md", "# B\n\n## Target\n")
+        files = ["x/a.md", "y/b.md"]
+        index.index_repo(files)
+        before = index.get_dir_docs_block("y")
+        assert "## Target ←" not in before
+
+        # Only x/ changes; y/'s incoming count moves with it.
+        st = source.stat()
+        _write(source, "# A\n\n[see](y/b.md#target)\n")
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        index.index_repo(files)
+        after = index.get_dir_docs_block("y")
+        assert "## Target ←1" in after
+        index._dir_block_cache.clear()
+        assert index.get_dir_docs_block("y") == after
+
+
 # ---------------------------------------------------------------------------
 # Snapshot discipline (D10)
 # ---------------------------------------------------------------------------
@@ -701,4 +839,85 @@ class TestSnapshotDiscipline:
         # objects in the same slots.
         assert set(index._all_outlines.keys()) == set(snapshot.keys())
         for key in snapshot:
-            assert index._all_outlines[key] is snapshot[key]
\ No newline at end of file
+            assert index._all_outlines[key] is snapshot[key]# ---------------------------------------------------------------------------
+# Process-pool extraction
+# ---------------------------------------------------------------------------
+def _write_linked_docs(root: Path, count: int) -> list[str]:
+    """Write ``count`` markdown docs, each linking the previous, plus an SVG."""
+    files: list[str] = []
+    for i in range(count):
+        body = f"# Doc {i}\n\n## Part {i}\n\nbody text.\n"
+        if i:
+            body += f"\nSee [previous](docs/doc{i - 1}.md).\n"
+        _write(root / "docs" / f"doc{i}.md", body)
+        files.append(f"docs/doc{i}.md")
+    _write(
+        root / "diagram.svg",
+        '<svg xmlns="http://www.w3.org/2000/svg">'
+        '<text x="1" y="1">Pipeline</text></svg>',
+    )
+    files.append("diagram.svg")
+    return files
+class TestParallelIndexing:
+    """Process-pool extraction produces the serial pass's result."""
+    @staticmethod
+    def _parallel(root: Path) -> DocIndex:
+        return DocIndex(
+            root, workers=2, parallel_min_files=1, shard_size=3
+        )
+    def test_matches_serial_result(self, tmp_path: Path) -> None:
+        serial_root, parallel_root = tmp_path / "s", tmp_path / "p"
+        files = _write_linked_docs(serial_root, 7)
+        _write_linked_docs(parallel_root, 7)
+        serial = DocIndex(serial_root)
+        serial.index_repo(files)
+        parallel = self._parallel(parallel_root)
+        parallel.index_repo(files)
+        assert list(parallel._all_outlines) == list(serial._all_outlines)
+        assert parallel.get_doc_map() == serial.get_doc_map()
+        # Parent-side reference graph and cache writes ran.
+        assert parallel._ref_index.file_ref_count("docs/doc0.md") == 1
+        assert parallel._cache.cached_paths == set(files)
+    def test_progress_reported_per_shard(self, repo_root: Path) -> None:
+        files = _write_linked_docs(repo_root, 6)
+        calls: list[tuple[int, int]] = []
+        self._parallel(repo_root).index_repo(
+            files, progress=lambda d, t: calls.append((d, t))
+        )
+        # Seven files in shards of three → three shards.
+        assert len(calls) == 3
+        assert calls[-1] == (7, 7)
+        assert [d for d, _ in calls] == sorted(d for d, _ in calls)
+    def test_cache_hits_stay_in_process(
+        self, repo_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        files = _write_linked_docs(repo_root, 3)
+        parallel = self._parallel(repo_root)
+        parallel.index_repo(files)
+        def _no_pool(*args: object, **kwargs: object) -> None:
+            raise AssertionError("pool started for a warm re-index")
+        monkeypatch.setattr(
+            "ac_dc.doc_index.index.ProcessPoolExecutor", _no_pool
+        )
+        parallel.index_repo(files)
+        assert len(parallel._all_outlines) == 4
+    def test_pool_failure_falls_back_to_serial(
+        self, repo_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        files = _write_linked_docs(repo_root, 3)
+        def _broken_pool(*args: object, **kwargs: object) -> None:
+            raise OSError("process creation not permitted")
+        monkeypatch.setattr(
+            "ac_dc.doc_index.index.ProcessPoolExecutor", _broken_pool
+        )
+        calls: list[tuple[int, int]] = []
+        parallel = self._parallel(repo_root)
+        parallel.index_repo(
+            files, progress=lambda d, t: calls.append((d, t))
+        )
+        assert len(parallel._all_outlines) == 4
+        assert calls[-1] == (4, 4)
+    def test_zero_workers_means_cpu_count(self, repo_root: Path) -> None:
+        assert DocIndex(repo_root, workers=0)._workers == (
+            os.cpu_count() or 1
+        )
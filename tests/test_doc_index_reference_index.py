@@ -829,4 +829,118 @@ class TestRealisticScenario:
         assert idx.bidirectional_edges() == {("a.md", "b.md")}
         components = idx.connected_components()
         assert len(components) == 1
-        assert components[0] == {"a.md", "b.md"}
\ No newline at end of file
+        assert components[0] == {"a.md", "b.md"}
+
+# ---------------------------------------------------------------------------
+# Incremental update
+# ---------------------------------------------------------------------------
+
+
+def _heading_counts(outlines: list[DocOutline]) -> dict[str, int]:
+    return {
+        f"{o.file_path}#{h.text}": h.incoming_ref_count
+        for o in outlines
+        for h in o.all_headings_flat
+    }
+
+
+def _doc_graph_state(idx: DocReferenceIndex) -> dict:
+    files = sorted(p for comp in idx.connected_components() for p in comp)
+    return {
+        "components": sorted(
+            sorted(comp) for comp in idx.connected_components()
+        ),
+        "incoming": {p: sorted(idx.files_referencing(p)) for p in files},
+        "counts": {p: idx.file_ref_count(p) for p in files},
+    }
+
+
+def _corpus() -> dict[str, DocOutline]:
+    """Small linked doc set — fresh objects on every call."""
+    return {
+        "a.md": _outline(
+            "a.md",
+            headings=[_h("A", children=[_h("Setup", 2)])],
+            links=[
+                _link("b.md#usage", source_heading="A"),
+                _link("c.md", source_heading="Setup"),
+            ],
+        ),
+        "b.md": _outline(
+            "b.md",
+            headings=[_h("B", children=[_h("Usage", 2)])],
+            links=[_link("a.md#setup", source_heading="B")],
+        ),
+        "c.md": _outline(
+            "c.md",
+            headings=[_h("C")],
+            links=[_link("b.md", source_heading="C")],
+        ),
+    }
+
+
+class TestIncrementalUpdate:
+    """update() matches build() over the same final outline set."""
+
+    def test_edited_target_headings_recounted(self) -> None:
+        outlines = _corpus()
+        idx = DocReferenceIndex()
+        idx.build(list(outlines.values()))
+        # b.md's Usage heading is renamed — a.md's #usage
+        # link now falls back to the top-level heading.
+        edited = _outline(
+            "b.md",
+            headings=[_h("B", children=[_h("Howto", 2)])],
+            links=[_link("a.md#setup", source_heading="B")],
+        )
+        outlines["b.md"] = edited
+        idx.update([edited])
+        counts = _heading_counts(list(outlines.values()))
+        # a.md → b (fallback) plus c.md → b (document-level).
+        assert counts["b.md#B"] == 2
+        assert counts["b.md#Howto"] == 0
+        # Counts on unchanged outlines are not double-applied.
+        assert counts["a.md#Setup"] == 1
+        assert counts["c.md#C"] == 1
+
+        fresh = DocReferenceIndex()
+        fresh.build(list(outlines.values()))
+        assert _heading_counts(list(outlines.values())) == counts
+        assert _doc_graph_state(idx) == _doc_graph_state(fresh)
+
+    def test_edited_source_links_replayed(self) -> None:
+        outlines = _corpus()
+        idx = DocReferenceIndex()
+        idx.build(list(outlines.values()))
+        edited = _outline(
+            "a.md",
+            headings=[_h("A", children=[_h("Setup", 2)])],
+            links=[_link("c.md", source_heading="Setup")],
+        )
+        outlines["a.md"] = edited
+        idx.update([edited])
+        counts = _heading_counts(list(outlines.values()))
+        assert counts["b.md#Usage"] == 0
+        # b.md → a.md#setup resolved against the new outline.
+        assert counts["a.md#Setup"] == 1
+
+        fresh = DocReferenceIndex()
+        fresh.build(list(outlines.values()))
+        assert _heading_counts(list(outlines.values())) == counts
+        assert _doc_graph_state(idx) == _doc_graph_state(fresh)
+
+    def test_removed_document(self) -> None:
+        outlines = _corpus()
+        idx = DocReferenceIndex()
+        idx.build(list(outlines.values()))
+        del outlines["c.md"]
+        idx.update([], removed=["c.md"])
+        counts = _heading_counts(list(outlines.values()))
+        assert counts["b.md#B"] == 0
+
+        fresh = DocReferenceIndex()
+        fresh.build(list(outlines.values()))
+        assert _heading_counts(list(outlines.values())) == counts
+        assert _doc_graph_state(idx) == _doc_graph_state(fresh)
+        # Still linked from a.md, so still a known file.
+        assert idx.file_ref_count("c.md") == 1
@@ -23,10 +23,12 @@ fixtures keep the tests readable.
 
 from __future__ import annotations
 
+import random
 from pathlib import Path
 
 import pytest
 
+from ac_dc.doc_index.extractors import svg as svg_module
 from ac_dc.doc_index.extractors.svg import (
     SvgExtractor,
     _local_name,
@@ -1402,6 +1404,64 @@ class TestContainmentNestedTexts:
         assert outer_text_children == []
 
 
+class _LinearIndex:
+    """Stand-in for BoxIndex that returns every shape — the old scan."""
+
+    def __init__(self, boxes: list) -> None:
+        self._all = list(range(len(boxes)))
+
+    def candidates(self, x: float, y: float) -> list[int]:
+        return self._all
+
+
+def _synthetic_diagram(seed: int, groups: int) -> str:
+    """Nested boxes and labels with deliberate ties and shared edges."""
+    rng = random.Random(seed)
+    parts: list[str] = []
+    for g in range(groups):
+        gx, gy = (g % 8) * 120, (g // 8) * 120
+        parts.append(
+            f'<g aria-label="Group {g}"><rect x="{gx}" y="{gy}" '
+            f'width="110" height="110"/></g>'
+        )
+        for k in range(rng.randint(1, 5)):
+            w, h = rng.choice([20, 30, 50]), rng.choice([20, 30, 50])
+            x = gx + rng.choice([0, 5, 10, 30, 60])
+            y = gy + rng.choice([0, 5, 10, 30, 60])
+            parts.append(
+                f'<rect x="{x}" y="{y}" width="{w}" height="{h}"/>'
+            )
+            if rng.random() < 0.3:
+                # Identical duplicate — exercises the tie rule.
+                parts.append(
+                    f'<rect x="{x}" y="{y}" width="{w}" height="{h}"/>'
+                )
+            parts.append(
+                f'<text x="{x + rng.choice([0, 5, w])}" '
+                f'y="{y + rng.choice([0, 8, h])}">g{g} item {k}</text>'
+            )
+    parts.append('<text x="5000" y="5000">Legend</text>')
+    return _wrap_ns("".join(parts))
+
+
+class TestContainmentIndexEquivalence:
+    """The spatial index changes nothing about the outline."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4])
+    def test_matches_linear_scan(
+        self,
+        extractor: SvgExtractor,
+        monkeypatch: pytest.MonkeyPatch,
+        seed: int,
+    ) -> None:
+        svg = _synthetic_diagram(seed, groups=40)
+        indexed = _extract(extractor, svg)
+        monkeypatch.setattr(svg_module, "BoxIndex", _LinearIndex)
+        linear = _extract(extractor, svg)
+        assert indexed == linear
+        assert indexed.headings
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
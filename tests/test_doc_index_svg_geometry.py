@@ -7,6 +7,7 @@ Pure-function tests covering:
 - Matrix composition and point transformation
 - Shape bounding boxes (rect, circle, ellipse, polygon, path)
 - Containment checks
+- The containment spatial index
 
 All tests use exact float arithmetic where possible; where
 floating-point drift is expected (rotation, compose chains),
@@ -19,11 +20,13 @@ No SVG tree parsing here — those tests live with the extractor
 from __future__ import annotations
 
 import math
+import random
 
 import pytest
 
 from ac_dc.doc_index.extractors.svg_geometry import (
     BBox,
+    BoxIndex,
     IDENTITY,
     Matrix,
     _parse_number,
@@ -535,4 +538,44 @@ class TestPointInBox:
 
     def test_degenerate_box_rejects_all(self) -> None:
         box = BBox(0, 0, 0, 100)
-        assert point_in_box(box, 0, 50) is False
\ No newline at end of file
+        assert point_in_box(box, 0, 50) is False
+
+class TestBoxIndex:
+    """Candidates are an ascending superset of the exact hits."""
+
+    def _exact(self, boxes: list[BBox], x: float, y: float) -> list[int]:
+        return [i for i, b in enumerate(boxes) if point_in_box(b, x, y)]
+
+    def test_superset_of_point_in_box(self) -> None:
+        rng = random.Random(7)
+        boxes = [
+            BBox(
+                rng.uniform(0, 900), rng.uniform(0, 900),
+                rng.choice([0, rng.uniform(1, 50), rng.uniform(100, 900)]),
+                rng.uniform(1, 120),
+            )
+            for _ in range(400)
+        ]
+        index = BoxIndex(boxes)
+        for _ in range(2000):
+            x, y = rng.uniform(-50, 1100), rng.uniform(-50, 1100)
+            found = index.candidates(x, y)
+            assert found == sorted(found)
+            assert set(self._exact(boxes, x, y)) <= set(found)
+            assert all(boxes[i].width > 0 for i in found)
+
+    def test_edges_and_corners_are_found(self) -> None:
+        boxes = [BBox(0, 0, 10, 10), BBox(10, 10, 10, 10)]
+        index = BoxIndex(boxes)
+        assert index.candidates(10, 10) == [0, 1]
+        assert 1 in index.candidates(20, 20)
+
+    def test_non_finite_inputs(self) -> None:
+        boxes = [BBox(0, 0, 10, 10), BBox(0, 0, math.inf, 10)]
+        index = BoxIndex(boxes)
+        assert 1 in index.candidates(5, 5)
+        assert index.candidates(math.nan, 5) == [0, 1]
+
+    def test_empty_and_degenerate(self) -> None:
+        assert BoxIndex([]).candidates(0, 0) == []
+        assert BoxIndex([BBox(0, 0, 0, 5)]).candidates(0, 0) == []
@@ -515,4 +515,103 @@ class TestTokenCounting:
         # Fenced count ≥ raw count (fences add tokens).
         raw = counter.count("x = 1")
         total = ctx.count_tokens(counter)
-        assert total >= raw
\ No newline at end of file
+        assert total >= raw
+
+# ---------------------------------------------------------------------------
+# Cached per-file hash and token count
+# ---------------------------------------------------------------------------
+
+
+class _CountingCounter:
+    """Counter double recording which texts reach count_many."""
+
+    def __init__(self, model: str = "m") -> None:
+        self.model = model
+        self.seen: list[str] = []
+
+    def count_many(self, texts: list[str]) -> list[int]:
+        self.seen.extend(texts)
+        return [len(t) for t in texts]
+
+
+class TestContentMetadata:
+    """get_content_hash and get_content_token_counts."""
+
+    def test_hash_is_sha256_of_content(self) -> None:
+        import hashlib
+
+        ctx = FileContext()
+        ctx.add_file("a.py", "x = 1")
+        assert ctx.get_content_hash("a.py") == hashlib.sha256(
+            b"x = 1"
+        ).hexdigest()
+        assert ctx.get_content_hash("missing.py") is None
+
+    def test_hash_computed_once_until_content_changes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import hashlib
+
+        from ac_dc import file_context as fc_module
+
+        calls: list[bytes] = []
+
+        class _Hashlib:
+            @staticmethod
+            def sha256(data: bytes) -> "hashlib._Hash":
+                calls.append(data)
+                return hashlib.sha256(data)
+
+        monkeypatch.setattr(fc_module, "hashlib", _Hashlib)
+        ctx = FileContext()
+        ctx.add_file("a.py", "v1")
+        first = ctx.get_content_hash("a.py")
+        # Re-adding identical content keeps the cached digest.
+        ctx.add_file("a.py", "v" + "1")
+        assert ctx.get_content_hash("a.py") == first
+        assert calls == [b"v1"]
+        ctx.add_file("a.py", "v2")
+        assert ctx.get_content_hash("a.py") != first
+        assert calls == [b"v1", b"v2"]
+
+    def test_token_counts_cached_and_batched(self) -> None:
+        counter = _CountingCounter()
+        ctx = FileContext()
+        ctx.add_file("a.py", "aaa")
+        ctx.add_file("b.py", "bbbbb")
+        assert ctx.get_content_token_counts(counter) == {
+            "a.py": 3, "b.py": 5,
+        }
+        assert ctx.get_content_token_counts(counter) == {
+            "a.py": 3, "b.py": 5,
+        }
+        assert counter.seen == ["aaa", "bbbbb"]
+
+        ctx.add_file("b.py", "bb")
+        assert ctx.get_content_token_counts(counter, ["b.py", "a.py"]) == {
+            "b.py": 2, "a.py": 3,
+        }
+        assert counter.seen[-1] == "bb"
+        assert len(counter.seen) == 3
+
+    def test_token_counts_keyed_by_model(self) -> None:
+        ctx = FileContext()
+        ctx.add_file("a.py", "aaa")
+        ctx.get_content_token_counts(_CountingCounter("m1"))
+        other = _CountingCounter("m2")
+        ctx.get_content_token_counts(other)
+        assert other.seen == ["aaa"]
+
+    def test_remove_and_clear_drop_metadata(self) -> None:
+        counter = _CountingCounter()
+        ctx = FileContext()
+        ctx.add_file("a.py", "aaa")
+        ctx.get_content_token_counts(counter)
+        ctx.remove_file("a.py")
+        assert ctx.get_content_token_counts(counter, ["a.py"]) == {}
+        ctx.add_file("a.py", "aaa")
+        ctx.get_content_token_counts(counter)
+        ctx.clear()
+        ctx.add_file("a.py", "aaa")
+        ctx.get_content_token_counts(counter)
+        assert counter.seen == ["aaa", "aaa", "aaa"]
@@ -0,0 +1,197 @@
+"""Tests for ac_dc.history_index — session offset index.
+
+Scope: HistoryIndex — sidecar persistence, validation against
+the JSONL file's size/mtime/tail signature, tail scans for
+external appends, full rebuilds on rewrite, and seek-based
+record reads. Exercised through :class:`HistoryStore` where
+possible since that's the only production caller.
+
+Strategy mirrors test_history_store: real filesystem, one
+tmp ``.ac-dc4/`` per test.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ac_dc import history_index
+from ac_dc.history_index import HistoryIndex
+from ac_dc.history_store import HistoryStore
+
+
+@pytest.fixture
+def ac_dc_dir(tmp_path: Path) -> Path:
+    d = tmp_path / ".ac-dc4"
+    d.mkdir()
+    return d
+
+
+def _count_scans(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Record the start offset of every scan the index runs."""
+    starts: list[int] = []
+    original = HistoryIndex._scan_from
+
+    def _spy(self: HistoryIndex, start: int) -> None:
+        starts.append(start)
+        original(self, start)
+
+    monkeypatch.setattr(HistoryIndex, "_scan_from", _spy)
+    return starts
+
+
+class TestSidecar:
+    """Sidecar lifecycle."""
+
+    def test_sidecar_written_after_first_read(
+        self, ac_dc_dir: Path
+    ) -> None:
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "hello")
+        store.list_sessions()
+        store._index.flush()
+        data = json.loads(
+            (ac_dc_dir / "history.index.json").read_text()
+        )
+        assert sid in data["sessions"]
+        assert data["sessions"][sid]["offsets"] == [0]
+
+    def test_warm_start_skips_scan(
+        self, ac_dc_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        for i in range(5):
+            store.append_message(sid, "user", f"m{i}")
+        store._index.flush()
+
+        starts = _count_scans(monkeypatch)
+        fresh = HistoryStore(ac_dc_dir)
+        summaries = fresh.list_sessions()
+        assert summaries[0].message_count == 5
+        assert starts == []
+
+    def test_store_flush_writes_pending_appends(
+        self, ac_dc_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        for i in range(3):
+            store.append_message(sid, "user", f"m{i}")
+        store.flush()
+
+        starts = _count_scans(monkeypatch)
+        assert HistoryStore(ac_dc_dir).list_sessions()[0].message_count == 3
+        assert starts == []
+
+    def test_unflushed_appends_recovered_by_tail_scan(
+        self, ac_dc_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Appends after the last flush are scanned, not rebuilt."""
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "flushed")
+        store._index.flush()
+        flushed_size = (ac_dc_dir / "history.jsonl").stat().st_size
+        store.append_message(sid, "assistant", "not flushed")
+
+        starts = _count_scans(monkeypatch)
+        fresh = HistoryStore(ac_dc_dir)
+        msgs = fresh.get_session_messages(sid)
+        assert [m["content"] for m in msgs] == ["flushed", "not flushed"]
+        assert starts == [flushed_size]
+
+    def test_corrupt_sidecar_triggers_rebuild(
+        self, ac_dc_dir: Path
+    ) -> None:
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "hi")
+        store._index.flush()
+        (ac_dc_dir / "history.index.json").write_text("{not json")
+        fresh = HistoryStore(ac_dc_dir)
+        assert [s.session_id for s in fresh.list_sessions()] == [sid]
+
+    def test_flush_threshold_rewrites_sidecar(
+        self, ac_dc_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(history_index, "_FLUSH_EVERY_APPENDS", 2)
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "a")
+        store.append_message(sid, "user", "b")
+        data = json.loads(
+            (ac_dc_dir / "history.index.json").read_text()
+        )
+        assert len(data["sessions"][sid]["offsets"]) == 2
+
+
+class TestValidation:
+    """External modifications to the JSONL file."""
+
+    def test_external_append_visible(self, ac_dc_dir: Path) -> None:
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "ours")
+        store.list_sessions()
+        # Another process appends a record for a new session.
+        with (ac_dc_dir / "history.jsonl").open("a") as fh:
+            fh.write(json.dumps({
+                "id": "x", "session_id": "sess_other",
+                "timestamp": "2099-01-01T00:00:00Z",
+                "role": "user", "content": "theirs",
+            }) + "\n")
+        summaries = store.list_sessions()
+        assert summaries[0].session_id == "sess_other"
+        assert store.get_session_messages("sess_other")[0][
+            "content"
+        ] == "theirs"
+
+    def test_rewrite_triggers_full_rebuild(
+        self, ac_dc_dir: Path
+    ) -> None:
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "original message")
+        store.list_sessions()
+        # Rewrite the file with different, longer content.
+        (ac_dc_dir / "history.jsonl").write_text(
+            json.dumps({
+                "id": "y", "session_id": "sess_new",
+                "timestamp": "2024-01-01T00:00:00Z",
+                "role": "user", "content": "replacement " * 20,
+            }) + "\n"
+        )
+        assert [s.session_id for s in store.list_sessions()] == [
+            "sess_new"
+        ]
+        assert store.get_session_messages(sid) == []
+
+    def test_deleted_file_empties_index(self, ac_dc_dir: Path) -> None:
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "hi")
+        (ac_dc_dir / "history.jsonl").unlink()
+        assert store.list_sessions() == []
+        assert store.get_session_messages(sid) == []
+
+
+class TestSeekReads:
+    """Per-session reads only touch that session's lines."""
+
+    def test_interleaved_sessions_read_by_offset(
+        self, ac_dc_dir: Path
+    ) -> None:
+        store = HistoryStore(ac_dc_dir)
+        a = HistoryStore.new_session_id()
+        b = HistoryStore.new_session_id() + "b"
+        for i in range(10):
+            store.append_message(a, "user", f"a{i}")
+            store.append_message(b, "user", f"b{i}")
+        msgs = store.get_session_messages_for_context(b)
+        assert [m["content"] for m in msgs] == [
+            f"b{i}" for i in range(10)
+        ]
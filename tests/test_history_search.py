@@ -0,0 +1,239 @@
+"""Tests for ac_dc.history_search — full-text history index.
+
+Scope: query translation (:func:`build_match_expression`) and
+:class:`HistorySearchIndex` as driven through
+:meth:`HistoryStore.search_messages` — prefix and phrase
+matching, ranking, filters, pagination, agent-archive coverage,
+catch-up after external writes, and the substring fallback.
+
+Strategy mirrors test_history_store: real filesystem, one
+tmp ``.ac-dc4/`` per test.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ac_dc.history_search import build_match_expression
+from ac_dc.history_store import HistoryStore
+
+
+@pytest.fixture
+def ac_dc_dir(tmp_path: Path) -> Path:
+    d = tmp_path / ".ac-dc4"
+    d.mkdir()
+    return d
+
+
+@pytest.fixture
+def store(ac_dc_dir: Path) -> HistoryStore:
+    return HistoryStore(ac_dc_dir)
+
+
+class TestMatchExpression:
+    """User query → FTS5 MATCH string."""
+
+    def test_bare_words_become_prefix_terms(self) -> None:
+        assert build_match_expression("Foo bar") == '"foo"* "bar"*'
+
+    def test_quoted_phrase_kept_together(self) -> None:
+        assert (
+            build_match_expression('"token budget" cache')
+            == '"token budget" "cache"*'
+        )
+
+    def test_operators_are_neutralised(self) -> None:
+        # FTS5 keywords and syntax are quoted, never interpreted.
+        assert build_match_expression("a OR b*") == '"a"* "or"* "b"*'
+
+    def test_no_word_tokens_returns_none(self) -> None:
+        assert build_match_expression("-> {}") is None
+
+
+class TestFullTextSearch:
+    """Ranked search through the store."""
+
+    def test_prefix_match(self, store: HistoryStore) -> None:
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "refactoring the parser")
+        hits = store.search_messages("refact")
+        assert [h["content_preview"] for h in hits] == [
+            "refactoring the parser"
+        ]
+
+    def test_phrase_requires_adjacency(self, store: HistoryStore) -> None:
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "cache the token budget")
+        store.append_message(sid, "user", "token spent on a budget")
+        hits = store.search_messages('"token budget"')
+        assert [h["content_preview"] for h in hits] == [
+            "cache the token budget"
+        ]
+
+    def test_all_terms_required(self, store: HistoryStore) -> None:
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "alpha beta")
+        store.append_message(sid, "user", "alpha only")
+        hits = store.search_messages("alpha beta")
+        assert len(hits) == 1
+
+    def test_ranked_by_relevance(self, store: HistoryStore) -> None:
+        sid = HistoryStore.new_session_id()
+        store.append_message(
+            sid, "user", "parser " + "unrelated words here " * 20
+        )
+        store.append_message(sid, "user", "parser parser parser")
+        hits = store.search_messages("parser")
+        assert hits[0]["content_preview"] == "parser parser parser"
+        assert hits[0]["score"] >= hits[1]["score"]
+
+    def test_hit_shape(self, store: HistoryStore) -> None:
+        sid = HistoryStore.new_session_id()
+        rec = store.append_message(sid, "assistant", "hello world")
+        [hit] = store.search_messages("hello")
+        assert hit["session_id"] == sid
+        assert hit["message_id"] == rec["id"]
+        assert hit["role"] == "assistant"
+        assert hit["timestamp"] == rec["timestamp"]
+        assert hit["source"] == "main"
+
+    def test_session_filter(self, store: HistoryStore) -> None:
+        a = HistoryStore.new_session_id()
+        b = HistoryStore.new_session_id() + "b"
+        store.append_message(a, "user", "needle one")
+        store.append_message(b, "user", "needle two")
+        hits = store.search_messages("needle", session_id=b)
+        assert [h["session_id"] for h in hits] == [b]
+
+    def test_date_filters(self, ac_dc_dir: Path) -> None:
+        lines = [
+            {"id": f"m{i}", "session_id": "s", "role": "user",
+             "timestamp": f"2024-0{i}-01T00:00:00Z",
+             "content": f"needle {i}"}
+            for i in range(1, 5)
+        ]
+        (ac_dc_dir / "history.jsonl").write_text(
+            "".join(json.dumps(r) + "\n" for r in lines)
+        )
+        store = HistoryStore(ac_dc_dir)
+        hits = store.search_messages(
+            "needle",
+            since="2024-02-01T00:00:00Z",
+            until="2024-03-01T00:00:00Z",
+        )
+        assert sorted(h["message_id"] for h in hits) == ["m2", "m3"]
+
+    def test_pagination(self, store: HistoryStore) -> None:
+        sid = HistoryStore.new_session_id()
+        for i in range(7):
+            store.append_message(sid, "user", f"needle {i}")
+        first = store.search_messages("needle", limit=3)
+        second = store.search_messages("needle", limit=3, offset=3)
+        rest = store.search_messages("needle", offset=6)
+        ids = [h["message_id"] for h in first + second + rest]
+        assert len(ids) == 7
+        assert len(set(ids)) == 7
+
+
+class TestAgentArchives:
+    """Agent turn archives are searchable."""
+
+    def test_agent_message_found(self, store: HistoryStore) -> None:
+        store.append_agent_message(
+            "turn_1", 2, "assistant", "agent found the bug",
+            session_id="sess_x",
+        )
+        [hit] = store.search_messages("bug")
+        assert hit["source"] == "agent"
+        assert hit["turn_id"] == "turn_1"
+        assert hit["agent_idx"] == 2
+
+    def test_agents_excluded_on_request(
+        self, store: HistoryStore
+    ) -> None:
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "bug report")
+        store.append_agent_message("turn_1", 0, "assistant", "bug fix")
+        hits = store.search_messages("bug", include_agents=False)
+        assert [h["source"] for h in hits] == ["main"]
+
+    def test_existing_archives_indexed_on_first_query(
+        self, ac_dc_dir: Path
+    ) -> None:
+        turn_dir = ac_dc_dir / "agents" / "turn_9"
+        turn_dir.mkdir(parents=True)
+        (turn_dir / "agent-00.jsonl").write_text(json.dumps({
+            "id": "a", "turn_id": "turn_9", "agent_idx": 0,
+            "timestamp": "2024-01-01T00:00:00Z",
+            "role": "assistant", "content": "archived finding",
+        }) + "\n")
+        store = HistoryStore(ac_dc_dir)
+        assert len(store.search_messages("finding")) == 1
+
+
+class TestCatchUp:
+    """Writes that bypass the store are picked up at query time."""
+
+    def test_external_append_indexed(
+        self, ac_dc_dir: Path, store: HistoryStore
+    ) -> None:
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "ours")
+        assert store.search_messages("ours")
+        with (ac_dc_dir / "history.jsonl").open("a") as fh:
+            fh.write(json.dumps({
+                "id": "x", "session_id": "other",
+                "timestamp": "2099-01-01T00:00:00Z",
+                "role": "user", "content": "theirs",
+            }) + "\n")
+        assert [h["message_id"] for h in store.search_messages("theirs")] \
+            == ["x"]
+        # Our earlier record isn't duplicated by the catch-up.
+        assert len(store.search_messages("ours")) == 1
+
+    def test_rewritten_file_reindexed(
+        self, ac_dc_dir: Path, store: HistoryStore
+    ) -> None:
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "original")
+        assert store.search_messages("original")
+        (ac_dc_dir / "history.jsonl").write_text(json.dumps({
+            "id": "y", "session_id": "s",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "role": "user", "content": "replacement " * 20,
+        }) + "\n")
+        assert store.search_messages("original") == []
+        assert len(store.search_messages("replacement")) == 1
+
+    def test_index_survives_restart(self, ac_dc_dir: Path) -> None:
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "persisted")
+        fresh = HistoryStore(ac_dc_dir)
+        assert len(fresh.search_messages("persisted")) == 1
+
+    def test_deleted_database_rebuilt(self, ac_dc_dir: Path) -> None:
+        store = HistoryStore(ac_dc_dir)
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "rebuild me")
+        store._search_index.close()
+        for path in ac_dc_dir.glob("history_search.db*"):
+            path.unlink()
+        fresh = HistoryStore(ac_dc_dir)
+        assert len(fresh.search_messages("rebuild")) == 1
+
+
+class TestSubstringFallback:
+    """Queries the index can't express still work."""
+
+    def test_punctuation_query(self, store: HistoryStore) -> None:
+        sid = HistoryStore.new_session_id()
+        store.append_message(sid, "user", "use a -> b arrow")
+        store.append_message(sid, "user", "no arrow here")
+        hits = store.search_messages("->")
+        assert [h["content_preview"] for h in hits] == [
+            "use a -> b arrow"
+        ]
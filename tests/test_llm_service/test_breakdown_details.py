@@ -13,6 +13,9 @@ Covers:
 
 Both fields drive the expandable UI chunks on the Context tab.
 
+- :class:`TestBreakdownTokenCountCache` — token-count memo
+  statistics summed across the service and context counters.
+
 Governing spec: :doc:`specs4/5-webapp/viewers-hud`.
 """
 
@@ -394,6 +397,28 @@ class TestBreakdownSymbolMapDetails:
         assert per_file_sum >= aggregate // 2
 
 
+class TestBreakdownTokenCountCache:
+    """``token_count_cache`` — the Token HUD's Count Cache row."""
+
+    def test_shape(self, service: LLMService) -> None:
+        memo = service.get_context_breakdown()["token_count_cache"]
+        assert set(memo) == {
+            "hits", "misses", "entries", "capacity", "hit_rate",
+        }
+        assert memo["capacity"] > 0
+
+    def test_sums_service_and_context_counters(
+        self, service: LLMService
+    ) -> None:
+        service._counter._memo_hits = 3
+        service._counter._memo_misses = 1
+        service._context.counter._memo_hits = 1
+        memo = service.get_context_breakdown()["token_count_cache"]
+        assert memo["hits"] >= 4
+        assert memo["hit_rate"] is not None
+        assert 0.0 < memo["hit_rate"] <= 1.0
+
+
 class TestBreakdownAgentTag:
     """``get_context_breakdown(agent_tag)`` routing.
 
@@ -0,0 +1,236 @@
+"""Incremental context breakdown and its pushed deltas.
+
+Covers:
+
+- :class:`TestMapDetailCache` — per-directory map details are
+  re-rendered only when the directory's dir-block version
+  moves.
+- :class:`TestBreakdownDelta` — the patch between two
+  published breakdowns.
+- :class:`TestPublish` — version stamping, the first
+  checkpoint, delta broadcast, agent scopes staying RPC-only,
+  the post-response push ordering, and the push after a
+  cancelled stream.
+
+Governing spec: :doc:`specs4/5-webapp/viewers-hud` § Pushed
+updates.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ac_dc.context_manager import Mode
+from ac_dc.doc_index.extractors.markdown import MarkdownExtractor
+from ac_dc.history_store import HistoryStore
+from ac_dc.llm._breakdown_cache import BreakdownCache, breakdown_delta
+from ac_dc.llm_service import LLMService
+
+from .conftest import _FakeLiteLLM, _RecordingEventCallback
+
+
+def _seed_docs(service: LLMService, paths: list[str]) -> None:
+    extractor = MarkdownExtractor()
+    for path in paths:
+        service._doc_index._all_outlines[path] = extractor.extract(
+            Path(path), f"# Title {path}\n\nsome body.\n"
+        )
+
+
+def _count_renders(
+    service: LLMService, monkeypatch: pytest.MonkeyPatch
+) -> list[str]:
+    rendered: list[str] = []
+    original = service._doc_index.get_file_doc_block
+
+    def _spy(path: str) -> str:
+        rendered.append(path)
+        return original(path)
+
+    monkeypatch.setattr(service._doc_index, "get_file_doc_block", _spy)
+    return rendered
+
+
+def _pushes(event_cb: _RecordingEventCallback) -> list[tuple[str, Any]]:
+    return [
+        (name, args[0]) for name, args in event_cb.events
+        if name.startswith("contextBreakdown")
+    ]
+
+
+class TestMapDetailCache:
+    """Only directories whose block version moved are recounted."""
+
+    @pytest.fixture
+    def doc_service(self, service: LLMService) -> LLMService:
+        _seed_docs(service, ["docs/a.md", "docs/b.md", "README.md"])
+        service._context.set_mode(Mode.DOC)
+        service._trackers[Mode.DOC] = service._stability_tracker
+        return service
+
+    def test_repeat_call_renders_nothing(
+        self, doc_service: LLMService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        first = doc_service.get_context_breakdown()["breakdown"]
+        rendered = _count_renders(doc_service, monkeypatch)
+        second = doc_service.get_context_breakdown()["breakdown"]
+        assert rendered == []
+        assert second["symbol_map_details"] == first["symbol_map_details"]
+        assert second["symbol_map"] == first["symbol_map"] > 0
+
+    def test_changed_directory_rerendered_alone(
+        self, doc_service: LLMService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        doc_service.get_context_breakdown()
+        rendered = _count_renders(doc_service, monkeypatch)
+        _seed_docs(doc_service, ["docs/c.md"])
+        details = doc_service.get_context_breakdown()["breakdown"][
+            "symbol_map_details"
+        ]
+        assert sorted(rendered) == ["docs/a.md", "docs/b.md", "docs/c.md"]
+        assert "docs/c.md" in [d["path"] for d in details]
+
+    def test_exclusion_change_drops_row(
+        self, doc_service: LLMService
+    ) -> None:
+        doc_service.get_context_breakdown()
+        doc_service._excluded_index_files = ["docs/a.md"]
+        details = doc_service.get_context_breakdown()["breakdown"][
+            "symbol_map_details"
+        ]
+        assert sorted(d["path"] for d in details) == [
+            "README.md", "docs/b.md",
+        ]
+
+
+class TestBreakdownDelta:
+    """Patch shape between two breakdowns."""
+
+    def _breakdown(self, **overrides: Any) -> dict[str, Any]:
+        base: dict[str, Any] = {
+            "total_tokens": 100,
+            "blocks": [
+                {"name": "L0", "tokens": 60},
+                {"name": "active", "tokens": 40},
+            ],
+            "breakdown": {
+                "files": 40,
+                "file_details": [
+                    {"name": "a.py", "path": "a.py", "tokens": 10},
+                    {"name": "b.py", "path": "b.py", "tokens": 30},
+                ],
+                "url_details": [],
+            },
+        }
+        base.update(overrides)
+        return base
+
+    def test_identical_breakdowns_have_no_delta(self) -> None:
+        assert breakdown_delta(self._breakdown(), self._breakdown()) is None
+
+    def test_changed_rows_only(self) -> None:
+        new = self._breakdown(total_tokens=90)
+        new["breakdown"]["files"] = 30
+        new["breakdown"]["file_details"] = [
+            {"name": "b.py", "path": "b.py", "tokens": 20},
+            {"name": "c.py", "path": "c.py", "tokens": 10},
+        ]
+        delta = breakdown_delta(self._breakdown(), new)
+        assert delta is not None
+        assert delta["set"] == {"total_tokens": 90}
+        assert delta["breakdown"] == {"files": 30}
+        patch = delta["details"]["file_details"]
+        assert [r["path"] for r in patch["upsert"]] == ["b.py", "c.py"]
+        assert patch["remove"] == ["a.py"]
+        assert "order" not in patch
+        assert delta["blocks"] is None
+
+    def test_reorder_carries_order(self) -> None:
+        new = self._breakdown()
+        new["blocks"] = list(reversed(new["blocks"]))
+        delta = breakdown_delta(self._breakdown(), new)
+        assert delta is not None
+        assert delta["blocks"] == {
+            "upsert": [], "remove": [], "order": ["active", "L0"],
+        }
+
+
+class TestPublish:
+    """Versioned checkpoint + delta pushes for the main scope."""
+
+    def test_cache_versions(self) -> None:
+        cache = BreakdownCache()
+        first = {"total_tokens": 1, "blocks": [], "breakdown": {}}
+        name, payload = cache.publish(first)
+        assert name == "contextBreakdown"
+        assert payload["version"] == first["version"] == 1
+        again = {"total_tokens": 1, "blocks": [], "breakdown": {}}
+        assert cache.publish(again) is None
+        assert again["version"] == 1
+        changed = {"total_tokens": 2, "blocks": [], "breakdown": {}}
+        name, delta = cache.publish(changed)
+        assert name == "contextBreakdownDelta"
+        assert (delta["base_version"], delta["version"]) == (1, 2)
+        assert delta["set"] == {"total_tokens": 2}
+
+    def test_main_breakdown_is_published(
+        self, service: LLMService, event_cb: _RecordingEventCallback
+    ) -> None:
+        first = service.get_context_breakdown()
+        service._context.add_message("user", "hello there")
+        second = service.get_context_breakdown()
+        pushes = _pushes(event_cb)
+        assert [name for name, _ in pushes] == [
+            "contextBreakdown", "contextBreakdownDelta",
+        ]
+        assert pushes[0][1]["version"] == first["version"]
+        delta = pushes[1][1]
+        assert delta["base_version"] == first["version"]
+        assert delta["version"] == second["version"]
+        assert delta["breakdown"]["history_messages"] == 1
+
+    def test_agent_scope_not_published(
+        self, service: LLMService, event_cb: _RecordingEventCallback
+    ) -> None:
+        result = service.get_context_breakdown(agent_tag="missing")
+        assert result == {"error": "agent not found"}
+        assert _pushes(event_cb) == []
+
+    async def test_post_response_pushes_before_complete(
+        self, service: LLMService, event_cb: _RecordingEventCallback
+    ) -> None:
+        service.get_context_breakdown()
+        service._context.add_message("user", "question")
+        service._context.add_message("assistant", "answer")
+        event_cb.events.clear()
+        await service._post_response("r1", HistoryStore.new_turn_id())
+        names = [name for name, _ in event_cb.events]
+        assert "contextBreakdownDelta" in names
+        assert names.index("contextBreakdownDelta") < names.index(
+            "postResponseComplete"
+        )
+
+    async def test_cancelled_stream_pushes_history(
+        self,
+        service: LLMService,
+        fake_litellm: _FakeLiteLLM,
+        event_cb: _RecordingEventCallback,
+    ) -> None:
+        first = service.get_context_breakdown()
+        fake_litellm.set_streaming_chunks(["partial"])
+        service._cancelled_requests.add("r1")
+        await service.chat_streaming(request_id="r1", message="question")
+        await asyncio.sleep(0.3)
+        names = [name for name, _ in event_cb.events]
+        assert "postResponseComplete" not in names
+        deltas = [
+            payload for name, payload in _pushes(event_cb)
+            if name == "contextBreakdownDelta"
+        ]
+        assert deltas
+        assert deltas[-1]["base_version"] == first["version"]
+        assert deltas[-1]["breakdown"]["history_messages"] >= 1
@@ -0,0 +1,276 @@
+"""Coalescing, delta-encoded stream chunk emission.
+
+Covers :class:`StreamChunkEmitter` in isolation — checkpoint
+placement, delta offsets, time/size coalescing — plus one
+end-to-end check that the streaming worker routes through it
+and a client reconstructing from the wire events ends up with
+the full reply.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+from ac_dc.llm._chunk_emitter import StreamChunkEmitter
+from ac_dc.llm_service import LLMService
+
+from .conftest import _FakeLiteLLM, _RecordingEventCallback
+
+
+class _Timers:
+    """Manually fired ``call_later`` — records armed callbacks."""
+
+    class _Handle:
+        def __init__(self, delay: float, callback: Any) -> None:
+            self.delay = delay
+            self.callback = callback
+            self.cancelled = False
+
+        def cancel(self) -> None:
+            self.cancelled = True
+
+    def __init__(self) -> None:
+        self.armed: list[_Timers._Handle] = []
+
+    def __call__(self, delay: float, callback: Any) -> _Handle:
+        handle = self._Handle(delay, callback)
+        self.armed.append(handle)
+        return handle
+
+    def live(self) -> list[_Handle]:
+        return [h for h in self.armed if not h.cancelled]
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make(
+    clock: _Clock, **kwargs: Any
+) -> tuple[StreamChunkEmitter, list[tuple[str, tuple[Any, ...]]]]:
+    events: list[tuple[str, tuple[Any, ...]]] = []
+
+    def _schedule(name: str, *args: Any) -> None:
+        events.append((name, args))
+
+    emitter = StreamChunkEmitter(
+        "r1", _schedule, clock=clock, **kwargs
+    )
+    return emitter, events
+
+
+def _replay(events: list[tuple[str, tuple[Any, ...]]]) -> str:
+    """Rebuild content the way the browser's AcApp does."""
+    buf: str | None = None
+    for name, args in events:
+        if name == "streamChunk":
+            buf = args[1]
+        elif name == "streamDelta":
+            _, offset, text = args
+            if buf is not None and len(buf) == offset:
+                buf += text
+    return buf or ""
+
+
+class TestStreamChunkEmitter:
+    """Wire-format decisions."""
+
+    def test_first_update_is_immediate_checkpoint(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(clock)
+        emitter.feed("He")
+        assert events == [("streamChunk", ("r1", "He"))]
+
+    def test_updates_inside_window_are_coalesced(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(clock, coalesce_seconds=0.05)
+        emitter.feed("a")
+        clock.now = 0.01
+        emitter.feed("ab")
+        clock.now = 0.02
+        emitter.feed("abc")
+        assert len(events) == 1
+
+    def test_delta_after_window_carries_offset(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(clock, coalesce_seconds=0.05)
+        emitter.feed("Hello")
+        clock.now = 0.1
+        emitter.feed("Hello world")
+        assert events[-1] == ("streamDelta", ("r1", 5, " world"))
+
+    def test_size_threshold_forces_flush_inside_window(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(
+            clock, coalesce_seconds=10.0, coalesce_chars=4
+        )
+        emitter.feed("a")
+        emitter.feed("abcde")
+        assert events[-1] == ("streamDelta", ("r1", 1, "bcde"))
+
+    def test_periodic_checkpoint(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(
+            clock, coalesce_seconds=0.0, checkpoint_seconds=1.0
+        )
+        emitter.feed("a")
+        clock.now = 0.5
+        emitter.feed("ab")
+        clock.now = 1.2
+        emitter.feed("abc")
+        names = [name for name, _ in events]
+        assert names == ["streamChunk", "streamDelta", "streamChunk"]
+
+    def test_held_text_flushed_when_window_closes(self) -> None:
+        clock = _Clock()
+        timers = _Timers()
+        emitter, events = _make(
+            clock, coalesce_seconds=0.05, call_later=timers
+        )
+        emitter.feed("Hello")
+        clock.now = 0.02
+        emitter.feed("Hello!")
+        assert len(events) == 1
+        [timer] = timers.live()
+        assert abs(timer.delay - 0.03) < 1e-9
+        # No further input — the window closing alone sends it.
+        clock.now = 0.05
+        timer.callback()
+        assert events[-1] == ("streamDelta", ("r1", 5, "!"))
+
+    def test_trailing_flush_cancelled_by_flush(self) -> None:
+        clock = _Clock()
+        timers = _Timers()
+        emitter, events = _make(
+            clock, coalesce_seconds=0.05, call_later=timers
+        )
+        emitter.feed("a")
+        clock.now = 0.01
+        emitter.feed("ab")
+        [timer] = timers.live()
+        clock.now = 0.06
+        emitter.feed("abc")
+        assert timer.cancelled
+        # A callback that lost the race sends nothing.
+        timer.callback()
+        assert len(events) == 2
+        emitter.feed("abcd")
+        emitter.finish("abcd")
+        assert timers.live() == []
+        assert _replay(events) == "abcd"
+
+    def test_finish_sends_full_checkpoint(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(clock, coalesce_seconds=1.0)
+        emitter.feed("Hello")
+        emitter.feed("Hello world")
+        emitter.finish("Hello world")
+        assert events[-1] == ("streamChunk", ("r1", "Hello world"))
+        assert _replay(events) == "Hello world"
+
+    def test_finish_skips_redundant_checkpoint(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(clock)
+        emitter.feed("done")
+        emitter.finish("done")
+        assert len(events) == 1
+
+    def test_finish_with_no_content_is_noop(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(clock)
+        emitter.finish("")
+        assert events == []
+
+    def test_delta_disabled_sends_full_content(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(
+            clock, delta_enabled=False, coalesce_seconds=0.0
+        )
+        emitter.feed("a")
+        emitter.feed("ab")
+        assert events == [
+            ("streamChunk", ("r1", "a")),
+            ("streamChunk", ("r1", "ab")),
+        ]
+
+    def test_replay_matches_content_across_many_updates(self) -> None:
+        clock = _Clock()
+        emitter, events = _make(
+            clock, coalesce_seconds=0.05, checkpoint_seconds=0.3
+        )
+        content = ""
+        for i in range(200):
+            content += f"tok{i} "
+            clock.now += 0.01
+            emitter.feed(content)
+            assert _replay(events) == content[: len(_replay(events))]
+        emitter.finish(content)
+        assert _replay(events) == content
+        # Coalescing cut the number of sends well below one
+        # per token.
+        assert len(events) < 200 // 3
+
+
+class TestStreamingUsesEmitter:
+    """The worker thread routes chunks through the emitter."""
+
+    async def test_lone_short_chunk_sent_after_window(
+        self,
+        service: LLMService,
+        fake_litellm: _FakeLiteLLM,
+        event_cb: _RecordingEventCallback,
+    ) -> None:
+        service._config.app_config["streaming"] = {"coalesce_ms": 100}
+        release = threading.Event()
+        fake_litellm.set_streaming_chunks(["He", "y"])
+        original = fake_litellm.completion
+
+        def _stalling_completion(**kwargs: Any) -> Any:
+            # Second chunk arrives inside the window, then the
+            # provider stalls until the test releases it.
+            for i, chunk in enumerate(original(**kwargs)):
+                if i == 2:
+                    release.wait(5)
+                yield chunk
+
+        fake_litellm.completion = _stalling_completion
+        try:
+            await service.chat_streaming(request_id="r1", message="hi")
+            await asyncio.sleep(0.5)
+            wire = [
+                (name, args) for name, args in event_cb.events
+                if name in ("streamChunk", "streamDelta")
+            ]
+            assert _replay(wire) == "Hey"
+        finally:
+            release.set()
+        await asyncio.sleep(0.3)
+
+    async def test_wire_events_reconstruct_full_reply(
+        self,
+        service: LLMService,
+        fake_litellm: _FakeLiteLLM,
+        event_cb: _RecordingEventCallback,
+    ) -> None:
+        chunks = [f"part{i} " for i in range(50)]
+        fake_litellm.set_streaming_chunks(chunks)
+
+        await service.chat_streaming(request_id="r1", message="hi")
+        await asyncio.sleep(0.3)
+
+        wire = [
+            (name, args) for name, args in event_cb.events
+            if name in ("streamChunk", "streamDelta")
+        ]
+        assert _replay(wire) == "".join(chunks)
+        # Fake chunks arrive back-to-back, well inside the
+        # coalescing window — far fewer sends than chunks.
+        assert len(wire) < len(chunks)
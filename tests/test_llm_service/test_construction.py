@@ -193,7 +193,7 @@ class TestDocIndexBackgroundBuild:
     - Fires as an ensure_future task during complete_deferred_init
     - Runs in the aux executor so the event loop stays responsive
     - Emits startupProgress events with stage='doc_index' at
-      start (0%) and completion (100%)
+      start (0%), per extraction shard, and completion (100%)
     - Flips ``_doc_index_ready`` on success
     - Non-fatal on failure — leaves readiness False, emits
       stage='doc_index_error' event
@@ -266,6 +266,37 @@ class TestDocIndexBackgroundBuild:
         assert progress_events[0][2] == 0
         assert progress_events[-1][2] == 100
 
+    async def test_background_build_reports_per_shard_progress(
+        self,
+        config: ConfigManager,
+        repo: Repo,
+        repo_dir: Path,
+        event_cb: _RecordingEventCallback,
+        fake_litellm: _FakeLiteLLM,
+    ) -> None:
+        """Extraction progress arrives between start and end."""
+        (repo_dir / "a.md").write_text("# A\n")
+        (repo_dir / "b.md").write_text("# B\n")
+
+        svc = LLMService(
+            config=config,
+            repo=repo,
+            event_callback=event_cb,
+            deferred_init=True,
+        )
+        svc._doc_index._shard_size = 1
+        svc.complete_deferred_init(symbol_index=object())
+        await asyncio.sleep(0.3)
+
+        percents = [
+            args[2] for name, args in event_cb.events
+            if name == "startupProgress" and args[0] == "doc_index"
+        ]
+        # seed.md, a.md, b.md → three per-file reports.
+        assert percents[0] == 0
+        assert percents[-1] == 100
+        assert percents[1:-1] == [33, 66, 99]
+
     async def test_empty_file_list_still_marks_ready(
         self,
         config: ConfigManager,
@@ -19,7 +19,7 @@ from typing import Any
 
 import pytest
 
-from ac_dc.config import ConfigManager
+from ac_dc.config import _AC_DC_DIR, ConfigManager
 from ac_dc.context_manager import Mode
 from ac_dc.history_store import HistoryStore
 from ac_dc.llm_service import LLMService
@@ -509,18 +509,20 @@ class TestEnrichmentStatus:
         monkeypatch.setattr(
             svc._enricher, "ensure_loaded", lambda: True
         )
-        # Stub enrich_single_file so we don't exercise real
+        # Stub enrich_files (the batched entry point the
+        # background loop uses) so we don't exercise real
         # KeyBERT. Just records that enrichment happened.
         enrichment_calls: list[str] = []
 
-        def _stub_enrich(
-            path: str, source_text: str = ""
-        ) -> Any:
-            enrichment_calls.append(path)
-            return svc._doc_index._all_outlines.get(path)
+        def _stub_enrich(items: list[tuple[str, str]]) -> Any:
+            enrichment_calls.extend(path for path, _ in items)
+            return [
+                svc._doc_index._all_outlines.get(path)
+                for path, _ in items
+            ]
 
         monkeypatch.setattr(
-            svc._doc_index, "enrich_single_file", _stub_enrich
+            svc._doc_index, "enrich_files", _stub_enrich
         )
 
         svc.complete_deferred_init(symbol_index=object())
@@ -657,6 +659,53 @@ class TestEnrichmentStatus:
         assert payload["mode"] == "code"
         assert "cross_ref_enabled" in payload
 
+    async def test_completion_broadcasts_section_cache_stats(
+        self,
+        config: ConfigManager,
+        repo: Repo,
+        repo_dir: Path,
+        event_cb: _RecordingEventCallback,
+        fake_litellm: _FakeLiteLLM,
+    ) -> None:
+        """Completion re-broadcasts status with cache hit rate.
+
+        The section keyword cache is flushed to its pack file
+        at the end of the pass.
+        """
+        (repo_dir / "doc.md").write_text(
+            "# Doc\n\n" + "Tiered caching keeps prompts stable. " * 8
+        )
+
+        class _FakeModel:
+            def extract_keywords(
+                self, texts: list[str], **kwargs: Any
+            ) -> list[list[tuple[str, float]]]:
+                return [[("caching", 0.9)] for _ in texts]
+
+        svc = LLMService(
+            config=config,
+            repo=repo,
+            event_callback=event_cb,
+            deferred_init=True,
+        )
+        svc._enricher._available = True
+        svc._enricher._model = _FakeModel()
+
+        svc.complete_deferred_init(symbol_index=object())
+        await asyncio.sleep(0.3)
+
+        complete = [
+            args[0] for name, args in event_cb.events
+            if name == "modeChanged"
+            and args[0].get("enrichment_status") == "complete"
+        ]
+        assert len(complete) == 1
+        stats = complete[0]["enrichment_cache"]
+        assert stats["hits"] == 0
+        assert stats["misses"] >= 1
+        assert stats["hit_rate"] == 0.0
+        assert (repo_dir / _AC_DC_DIR / "keyword_cache.json").exists()
+
     async def test_model_load_failure_triggers_broadcast(
         self,
         config: ConfigManager,
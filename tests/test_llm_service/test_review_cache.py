@@ -0,0 +1,201 @@
+"""Review-context cache — prefetched diffs and the cached header.
+
+Covers:
+
+- :class:`TestReviewContextCache` — the cache on its own with a
+  counting fake repo: prefetched diffs are reused, inline misses
+  are computed once, failures are retried, ``reset`` and
+  ``clear`` release entries, and the header is rendered once per
+  (parent, tip).
+- :class:`TestReviewContextIntegration` — a real review: entry
+  prefetches every changed file's diff, turns only concatenate
+  the selected files' sections, and exit clears the cache.
+
+Governing spec: :doc:`specs4/4-features/code-review` § Review
+Context in LLM Messages.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+from ac_dc.llm._review_cache import ReviewContextCache
+from ac_dc.llm_service import LLMService
+
+from .conftest import _run_git
+
+
+class _CountingRepo:
+    """Stands in for :class:`Repo` — records every diff request."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.fail: set[str] = set()
+        self.gate: threading.Event | None = None
+        self._lock = threading.Lock()
+
+    def get_review_file_diff(
+        self,
+        path: str,
+        base_commit: str | None = None,
+        head_commit: str | None = None,
+    ) -> dict[str, str]:
+        if self.gate is not None:
+            self.gate.wait(5)
+        with self._lock:
+            self.calls.append(path)
+        if path in self.fail:
+            raise RuntimeError("git exploded")
+        if path.endswith(".bin"):
+            return {"path": path, "diff": ""}
+        return {
+            "path": path,
+            "diff": f"+{path} {base_commit}..{head_commit}",
+        }
+
+
+def _state(**overrides: Any) -> dict[str, Any]:
+    state: dict[str, Any] = {
+        "active": True,
+        "branch": "feature",
+        "parent_commit": "a" * 40,
+        "branch_tip": "b" * 40,
+        "commits": [
+            {"short_sha": "bbbbbbb", "message": "feat: x\n\nbody",
+             "author": "dev", "relative_date": "1 day ago"},
+        ],
+        "changed_files": [],
+        "stats": {"commit_count": 1},
+        "pre_change_symbol_map": "",
+    }
+    state.update(overrides)
+    return state
+
+
+class TestReviewContextCache:
+    def test_prefetched_diff_reused(self) -> None:
+        repo = _CountingRepo()
+        cache = ReviewContextCache()
+        entry = {"path": "a.py", "additions": 3, "deletions": 1}
+        cache.prefetch(repo, "p", "t", [entry])
+        block = cache.diff_block(repo, "p", "t", "a.py", entry)
+        again = cache.diff_block(repo, "p", "t", "a.py", entry)
+        cache.close()
+        assert block == again
+        assert block.startswith("### a.py (+3 -1)\n```diff\n+a.py p..t")
+        assert repo.calls == ["a.py"]
+
+    def test_waits_on_in_flight_prefetch(self) -> None:
+        repo = _CountingRepo()
+        repo.gate = threading.Event()
+        cache = ReviewContextCache()
+        entry = {"path": "a.py"}
+        cache.prefetch(repo, "p", "t", [entry])
+        threading.Timer(0.1, repo.gate.set).start()
+        assert cache.diff_block(repo, "p", "t", "a.py", entry)
+        cache.close()
+        assert repo.calls == ["a.py"]
+
+    def test_miss_computed_inline_once(self) -> None:
+        repo = _CountingRepo()
+        cache = ReviewContextCache()
+        entry = {"path": "a.py"}
+        cache.diff_block(repo, "p", "t", "a.py", entry)
+        cache.diff_block(repo, "p", "t", "a.py", entry)
+        assert repo.calls == ["a.py"]
+        assert cache.diffs_computed == 1
+
+    def test_key_includes_both_commits(self) -> None:
+        repo = _CountingRepo()
+        cache = ReviewContextCache()
+        entry = {"path": "a.py"}
+        cache.diff_block(repo, "p", "t", "a.py", entry)
+        cache.diff_block(repo, "p", "t2", "a.py", entry)
+        assert repo.calls == ["a.py", "a.py"]
+
+    def test_empty_diff_renders_nothing(self) -> None:
+        cache = ReviewContextCache()
+        entry = {"path": "logo.bin"}
+        assert cache.diff_block(
+            _CountingRepo(), "p", "t", "logo.bin", entry
+        ) == ""
+
+    def test_failure_not_cached(self) -> None:
+        repo = _CountingRepo()
+        repo.fail.add("a.py")
+        cache = ReviewContextCache()
+        entry = {"path": "a.py"}
+        assert cache.diff_block(repo, "p", "t", "a.py", entry) == ""
+        assert len(cache) == 0
+        repo.fail.clear()
+        assert cache.diff_block(repo, "p", "t", "a.py", entry)
+        assert repo.calls == ["a.py", "a.py"]
+
+    def test_reset_keeps_only_current_pair(self) -> None:
+        repo = _CountingRepo()
+        cache = ReviewContextCache()
+        entry = {"path": "a.py"}
+        cache.diff_block(repo, "p1", "t1", "a.py", entry)
+        cache.diff_block(repo, "p2", "t2", "a.py", entry)
+        cache.reset("p2", "t2")
+        assert len(cache) == 1
+        cache.diff_block(repo, "p2", "t2", "a.py", entry)
+        assert len(repo.calls) == 2
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_header_rendered_once_per_pair(self) -> None:
+        cache = ReviewContextCache()
+        state = _state()
+        first = cache.header(state)
+        # Mutating the commit list in place doesn't re-render —
+        # review state is fixed for a (parent, tip) pair.
+        state["commits"].append({"short_sha": "ccccccc"})
+        assert cache.header(state) is first
+        assert "## Review: feature (merge-base aaaaaaa → bbbbbbb)" in first
+        assert "1. bbbbbbb feat: x (dev, 1 day ago)" in first
+        other = cache.header(_state(branch_tip="c" * 40))
+        assert "→ ccccccc" in other
+
+
+class TestReviewContextIntegration:
+    def _start(self, service: LLMService, repo_dir: Path) -> None:
+        _run_git(repo_dir, "checkout", "-q", "-b", "feature")
+        (repo_dir / "one.py").write_text("def one():\n    return 1\n")
+        (repo_dir / "two.py").write_text("def two():\n    return 2\n")
+        _run_git(repo_dir, "add", "one.py", "two.py")
+        _run_git(repo_dir, "commit", "-q", "-m", "feat: add one, two")
+        _run_git(repo_dir, "checkout", "-q", "main")
+        tip = service._repo._run_git(
+            ["rev-parse", "feature"], check=True
+        ).stdout.strip()
+        result = service.start_review("feature", tip)
+        assert result["status"] == "review_active"
+
+    def test_turns_reuse_prefetched_diffs(
+        self, service: LLMService, repo_dir: Path
+    ) -> None:
+        self._start(service, repo_dir)
+        cache = service._review_cache
+        assert len(cache) == 2
+
+        service._selected_files = ["one.py"]
+        service._build_and_set_review_context()
+        first = service._context.get_review_context()
+        service._build_and_set_review_context()
+        assert service._context.get_review_context() == first
+        assert "### one.py (+2 -0)" in first
+        assert "+def one():" in first
+        assert "two.py" not in first.split("## Diffs")[1]
+
+        service._selected_files = ["one.py", "two.py"]
+        service._build_and_set_review_context()
+        both = service._context.get_review_context()
+        assert "### two.py" in both
+        # One diff per changed file, all from the entry prefetch.
+        assert cache.diffs_computed == 2
+
+        service.end_review()
+        assert len(cache) == 0
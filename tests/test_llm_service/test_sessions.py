@@ -6,7 +6,8 @@ Covers:
   and :meth:`LLMService.get_selected_files` — existence filtering,
   broadcast side effect, stored-copy discipline.
 - :class:`TestNewSession` — :meth:`LLMService.new_session` — fresh
-  session ID, history cleared, ``sessionChanged`` broadcast.
+  session ID, history cleared, ``sessionChanged`` broadcast, and
+  the history index flushed (at shutdown too).
 - :class:`TestBinaryFileRejection` — turn-start sync drops binary
   files from FileContext and broadcasts ``binaryFilesSkipped`` so
   the frontend can render a toast.
@@ -153,6 +154,29 @@ class TestNewSession:
         service.new_session()
         assert service._url_service.get_fetched_urls() == []
 
+    def test_flushes_history_index(
+        self,
+        service: LLMService,
+        history_store: HistoryStore,
+        repo_dir: Path,
+    ) -> None:
+        """The session-index sidecar catches up on session switch."""
+        history_store.append_message(service._session_id, "user", "hi")
+        sidecar = repo_dir / ".ac-dc4" / "history.index.json"
+        assert not sidecar.exists()
+        service.new_session()
+        assert sidecar.exists()
+
+    def test_shutdown_flushes_history_index(
+        self,
+        service: LLMService,
+        history_store: HistoryStore,
+        repo_dir: Path,
+    ) -> None:
+        history_store.append_message(service._session_id, "user", "hi")
+        service.shutdown()
+        assert (repo_dir / ".ac-dc4" / "history.index.json").exists()
+
 
 # ---------------------------------------------------------------------------
 # new_session closes live agents (Increment 2)
@@ -11,6 +11,9 @@ Covers:
   filters that enforce "a file never appears twice" when
   upstream tracker state drifted (selected files, excluded
   files, cross-reference rebuild edge cases).
+- :class:`TestTierRenderCache` — unchanged tiers are served
+  from the per-tracker render cache; any member change
+  re-renders.
 - :class:`TestAssembleTieredLegendDispatch` — legend routing in
   :meth:`LLMService._assemble_tiered` based on mode and
   cross-reference state.
@@ -874,4 +877,170 @@ class TestAssembleTieredLegendDispatch:
 
         # Primary is doc legend; secondary is symbol legend.
         assert capture["symbol_legend"] == "DOC-LEGEND"
-        assert capture["doc_legend"] == "SYMBOL-LEGEND"
\ No newline at end of file
+        assert capture["doc_legend"] == "SYMBOL-LEGEND"
+
+
+class _VersionedSymbolIndex(_FakeSymbolIndex):
+    """Fake index that versions its blocks and counts renders."""
+
+    def __init__(self, blocks: dict[str, str]) -> None:
+        super().__init__(blocks)
+        self.versions: dict[str, int] = {}
+        self.renders: list[str] = []
+
+    def get_dir_block_version(
+        self,
+        directory: str,
+        exclude_active: set[str] | None = None,
+    ) -> tuple[Any, ...]:
+        return (
+            self.versions.get(directory, 0),
+            tuple(sorted(exclude_active or ())),
+        )
+
+    def get_dir_symbols_block(
+        self,
+        directory: str,
+        exclude_active: set[str] | None = None,
+    ) -> str:
+        self.renders.append(directory)
+        return super().get_dir_symbols_block(directory, exclude_active)
+
+
+class TestTierRenderCache:
+    """Unchanged tiers are reused rather than re-rendered."""
+
+    def _make(
+        self, config: ConfigManager, repo: Repo
+    ) -> tuple[LLMService, _VersionedSymbolIndex]:
+        index = _VersionedSymbolIndex({
+            "core/a.py": "block-a",
+            "web/b.py": "block-b",
+        })
+        svc = LLMService(config=config, repo=repo, symbol_index=index)
+        _place_item(svc._stability_tracker, "symbols:core", "L0")
+        _place_item(svc._stability_tracker, "symbols:web", "L2")
+        return svc, index
+
+    def test_stable_tiers_not_re_rendered(
+        self,
+        config: ConfigManager,
+        repo: Repo,
+        fake_litellm: _FakeLiteLLM,
+    ) -> None:
+        svc, index = self._make(config, repo)
+        first = svc._build_tiered_content()
+        renders = len(index.renders)
+        second = svc._build_tiered_content()
+        assert len(index.renders) == renders
+        assert second == first
+
+    def test_version_change_re_renders_only_that_tier(
+        self,
+        config: ConfigManager,
+        repo: Repo,
+        fake_litellm: _FakeLiteLLM,
+    ) -> None:
+        svc, index = self._make(config, repo)
+        svc._build_tiered_content()
+        index.renders.clear()
+        index._blocks["web/b.py"] = "block-b2"
+        index.versions["web"] = 1
+        result = svc._build_tiered_content()
+        assert result is not None
+        assert index.renders == ["web"]
+        assert result["L2"]["symbols"] == "block-b2"
+        assert result["L0"]["symbols"] == "block-a"
+
+    def test_membership_change_re_renders(
+        self,
+        config: ConfigManager,
+        repo: Repo,
+        fake_litellm: _FakeLiteLLM,
+    ) -> None:
+        svc, _index = self._make(config, repo)
+        svc._build_tiered_content()
+        svc._stability_tracker._items.pop("symbols:web")
+        _place_item(svc._stability_tracker, "symbols:web", "L0")
+        result = svc._build_tiered_content()
+        assert result is not None
+        assert result["L0"]["symbols"] == "block-a\n\nblock-b"
+        assert result["L2"]["symbols"] == ""
+
+    def test_file_and_history_changes_seen(
+        self, service: LLMService
+    ) -> None:
+        service._file_context.add_file("a.py", "v1")
+        service._context.add_message("user", "first")
+        _place_item(service._stability_tracker, "file:a.py", "L1")
+        _place_item(service._stability_tracker, "history:0", "L1")
+        service._build_tiered_content()
+        service._file_context.add_file("a.py", "v2")
+        service._context.clear_history()
+        service._context.add_message("user", "replaced")
+        _place_item(service._stability_tracker, "history:0", "L1")
+        result = service._build_tiered_content()
+        assert result is not None
+        assert "v2" in result["L1"]["files"]
+        assert result["L1"]["history"][0]["content"] == "replaced"
+
+    def test_result_mutation_does_not_leak_into_cache(
+        self, service: LLMService
+    ) -> None:
+        service._context.add_message("user", "hello")
+        _place_item(service._stability_tracker, "history:0", "L1")
+        first = service._build_tiered_content()
+        assert first is not None
+        first["L1"]["history"][0]["content"] = "mutated"
+        first["L1"]["graduated_history_indices"].append(99)
+        second = service._build_tiered_content()
+        assert second is not None
+        assert second["L1"]["history"][0]["content"] == "hello"
+        assert second["L1"]["graduated_history_indices"] == [0]
+
+    def test_cross_directory_doc_link_re_renders_tier(
+        self, service: LLMService
+    ) -> None:
+        import os
+
+        doc_index = service._doc_index
+        root = Path(doc_index.repo_root)
+        source = root / "x" / "a.md"
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text("# A\n", encoding="utf-8")
+        (root / "y").mkdir(exist_ok=True)
+        (root / "y" / "b.md").write_text(
+            "# B\n\n## Target\n", encoding="utf-8"
+        )
+        files = ["x/a.md", "y/b.md"]
+        doc_index.index_repo(files)
+        _place_item(service._stability_tracker, "docs:y", "L1")
+        first = service._build_tiered_content()
+        assert first is not None
+        assert "## Target ←" not in first["L1"]["symbols"]
+
+        # Only x/ changes; the docs:y tier must still re-render.
+        st = source.stat()
+        source.write_text(
+            "# A\n\n[see](y/b.md#target)\n", encoding="utf-8"
+        )
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        doc_index.index_repo(files)
+        result = service._build_tiered_content()
+        assert result is not None
+        assert "## Target ←1" in result["L1"]["symbols"]
+
+    def test_unversioned_index_compared_by_value(
+        self,
+        config: ConfigManager,
+        repo: Repo,
+        fake_litellm: _FakeLiteLLM,
+    ) -> None:
+        index = _FakeSymbolIndex({"src/a.py": "old"})
+        svc = LLMService(config=config, repo=repo, symbol_index=index)
+        _place_item(svc._stability_tracker, "symbols:src", "L1")
+        svc._build_tiered_content()
+        index._blocks["src/a.py"] = "new"
+        result = svc._build_tiered_content()
+        assert result is not None
+        assert result["L1"]["symbols"] == "new"
@@ -9,7 +9,7 @@ argument.
 
 Thin RPC surface (:func:`detect_urls`, :func:`get_url_content`,
 :func:`invalidate_url_cache`, :func:`remove_fetched_url`,
-:func:`clear_url_cache`) is also pinned here — those methods
+:func:`clear_url_cache`, :func:`get_url_cache_stats`) is also pinned here — those methods
 delegate to the URL service.
 
 Governing spec: :doc:`specs4/4-features/url-content`.
@@ -87,6 +87,18 @@ class TestURLIntegration:
         assert result["status"] == "ok"
         assert "cache_cleared" in result
 
+    def test_get_url_cache_stats_delegates(
+        self,
+        service: LLMService,
+    ) -> None:
+        """get_url_cache_stats reports the cache budget and counters."""
+        stats = service.get_url_cache_stats()
+        assert stats["enabled"] is True
+        assert stats["max_bytes"] == (
+            service._config.url_cache_config["max_size_mb"] * 1024 * 1024
+        )
+        assert {"hits", "misses", "evictions", "revalidated"} <= set(stats)
+
     async def test_streaming_with_url_triggers_fetch(
         self,
         service: LLMService,
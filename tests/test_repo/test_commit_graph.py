@@ -34,7 +34,9 @@ class TestCommitGraph:
         """Result has commits, branches, and has_more keys."""
         self._seed_linear_history(repo, count=3)
         result = repo.get_commit_graph()
-        assert set(result.keys()) == {"commits", "branches", "has_more"}
+        assert set(result.keys()) == {
+            "commits", "branches", "has_more", "branch_lanes",
+        }
         assert isinstance(result["commits"], list)
         assert isinstance(result["branches"], list)
         assert isinstance(result["has_more"], bool)
@@ -54,6 +56,8 @@ class TestCommitGraph:
             "date",
             "relative_date",
             "parents",
+            "lane",
+            "edges",
         }
         assert len(entry["sha"]) == 40
         assert len(entry["short_sha"]) >= 7
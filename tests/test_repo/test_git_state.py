@@ -0,0 +1,153 @@
+"""Shared git-state snapshot — reuse, staleness signals, invalidation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ac_dc.repo import Repo
+
+from .conftest import _run_git
+
+
+def _spy_git(
+    repo: Repo, monkeypatch: pytest.MonkeyPatch
+) -> list[list[str]]:
+    """Record the args of every git call the repo makes."""
+    calls: list[list[str]] = []
+    original = repo._run_git
+
+    def _spy(args: list[str], **kwargs: Any) -> Any:
+        calls.append(list(args))
+        return original(args, **kwargs)
+
+    monkeypatch.setattr(repo, "_run_git", _spy)
+    return calls
+
+
+@pytest.fixture
+def seeded(repo: Repo) -> Repo:
+    """Repo with one committed file in a subdirectory."""
+    (repo.root / "src").mkdir()
+    (repo.root / "src" / "a.py").write_text("a = 1\n")
+    (repo.root / "top.md").write_text("top\n")
+    _run_git(repo.root, "add", "-A")
+    _run_git(repo.root, "commit", "-q", "-m", "init")
+    return repo
+
+
+class TestSharedSnapshot:
+    """Repeated readers share one set of git invocations."""
+
+    def test_listing_callers_share_ls_files(
+        self, seeded: Repo, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = _spy_git(seeded, monkeypatch)
+        flat = seeded.get_flat_file_list()
+        by_dir = seeded.get_files_by_directory()
+        seeded.get_flat_file_list()
+        assert flat == "src/a.py\ntop.md"
+        assert by_dir == {"src": ["src/a.py"], "": ["top.md"]}
+        assert [c[0] for c in calls] == ["ls-files", "ls-files"]
+
+    def test_file_tree_reuses_status(
+        self, seeded: Repo, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        first = seeded.get_file_tree()
+        calls = _spy_git(seeded, monkeypatch)
+        second = seeded.get_file_tree()
+        assert calls == []
+        assert second == first
+
+
+class TestStalenessSignals:
+    """Changes made outside the repo layer are still seen."""
+
+    def test_new_untracked_file(self, seeded: Repo) -> None:
+        seeded.get_flat_file_list()
+        (seeded.root / "src" / "b.py").write_text("b = 2\n")
+        assert "src/b.py" in seeded.get_flat_file_list().split("\n")
+
+    def test_new_file_in_new_directory(self, seeded: Repo) -> None:
+        seeded.get_flat_file_list()
+        (seeded.root / "pkg" / "sub").mkdir(parents=True)
+        (seeded.root / "pkg" / "sub" / "c.py").write_text("c\n")
+        assert "pkg/sub/c.py" in seeded.get_flat_file_list()
+
+    def test_new_file_in_existing_empty_directory(
+        self, seeded: Repo
+    ) -> None:
+        (seeded.root / "src" / "empty").mkdir()
+        before = seeded.get_flat_file_list()
+        (seeded.root / "src" / "empty" / "d.py").write_text("d\n")
+        after = seeded.get_flat_file_list()
+        assert after != before
+        assert "src/empty/d.py" in after.split("\n")
+
+    def test_external_delete(self, seeded: Repo) -> None:
+        seeded.get_flat_file_list()
+        (seeded.root / "src" / "a.py").unlink()
+        assert seeded.get_flat_file_list() == "top.md"
+
+    def test_in_place_edit_shows_modified(self, seeded: Repo) -> None:
+        assert seeded.get_file_tree()["modified"] == []
+        (seeded.root / "top.md").write_text("top, edited\n")
+        tree = seeded.get_file_tree()
+        assert tree["modified"] == ["top.md"]
+        assert tree["diff_stats"]["top.md"]["additions"] == 1
+
+    def test_gitignore_edit_hides_file(self, seeded: Repo) -> None:
+        (seeded.root / "build.log").write_text("x\n")
+        (seeded.root / ".gitignore").write_text("")
+        assert "build.log" in seeded.get_flat_file_list()
+        (seeded.root / ".gitignore").write_text("*.log\n")
+        assert "build.log" not in seeded.get_flat_file_list()
+
+    def test_external_commit(self, seeded: Repo) -> None:
+        (seeded.root / "top.md").write_text("changed\n")
+        assert seeded.get_file_tree()["modified"] == ["top.md"]
+        _run_git(seeded.root, "commit", "-q", "-am", "external")
+        assert seeded.get_file_tree()["modified"] == []
+
+
+class TestInvalidation:
+    """Our own mutations drop the snapshot immediately."""
+
+    def test_staging_invalidates(self, seeded: Repo) -> None:
+        (seeded.root / "top.md").write_text("changed\n")
+        assert seeded.get_file_tree()["staged"] == []
+        seeded.stage_files(["top.md"])
+        assert seeded.get_file_tree()["staged"] == ["top.md"]
+        seeded.unstage_files(["top.md"])
+        assert seeded.get_file_tree()["staged"] == []
+
+    def test_mutating_git_command_drops_snapshot(
+        self, seeded: Repo
+    ) -> None:
+        seeded.get_flat_file_list()
+        assert seeded._git_snapshot is not None
+        seeded._run_git(["status"])
+        assert seeded._git_snapshot is not None
+        seeded._run_git(["add", "-A"])
+        assert seeded._git_snapshot is None
+
+    async def test_write_and_delete_invalidate(self, seeded: Repo) -> None:
+        seeded.get_flat_file_list()
+        await seeded.create_file("new.py", "x\n")
+        assert seeded._git_snapshot is None
+        assert "new.py" in seeded.get_flat_file_list()
+        await seeded.delete_file("new.py")
+        assert seeded._git_snapshot is None
+        assert "new.py" not in seeded.get_flat_file_list()
+
+    def test_worktree_git_file(self, seeded: Repo, tmp_path: Path) -> None:
+        """A linked worktree (``.git`` is a file) is supported."""
+        wt = tmp_path / "wt"
+        _run_git(seeded.root, "worktree", "add", "-q", str(wt))
+        repo = Repo(wt)
+        assert repo._git_dir().is_dir()
+        assert repo.get_flat_file_list() == "src/a.py\ntop.md"
+        (wt / "top.md").write_text("edited\n")
+        assert repo.get_file_tree()["modified"] == ["top.md"]
@@ -0,0 +1,258 @@
+"""Commit-graph cache — tip keying, incremental extension, lanes.
+
+Covers:
+
+- :class:`TestRelativeDate` — :func:`relative_date` against
+  git's own ``%ar`` wording.
+- :class:`TestAssignLanes` — the server-side lane walk.
+- :class:`TestCommitGraphCache` — paging through a real repo:
+  unchanged tips re-walk nothing, new commits extend the
+  cached walk, rewinds re-walk, pages slice the same history
+  a fresh ``git log --topo-order`` sees, extensions defer the
+  pack rewrite, and the pack file survives a restart.
+
+Governing spec: ``specs4/4-features/code-review.md``
+§ Commit Graph Data.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from ac_dc.config import _AC_DC_DIR
+from ac_dc.repo import Repo
+from ac_dc.repo.graph_cache import assign_lanes, relative_date
+
+from .conftest import _run_git
+
+
+def _commit(repo_dir: Path, message: str, **env: str) -> str:
+    path = repo_dir / "log.md"
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(f"{message}\n")
+    _run_git(repo_dir, "add", "log.md")
+    if env:
+        old = {k: os.environ.get(k) for k in env}
+        os.environ.update(env)
+        try:
+            _run_git(repo_dir, "commit", "-q", "-m", message)
+        finally:
+            for key, value in old.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+    else:
+        _run_git(repo_dir, "commit", "-q", "-m", message)
+    return _run_git(repo_dir, "rev-parse", "HEAD").stdout.strip()
+
+
+def _topo_shas(repo_dir: Path, *scope: str) -> list[str]:
+    return _run_git(
+        repo_dir, "log", *scope, "--topo-order", "--format=%H"
+    ).stdout.split()
+
+
+def _all_pages(repo: Repo, limit: int, **kwargs: bool) -> list[str]:
+    shas: list[str] = []
+    offset = 0
+    while True:
+        page = repo.get_commit_graph(limit=limit, offset=offset, **kwargs)
+        shas.extend(c["sha"] for c in page["commits"])
+        offset += limit
+        if not page["has_more"]:
+            return shas
+
+
+class TestRelativeDate:
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            (1, "1 second ago"),
+            (45, "45 seconds ago"),
+            (60 * 5, "5 minutes ago"),
+            (3600 * 3, "3 hours ago"),
+            (86400 * 3, "3 days ago"),
+            (86400 * 30, "4 weeks ago"),
+            (86400 * 200, "7 months ago"),
+            (86400 * 365, "1 year ago"),
+            (86400 * 500, "1 year, 4 months ago"),
+            (86400 * 365 * 8, "8 years ago"),
+            (-600, "in the future"),
+        ],
+    )
+    def test_wording(self, seconds: int, expected: str) -> None:
+        now = 1_700_000_000.0
+        iso = time.strftime(
+            "%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(now - seconds)
+        )
+        assert relative_date(iso, now) == expected
+
+    def test_matches_git(self, repo_dir: Path) -> None:
+        stamp = int(time.time()) - 86400 * 40
+        _commit(
+            repo_dir, "old",
+            GIT_AUTHOR_DATE=f"{stamp} +0200",
+            GIT_COMMITTER_DATE=f"{stamp} +0200",
+        )
+        iso, git_relative = _run_git(
+            repo_dir, "log", "-1", "--format=%aI%x00%ar"
+        ).stdout.strip().split("\x00")
+        assert relative_date(iso) == git_relative
+
+    def test_unparseable(self) -> None:
+        assert relative_date("yesterday") == ""
+
+
+class TestAssignLanes:
+    def test_branch_joins_and_merges(self) -> None:
+        # m2 merges f1 into m1; f1 forks from m0.
+        rows = [
+            ("m2", "", "", "", "2025-01-04T00:00:00+00:00", ("m1", "f1")),
+            ("f1", "", "", "", "2025-01-03T00:00:00+00:00", ("m0",)),
+            ("m1", "", "", "", "2025-01-02T00:00:00+00:00", ("m0",)),
+            ("m0", "", "", "", "2025-01-01T00:00:00+00:00", ()),
+        ]
+        index = {row[0]: i for i, row in enumerate(rows)}
+        branches = [
+            {"name": "feature", "sha": "f1"},
+            {"name": "main", "sha": "m2"},
+        ]
+        lanes, edges, branch_lanes = assign_lanes(rows, index, branches)
+        # Newest tip takes lane 0.
+        assert branch_lanes == {"main": 0, "feature": 1}
+        assert lanes == [0, 1, 0, 1]
+        assert edges[0] == [("f1", 1, True)]
+        # m1 reaches m0 after feature claimed it — a join edge.
+        assert edges[2] == [("m0", 1, False)]
+
+
+class TestCommitGraphCache:
+    def test_pages_match_full_topo_walk(self, repo: Repo) -> None:
+        for i in range(7):
+            _commit(repo.root, f"c{i}")
+        _run_git(repo.root, "checkout", "-q", "-b", "feature", "HEAD~3")
+        for i in range(4):
+            _commit(repo.root, f"f{i}")
+        _run_git(repo.root, "checkout", "-q", "main")
+        assert _all_pages(repo, limit=3) == _topo_shas(
+            repo.root, "--branches"
+        )
+        cache = repo._commit_graph_cache
+        assert (cache.full_walks, cache.extensions) == (1, 0)
+
+    def test_unchanged_tips_walk_nothing(self, repo: Repo) -> None:
+        for i in range(3):
+            _commit(repo.root, f"c{i}")
+        first = repo.get_commit_graph(limit=2)
+        second = repo.get_commit_graph(limit=2, offset=2)
+        again = repo.get_commit_graph(limit=2)
+        assert first["commits"] == again["commits"]
+        assert len(second["commits"]) == 1
+        assert repo._commit_graph_cache.full_walks == 1
+
+    def test_new_commits_extend(self, repo: Repo) -> None:
+        old = [_commit(repo.root, f"c{i}") for i in range(3)]
+        repo.get_commit_graph()
+        _run_git(repo.root, "checkout", "-q", "-b", "side", old[0])
+        side = _commit(repo.root, "side")
+        _run_git(repo.root, "checkout", "-q", "main")
+        new = _commit(repo.root, "c3")
+        shas = [c["sha"] for c in repo.get_commit_graph()["commits"]]
+        cache = repo._commit_graph_cache
+        assert (cache.full_walks, cache.extensions) == (1, 1)
+        assert sorted(shas) == sorted([*old, side, new])
+        assert shas[2:] == list(reversed(old))
+        # Still a topological order: children before parents.
+        assert shas.index(side) < shas.index(old[0])
+
+    def test_rewind_rewalks(self, repo: Repo) -> None:
+        shas = [_commit(repo.root, f"c{i}") for i in range(3)]
+        repo.get_commit_graph()
+        _run_git(repo.root, "reset", "-q", "--hard", shas[1])
+        result = repo.get_commit_graph()
+        assert [c["sha"] for c in result["commits"]] == [shas[1], shas[0]]
+        assert repo._commit_graph_cache.full_walks == 2
+
+    def test_deleted_merged_branch_extends(self, repo: Repo) -> None:
+        _commit(repo.root, "c0")
+        _run_git(repo.root, "checkout", "-q", "-b", "feature")
+        _commit(repo.root, "f0")
+        _run_git(repo.root, "checkout", "-q", "main")
+        repo.get_commit_graph()
+        _run_git(repo.root, "merge", "-q", "--ff-only", "feature")
+        _run_git(repo.root, "branch", "-q", "-d", "feature")
+        assert len(repo.get_commit_graph()["commits"]) == 2
+        cache = repo._commit_graph_cache
+        assert (cache.full_walks, cache.extensions) == (1, 1)
+
+    def test_include_remote_scope_sees_detached_head(
+        self, repo: Repo
+    ) -> None:
+        base = _commit(repo.root, "c0")
+        _run_git(repo.root, "checkout", "-q", "--detach")
+        loose = _commit(repo.root, "detached")
+        local = [c["sha"] for c in repo.get_commit_graph()["commits"]]
+        everything = [
+            c["sha"]
+            for c in repo.get_commit_graph(include_remote=True)["commits"]
+        ]
+        assert local == [base]
+        assert everything == [loose, base]
+
+    def test_lanes_served_with_pages(self, repo: Repo) -> None:
+        _commit(repo.root, "c0")
+        _run_git(repo.root, "checkout", "-q", "-b", "feature")
+        _commit(repo.root, "f0")
+        _run_git(repo.root, "checkout", "-q", "main")
+        _commit(repo.root, "c1")
+        result = repo.get_commit_graph()
+        assert set(result["branch_lanes"]) == {"main", "feature"}
+        assert sorted(result["branch_lanes"].values()) == [0, 1]
+        lanes = {c["message"]: c["lane"] for c in result["commits"]}
+        assert lanes["c1"] == result["branch_lanes"]["main"]
+        assert lanes["f0"] == result["branch_lanes"]["feature"]
+
+    def test_pack_survives_restart(self, repo: Repo) -> None:
+        for i in range(3):
+            _commit(repo.root, f"c{i}")
+        expected = repo.get_commit_graph()["commits"]
+        pack = repo.root / _AC_DC_DIR / "commit_graph.json"
+        assert json.loads(pack.read_text())["version"] == 2
+        fresh = Repo(repo.root)
+        assert fresh.get_commit_graph()["commits"] == expected
+        assert fresh._commit_graph_cache.full_walks == 0
+
+    def test_extension_defers_pack_write(self, repo: Repo) -> None:
+        for i in range(3):
+            _commit(repo.root, f"c{i}")
+        repo.get_commit_graph()
+        pack = repo.root / _AC_DC_DIR / "commit_graph.json"
+        written = pack.read_text()
+        _commit(repo.root, "c3")
+        expected = repo.get_commit_graph()["commits"]
+        cache = repo._commit_graph_cache
+        assert cache.extensions == 1
+        # Scheduled, not written inline.
+        assert pack.read_text() == written
+        assert cache._flush_timer is not None
+        cache.flush()
+        assert cache._flush_timer is None
+        rows = json.loads(pack.read_text())["scopes"]["branches"]["rows"]
+        # Oldest-first: the extension landed on the end.
+        assert [row[2] for row in rows] == ["c0", "c1", "c2", "c3"]
+        fresh = Repo(repo.root)
+        assert fresh.get_commit_graph()["commits"] == expected
+        assert fresh._commit_graph_cache.full_walks == 0
+
+    def test_corrupt_pack_ignored(self, repo: Repo) -> None:
+        _commit(repo.root, "c0")
+        pack = repo.root / _AC_DC_DIR / "commit_graph.json"
+        pack.parent.mkdir()
+        pack.write_text("{not json")
+        assert len(Repo(repo.root).get_commit_graph()["commits"]) == 1
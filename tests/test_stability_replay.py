@@ -0,0 +1,168 @@
+"""Stability replay harness — turn sources, accounting, CLI."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ac_dc.cache_membrane import FluxConfig
+from ac_dc.stability_replay import (
+    ReplayTurn,
+    append_snapshot,
+    load_snapshots,
+    main,
+    simulate,
+    synthetic_turns,
+    turns_from_history,
+)
+from ac_dc.token_counter import TokenCounter
+
+
+def _item(h: str, tokens: int = 100) -> dict[str, object]:
+    return {"hash": h, "tokens": tokens}
+
+
+class TestTurnSources:
+    def test_snapshot_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "turns.jsonl"
+        append_snapshot(path, {"file:a.py": _item("h1")}, {"a.py"})
+        append_snapshot(path, {"file:a.py": _item("h2")}, None)
+        with path.open("a") as fh:
+            fh.write("not json\n")
+        turns = load_snapshots(path)
+        assert [t.active_items["file:a.py"]["hash"] for t in turns] == [
+            "h1", "h2",
+        ]
+        assert turns[0].existing_files == {"a.py"}
+        assert turns[1].existing_files is None
+
+    def test_synthetic_is_deterministic(self) -> None:
+        a = synthetic_turns(files=300, turns=4, seed=7)
+        b = synthetic_turns(files=300, turns=4, seed=7)
+        c = synthetic_turns(files=300, turns=4, seed=8)
+        assert [t.active_items for t in a] == [t.active_items for t in b]
+        assert [t.active_items for t in a] != [t.active_items for t in c]
+
+    def test_synthetic_history_grows_by_exchange(self) -> None:
+        turns = synthetic_turns(files=100, turns=3)
+        counts = [
+            sum(k.startswith("history:") for k in t.active_items)
+            for t in turns
+        ]
+        assert counts == [2, 4, 6]
+        assert any(k.startswith("symbols:") for k in turns[0].active_items)
+
+    def test_history_exchanges_become_turns(self, tmp_path: Path) -> None:
+        (tmp_path / "a.py").write_text("x = 1\n")
+        history = tmp_path / "history.jsonl"
+        records = [
+            {"session_id": "old", "role": "user", "content": "ignored"},
+            {"session_id": "s", "role": "user", "content": "q1",
+             "files": ["a.py", "missing.py"]},
+            {"session_id": "s", "role": "assistant", "content": "a1"},
+            {"session_id": "s", "role": "user", "content": "q2"},
+            {"session_id": "s", "role": "assistant", "content": "a2"},
+        ]
+        history.write_text(
+            "".join(json.dumps(r) + "\n" for r in records)
+        )
+        turns = turns_from_history(
+            history,
+            counter=TokenCounter("anthropic/claude-sonnet-4-5"),
+            repo_root=tmp_path,
+        )
+        assert len(turns) == 2
+        assert sorted(turns[0].active_items) == [
+            "file:a.py", "history:0", "history:1",
+        ]
+        # The second user record carries no selection.
+        assert sorted(turns[1].active_items) == [
+            "history:0", "history:1", "history:2", "history:3",
+        ]
+        assert (
+            turns[0].active_items["history:0"]
+            == turns[1].active_items["history:0"]
+        )
+
+
+class TestSimulate:
+    def test_first_turn_writes_then_stable_turns_read(self) -> None:
+        items = {f"symbols:d{i}": _item(f"h{i}", 1000) for i in range(8)}
+        turns = [ReplayTurn(active_items=dict(items)) for _ in range(3)]
+        report = simulate(turns)
+        first, second, third = report.per_turn
+        assert first["read"] == 0 and first["write"] == 8000
+        assert second["write"] == 0 and second["read"] == 8000
+        assert third == second
+        assert report.hit_rate == pytest.approx(16000 / 24000)
+
+    def test_changed_block_invalidates_from_its_tier(self) -> None:
+        items = {f"symbols:d{i}": _item(f"h{i}", 1000) for i in range(8)}
+        edited = dict(items)
+        # Equal mtimes seed in key order, hottest first — d7
+        # lands in L0, ahead of every other cached tier.
+        edited["symbols:d7"] = _item("edited", 1000)
+        turns = [
+            ReplayTurn(active_items=items),
+            ReplayTurn(active_items=items),
+            ReplayTurn(active_items=edited),
+        ]
+        report = simulate(turns, warmup=2)
+        (row,) = report.per_turn
+        # The edited block demoted to Active (uncached); L0
+        # changed, so it and every tier after it re-wrote.
+        assert row["uncached"] == 1000
+        assert row["demotions"] == 1
+        assert row["read"] == 0
+        assert row["write"] == 7000
+
+    def test_unseeded_run_starts_in_active(self) -> None:
+        items = {f"symbols:d{i}": _item(f"h{i}") for i in range(4)}
+        report = simulate(
+            [ReplayTurn(active_items=items)], seed_dir_blocks=False
+        )
+        assert report.per_turn[0]["uncached"] == 400
+
+    def test_configs_reported_independently(self) -> None:
+        turns = synthetic_turns(files=400, turns=6)
+        a = simulate(turns, FluxConfig(), name="a")
+        b = simulate(turns, FluxConfig(), name="b")
+        assert a.turns == b.turns == 6
+        assert a.cache_read_tokens == b.cache_read_tokens
+        assert len(a.update_seconds) == 6
+
+
+class TestCli:
+    def test_json_report_per_config(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        config = tmp_path / "tuned.json"
+        config.write_text(json.dumps({"flux_threshold": 0.5}))
+        emitted = tmp_path / "emitted.jsonl"
+        code = main([
+            "--synthetic", "--files", "200", "--turns", "4",
+            "--config", str(config), "--emit", str(emitted), "--json",
+        ])
+        assert code == 0
+        (report,) = json.loads(capsys.readouterr().out)
+        assert report["name"] == "tuned.json"
+        assert report["turns"] == 4
+        assert len(load_snapshots(emitted)) == 4
+
+    def test_snapshot_file_table(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        path = tmp_path / "turns.jsonl"
+        for _ in range(2):
+            append_snapshot(path, {"symbols:d": _item("h")})
+        assert main([str(path)]) == 0
+        out = capsys.readouterr().out
+        assert "2 turns" in out
+        assert "default" in out
+
+    def test_empty_source_fails(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        assert main([str(path)]) == 1
@@ -26,6 +26,8 @@ Spec authority: ``specs4/3-llm/cache-tiering.md`` and
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from ac_dc.cache_membrane import (
@@ -434,6 +436,168 @@ class TestRelaxLoop:
         assert files[0].tier >= L3_IDX
 
 
+def _naive_relax(files, *, config, tier_of, set_tier, n_of, tokens_of,
+                 key_of, is_protected, is_balance_excluded):
+    """The full-rescan relaxation loop, kept as an oracle.
+
+    Recomputes V/c and rescans with :func:`pick_mover` on every
+    membrane of every pass — the behaviour the incremental
+    :func:`relax` must reproduce move for move.
+    """
+    moves: list[tuple[int, str]] = []
+    accessors = dict(
+        tier_of=tier_of, n_of=n_of, tokens_of=tokens_of, key_of=key_of
+    )
+    for _ in range(1000):
+        moved_any = False
+        for m_idx, (lower, upper) in enumerate(LIVE_MEMBRANES):
+            params = config.membranes[m_idx]
+            protected = [f for f in files if is_protected(f)]
+            if params.admission_only:
+                mover = pick_mover(
+                    files, tier_idx=lower, n_admit=params.n_admit,
+                    pick_mode=params.pick_mode, excluded=protected,
+                    **accessors,
+                )
+                if mover is None:
+                    continue
+            else:
+                c_lower = c_upper = 0
+                t_lower = t_upper = 0.0
+                for f in files:
+                    if is_balance_excluded(f):
+                        continue
+                    if tier_of(f) == lower:
+                        c_lower += 1
+                        t_lower += tokens_of(f)
+                    elif tier_of(f) == upper:
+                        c_upper += 1
+                        t_upper += tokens_of(f)
+                if c_lower == 0 and c_upper == 0:
+                    continue
+                phi = compute_flux(
+                    c_lower, t_lower, t_upper, c_upper, params
+                )
+                if phi < config.threshold:
+                    continue
+                mover = pick_mover(
+                    files, tier_idx=lower, n_admit=params.n_admit,
+                    pick_mode=params.pick_mode, excluded=protected,
+                    **accessors,
+                )
+                if mover is None and params.n_admit > 0:
+                    mover = pick_mover(
+                        files, tier_idx=lower, n_admit=0,
+                        pick_mode=params.pick_mode, excluded=protected,
+                        **accessors,
+                    )
+                if mover is None:
+                    continue
+            set_tier(mover, upper)
+            moves.append((m_idx, key_of(mover)))
+            moved_any = True
+        if not moved_any:
+            break
+    return moves
+
+
+def _random_population(rng: random.Random, fractional: bool):
+    files = []
+    for i in range(rng.randint(0, 120)):
+        tokens: float = rng.choice([10, 50, 200, 1000, 5000])
+        if fractional:
+            tokens = tokens * rng.random()
+        files.append(_StubFile(
+            # Shared keys exercise the position tie-break.
+            f"k{i % 40}",
+            rng.choice([ACTIVE_IDX, ACTIVE_IDX, L3_IDX, L2_IDX, L1_IDX,
+                        L0_IDX]),
+            rng.randint(0, 6),
+            tokens,
+        ))
+    return files
+
+
+def _random_config(rng: random.Random) -> FluxConfig:
+    membranes = tuple(
+        MembraneParams(
+            P=rng.choice([1e-3, 0.05, 1.0]),
+            V_T=rng.choice([500.0, 2000.0, 1e5]),
+            n_admit=rng.randint(0, 4),
+            pick_mode=rng.choice(["smallest", "oldest"]),
+            admission_only=(idx == 0 and rng.random() < 0.8),
+        )
+        for idx in range(4)
+    )
+    return FluxConfig(
+        threshold=rng.choice([0.5, 1.0, 5.0]),
+        membranes=membranes,  # type: ignore[arg-type]
+    )
+
+
+class TestIncrementalRelaxation:
+    """Incremental aggregates and queues reproduce the full rescan."""
+
+    @pytest.mark.parametrize("seed", range(60))
+    def test_moves_match_full_rescan(self, seed: int) -> None:
+        rng = random.Random(seed)
+        fractional = seed % 3 == 0
+        reset_age = seed % 2 == 0
+        config = _random_config(rng)
+        population = _random_population(rng, fractional)
+        protected = {id(f) for f in population if rng.random() < 0.1}
+        excluded = {id(f) for f in population if rng.random() < 0.1}
+
+        def run(driver):  # type: ignore[no-untyped-def]
+            files = [
+                _StubFile(f.key, f.tier, f.n, f.tokens)
+                for f in population
+            ]
+            ids = {id(c): id(f) for c, f in zip(files, population)}
+
+            def set_tier(f, idx):  # type: ignore[no-untyped-def]
+                f.tier = idx
+                if reset_age:
+                    f.n = 0
+
+            result = driver(
+                files, config=config, set_tier=set_tier,
+                is_protected=lambda f: ids[id(f)] in protected,
+                is_balance_excluded=lambda f: ids[id(f)] in excluded,
+                **_stub_accessors(),
+            )
+            return result, [f.tier for f in files]
+
+        expected, expected_tiers = run(_naive_relax)
+        stats, tiers = run(relax)
+        assert stats.moves == expected
+        assert tiers == expected_tiers
+
+    def test_setter_age_reset_applies_in_new_tier(self) -> None:
+        """A mover re-queued upstream is keyed on its post-move age."""
+        cfg = _test_config(n_admit_active=0)
+        files = [
+            _StubFile("a.py", ACTIVE_IDX, 9, 100),
+            _StubFile("b.py", L3_IDX, 0, 100),
+        ]
+
+        def set_tier(f, idx):  # type: ignore[no-untyped-def]
+            f.tier = idx
+            f.n = 0
+
+        expected = _naive_relax(
+            [_StubFile(f.key, f.tier, f.n, f.tokens) for f in files],
+            config=cfg, set_tier=set_tier,
+            is_protected=lambda f: False,
+            is_balance_excluded=lambda f: False,
+            **_stub_accessors(),
+        )
+        stats = relax(
+            files, config=cfg, set_tier=set_tier, **_stub_accessors()
+        )
+        assert stats.moves == expected
+
+
 # ---------------------------------------------------------------------------
 # Tracker integration — FluxConfig wired in, deadband + rectification
 # ---------------------------------------------------------------------------
@@ -484,4 +484,113 @@ class TestCachedFilesAlias:
         cache.put("a.py", 1.0, _make_simple_file())
         files = cache.cached_files
         files.add("fake.py")
-        assert cache.cached_files == {"a.py"}
\ No newline at end of file
+        assert cache.cached_files == {"a.py"}
+
+# ---------------------------------------------------------------------------
+# Pack persistence
+# ---------------------------------------------------------------------------
+
+
+def _make_rich_file() -> FileSymbols:
+    """FileSymbols exercising every serialised field."""
+    method = Symbol(
+        name="run",
+        kind="method",
+        file_path="src/mod.py",
+        range=(3, 4, 6, 0),
+        parameters=[
+            Parameter(name="self"),
+            Parameter(name="n", type_annotation="int", default="1"),
+            Parameter(name="args", is_vararg=True),
+            Parameter(name="kw", is_kwarg=True),
+        ],
+        return_type="str",
+        is_async=True,
+        call_sites=[CallSite(name="helper", line=5, is_conditional=True)],
+    )
+    cls = Symbol(
+        name="Worker",
+        kind="class",
+        file_path="src/mod.py",
+        range=(2, 0, 6, 0),
+        bases=["Base"],
+        children=[method],
+        instance_vars=["state"],
+    )
+    return FileSymbols(
+        file_path="src/mod.py",
+        symbols=[cls],
+        imports=[
+            Import(module="os", line=1),
+            Import(module="pkg", names=["helper"], alias="h", level=1),
+        ],
+    )
+
+
+class TestPackPersistence:
+    """The pack file round-trips entries across instances."""
+
+    def test_round_trip_preserves_structure(self, tmp_path) -> None:
+        original = _make_rich_file()
+        cache = SymbolCache(tmp_path)
+        cache.put("src/mod.py", 123.0, original, content_hash="abc")
+        cache.flush()
+
+        loaded = SymbolCache(tmp_path)
+        restored = loaded.get("src/mod.py", 123.0)
+        assert restored == original
+        assert loaded.get_signature_hash(
+            "src/mod.py"
+        ) == cache.get_signature_hash("src/mod.py")
+
+    def test_resolution_targets_not_persisted(self, tmp_path) -> None:
+        fs = _make_rich_file()
+        fs.symbols[0].children[0].call_sites[0].target_file = "x.py"
+        cache = SymbolCache(tmp_path)
+        cache.put("src/mod.py", 1.0, fs)
+        cache.flush()
+        restored = SymbolCache(tmp_path).get("src/mod.py", 1.0)
+        assert restored is not None
+        call = restored.symbols[0].children[0].call_sites[0]
+        assert call.target_file is None
+
+    def test_get_by_content_ignores_mtime(self, tmp_path) -> None:
+        cache = SymbolCache(tmp_path)
+        fs = _make_simple_file()
+        cache.put("src/mod.py", 1.0, fs, content_hash="h1")
+        assert cache.get("src/mod.py", 2.0) is None
+        assert cache.get_by_content("src/mod.py", "h1") is fs
+        assert cache.get_by_content("src/mod.py", "h2") is None
+
+    def test_flush_skipped_when_clean(self, tmp_path) -> None:
+        cache = SymbolCache(tmp_path)
+        cache.flush()
+        assert not (tmp_path / ".ac-dc4" / "symbol_cache.json").exists()
+
+    def test_invalidate_removed_from_pack(self, tmp_path) -> None:
+        cache = SymbolCache(tmp_path)
+        cache.put("a.py", 1.0, _make_simple_file())
+        cache.put("b.py", 1.0, _make_simple_file())
+        cache.flush()
+        cache.invalidate("a.py")
+        cache.flush()
+        assert SymbolCache(tmp_path).cached_paths == {"b.py"}
+
+    def test_corrupt_pack_ignored(self, tmp_path) -> None:
+        pack = tmp_path / ".ac-dc4" / "symbol_cache.json"
+        pack.parent.mkdir()
+        pack.write_text("{truncated")
+        cache = SymbolCache(tmp_path)
+        assert cache.cached_paths == set()
+
+    def test_version_mismatch_ignored(self, tmp_path) -> None:
+        pack = tmp_path / ".ac-dc4" / "symbol_cache.json"
+        pack.parent.mkdir()
+        pack.write_text('{"version": 0, "entries": {"a.py": {}}}')
+        assert SymbolCache(tmp_path).cached_paths == set()
+
+    def test_no_repo_root_is_memory_only(self, tmp_path) -> None:
+        cache = SymbolCache()
+        cache.put("a.py", 1.0, _make_simple_file())
+        cache.flush()
+        assert not any(tmp_path.iterdir())
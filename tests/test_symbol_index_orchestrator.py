@@ -20,6 +20,7 @@ Governing spec: specs4/2-indexing/symbol-index.md.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -332,6 +333,226 @@ class TestIndexRepo:
         assert index._all_symbols == {}
 
 
+# ---------------------------------------------------------------------------
+# Parallel indexing
+# ---------------------------------------------------------------------------
+
+
+def _write_cross_importing_repo(repo_dir: Path, count: int) -> list[str]:
+    """Write ``count`` modules, each importing and calling the previous."""
+    files: list[str] = []
+    for i in range(count):
+        body = f"def fn{i}(x: int = {i}):\n    return x\n"
+        if i:
+            body = (
+                f"from mod{i - 1} import fn{i - 1}\n\n"
+                + body.replace("return x", f"return fn{i - 1}(x)")
+            )
+        _write(repo_dir / f"mod{i}.py", body)
+        files.append(f"mod{i}.py")
+    _write(repo_dir / "notes.txt", "not indexed\n")
+    files.append("notes.txt")
+    return files
+
+
+class TestParallelIndexing:
+    """Process-pool indexing produces the serial pass's result."""
+
+    def _parallel(self, repo_dir: Path) -> SymbolIndex:
+        return SymbolIndex(
+            repo_root=repo_dir,
+            workers=2,
+            parallel_min_files=1,
+            shard_size=3,
+            # Don't pick up the serial index's pack file —
+            # these tests need the parses to happen.
+            persist_cache=False,
+        )
+
+    def test_matches_serial_result(
+        self, index: SymbolIndex, repo_dir: Path
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 8)
+        index.index_repo(files)
+        parallel = self._parallel(repo_dir)
+        parallel.index_repo(files)
+
+        assert list(parallel._all_symbols) == list(index._all_symbols)
+        assert parallel.get_symbol_map() == index.get_symbol_map()
+        assert parallel.get_lsp_symbol_map() == index.get_lsp_symbol_map()
+        # Parent-side import and call-site resolution ran.
+        assert "mod2.py" in parallel._ref_index.files_referencing(
+            "mod1.py"
+        )
+        # Parsed results landed in the cache.
+        assert parallel._cache.cached_paths == set(index._all_symbols)
+
+    def test_progress_reported_per_shard(
+        self, index: SymbolIndex, repo_dir: Path
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 7)
+        calls: list[tuple[int, int]] = []
+        self._parallel(repo_dir).index_repo(
+            files, progress=lambda d, t: calls.append((d, t))
+        )
+        # Seven files in shards of three → three shards.
+        assert len(calls) == 3
+        assert calls[-1] == (7, 7)
+        assert [d for d, _ in calls] == sorted(d for d, _ in calls)
+
+    def test_cache_hits_stay_in_process(
+        self,
+        index: SymbolIndex,
+        repo_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A warm re-index has nothing to parse — no pool start."""
+        files = _write_cross_importing_repo(repo_dir, 4)
+        parallel = self._parallel(repo_dir)
+        parallel.index_repo(files)
+
+        def _no_pool(*args: object, **kwargs: object) -> None:
+            raise AssertionError("pool started for a warm re-index")
+
+        monkeypatch.setattr(
+            "ac_dc.symbol_index.index.ProcessPoolExecutor", _no_pool
+        )
+        parallel.index_repo(files)
+        assert len(parallel._all_symbols) == 4
+
+    def test_pool_failure_falls_back_to_serial(
+        self,
+        index: SymbolIndex,
+        repo_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 4)
+
+        def _broken_pool(*args: object, **kwargs: object) -> None:
+            raise OSError("process creation not permitted")
+
+        monkeypatch.setattr(
+            "ac_dc.symbol_index.index.ProcessPoolExecutor", _broken_pool
+        )
+        calls: list[tuple[int, int]] = []
+        parallel = self._parallel(repo_dir)
+        parallel.index_repo(
+            files, progress=lambda d, t: calls.append((d, t))
+        )
+        assert len(parallel._all_symbols) == 4
+        assert calls[-1] == (4, 4)
+
+    def test_below_threshold_stays_serial(
+        self,
+        index: SymbolIndex,
+        repo_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 3)
+
+        def _no_pool(*args: object, **kwargs: object) -> None:
+            raise AssertionError("pool started below threshold")
+
+        monkeypatch.setattr(
+            "ac_dc.symbol_index.index.ProcessPoolExecutor", _no_pool
+        )
+        small = SymbolIndex(
+            repo_root=repo_dir, workers=4, parallel_min_files=10
+        )
+        small.index_repo(files)
+        assert len(small._all_symbols) == 3
+
+    def test_zero_workers_means_cpu_count(self, repo_dir: Path) -> None:
+        idx = SymbolIndex(repo_root=repo_dir, workers=0)
+        assert idx._workers == (os.cpu_count() or 1)
+
+
+# ---------------------------------------------------------------------------
+# Persistent cache
+# ---------------------------------------------------------------------------
+
+
+def _count_extractions(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every in-process extraction by path."""
+    from ac_dc.symbol_index import index as index_module
+
+    seen: list[str] = []
+    original = index_module._extract_source
+
+    def _spy(parser, extractor, language, source, rel):  # type: ignore[no-untyped-def]
+        seen.append(rel)
+        return original(parser, extractor, language, source, rel)
+
+    monkeypatch.setattr(index_module, "_extract_source", _spy)
+    return seen
+
+
+class TestPersistentCache:
+    """Warm starts reuse the on-disk pack."""
+
+    def test_warm_start_parses_nothing(
+        self,
+        index: SymbolIndex,
+        repo_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 4)
+        index.index_repo(files)
+        assert (repo_dir / ".ac-dc4" / "symbol_cache.json").exists()
+
+        seen = _count_extractions(monkeypatch)
+        fresh = SymbolIndex(repo_root=repo_dir)
+        fresh.index_repo(files)
+        assert seen == []
+        assert fresh.get_symbol_map() == index.get_symbol_map()
+        # Resolution re-ran against the loaded entries.
+        assert "mod1.py" in fresh._ref_index.files_referencing("mod0.py")
+
+    def test_touched_file_reused_by_content(
+        self,
+        index: SymbolIndex,
+        repo_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 2)
+        index.index_repo(files)
+        path = repo_dir / "mod0.py"
+        mtime = path.stat().st_mtime + 10
+        os.utime(path, (mtime, mtime))
+
+        seen = _count_extractions(monkeypatch)
+        fresh = SymbolIndex(repo_root=repo_dir)
+        fresh.index_repo(files)
+        assert seen == []
+        # Re-stamped — the next lookup hits on mtime.
+        assert fresh._cache.get("mod0.py", path.stat().st_mtime)
+
+    def test_edited_file_reparsed(
+        self,
+        index: SymbolIndex,
+        repo_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 2)
+        index.index_repo(files)
+        path = repo_dir / "mod0.py"
+        _write(path, "def renamed():\n    pass\n")
+        mtime = path.stat().st_mtime + 10
+        os.utime(path, (mtime, mtime))
+
+        seen = _count_extractions(monkeypatch)
+        fresh = SymbolIndex(repo_root=repo_dir)
+        fresh.index_repo(files)
+        assert seen == ["mod0.py"]
+        assert fresh._all_symbols["mod0.py"].symbols[0].name == "renamed"
+
+    def test_persist_disabled_writes_nothing(self, repo_dir: Path) -> None:
+        _write(repo_dir / "a.py", "x = 1\n")
+        idx = SymbolIndex(repo_root=repo_dir, persist_cache=False)
+        idx.index_repo(["a.py"])
+        assert not (repo_dir / ".ac-dc4").exists()
+
+
 # ---------------------------------------------------------------------------
 # Stale removal
 # ---------------------------------------------------------------------------
@@ -400,6 +621,128 @@ class TestStaleRemoval:
         assert index._ref_index.files_referencing("b.py") == set()
 
 
+def _graph_snapshot(index: SymbolIndex) -> dict:
+    """Order-insensitive view of the reference graph."""
+    ref = index._ref_index
+    files = sorted(index._all_symbols)
+    return {
+        "components": sorted(
+            sorted(c) for c in ref.connected_components()
+        ),
+        "incoming": {f: sorted(ref.files_referencing(f)) for f in files},
+        "counts": {f: ref.file_ref_count(f) for f in files},
+    }
+
+
+def _bump(path: Path, content: str) -> None:
+    """Rewrite ``path`` with a strictly newer mtime."""
+    st = path.stat()
+    _write(path, content)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+class TestIncrementalReferenceGraph:
+    """Re-index passes update the graph for affected files only."""
+
+    def _spy_resolution(
+        self, index: SymbolIndex, monkeypatch: pytest.MonkeyPatch
+    ) -> list[set[str] | None]:
+        calls: list[set[str] | None] = []
+        original = index._resolve_call_sites
+
+        def _spy(paths=None):  # type: ignore[no-untyped-def]
+            calls.append(None if paths is None else set(paths))
+            original(paths)
+
+        monkeypatch.setattr(index, "_resolve_call_sites", _spy)
+        return calls
+
+    def test_edit_resolves_file_and_importers_only(
+        self,
+        index: SymbolIndex,
+        repo_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 8)
+        index.index_repo(files)
+        calls = self._spy_resolution(index, monkeypatch)
+
+        _bump(
+            repo_dir / "mod3.py",
+            "from mod2 import fn2\n\n"
+            "def fn3(x: int = 3):\n    return fn2(x) + 1\n",
+        )
+        index.index_repo(files)
+        # mod3 itself plus mod4, the only module importing it.
+        assert calls == [{"mod3.py", "mod4.py"}]
+
+        fresh = SymbolIndex(repo_root=repo_dir, persist_cache=False)
+        fresh.index_repo(files)
+        assert _graph_snapshot(index) == _graph_snapshot(fresh)
+
+    def test_unchanged_pass_skips_resolution(
+        self,
+        index: SymbolIndex,
+        repo_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 4)
+        index.index_repo(files)
+        calls = self._spy_resolution(index, monkeypatch)
+        index.index_repo(files)
+        assert calls == []
+
+    def test_deleted_module_retracts_edges(
+        self, index: SymbolIndex, repo_dir: Path
+    ) -> None:
+        files = _write_cross_importing_repo(repo_dir, 8)
+        index.index_repo(files)
+        assert index._ref_index.files_referencing("mod7.py") == set()
+        assert "mod5.py" in index._ref_index.files_referencing("mod4.py")
+
+        (repo_dir / "mod4.py").unlink()
+        files.remove("mod4.py")
+        index.index_repo(files)
+        # mod5's import no longer resolves — no edge to the
+        # vanished file, and none of its call sites point at it.
+        assert index._ref_index.file_dependencies("mod5.py") == set()
+        calls = [
+            cs for sym in index._all_symbols["mod5.py"].all_symbols_flat
+            for cs in sym.call_sites
+        ]
+        assert all(cs.target_file is None for cs in calls)
+
+        fresh = SymbolIndex(repo_root=repo_dir, persist_cache=False)
+        fresh.index_repo(files)
+        assert _graph_snapshot(index) == _graph_snapshot(fresh)
+
+    def test_new_module_resolves_unchanged_importer(
+        self, index: SymbolIndex, repo_dir: Path
+    ) -> None:
+        """An import that starts resolving re-resolves its file.
+
+        mod5.py isn't edited, but mod4.py reappearing changes
+        where its ``from mod4 import fn4`` points.
+        """
+        files = _write_cross_importing_repo(repo_dir, 8)
+        content = (repo_dir / "mod4.py").read_text()
+        (repo_dir / "mod4.py").unlink()
+        files.remove("mod4.py")
+        index.index_repo(files)
+        assert index._ref_index.file_dependencies("mod5.py") == set()
+
+        _write(repo_dir / "mod4.py", content)
+        files.append("mod4.py")
+        index.index_repo(files)
+        assert index._ref_index.file_dependencies("mod5.py") == {
+            "mod4.py"
+        }
+
+        fresh = SymbolIndex(repo_root=repo_dir, persist_cache=False)
+        fresh.index_repo(files)
+        assert _graph_snapshot(index) == _graph_snapshot(fresh)
+
+
 # ---------------------------------------------------------------------------
 # Invalidation
 # ---------------------------------------------------------------------------
@@ -621,6 +964,129 @@ class TestSignatureHash:
         assert first_hash == second_hash
 
 
+class TestDirBlockCache:
+    """Per-directory blocks and hashes are cached until an input moves."""
+
+    @pytest.fixture
+    def two_dirs(self, index: SymbolIndex, repo_dir: Path) -> list[str]:
+        _write(repo_dir / "pkg" / "a.py", "def fa():\n    return 1\n")
+        _write(repo_dir / "pkg" / "b.py", "def fb():\n    return 2\n")
+        _write(repo_dir / "other" / "c.py", "def fc():\n    return 3\n")
+        files = ["pkg/a.py", "pkg/b.py", "other/c.py"]
+        index.index_repo(files)
+        return files
+
+    def _count_renders(
+        self, index: SymbolIndex, monkeypatch: pytest.MonkeyPatch
+    ) -> list[str]:
+        calls: list[str] = []
+        original = index.get_file_symbol_block
+
+        def _spy(path):  # type: ignore[no-untyped-def]
+            calls.append(path)
+            return original(path)
+
+        monkeypatch.setattr(index, "get_file_symbol_block", _spy)
+        return calls
+
+    def test_repeat_reads_hit_cache(
+        self,
+        index: SymbolIndex,
+        two_dirs: list[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        calls = self._count_renders(index, monkeypatch)
+        first = index.get_dir_symbols_block("pkg")
+        second = index.get_dir_symbols_block("pkg")
+        assert first == second
+        assert calls == ["pkg/a.py", "pkg/b.py"]
+        assert index.get_dir_signature_hash("pkg") == (
+            index.get_dir_signature_hash("pkg")
+        )
+
+    def test_other_directory_change_keeps_cache(
+        self,
+        index: SymbolIndex,
+        two_dirs: list[str],
+        repo_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        index.get_dir_symbols_block("pkg")
+        calls = self._count_renders(index, monkeypatch)
+        _bump(repo_dir / "other" / "c.py", "def fc2():\n    return 4\n")
+        index.index_file("other/c.py")
+        index.get_dir_symbols_block("pkg")
+        assert calls == []
+
+    def test_block_version_tracks_rendered_block(
+        self, index: SymbolIndex, two_dirs: list[str], repo_dir: Path
+    ) -> None:
+        version = index.get_dir_block_version("pkg")
+        assert index.get_dir_block_version("pkg") == version
+        assert index.get_dir_block_version(
+            "pkg", exclude_active={"pkg/a.py"}
+        ) != version
+        _bump(repo_dir / "other" / "c.py", "def fc2():\n    return 4\n")
+        index.index_file("other/c.py")
+        assert index.get_dir_block_version("pkg") == version
+        _bump(repo_dir / "pkg" / "a.py", "def renamed():\n    return 1\n")
+        index.index_file("pkg/a.py")
+        assert index.get_dir_block_version("pkg") != version
+
+    def test_member_edit_rerenders_and_rehashes(
+        self, index: SymbolIndex, two_dirs: list[str], repo_dir: Path
+    ) -> None:
+        block = index.get_dir_symbols_block("pkg")
+        digest = index.get_dir_signature_hash("pkg")
+        _bump(repo_dir / "pkg" / "a.py", "def renamed():\n    return 1\n")
+        index.index_file("pkg/a.py")
+        assert "renamed" in index.get_dir_symbols_block("pkg")
+        assert index.get_dir_symbols_block("pkg") != block
+        assert index.get_dir_signature_hash("pkg") != digest
+
+    def test_active_exclusion_is_part_of_key(
+        self, index: SymbolIndex, two_dirs: list[str]
+    ) -> None:
+        full = index.get_dir_symbols_block("pkg")
+        partial = index.get_dir_symbols_block("pkg", {"pkg/a.py"})
+        assert "fa" in full
+        assert "fa" not in partial
+        # Active files outside the directory don't matter.
+        assert index.get_dir_symbols_block(
+            "pkg", {"other/c.py"}
+        ) == full
+        assert index.get_dir_signature_hash("pkg", {"pkg/a.py"}) != (
+            index.get_dir_signature_hash("pkg")
+        )
+
+    def test_removal_and_new_members_seen(
+        self, index: SymbolIndex, two_dirs: list[str], repo_dir: Path
+    ) -> None:
+        index.get_dir_symbols_block("pkg")
+        index.invalidate_file("pkg/b.py")
+        assert "fb" not in index.get_dir_symbols_block("pkg")
+        _write(repo_dir / "pkg" / "d.py", "def fd():\n    return 5\n")
+        index.index_file("pkg/d.py")
+        assert "fd" in index.get_dir_symbols_block("pkg")
+        assert index.get_indexed_directories() == ["other", "pkg"]
+
+    def test_graph_change_elsewhere_refreshes_ref_counts(
+        self, index: SymbolIndex, two_dirs: list[str], repo_dir: Path
+    ) -> None:
+        """``←N`` counts come from other directories' imports."""
+        index.get_dir_symbols_block("pkg")
+        _write(
+            repo_dir / "other" / "user.py",
+            "from pkg.a import fa\n\ndef go():\n    return fa()\n",
+        )
+        index.index_repo(two_dirs + ["other/user.py"])
+        fresh = SymbolIndex(repo_root=repo_dir, persist_cache=False)
+        fresh.index_repo(two_dirs + ["other/user.py"])
+        assert index.get_dir_symbols_block("pkg") == (
+            fresh.get_dir_symbols_block("pkg")
+        )
+
+
 # ---------------------------------------------------------------------------
 # Snapshot discipline
 # ---------------------------------------------------------------------------
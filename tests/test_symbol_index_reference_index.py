@@ -355,4 +355,112 @@ class TestImportEdges:
         )
         fs_b = _make_fs("b.py")
         idx.build([fs_a, fs_b])
-        assert idx.file_ref_count("b.py") == 2
\ No newline at end of file
+        assert idx.file_ref_count("b.py") == 2
+
+# ---------------------------------------------------------------------------
+# Incremental update
+# ---------------------------------------------------------------------------
+
+
+def _graph_state(idx: ReferenceIndex, names: list[str]) -> dict:
+    """Snapshot every query result, order-insensitively."""
+    files = sorted(
+        path for comp in idx.connected_components() for path in comp
+    )
+    return {
+        "components": sorted(
+            sorted(comp) for comp in idx.connected_components()
+        ),
+        "incoming": {p: sorted(idx.files_referencing(p)) for p in files},
+        "outgoing": {p: sorted(idx.file_dependencies(p)) for p in files},
+        "counts": {p: idx.file_ref_count(p) for p in files},
+        "refs": {n: sorted(idx.references_to_symbol(n)) for n in names},
+    }
+
+
+def _calls(path: str, *targets: str) -> FileSymbols:
+    """File whose function calls ``f_<target stem>`` in each target."""
+    return _make_fs(
+        path,
+        call_sites=[
+            CallSite(
+                name=f"f_{t[0]}", line=i + 1,
+                target_file=t, target_symbol=f"f_{t[0]}",
+            )
+            for i, t in enumerate(targets)
+        ],
+    )
+
+
+class TestIncrementalUpdate:
+    """update() leaves the graph exactly as a fresh build would."""
+
+    _NAMES = ["f_a", "f_b", "f_c", "f_d"]
+
+    def test_edit_matches_rebuild(self) -> None:
+        idx = ReferenceIndex()
+        idx.build([
+            _calls("a.py", "b.py"),
+            _calls("b.py", "a.py", "c.py"),
+            _calls("c.py"),
+        ])
+        edited = _calls("b.py", "c.py", "d.py")
+        idx.update([edited])
+
+        fresh = ReferenceIndex()
+        fresh.build([_calls("a.py", "b.py"), edited, _calls("c.py")])
+        assert _graph_state(idx, self._NAMES) == _graph_state(
+            fresh, self._NAMES
+        )
+        # The a↔b cluster dissolved with the edit.
+        assert {"a.py", "b.py"} not in idx.connected_components()
+
+    def test_removal_matches_rebuild(self) -> None:
+        idx = ReferenceIndex()
+        idx.build([
+            _calls("a.py", "b.py"),
+            _calls("b.py", "a.py", "d.py"),
+            _calls("c.py", "a.py"),
+        ])
+        idx.update([], removed=["b.py"])
+
+        fresh = ReferenceIndex()
+        fresh.build([_calls("a.py", "b.py"), _calls("c.py", "a.py")])
+        assert _graph_state(idx, self._NAMES) == _graph_state(
+            fresh, self._NAMES
+        )
+        # b.py is still referenced, so it stays known; d.py
+        # was only reachable through b.py and is gone.
+        assert idx.file_ref_count("b.py") == 1
+        assert idx.file_ref_count("d.py") == 0
+        assert not any("d.py" in c for c in idx.connected_components())
+
+    def test_added_file_matches_rebuild(self) -> None:
+        idx = ReferenceIndex()
+        idx.build([_calls("a.py", "b.py")])
+        new = _make_fs(
+            "b.py",
+            imports=[_with_resolved_import(
+                Import(module="a", line=1), "a.py",
+            )],
+        )
+        idx.update([new])
+
+        fresh = ReferenceIndex()
+        fresh.build([_calls("a.py", "b.py"), new])
+        assert _graph_state(idx, self._NAMES) == _graph_state(
+            fresh, self._NAMES
+        )
+        assert {"a.py", "b.py"} in idx.connected_components()
+
+    def test_unrelated_files_untouched(self) -> None:
+        idx = ReferenceIndex()
+        idx.build([
+            _calls("a.py", "b.py"),
+            _calls("b.py"),
+            _calls("x.py", "y.py"),
+        ])
+        idx.update([_calls("a.py")])
+        assert idx.files_referencing("y.py") == {"x.py"}
+        assert idx.references_to_symbol("f_y") == [("x.py", 1)]
+        assert idx.references_to_symbol("f_b") == []
@@ -642,4 +642,178 @@ class TestInstanceIndependence:
         first = tc.count(text)
         second = tc.count(text)
         third = tc.count(text)
-        assert first == second == third
\ No newline at end of file
+        assert first == second == third
+
+# ---------------------------------------------------------------------------
+# Count memo
+# ---------------------------------------------------------------------------
+
+
+class _CountingEncoder:
+    """Whitespace 'tokenizer' that records every encode call."""
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def encode(self, text: str) -> list[str]:
+        self.calls += 1
+        return text.split()
+
+
+class TestCountMemo:
+    """Long strings are counted once per content hash."""
+
+    @pytest.fixture
+    def encoder(self, monkeypatch: pytest.MonkeyPatch) -> _CountingEncoder:
+        enc = _CountingEncoder()
+        monkeypatch.setattr(tc_module, "_load_encoding", lambda: enc)
+        return enc
+
+    def test_repeat_count_is_a_hit(self, encoder: _CountingEncoder) -> None:
+        tc = TokenCounter("anthropic/claude-sonnet-4-5")
+        text = "word " * 200
+        assert tc.count(text) == 200
+        assert tc.count(text) == 200
+        # Equal content in a distinct string object still hits.
+        assert tc.count("".join(["word "] * 200)) == 200
+        assert encoder.calls == 1
+        stats = tc.cache_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (
+            2, 1, 1,
+        )
+
+    def test_changed_content_misses(
+        self, encoder: _CountingEncoder
+    ) -> None:
+        tc = TokenCounter("anthropic/claude-sonnet-4-5")
+        tc.count("word " * 200)
+        assert tc.count("word " * 201) == 201
+        assert encoder.calls == 2
+
+    def test_short_strings_bypass_memo(
+        self, encoder: _CountingEncoder
+    ) -> None:
+        tc = TokenCounter("anthropic/claude-sonnet-4-5")
+        tc.count("short text")
+        tc.count("short text")
+        assert encoder.calls == 2
+        assert tc.cache_stats()["hits"] == 0
+
+    def test_lru_bounded(self, encoder: _CountingEncoder) -> None:
+        tc = TokenCounter("anthropic/claude-sonnet-4-5", memo_entries=2)
+        a, b, c = ("a " * 200, "b " * 200, "c " * 200)
+        tc.count(a)
+        tc.count(b)
+        tc.count(a)  # refresh a — b is now least recent
+        tc.count(c)
+        assert tc.cache_stats()["entries"] == 2
+        calls = encoder.calls
+        tc.count(a)
+        assert encoder.calls == calls
+        tc.count(b)
+        assert encoder.calls == calls + 1
+
+    def test_zero_capacity_disables(
+        self, encoder: _CountingEncoder
+    ) -> None:
+        tc = TokenCounter("anthropic/claude-sonnet-4-5", memo_entries=0)
+        tc.count("word " * 200)
+        tc.count("word " * 200)
+        assert encoder.calls == 2
+        assert tc.cache_stats()["entries"] == 0
+
+    def test_messages_share_the_memo(
+        self, encoder: _CountingEncoder
+    ) -> None:
+        tc = TokenCounter("anthropic/claude-sonnet-4-5")
+        body = "word " * 200
+        tc.count({"role": "user", "content": body})
+        tc.count({"role": "user", "content": [
+            {"type": "text", "text": body},
+        ]})
+        assert tc.cache_stats()["hits"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Batch counting
+# ---------------------------------------------------------------------------
+
+
+class _BatchEncoder(_CountingEncoder):
+    """Adds an ``encode_batch`` that records its batch sizes."""
+
+    def __init__(self, fail: bool = False) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+        self.fail = fail
+
+    def encode_batch(
+        self, texts: list[str], *, num_threads: int = 8
+    ) -> list[list[str]]:
+        self.batches.append(len(texts))
+        if self.fail:
+            raise ValueError("special token in batch")
+        return [t.split() for t in texts]
+
+
+class TestCountMany:
+    """count_many agrees with count and batches the misses."""
+
+    def _texts(self) -> list[str]:
+        return [f"w{i} " * (i + 1) for i in range(20)] + ["", "x" * 300]
+
+    def test_matches_individual_counts(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        enc = _BatchEncoder()
+        monkeypatch.setattr(tc_module, "_load_encoding", lambda: enc)
+        tc = TokenCounter("anthropic/claude-sonnet-4-5")
+        texts = self._texts()
+        batched = tc.count_many(texts)
+        fresh = TokenCounter("anthropic/claude-sonnet-4-5")
+        assert batched == [fresh.count(t) for t in texts]
+        # One batch, empty string skipped.
+        assert enc.batches == [len(texts) - 1]
+
+    def test_memo_hits_skip_the_batch(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        enc = _BatchEncoder()
+        monkeypatch.setattr(tc_module, "_load_encoding", lambda: enc)
+        tc = TokenCounter("anthropic/claude-sonnet-4-5")
+        long_texts = [f"block{i} " * 100 for i in range(10)]
+        first = tc.count_many(long_texts)
+        assert tc.count_many(long_texts) == first
+        assert enc.batches == [10]
+        assert tc.cache_stats()["hits"] == 10
+
+    def test_duplicates_encoded_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        enc = _BatchEncoder()
+        monkeypatch.setattr(tc_module, "_load_encoding", lambda: enc)
+        tc = TokenCounter("anthropic/claude-sonnet-4-5")
+        assert tc.count_many(["a b", "a b", "c"]) == [2, 2, 1]
+        # Below the batch threshold — encoded one by one.
+        assert enc.batches == []
+        assert enc.calls == 2
+
+    def test_batch_failure_falls_back_per_item(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        enc = _BatchEncoder(fail=True)
+        monkeypatch.setattr(tc_module, "_load_encoding", lambda: enc)
+        tc = TokenCounter("anthropic/claude-sonnet-4-5")
+        texts = self._texts()
+        assert tc.count_many(texts) == [
+            len(t.split()) for t in texts
+        ]
+
+    def test_without_encoder_uses_char_estimate(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(tc_module, "_load_encoding", lambda: None)
+        tc = TokenCounter("anthropic/claude-sonnet-4-5")
+        assert tc.count_many(["x" * 40, "", "y" * 8]) == [10, 0, 2]
@@ -5,9 +5,10 @@ Scope:
 - URLContent and GitHubInfo dataclasses — defaults, to_dict /
   from_dict round-trip, format_for_prompt with every body
   priority and truncation.
-- URLCache — set / get round-trip, miss, expiry, corrupt
-  entry handling, invalidate, clear, cleanup_expired,
-  timestamp injection, error-record refusal.
+- URLCache — set / get round-trip, miss, expiry, invalidate,
+  clear, cleanup_expired, timestamp injection, error-record
+  refusal, LRU eviction under the byte budget, stats, and
+  migration of the old per-URL sidecar files.
 
 Strategy:
 
@@ -19,6 +20,7 @@ Strategy:
 from __future__ import annotations
 
 import json
+import sqlite3
 import time
 from pathlib import Path
 
@@ -297,6 +299,15 @@ def cache_dir(tmp_path: Path) -> Path:
     return d
 
 
+def _age(cache: URLCache, url: str, seconds: float) -> None:
+    """Backdate ``url``'s cache timestamp by ``seconds``."""
+    with sqlite3.connect(cache.db_path) as conn:
+        conn.execute(
+            "UPDATE entries SET cached_at = ? WHERE url = ?",
+            (time.time() - seconds, url),
+        )
+
+
 class TestCacheConstruction:
     """Cache directory creation and basic properties."""
 
@@ -435,15 +446,9 @@ class TestCacheExpiry:
 
     def test_get_expired_returns_none(self, cache_dir: Path) -> None:
         """Expired entries disappear from get."""
-        # 0.001 hours = 3.6 seconds, but we use a custom cached_at
-        # so we don't need to wait.
         cache = URLCache(cache_dir, ttl_hours=1)
         cache.set("https://example.com", {"url": "https://example.com"})
-        # Rewrite the file with a stale timestamp.
-        path = cache_dir / f"{url_hash('https://example.com')}.json"
-        data = json.loads(path.read_text(encoding="utf-8"))
-        data["_cached_at"] = time.time() - 7200  # 2 hours ago
-        path.write_text(json.dumps(data), encoding="utf-8")
+        _age(cache, "https://example.com", 7200)  # 2 hours ago
         # Now the entry is older than the 1-hour TTL.
         assert cache.get("https://example.com") is None
 
@@ -451,77 +456,24 @@ class TestCacheExpiry:
         """ttl_hours=0 effectively disables the cache."""
         cache = URLCache(cache_dir, ttl_hours=0)
         cache.set("https://example.com", {"url": "https://example.com"})
-        # Age is ~0 but TTL is 0, so it's always expired.
-        # ``age > ttl_seconds`` when both are 0.something ≈ 0
-        # — our implementation uses strict ``>``, so technically
-        # a fresh entry could still be visible for a microsecond.
-        # That's acceptable and the test shouldn't depend on it.
-        # What we CAN assert: aging the entry by any non-zero
-        # amount makes it expire.
-        path = cache_dir / f"{url_hash('https://example.com')}.json"
-        data = json.loads(path.read_text(encoding="utf-8"))
-        data["_cached_at"] = time.time() - 1  # 1 second ago
-        path.write_text(json.dumps(data), encoding="utf-8")
+        _age(cache, "https://example.com", 1)
         assert cache.get("https://example.com") is None
 
-    def test_expired_entry_not_auto_deleted(
+    def test_expired_entry_kept_for_revalidation(
         self, cache_dir: Path,
     ) -> None:
-        """Expired entries stay on disk until cleanup_expired."""
+        """Expired entries stay stored and visible to get_stale."""
         cache = URLCache(cache_dir, ttl_hours=1)
-        cache.set("https://example.com", {"url": "https://example.com"})
-        path = cache_dir / f"{url_hash('https://example.com')}.json"
-        data = json.loads(path.read_text(encoding="utf-8"))
-        data["_cached_at"] = time.time() - 7200
-        path.write_text(json.dumps(data), encoding="utf-8")
-        # get() returns None but the file still exists.
+        cache.set("https://example.com", {
+            "url": "https://example.com", "etag": '"v1"',
+        })
+        _age(cache, "https://example.com", 7200)
         assert cache.get("https://example.com") is None
-        assert path.is_file()
-
-
-class TestCacheCorruption:
-    """Corrupt entry handling."""
-
-    def test_invalid_json_returns_none_and_deletes(
-        self, cache_dir: Path,
-    ) -> None:
-        cache = URLCache(cache_dir, ttl_hours=1)
-        path = cache_dir / f"{url_hash('https://x.com')}.json"
-        path.write_text("not valid json {", encoding="utf-8")
-        assert cache.get("https://x.com") is None
-        # Delete on read.
-        assert not path.exists()
-
-    def test_non_dict_json_returns_none_and_deletes(
-        self, cache_dir: Path,
-    ) -> None:
-        cache = URLCache(cache_dir, ttl_hours=1)
-        path = cache_dir / f"{url_hash('https://x.com')}.json"
-        path.write_text('["array", "not", "dict"]', encoding="utf-8")
-        assert cache.get("https://x.com") is None
-        assert not path.exists()
-
-    def test_missing_cached_at_returns_none(
-        self, cache_dir: Path,
-    ) -> None:
-        """Entry without timestamp treated as expired (not deleted)."""
-        cache = URLCache(cache_dir, ttl_hours=1)
-        path = cache_dir / f"{url_hash('https://x.com')}.json"
-        path.write_text('{"url": "https://x.com"}', encoding="utf-8")
-        assert cache.get("https://x.com") is None
-        # No cached_at is different from corrupt — we don't
-        # delete; cleanup_expired will handle it. See that
-        # test below.
-
-    def test_non_numeric_cached_at_returns_none(
-        self, cache_dir: Path,
-    ) -> None:
-        cache = URLCache(cache_dir, ttl_hours=1)
-        path = cache_dir / f"{url_hash('https://x.com')}.json"
-        path.write_text(
-            '{"_cached_at": "not a number"}', encoding="utf-8"
-        )
-        assert cache.get("https://x.com") is None
+        stale = cache.get_stale("https://example.com")
+        assert stale is not None
+        assert stale["etag"] == '"v1"'
+        stats = cache.stats()
+        assert (stats["entries"], stats["expired"]) == (1, 1)
 
 
 class TestCacheInvalidate:
@@ -587,7 +539,7 @@ class TestCacheClear:
 
 
 class TestCacheCleanupExpired:
-    """Periodic cleanup pass."""
+    """Explicit expiry sweep."""
 
     def test_cleanup_empty_cache(self, cache_dir: Path) -> None:
         cache = URLCache(cache_dir, ttl_hours=1)
@@ -597,44 +549,192 @@ class TestCacheCleanupExpired:
         self, cache_dir: Path,
     ) -> None:
         cache = URLCache(cache_dir, ttl_hours=1)
-        # Fresh entry.
         cache.set("https://fresh.com", {"url": "https://fresh.com"})
-        # Expired entry — manually age it.
         cache.set("https://stale.com", {"url": "https://stale.com"})
-        stale_path = cache_dir / f"{url_hash('https://stale.com')}.json"
-        data = json.loads(stale_path.read_text(encoding="utf-8"))
-        data["_cached_at"] = time.time() - 7200  # 2 hours ago
-        stale_path.write_text(json.dumps(data), encoding="utf-8")
+        _age(cache, "https://stale.com", 7200)
+        before = cache.stats()["bytes"]
 
-        removed = cache.cleanup_expired()
-        assert removed == 1
+        assert cache.cleanup_expired() == 1
         assert cache.get("https://fresh.com") is not None
-        assert not stale_path.exists()
+        assert cache.get_stale("https://stale.com") is None
+        assert cache.stats()["bytes"] < before
 
-    def test_cleanup_removes_corrupt_entries(
+    def test_cleanup_leaves_non_cache_files_alone(
         self, cache_dir: Path,
     ) -> None:
         cache = URLCache(cache_dir, ttl_hours=1)
-        corrupt = cache_dir / "abc1234567890def.json"
-        corrupt.write_text("not json", encoding="utf-8")
-        assert cache.cleanup_expired() == 1
-        assert not corrupt.exists()
+        stray = cache_dir / "README.md"
+        stray.write_text("hands off")
+        cache.cleanup_expired()
+        assert stray.is_file()
+
 
-    def test_cleanup_removes_missing_timestamp(
+class TestCacheEviction:
+    """Byte budget with least-recently-used eviction."""
+
+    @staticmethod
+    def _entry(url: str) -> dict[str, str]:
+        return {"url": url, "content": "x" * 1000}
+
+    def test_lru_entry_evicted_over_budget(self, cache_dir: Path) -> None:
+        cache = URLCache(cache_dir, ttl_hours=1, max_bytes=2500)
+        cache.set("https://a.com", self._entry("https://a.com"))
+        cache.set("https://b.com", self._entry("https://b.com"))
+        # Touch a — b becomes least recently used.
+        assert cache.get("https://a.com") is not None
+        cache.set("https://c.com", self._entry("https://c.com"))
+        assert cache.get_stale("https://b.com") is None
+        assert cache.get("https://a.com") is not None
+        assert cache.get("https://c.com") is not None
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= 2500
+
+    def test_oversized_entry_kept(self, cache_dir: Path) -> None:
+        """A write never evicts itself, even over budget."""
+        cache = URLCache(cache_dir, ttl_hours=1, max_bytes=100)
+        cache.set("https://a.com", self._entry("https://a.com"))
+        cache.set("https://b.com", self._entry("https://b.com"))
+        assert cache.get_stale("https://a.com") is None
+        assert cache.get("https://b.com") is not None
+
+    def test_overwrite_accounts_size_once(self, cache_dir: Path) -> None:
+        cache = URLCache(cache_dir, ttl_hours=1)
+        cache.set("https://a.com", self._entry("https://a.com"))
+        size = cache.stats()["bytes"]
+        cache.set("https://a.com", self._entry("https://a.com"))
+        assert cache.stats()["bytes"] == size
+
+    def test_budget_applied_on_reopen(self, cache_dir: Path) -> None:
+        cache = URLCache(cache_dir, ttl_hours=1)
+        for name in ("a", "b", "c"):
+            cache.set(f"https://{name}.com", self._entry(f"https://{name}.com"))
+        cache.close()
+        reopened = URLCache(cache_dir, ttl_hours=1, max_bytes=1500)
+        stats = reopened.stats()
+        assert (stats["entries"], stats["evictions"]) == (1, 2)
+        assert reopened.get("https://c.com") is not None
+
+
+class TestCacheStats:
+    def test_hit_miss_counters(self, cache_dir: Path) -> None:
+        cache = URLCache(cache_dir, ttl_hours=1)
+        cache.set("https://a.com", {"url": "https://a.com"})
+        cache.get("https://a.com")
+        cache.get("https://a.com")
+        cache.get("https://missing.com")
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["available"] is True
+        assert stats["bytes"] > 0
+
+    def test_persists_across_instances(self, cache_dir: Path) -> None:
+        cache = URLCache(cache_dir, ttl_hours=1)
+        cache.set("https://a.com", {"url": "https://a.com", "content": "x"})
+        cache.close()
+        reopened = URLCache(cache_dir, ttl_hours=1)
+        got = reopened.get("https://a.com")
+        assert got is not None and got["content"] == "x"
+        assert reopened.stats()["bytes"] == cache.stats()["bytes"]
+
+
+class TestCacheMigration:
+    """Per-URL JSON sidecars from the old layout are imported on open."""
+
+    @staticmethod
+    def _sidecar(cache_dir: Path, data: object, name: str | None = None) -> Path:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        url = data.get("url", "x") if isinstance(data, dict) else "x"
+        path = cache_dir / f"{name or url_hash(str(url))}.json"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+    def test_sidecar_imported_with_original_timestamp(
         self, cache_dir: Path,
     ) -> None:
-        """Entries without _cached_at are treated as stale."""
+        stamp = time.time() - 600
+        path = self._sidecar(cache_dir, {
+            "url": "https://example.com",
+            "content": "old layout",
+            "_cached_at": stamp,
+        })
         cache = URLCache(cache_dir, ttl_hours=1)
-        path = cache_dir / "abc1234567890def.json"
-        path.write_text('{"url": "https://x.com"}', encoding="utf-8")
-        assert cache.cleanup_expired() == 1
+        got = cache.get("https://example.com")
+        assert got is not None
+        assert got["content"] == "old layout"
+        assert got["_cached_at"] == pytest.approx(stamp)
+        assert cache.stats()["migrated"] == 1
         assert not path.exists()
 
-    def test_cleanup_leaves_non_cache_files_alone(
+    def test_expired_sidecar_imported_as_expired(
         self, cache_dir: Path,
     ) -> None:
+        self._sidecar(cache_dir, {
+            "url": "https://example.com",
+            "_cached_at": time.time() - 7200,
+        })
         cache = URLCache(cache_dir, ttl_hours=1)
-        stray = cache_dir / "README.md"
-        stray.write_text("hands off")
-        cache.cleanup_expired()
-        assert stray.is_file()
\ No newline at end of file
+        assert cache.get("https://example.com") is None
+        assert cache.get_stale("https://example.com") is not None
+
+    @pytest.mark.parametrize("data", [
+        '"not valid json {',
+        ["array", "not", "dict"],
+        {"url": "https://x.com"},
+        {"url": "https://x.com", "_cached_at": "not a number"},
+        {"_cached_at": 1.0},
+    ])
+    def test_unusable_sidecars_kept(
+        self, cache_dir: Path, data: object,
+    ) -> None:
+        if isinstance(data, str):
+            cache_dir.mkdir(parents=True)
+            path = cache_dir / "abc1234567890def.json"
+            path.write_text(data, encoding="utf-8")
+        else:
+            path = self._sidecar(cache_dir, data, "abc1234567890def")
+        cache = URLCache(cache_dir, ttl_hours=1)
+        assert path.exists()
+        stats = cache.stats()
+        assert (stats["entries"], stats["migrated"]) == (0, 0)
+
+    @pytest.mark.parametrize("name", [
+        "settings.json",
+        "ABC1234567890DEF.json",
+        "abc1234567890de.json",
+        "abc1234567890def0.json",
+    ])
+    def test_other_json_files_untouched(
+        self, cache_dir: Path, name: str,
+    ) -> None:
+        path = self._sidecar(cache_dir, {
+            "url": "https://example.com",
+            "_cached_at": time.time(),
+        }, name.removesuffix(".json"))
+        cache = URLCache(cache_dir, ttl_hours=1)
+        assert path.exists()
+        assert cache.get("https://example.com") is None
+        assert cache.stats()["migrated"] == 0
+
+    def test_database_entry_wins_over_sidecar(
+        self, cache_dir: Path,
+    ) -> None:
+        URLCache(cache_dir, ttl_hours=1).set(
+            "https://example.com",
+            {"url": "https://example.com", "content": "new"},
+        )
+        self._sidecar(cache_dir, {
+            "url": "https://example.com",
+            "content": "old",
+            "_cached_at": time.time(),
+        })
+        got = URLCache(cache_dir, ttl_hours=1).get("https://example.com")
+        assert got is not None and got["content"] == "new"
+
+    def test_corrupt_database_recreated(self, cache_dir: Path) -> None:
+        cache_dir.mkdir()
+        (cache_dir / "url_cache.db").write_bytes(b"not a database" * 100)
+        cache = URLCache(cache_dir, ttl_hours=1)
+        assert cache.set("https://a.com", {"url": "https://a.com"})
+        assert cache.get("https://a.com") is not None
@@ -0,0 +1,398 @@
+"""Tests for ac_dc.url_service.http_client and the fetch engine around it.
+
+Scope:
+
+- :class:`HTTPClient` — keep-alive reuse, stale-connection
+  retry, gzip/deflate decoding, redirects, error mapping,
+  conditional requests (304 → :class:`NotModified`), and the
+  per-host concurrency limit.
+- Fetchers with a client — validators recorded on the result,
+  ``NotModified`` propagated.
+- :class:`URLService` — expired entries revalidated with a 304
+  (no refetch, no re-summarisation), changed pages refetched,
+  and :meth:`URLService.fetch_many` running concurrently.
+
+Strategy:
+
+- A real :class:`http.server.ThreadingHTTPServer` on
+  127.0.0.1 speaking HTTP/1.1 stands in for the internet.
+  Each request records its client port, so connection reuse
+  is observable from the server side.
+- Proxy environment variables are cleared so requests go
+  straight to the stand-in.
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+import time
+import urllib.error
+import zlib
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ac_dc.url_service.cache import URLCache
+from ac_dc.url_service.fetchers import fetch_web_page
+from ac_dc.url_service.http_client import HTTPClient, NotModified
+from ac_dc.url_service.models import URLContent
+from ac_dc.url_service.service import URLService
+
+_PAGE = (
+    "<html><head><title>Stand-in</title></head>"
+    "<body><p>{body}</p></body></html>"
+)
+
+
+class _State:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.etag = '"v1"'
+        self.body = "first version"
+        # (path, client_port, status)
+        self.log: list[tuple[str, int, int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: _State
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _send(
+        self,
+        status: int,
+        body: bytes = b"",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.state.lock:
+            self.state.log.append(
+                (self.path, self.client_address[1], status)
+            )
+
+    def do_GET(self) -> None:
+        state = self.state
+        path = self.path
+        if path == "/page":
+            if self.headers.get("If-None-Match") == state.etag:
+                self._send(304, headers={"ETag": state.etag})
+                return
+            body = _PAGE.format(body=state.body).encode()
+            headers = {
+                "Content-Type": "text/html; charset=utf-8",
+                "ETag": state.etag,
+            }
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                headers["Content-Encoding"] = "gzip"
+            self._send(200, body, headers)
+        elif path == "/deflate":
+            self._send(
+                200, zlib.compress(b"deflated text"),
+                {"Content-Encoding": "deflate"},
+            )
+        elif path == "/dated":
+            stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+            if self.headers.get("If-Modified-Since") == stamp:
+                self._send(304)
+                return
+            self._send(200, b"dated", {"Last-Modified": stamp})
+        elif path == "/latin1":
+            self._send(
+                200, "café".encode("latin-1"),
+                {"Content-Type": "text/plain; charset=iso-8859-1"},
+            )
+        elif path == "/redirect":
+            self._send(302, headers={"Location": "/page"})
+        elif path == "/loop":
+            self._send(302, headers={"Location": "/loop"})
+        elif path == "/drop":
+            # Answer, then drop the connection without saying so.
+            self._send(200, b"dropped")
+            self.close_connection = True
+        elif path.startswith("/slow"):
+            with state.lock:
+                state.in_flight += 1
+                state.max_in_flight = max(
+                    state.max_in_flight, state.in_flight
+                )
+            time.sleep(0.3)
+            with state.lock:
+                state.in_flight -= 1
+            self._send(
+                200,
+                _PAGE.format(body=path).encode(),
+                {"Content-Type": "text/html"},
+            )
+        else:
+            self._send(404, b"nope")
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[str, _State]]:
+    for name in (
+        "http_proxy", "https_proxy", "HTTP_PROXY", "HTTPS_PROXY",
+        "all_proxy", "ALL_PROXY",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    state = _State()
+    handler = type("_BoundHandler", (_Handler,), {"state": state})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", state
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def client() -> Iterator[HTTPClient]:
+    c = HTTPClient(timeout=5)
+    try:
+        yield c
+    finally:
+        c.close()
+
+
+# ---------------------------------------------------------------------------
+# HTTPClient
+# ---------------------------------------------------------------------------
+
+
+class TestHTTPClient:
+    def test_gzip_decoded_and_connection_reused(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, state = server
+        first = client.get(f"{base}/page")
+        second = client.get(f"{base}/page")
+        assert first.headers["content-encoding"] == "gzip"
+        assert "first version" in first.text()
+        assert second.body == first.body
+        assert client.connections_opened == 1
+        assert len({port for _, port, _ in state.log}) == 1
+
+    def test_deflate_decoded(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        assert client.get(f"{base}/deflate").text() == "deflated text"
+
+    def test_declared_charset_used(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        assert client.get(f"{base}/latin1").text() == "café"
+
+    def test_etag_revalidation(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, state = server
+        response = client.get(f"{base}/page")
+        assert response.etag == '"v1"'
+        with pytest.raises(NotModified):
+            client.get(
+                f"{base}/page", validators={"etag": response.etag}
+            )
+        assert state.log[-1][2] == 304
+
+    def test_last_modified_revalidation(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        response = client.get(f"{base}/dated")
+        with pytest.raises(NotModified):
+            client.get(
+                f"{base}/dated",
+                validators={"last_modified": response.last_modified},
+            )
+
+    def test_redirect_followed(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        response = client.get(f"{base}/redirect")
+        assert response.status == 200
+        assert response.url == f"{base}/page"
+
+    def test_redirect_loop_is_url_error(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        with pytest.raises(urllib.error.URLError, match="redirects"):
+            client.get(f"{base}/loop")
+
+    def test_error_status_is_http_error(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        with pytest.raises(urllib.error.HTTPError) as info:
+            client.get(f"{base}/missing")
+        assert info.value.code == 404
+
+    def test_refused_connection_is_url_error(
+        self, client: HTTPClient
+    ) -> None:
+        with pytest.raises(urllib.error.URLError):
+            client.get("http://127.0.0.1:9/")
+
+    def test_stale_pooled_connection_retried(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        assert client.get(f"{base}/drop").body == b"dropped"
+        # Give the server a moment to close its end.
+        time.sleep(0.1)
+        assert "first version" in client.get(f"{base}/page").text()
+        assert client.connections_opened == 2
+
+    def test_per_host_limit(self, server: tuple[str, _State]) -> None:
+        base, state = server
+        limited = HTTPClient(max_per_host=2, timeout=5)
+        threads = [
+            threading.Thread(
+                target=limited.get, args=(f"{base}/slow{i}",)
+            )
+            for i in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        limited.close()
+        assert state.max_in_flight == 2
+        assert limited.connections_opened == 2
+
+
+# ---------------------------------------------------------------------------
+# Fetchers with a client
+# ---------------------------------------------------------------------------
+
+
+class TestFetchersWithClient:
+    def test_validators_recorded(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        result = fetch_web_page(f"{base}/page", client=client)
+        assert result.error is None
+        assert result.title == "Stand-in"
+        assert result.etag == '"v1"'
+
+    def test_not_modified_propagates(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        with pytest.raises(NotModified):
+            fetch_web_page(
+                f"{base}/page",
+                client=client,
+                validators={"etag": '"v1"', "last_modified": None},
+            )
+
+    def test_http_error_still_an_error_record(
+        self, server: tuple[str, _State], client: HTTPClient
+    ) -> None:
+        base, _ = server
+        result = fetch_web_page(f"{base}/missing", client=client)
+        assert result.error is not None
+        assert result.error.startswith("HTTP 404")
+
+
+# ---------------------------------------------------------------------------
+# URLService revalidation and fan-out
+# ---------------------------------------------------------------------------
+
+
+class _CountingService(URLService):
+    """Counts summariser calls without a real smaller model."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.summaries = 0
+
+    def _summarize(
+        self, content: URLContent, summary_type: Any, user_text: Any
+    ) -> URLContent:
+        self.summaries += 1
+        content.summary = f"summary #{self.summaries}"
+        return content
+
+
+class TestServiceRevalidation:
+    def _service(
+        self, tmp_path: Path, client: HTTPClient
+    ) -> _CountingService:
+        # ttl_hours=0 — every entry is expired as soon as written.
+        cache = URLCache(tmp_path / "urls", ttl_hours=0)
+        return _CountingService(cache=cache, http_client=client)
+
+    def test_unchanged_page_costs_a_304(
+        self,
+        server: tuple[str, _State],
+        client: HTTPClient,
+        tmp_path: Path,
+    ) -> None:
+        base, state = server
+        url = f"{base}/page"
+        service = self._service(tmp_path, client)
+        first = service.fetch_url(url, summarize=True)
+        service.clear_fetched()
+        second = service.fetch_url(url, summarize=True)
+        assert [status for _, _, status in state.log] == [200, 304]
+        assert service.revalidated == 1
+        assert service.summaries == 1
+        assert second.summary == first.summary == "summary #1"
+        assert second.content == first.content
+
+    def test_changed_page_refetched(
+        self,
+        server: tuple[str, _State],
+        client: HTTPClient,
+        tmp_path: Path,
+    ) -> None:
+        base, state = server
+        url = f"{base}/page"
+        service = self._service(tmp_path, client)
+        service.fetch_url(url, summarize=True)
+        state.etag, state.body = '"v2"', "second version"
+        service.clear_fetched()
+        result = service.fetch_url(url, summarize=True)
+        assert [status for _, _, status in state.log] == [200, 200]
+        assert service.revalidated == 0
+        assert service.summaries == 2
+        assert "second version" in (result.content or "")
+        assert result.etag == '"v2"'
+
+    def test_fetch_many_runs_concurrently(
+        self, server: tuple[str, _State], tmp_path: Path
+    ) -> None:
+        base, state = server
+        client = HTTPClient(max_per_host=4, timeout=5)
+        service = URLService(
+            http_client=client, max_concurrent_fetches=4,
+        )
+        urls = [f"{base}/slow{i}" for i in range(4)]
+        try:
+            results = service.fetch_many(urls, use_cache=False)
+        finally:
+            service.close()
+        assert [r.url for r in results] == urls
+        assert all(r.error is None for r in results)
+        assert state.max_in_flight > 1
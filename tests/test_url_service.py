@@ -812,6 +812,26 @@ class TestClearUrlCache:
         assert service._fetched == {}
 
 
+class TestCacheStats:
+    """cache_stats — cache counters plus service-level counts."""
+
+    def test_with_cache(self, cache: URLCache) -> None:
+        cache.set("https://a.com", {"url": "https://a.com"})
+        service = URLService(cache=cache)
+        service.fetch_url("https://a.com")
+        stats = service.cache_stats()
+        assert stats["enabled"] is True
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["revalidated"] == 0
+        assert stats["fetched"] == 1
+
+    def test_without_cache(self) -> None:
+        stats = URLService().cache_stats()
+        assert stats["enabled"] is False
+        assert stats["revalidated"] == 0
+
+
 class TestRemoveFetched:
     """Remove from in-memory only; cache preserved."""
 
@@ -211,6 +211,9 @@ export class AppShell extends JRPCClient {
     // JRPCClient configuration — serverURI set in connectedCallback
     // so the port is read at the right time.
     this.remoteTimeout = 60;
+    // Per-request accumulated stream content, rebuilt from
+    // streamChunk checkpoints plus streamDelta appends.
+    this._streamBuffers = new Map();
 
     this.connectionState = 'connecting';
     this.startupStage = '';
@@ -768,6 +771,11 @@ export class AppShell extends JRPCClient {
   // vanishing.
 
   streamChunk(requestId, content) {
+    // Full-content checkpoint. Resets the per-request delta
+    // buffer so subsequent streamDelta calls append to a
+    // known state — this is also how a client that
+    // reconnected mid-stream resyncs.
+    this._streamBuffers.set(requestId, content);
     // Phase 2: chat panel listens via window event.
     window.dispatchEvent(new CustomEvent('stream-chunk', {
       detail: { requestId, content },
@@ -775,7 +783,30 @@ export class AppShell extends JRPCClient {
     return true;
   }
 
+  /**
+   * Append-only delta between streamChunk checkpoints.
+   * ``offset`` is the length of the content the server
+   * believes we hold. A mismatch (missed delta, or no
+   * checkpoint seen since reconnect) drops the delta; the
+   * next checkpoint resyncs. Downstream listeners still see
+   * full accumulated content on the ``stream-chunk`` window
+   * event, so the delta protocol is invisible to them.
+   */
+  streamDelta(requestId, offset, text) {
+    const current = this._streamBuffers.get(requestId);
+    if (typeof current !== 'string' || current.length !== offset) {
+      return true;
+    }
+    const content = current + text;
+    this._streamBuffers.set(requestId, content);
+    window.dispatchEvent(new CustomEvent('stream-chunk', {
+      detail: { requestId, content },
+    }));
+    return true;
+  }
+
   streamComplete(requestId, result) {
+    this._streamBuffers.delete(requestId);
     window.dispatchEvent(new CustomEvent('stream-complete', {
       detail: { requestId, result },
     }));
@@ -851,6 +882,33 @@ export class AppShell extends JRPCClient {
     return true;
   }
 
+  /**
+   * Full main-conversation breakdown checkpoint, pushed the
+   * first time the backend publishes one. Payload:
+   * {scope, version, breakdown}. Re-dispatched as a window
+   * event for the Context tab.
+   */
+  contextBreakdown(payload) {
+    window.dispatchEvent(new CustomEvent('context-breakdown', {
+      detail: payload,
+    }));
+    return true;
+  }
+
+  /**
+   * Patch from the last published breakdown to the current
+   * one — {scope, base_version, version, set, breakdown,
+   * details, blocks}. Applied by the Context tab when it holds
+   * ``base_version``; otherwise it refetches. See
+   * context-breakdown-delta.js.
+   */
+  contextBreakdownDelta(payload) {
+    window.dispatchEvent(new CustomEvent('context-breakdown-delta', {
+      detail: payload,
+    }));
+    return true;
+  }
+
   /**
    * Cache-warmup countdown tick. Fired once per second
    * during the visible 30-second lead-in to a warm-up
@@ -88,6 +88,34 @@ describe('AppShell events and toasts', () => {
       window.removeEventListener('stream-chunk', listener);
     });
 
+    it('streamDelta appends to the last checkpoint', () => {
+      const shell = mountShell();
+      const listener = vi.fn();
+      window.addEventListener('stream-chunk', listener);
+      shell.streamChunk('req-1', 'hello');
+      shell.streamDelta('req-1', 5, ' world');
+      expect(listener).toHaveBeenCalledTimes(2);
+      expect(listener.mock.calls[1][0].detail).toEqual({
+        requestId: 'req-1',
+        content: 'hello world',
+      });
+      window.removeEventListener('stream-chunk', listener);
+    });
+
+    it('streamDelta with mismatched offset waits for checkpoint', () => {
+      const shell = mountShell();
+      const listener = vi.fn();
+      window.addEventListener('stream-chunk', listener);
+      // No checkpoint seen yet (e.g. reconnected mid-stream).
+      shell.streamDelta('req-1', 5, ' world');
+      expect(listener).not.toHaveBeenCalled();
+      shell.streamChunk('req-1', 'hello');
+      // Missed delta — offset is beyond our buffer.
+      shell.streamDelta('req-1', 11, '!');
+      expect(listener).toHaveBeenCalledOnce();
+      window.removeEventListener('stream-chunk', listener);
+    });
+
     it('streamComplete dispatches window event', () => {
       const shell = mountShell();
       const listener = vi.fn();
@@ -123,6 +151,7 @@ describe('AppShell events and toasts', () => {
     it('callbacks return true for jrpc-oo ack', () => {
       const shell = mountShell();
       expect(shell.streamChunk('r', 'c')).toBe(true);
+      expect(shell.streamDelta('r', 1, 'd')).toBe(true);
       expect(shell.streamComplete('r', {})).toBe(true);
       expect(shell.filesChanged([])).toBe(true);
     });
@@ -11,17 +11,22 @@
 //
 //   {
 //     commits: [{sha, short_sha, message, author,
-//                date, relative_date, parents: [sha, ...]}, ...],
+//                date, relative_date, parents: [sha, ...],
+//                lane, edges: [{sha, lane, merge}, ...]}, ...],
 //     branches: [{name, sha, is_current, is_remote}, ...],
-//     has_more: bool
+//     has_more: bool,
+//     branch_lanes: {branchName: laneIndex}
 //   }
 //
-// The frontend does ALL the graph drawing work:
-// lane assignment (each branch tip gets a stable
-// vertical column), commit node placement, parent-
-// edge lines (curved for cross-lane, straight
-// within a lane), merge-commit second-parent
-// connectors.
+// Lane assignment is precomputed server-side over
+// the whole history (ac_dc/repo/graph_cache.py runs
+// the same walk described below), so lanes don't
+// shift as deeper pages load. The frontend does the
+// drawing work: commit node placement, parent-edge
+// lines (curved for cross-lane, straight within a
+// lane), merge-commit second-parent connectors. When
+// a response lacks lane data, the walk below runs
+// client-side over the loaded commits instead.
 //
 // ---
 //
@@ -233,10 +238,16 @@ function _buildCommitTooltip(commit, branchNames) {
  * their claims on its lane are already recorded in
  * a map.
  */
-function computeGraphLayout(commits, branches) {
+function computeGraphLayout(commits, branches, serverLanes = null) {
   if (!Array.isArray(commits) || commits.length === 0) {
     return { rows: [], totalLanes: 0, branchLanes: new Map() };
   }
+  if (
+    serverLanes
+    && commits.every((c) => Number.isInteger(c?.lane))
+  ) {
+    return _layoutFromServerLanes(commits, serverLanes);
+  }
   // Sort branches by the date of their tip commit so
   // the most-recently-active branch gets lane 0.
   const commitBySha = new Map();
@@ -372,12 +383,62 @@ function computeGraphLayout(commits, branches) {
     });
   }
 
-  // Second pass: resolve edge `toY` by looking up
-  // the target commit's row. Edges pointing at
-  // commits not in the current page (older than
-  // what we've loaded) get their toY clamped to
-  // one row past the bottom — the edge stub trails
-  // off-screen until the next page loads.
+  _resolveEdgeCoordinates(rows);
+
+  return {
+    rows,
+    totalLanes: nextLane,
+    branchLanes,
+  };
+}
+
+/**
+ * Build the layout from lanes the backend assigned.
+ *
+ * ``serverLanes`` is the response's ``branch_lanes``
+ * object. Each commit carries ``lane`` and ``edges``
+ * ([{sha, lane, merge}]) — the same values the
+ * client-side walk would produce, computed over the
+ * whole history. ``totalLanes`` covers the lanes the
+ * loaded rows, their edges, and the branch legend use.
+ */
+function _layoutFromServerLanes(commits, serverLanes) {
+  const branchLanes = new Map(Object.entries(serverLanes));
+  let totalLanes = 0;
+  for (const lane of branchLanes.values()) {
+    totalLanes = Math.max(totalLanes, lane + 1);
+  }
+  const rows = commits.map((commit, i) => {
+    const edges = (Array.isArray(commit.edges) ? commit.edges : [])
+      .map((e) => ({
+        targetSha: e.sha,
+        fromLane: commit.lane,
+        toLane: e.lane,
+        merge: !!e.merge,
+      }));
+    totalLanes = Math.max(totalLanes, commit.lane + 1);
+    for (const e of edges) totalLanes = Math.max(totalLanes, e.toLane + 1);
+    return {
+      commit,
+      lane: commit.lane,
+      y: i * _ROW_HEIGHT + _ROW_HEIGHT / 2,
+      edges,
+      rowIndex: i,
+    };
+  });
+  _resolveEdgeCoordinates(rows);
+  return { rows, totalLanes, branchLanes };
+}
+
+/**
+ * Resolve each edge's `toY` by looking up the target
+ * commit's row. Edges pointing at commits not in the
+ * current page (older than what we've loaded) get
+ * their toY clamped to one row past the bottom — the
+ * edge stub trails off-screen until the next page
+ * loads.
+ */
+function _resolveEdgeCoordinates(rows) {
   const rowBySha = new Map();
   for (const r of rows) rowBySha.set(r.commit.sha, r);
   for (const r of rows) {
@@ -392,12 +453,6 @@ function computeGraphLayout(commits, branches) {
       e.color = _laneColor(e.fromLane);
     }
   }
-
-  return {
-    rows,
-    totalLanes: nextLane,
-    branchLanes,
-  };
 }
 
 // ---------------------------------------------------------------
@@ -513,6 +568,12 @@ export class CommitGraph extends LitElement {
      * returns the full list with each response.
      */
     _branches: { type: Array, state: true },
+    /**
+     * Server-assigned branch lanes
+     * (``branch_lanes``) from the most recent
+     * fetch, or null when the backend sent none.
+     */
+    _branchLanes: { attribute: false, state: true },
     /**
      * True when more commits are available to
      * fetch. Flips false when the backend reports
@@ -816,6 +877,7 @@ export class CommitGraph extends LitElement {
     this.highlightedCommits = null;
     this._commits = [];
     this._branches = [];
+    this._branchLanes = null;
     this._hasMore = true;
     this._loading = false;
     this._popover = null;
@@ -858,6 +920,7 @@ export class CommitGraph extends LitElement {
       // updated() pass.
       this._commits = [];
       this._branches = [];
+      this._branchLanes = null;
       this._hasMore = true;
       if (this.rpcCall) this._fetchInitial();
     }
@@ -871,6 +934,7 @@ export class CommitGraph extends LitElement {
       if (!result) return;
       this._commits = Array.isArray(result.commits) ? result.commits : [];
       this._branches = Array.isArray(result.branches) ? result.branches : [];
+      this._branchLanes = result.branch_lanes || null;
       this._hasMore = result.has_more === true;
     } catch (err) {
       console.error('[commit-graph] initial fetch failed', err);
@@ -902,6 +966,7 @@ export class CommitGraph extends LitElement {
         // the full list.
         this._branches = result.branches;
       }
+      if (result.branch_lanes) this._branchLanes = result.branch_lanes;
       this._hasMore = result.has_more === true;
     } catch (err) {
       console.error('[commit-graph] page fetch failed', err);
@@ -1074,7 +1139,9 @@ export class CommitGraph extends LitElement {
   }
 
   render() {
-    const layout = computeGraphLayout(this._commits, this._branches);
+    const layout = computeGraphLayout(
+      this._commits, this._branches, this._branchLanes,
+    );
     return html`
       ${this._renderLegend(layout)}
       ${this._commits.length === 0 && !this._loading
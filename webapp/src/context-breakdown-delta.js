@@ -0,0 +1,74 @@
+// Context breakdown delta application.
+//
+// The backend pushes the main conversation's breakdown as a
+// ``contextBreakdown`` checkpoint followed by
+// ``contextBreakdownDelta`` patches (see
+// src/ac_dc/llm/_breakdown_cache.py). Kept as a pure module
+// so the patch semantics are testable without mounting the
+// Context tab.
+//
+// Governing spec: specs4/5-webapp/viewers-hud.md § Pushed
+// updates.
+
+/** Row key per patched breakdown detail list. */
+export const DETAIL_KEYS = {
+  symbol_map_details: 'path',
+  file_details: 'path',
+  url_details: 'url',
+};
+
+/**
+ * Apply an upsert/remove patch to a keyed list.
+ *
+ * Upserted rows replace existing rows in place; unseen ones
+ * are appended. ``order``, when present, is the complete
+ * final key sequence.
+ */
+export function applyListPatch(list, patch, key) {
+  const removed = new Set(patch.remove || []);
+  const upserts = new Map(
+    (patch.upsert || []).map((row) => [row[key], row]),
+  );
+  const seen = new Set();
+  const out = [];
+  for (const row of list) {
+    const k = row[key];
+    if (removed.has(k)) continue;
+    seen.add(k);
+    out.push(upserts.has(k) ? upserts.get(k) : row);
+  }
+  for (const row of patch.upsert || []) {
+    if (!seen.has(row[key])) out.push(row);
+  }
+  if (Array.isArray(patch.order)) {
+    const byKey = new Map(out.map((row) => [row[key], row]));
+    return patch.order.map((k) => byKey.get(k)).filter(Boolean);
+  }
+  return out;
+}
+
+/**
+ * Return ``data`` with ``delta`` applied, or null when the
+ * delta was computed against a version we don't hold — the
+ * caller then refetches over RPC. Never mutates ``data``.
+ */
+export function applyBreakdownDelta(data, delta) {
+  if (!data || !delta || data.version !== delta.base_version) {
+    return null;
+  }
+  const next = { ...data, ...(delta.set || {}), version: delta.version };
+  const breakdown = {
+    ...(data.breakdown || {}),
+    ...(delta.breakdown || {}),
+  };
+  for (const [name, patch] of Object.entries(delta.details || {})) {
+    breakdown[name] = applyListPatch(
+      breakdown[name] || [], patch, DETAIL_KEYS[name] || 'path',
+    );
+  }
+  next.breakdown = breakdown;
+  if (delta.blocks) {
+    next.blocks = applyListPatch(data.blocks || [], delta.blocks, 'name');
+  }
+  return next;
+}
@@ -0,0 +1,99 @@
+// Tests for webapp/src/context-breakdown-delta.js — applying
+// pushed context-breakdown patches.
+
+import { describe, expect, it } from 'vitest';
+
+import {
+  applyBreakdownDelta,
+  applyListPatch,
+} from './context-breakdown-delta.js';
+
+function base() {
+  return {
+    version: 3,
+    total_tokens: 100,
+    blocks: [
+      { name: 'L0', tokens: 60 },
+      { name: 'active', tokens: 40 },
+    ],
+    breakdown: {
+      files: 40,
+      file_details: [
+        { path: 'a.py', tokens: 10 },
+        { path: 'b.py', tokens: 30 },
+      ],
+      url_details: [],
+    },
+  };
+}
+
+describe('applyListPatch', () => {
+  it('replaces in place, appends new rows, drops removed', () => {
+    const out = applyListPatch(
+      [{ k: 'a', v: 1 }, { k: 'b', v: 2 }, { k: 'c', v: 3 }],
+      { upsert: [{ k: 'b', v: 9 }, { k: 'd', v: 4 }], remove: ['a'] },
+      'k',
+    );
+    expect(out).toEqual([
+      { k: 'b', v: 9 }, { k: 'c', v: 3 }, { k: 'd', v: 4 },
+    ]);
+  });
+
+  it('honours an explicit order', () => {
+    const out = applyListPatch(
+      [{ k: 'a' }, { k: 'b' }],
+      { upsert: [], remove: [], order: ['b', 'a'] },
+      'k',
+    );
+    expect(out.map((r) => r.k)).toEqual(['b', 'a']);
+  });
+});
+
+describe('applyBreakdownDelta', () => {
+  it('applies set, scalar, detail and block changes', () => {
+    const data = base();
+    const next = applyBreakdownDelta(data, {
+      base_version: 3,
+      version: 4,
+      set: { total_tokens: 120 },
+      breakdown: { files: 60 },
+      details: {
+        file_details: {
+          upsert: [{ path: 'c.py', tokens: 20 }],
+          remove: [],
+        },
+      },
+      blocks: { upsert: [{ name: 'active', tokens: 60 }], remove: [] },
+    });
+    expect(next.version).toBe(4);
+    expect(next.total_tokens).toBe(120);
+    expect(next.breakdown.files).toBe(60);
+    expect(next.breakdown.file_details.map((r) => r.path)).toEqual([
+      'a.py', 'b.py', 'c.py',
+    ]);
+    expect(next.blocks[1].tokens).toBe(60);
+    // The input is untouched.
+    expect(data.version).toBe(3);
+    expect(data.breakdown.file_details).toHaveLength(2);
+  });
+
+  it('keys URL details by url', () => {
+    const data = base();
+    data.breakdown.url_details = [{ url: 'https://x', tokens: 5 }];
+    const next = applyBreakdownDelta(data, {
+      base_version: 3,
+      version: 4,
+      details: { url_details: { upsert: [], remove: ['https://x'] } },
+    });
+    expect(next.breakdown.url_details).toEqual([]);
+  });
+
+  it('rejects a delta against another version', () => {
+    expect(
+      applyBreakdownDelta(base(), { base_version: 2, version: 3 }),
+    ).toBeNull();
+    expect(
+      applyBreakdownDelta(null, { base_version: 3, version: 4 }),
+    ).toBeNull();
+  });
+});
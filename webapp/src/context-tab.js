@@ -12,6 +12,7 @@
 
 import { LitElement, css, html } from 'lit';
 import { RpcMixin } from './rpc-mixin.js';
+import { applyBreakdownDelta } from './context-breakdown-delta.js';
 import { fuzzyMatch } from './file-picker/index.js';
 import { parseAgentTabId } from './chat-panel/index.js';
 
@@ -932,6 +933,8 @@ export class ContextTab extends RpcMixin(LitElement) {
 
     this._onStreamComplete = this._onStreamComplete.bind(this);
     this._onPostResponseComplete = this._onPostResponseComplete.bind(this);
+    this._onBreakdownPushed = this._onBreakdownPushed.bind(this);
+    this._onBreakdownDelta = this._onBreakdownDelta.bind(this);
     this._onFilesChanged = this._onFilesChanged.bind(this);
     this._onModeChanged = this._onModeChanged.bind(this);
     this._onSessionChanged = this._onSessionChanged.bind(this);
@@ -956,6 +959,12 @@ export class ContextTab extends RpcMixin(LitElement) {
     window.addEventListener(
       'post-response-complete', this._onPostResponseComplete,
     );
+    // Server-pushed main-conversation breakdown — a full
+    // checkpoint, then deltas against a version we hold.
+    window.addEventListener('context-breakdown', this._onBreakdownPushed);
+    window.addEventListener(
+      'context-breakdown-delta', this._onBreakdownDelta,
+    );
     window.addEventListener('files-changed', this._onFilesChanged);
     window.addEventListener('mode-changed', this._onModeChanged);
     // session-changed fires on startup after _restore_last_session
@@ -1002,6 +1011,12 @@ export class ContextTab extends RpcMixin(LitElement) {
     window.removeEventListener(
       'post-response-complete', this._onPostResponseComplete,
     );
+    window.removeEventListener(
+      'context-breakdown', this._onBreakdownPushed,
+    );
+    window.removeEventListener(
+      'context-breakdown-delta', this._onBreakdownDelta,
+    );
     window.removeEventListener('files-changed', this._onFilesChanged);
     window.removeEventListener('mode-changed', this._onModeChanged);
     window.removeEventListener('session-changed', this._onSessionChanged);
@@ -1055,12 +1070,27 @@ export class ContextTab extends RpcMixin(LitElement) {
     return this.offsetParent !== null;
   }
 
+  /**
+   * True when the displayed data is the main conversation's
+   * published breakdown. The backend pushes that state's
+   * changes (ahead of post-response-complete), so the
+   * stream-lifecycle refetches become redundant.
+   */
+  _tracksPushes() {
+    return (
+      this._activeTabId === 'main'
+      && typeof this._data?.version === 'number'
+    );
+  }
+
   _onStreamComplete() {
     // Refresh eagerly regardless of visibility — the Context
     // tab should be current the moment the user switches to
     // it, not after a deferred fetch resolves. The cost is
     // one get_context_breakdown RPC per stream completion;
-    // cheap relative to the stream itself.
+    // cheap relative to the stream itself. Skipped when
+    // pushes keep the data current.
+    if (this._tracksPushes()) return;
     this._refresh();
   }
 
@@ -1073,9 +1103,39 @@ export class ContextTab extends RpcMixin(LitElement) {
     // fetch + one queued fetch" — exactly what we want:
     // the queued fetch reads the now-consistent state
     // and the UI updates without a manual refresh click.
+    // With pushes, the settled state's delta has already
+    // been applied by the time this event arrives.
+    if (this._tracksPushes()) return;
     this._refresh();
   }
 
+  _onBreakdownPushed(event) {
+    const payload = event?.detail;
+    if (this._activeTabId !== 'main') return;
+    if (!payload || typeof payload.breakdown !== 'object') return;
+    if (payload.version <= (this._data?.version ?? 0)) return;
+    this._data = payload.breakdown;
+    this._stale = false;
+  }
+
+  _onBreakdownDelta(event) {
+    const delta = event?.detail;
+    if (this._activeTabId !== 'main' || !delta) return;
+    const current = this._data?.version;
+    // Already covered — e.g. an RPC response stamped with
+    // this version beat the push here.
+    if (typeof current === 'number' && delta.version <= current) return;
+    const next = applyBreakdownDelta(this._data, delta);
+    if (next === null) {
+      // Missed a push, or the data predates versioning:
+      // resync over RPC.
+      this._refresh();
+      return;
+    }
+    this._data = next;
+    this._stale = false;
+  }
+
   _onFilesChanged() {
     this._refresh();
   }
@@ -1167,6 +1227,17 @@ export class ContextTab extends RpcMixin(LitElement) {
         this._stale = false;
         return;
       }
+      // A push applied while this fetch was in flight may
+      // already be newer than the response.
+      if (
+        typeof result?.version === 'number'
+        && typeof this._data?.version === 'number'
+        && this._activeTabId === 'main'
+        && result.version < this._data.version
+      ) {
+        this._stale = false;
+        return;
+      }
       this._data = result && typeof result === 'object' ? result : null;
       this._stale = false;
     } catch (err) {
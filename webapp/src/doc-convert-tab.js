@@ -6,7 +6,7 @@
 //   - DocConvert.is_available()          — backend capability probe
 //   - DocConvert.scan_convertible_files() — file list + status
 //   - DocConvert.convert_files(paths)    — conversion trigger
-//     (Commit 4, not yet wired)
+//   - DocConvert.cancel_conversion()     — stop a background batch
 //
 // The backend's async mode fires `docConvertProgress` events which
 // AppShell translates to `doc-convert-progress` window events; this
@@ -170,6 +170,8 @@ export class DocConvertTab extends RpcMixin(LitElement) {
      * which live inside _convertResults.
      */
     _convertError: { type: String, state: true },
+    /** True once Cancel was clicked for the running batch. */
+    _cancelling: { type: Boolean, state: true },
   };
 
   static styles = css`
@@ -519,6 +521,7 @@ export class DocConvertTab extends RpcMixin(LitElement) {
     this._progressByPath = new Map();
     this._convertResults = [];
     this._convertError = null;
+    this._cancelling = false;
 
     // Re-scan after commits / resets — the picker fires
     // `files-modified` as a window event after those ops,
@@ -579,9 +582,10 @@ export class DocConvertTab extends RpcMixin(LitElement) {
    *
    * Events arriving when we're not in the 'converting'
    * phase are dropped defensively — late events from a
-   * cancelled batch (not yet a feature, but a likely
-   * addition) shouldn't corrupt an idle or already-
-   * completed view.
+   * cancelled batch shouldn't corrupt an idle or already-
+   * completed view. With several backend workers, `file`
+   * events arrive in completion order, not request order;
+   * rows are keyed by path so that doesn't matter.
    */
   _onConvertProgress(event) {
     // AppShell dispatches the backend's event payload
@@ -711,6 +715,7 @@ export class DocConvertTab extends RpcMixin(LitElement) {
     this._convertBatch = paths;
     this._convertResults = [];
     this._convertError = null;
+    this._cancelling = false;
     // Seed progressByPath optimistically so the user sees
     // something even before the start event arrives. The
     // backend's start event will overwrite this with the
@@ -769,6 +774,29 @@ export class DocConvertTab extends RpcMixin(LitElement) {
     }
   }
 
+  /**
+   * Ask the backend to stop the running batch. The worker
+   * processes are killed; unfinished files come back as
+   * 'skipped' ("Cancelled") through the normal `file` and
+   * `complete` events, so this only flags the button.
+   */
+  async _cancelConversion() {
+    if (this._convertPhase !== 'converting' || this._cancelling) return;
+    this._cancelling = true;
+    try {
+      const result = await this.rpcExtract(
+        'DocConvert.cancel_conversion',
+      );
+      if (result && result.error) {
+        this._cancelling = false;
+        this._convertError = String(result.reason || result.error);
+      }
+    } catch (err) {
+      this._cancelling = false;
+      this._convertError = err?.message || String(err);
+    }
+  }
+
   /**
    * Common completion handler for both execution modes.
    * Stores the results list, flips to the summary view,
@@ -783,6 +811,7 @@ export class DocConvertTab extends RpcMixin(LitElement) {
    */
   _applyCompletion(results) {
     this._convertResults = results;
+    this._cancelling = false;
     // Fold per-file results into the progress map so the
     // summary's progress rows render final status,
     // output_path, and message. Inline (sync) mode never
@@ -1164,6 +1193,14 @@ export class DocConvertTab extends RpcMixin(LitElement) {
               style="width: ${pct}%"
             ></div>
           </div>
+          ${isComplete ? null : html`
+            <button
+              class="toolbar-button cancel-button"
+              @click=${this._cancelConversion}
+              ?disabled=${this._cancelling}
+              title="Stop converting; finished files are kept"
+            >${this._cancelling ? 'Cancelling…' : 'Cancel'}</button>
+          `}
         </div>
         ${this._convertError ? html`
           <div class="top-error">${this._convertError}</div>
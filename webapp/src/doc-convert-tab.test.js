@@ -908,6 +908,64 @@ describe('DocConvertTab progress events', () => {
   });
 });
 
+// ---------------------------------------------------------------------------
+// Cancellation
+// ---------------------------------------------------------------------------
+
+describe('DocConvertTab cancel', () => {
+  async function startBackground(cancel) {
+    publishFakeRpc({
+      'DocConvert.scan_convertible_files': () => [
+        fileEntry('a.docx'),
+        fileEntry('b.pdf'),
+      ],
+      'DocConvert.convert_files': () => ({
+        status: 'started',
+        count: 2,
+      }),
+      'DocConvert.cancel_conversion': cancel,
+    });
+    const t = mountTab();
+    await settle(t);
+    t._selected = new Set(['a.docx', 'b.pdf']);
+    await t._startConversion();
+    await settle(t);
+    return t;
+  }
+
+  it('calls cancel_conversion and disables the button', async () => {
+    const cancel = vi.fn(() => ({ status: 'cancelled', batches: 1 }));
+    const t = await startBackground(cancel);
+    const button = t.shadowRoot.querySelector('.cancel-button');
+    expect(button).toBeTruthy();
+    button.click();
+    await settle(t);
+    expect(cancel).toHaveBeenCalledTimes(1);
+    const after = t.shadowRoot.querySelector('.cancel-button');
+    expect(after.disabled).toBe(true);
+    expect(after.textContent).toContain('Cancelling');
+  });
+
+  it('shows cancelled files as skipped on complete', async () => {
+    const t = await startBackground(() => ({ status: 'cancelled' }));
+    await t._cancelConversion();
+    pushEvent('doc-convert-progress', {
+      data: {
+        stage: 'complete',
+        cancelled: true,
+        results: [
+          { path: 'a.docx', status: 'ok', output_path: 'a.md' },
+          { path: 'b.pdf', status: 'skipped', message: 'Cancelled' },
+        ],
+      },
+    });
+    await settle(t);
+    expect(t._convertPhase).toBe('complete');
+    expect(t._progressByPath.get('b.pdf').message).toBe('Cancelled');
+    expect(t.shadowRoot.querySelector('.cancel-button')).toBeNull();
+  });
+});
+
 // ---------------------------------------------------------------------------
 // Summary view + retry/done buttons
 // ---------------------------------------------------------------------------
@@ -108,6 +108,12 @@ export class HistoryBrowser extends RpcMixin(LitElement) {
     _loadingSessions: { type: Boolean, state: true },
     /** Currently selected session ID (left pane click). */
     _selectedSessionId: { type: String, state: true },
+    /**
+     * Agent conversation being previewed, `{turn_id,
+     * agent_idx}`, when the selection came from an agent
+     * search hit. Null for a plain session selection.
+     */
+    _selectedAgent: { type: Object, state: true },
     /** Messages for the selected session (right pane). */
     _selectedMessages: { type: Array, state: true },
     /** Loading state for the selected session's messages. */
@@ -352,6 +358,9 @@ export class HistoryBrowser extends RpcMixin(LitElement) {
       color: var(--accent-primary, #58a6ff);
       margin-bottom: 0.2rem;
     }
+    .search-hit .hit-agent {
+      color: var(--text-secondary, #8b949e);
+    }
     .search-hit .hit-content {
       font-size: 0.8125rem;
       overflow: hidden;
@@ -605,6 +614,7 @@ export class HistoryBrowser extends RpcMixin(LitElement) {
     this._sessions = [];
     this._loadingSessions = false;
     this._selectedSessionId = null;
+    this._selectedAgent = null;
     this._selectedMessages = [];
     this._loadingMessages = false;
     this._searchQuery = '';
@@ -687,6 +697,7 @@ export class HistoryBrowser extends RpcMixin(LitElement) {
           this._searchMode = false;
           this._searchHits = [];
           this._selectedSessionId = null;
+          this._selectedAgent = null;
           this._selectedMessages = [];
           this._contextMenu = null;
         });
@@ -755,6 +766,39 @@ export class HistoryBrowser extends RpcMixin(LitElement) {
     }
   }
 
+  async _loadAgentMessages(turnId, agentIdx) {
+    if (!this.rpcConnected || !turnId) return;
+    // Shares the session preview's generation counter — an
+    // agent hit and a session click race for the same pane.
+    const gen = ++this._messagesGeneration;
+    this._loadingMessages = true;
+    try {
+      const result = await this.rpcExtract(
+        'LLMService.get_turn_archive',
+        turnId,
+      );
+      if (gen !== this._messagesGeneration) return;
+      const agent = Array.isArray(result)
+        ? result.find((a) => a && a.agent_idx === agentIdx)
+        : null;
+      this._selectedMessages = Array.isArray(agent?.messages)
+        ? agent.messages
+        : [];
+    } catch (err) {
+      console.error(
+        '[history-browser] get_turn_archive failed',
+        err,
+      );
+      if (gen === this._messagesGeneration) {
+        this._selectedMessages = [];
+      }
+    } finally {
+      if (gen === this._messagesGeneration) {
+        this._loadingMessages = false;
+      }
+    }
+  }
+
   async _runSearch(query) {
     const gen = ++this._searchGeneration;
     if (!this.rpcConnected) return;
@@ -885,20 +929,43 @@ export class HistoryBrowser extends RpcMixin(LitElement) {
   }
 
   _onSessionClick(sessionId) {
-    if (this._selectedSessionId === sessionId) return;
+    if (
+      this._selectedSessionId === sessionId &&
+      !this._selectedAgent
+    ) {
+      return;
+    }
     this._selectedSessionId = sessionId;
+    this._selectedAgent = null;
     this._selectedMessages = [];
     this._loadSessionMessages(sessionId);
   }
 
-  _onSearchHitClick(sessionId) {
-    // A search hit is a message in a session — clicking it
-    // selects that session for preview. A future enhancement
-    // could scroll to the specific message; for now we just
-    // load the session.
+  _onSearchHitClick(hit) {
+    // Two kinds of hit. A main-store hit is a message in a
+    // session — clicking it selects that session for preview
+    // (a future enhancement could scroll to the specific
+    // message). An agent-archive hit (source "agent") previews
+    // that agent's conversation from its turn archive instead;
+    // see the branch below.
     this._searchMode = false;
     this._searchQuery = '';
-    this._onSessionClick(sessionId);
+    if (hit.source === 'agent') {
+      // Agent-archive hits live under the turn that spawned
+      // the agent, not in the session's message list. Preview
+      // that agent's conversation; the parent session (when
+      // the archive recorded one) stays the Load target, and
+      // loading it rehydrates the agent tabs.
+      this._selectedSessionId = hit.session_id || null;
+      this._selectedAgent = {
+        turn_id: hit.turn_id,
+        agent_idx: hit.agent_idx,
+      };
+      this._selectedMessages = [];
+      this._loadAgentMessages(hit.turn_id, hit.agent_idx);
+      return;
+    }
+    this._onSessionClick(hit.session_id);
   }
 
   async _onLoadClick() {
@@ -1156,15 +1223,23 @@ export class HistoryBrowser extends RpcMixin(LitElement) {
     }
     return this._searchHits.map((hit) => {
       // Hit shape from history_search: {session_id,
-      // message_id, role, content_preview, timestamp}.
+      // message_id, role, content_preview, timestamp, source};
+      // agent-archive hits (source "agent") add turn_id and
+      // agent_idx.
       const preview = hit.content_preview || hit.content || '';
+      const isAgent = hit.source === 'agent';
       return html`
         <div
-          class="search-hit"
-          @click=${() => this._onSearchHitClick(hit.session_id)}
+          class="search-hit ${isAgent ? 'agent-hit' : ''}"
+          @click=${() => this._onSearchHitClick(hit)}
           role="button"
         >
           <div class="hit-role">
+            ${isAgent
+              ? html`<span class="hit-agent">
+                  Agent ${String(hit.agent_idx ?? 0).padStart(2, '0')} ·
+                </span>`
+              : ''}
             ${hit.role || 'message'}
             · ${formatRelativeTime(hit.timestamp)}
           </div>
@@ -1175,7 +1250,7 @@ export class HistoryBrowser extends RpcMixin(LitElement) {
   }
 
   _renderPreview() {
-    if (!this._selectedSessionId) {
+    if (!this._selectedSessionId && !this._selectedAgent) {
       return html`<div class="preview-empty">
         Select a session to preview
       </div>`;
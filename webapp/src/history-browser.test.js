@@ -608,6 +608,65 @@ describe('HistoryBrowser search', () => {
     // Search mode exits.
     expect(el._searchMode).toBe(false);
   });
+
+  it('agent hits are labelled and open the agent conversation', async () => {
+    const getSession = vi.fn().mockResolvedValue([]);
+    const getArchive = vi.fn().mockResolvedValue([
+      { agent_idx: 0, messages: [{ role: 'user', content: 'other' }] },
+      {
+        agent_idx: 1,
+        messages: [{ role: 'assistant', content: 'agent reply' }],
+      },
+    ]);
+    publishFakeRpc({
+      'LLMService.history_list_sessions': vi
+        .fn()
+        .mockResolvedValue([]),
+      'LLMService.history_search': vi.fn().mockResolvedValue([
+        {
+          session_id: 'parent_session',
+          message_id: 'm1',
+          role: 'assistant',
+          content_preview: 'agent hit',
+          timestamp: new Date().toISOString(),
+          source: 'agent',
+          turn_id: 'turn_1_abc',
+          agent_idx: 1,
+        },
+      ]),
+      'LLMService.history_get_session': getSession,
+      'LLMService.get_turn_archive': getArchive,
+    });
+    const el = mountBrowser({ open: true });
+    await el.updateComplete;
+    await vi.runAllTimersAsync();
+    await el.updateComplete;
+
+    const input = el.shadowRoot.querySelector('.search-input');
+    input.value = 'agent';
+    input.dispatchEvent(new Event('input'));
+    vi.advanceTimersByTime(SEARCH_DEBOUNCE_MS);
+    await vi.runAllTimersAsync();
+    await el.updateComplete;
+    const hit = el.shadowRoot.querySelector('.search-hit');
+    expect(hit.classList.contains('agent-hit')).toBe(true);
+    expect(hit.textContent).toContain('Agent 01');
+
+    hit.click();
+    await vi.runAllTimersAsync();
+    await el.updateComplete;
+    expect(getArchive).toHaveBeenCalledWith('turn_1_abc');
+    expect(getSession).not.toHaveBeenCalled();
+    expect(el._selectedAgent).toEqual({
+      turn_id: 'turn_1_abc',
+      agent_idx: 1,
+    });
+    // The parent session stays the Load target.
+    expect(el._selectedSessionId).toBe('parent_session');
+    const preview = el.shadowRoot.querySelector('.preview-messages');
+    expect(preview.textContent).toContain('agent reply');
+    expect(preview.textContent).not.toContain('other');
+  });
 });
 
 // ---------------------------------------------------------------------------
@@ -1231,9 +1231,28 @@ export class TokenHud extends RpcMixin(LitElement) {
           class="tot-value ${roiColor}"
           title="Return on cache-write investment: ((read / write) − 1) × 100. 0% means the writes have been read back exactly once (broke even). 100% = read back twice. Negative values mean the writes haven't been fully read back yet — common at the start of a session before cache hits accumulate. Suppressed (—) when there's been no cache write activity yet."
         >${roiLabel}</span>
+        ${this._renderCountCache(d?.token_count_cache)}
       </div>
     `;
   }
+
+  _renderCountCache(memo) {
+    // Local token-count memo — how often counting a file,
+    // dir-block or message was a hash lookup instead of a
+    // tokenizer run. Omitted by older backends.
+    if (!memo) return '';
+    const rate = memo.hit_rate;
+    const label = rate === null || rate === undefined
+      ? '—'
+      : `${(rate * 100).toFixed(1)}%`;
+    return html`
+      <span class="tot-label">Count Cache</span>
+      <span
+        class="tot-value ${rate >= 0.5 ? 'green' : ''}"
+        title="Server-side token-count memo: ${memo.hits} hits, ${memo.misses} misses, ${memo.entries}/${memo.capacity} entries. A hit means unchanged content was counted by hash lookup rather than re-tokenised."
+      >${label}</span>
+    `;
+  }
 }
 
 customElements.define('ac-token-hud', TokenHud);
\ No newline at end of file